@@ -11,7 +11,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 import redis
 from tenacity import (
@@ -22,6 +22,8 @@ from tenacity import (
 )
 
 from api_clients.base.rate_limiter import RateLimiter
+from app.core.cache_codec import get_cache_codec
+from app.core.http_transport import get_http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +51,16 @@ class BaseAPIClient(ABC):
         self.session: Optional[aiohttp.ClientSession] = None
         self.rate_limiter = RateLimiter(
             max_requests=config.get('rate_limit', 100),
-            time_window=60
+            time_window=60,
+            key=urlparse(self.base_url).netloc if self.base_url else None
         )
 
-        # Redis cache connection
+        # Redis cache connection (binary values, see app.core.cache_codec)
         self.cache = redis.Redis(
             host=config.get('redis_host', 'localhost'),
-            port=config.get('redis_port', 6379),
-            decode_responses=True
+            port=config.get('redis_port', 6379)
         )
+        self.codec = get_cache_codec()
 
         # Request headers
         self.headers = self._build_headers()
@@ -78,14 +81,13 @@ class BaseAPIClient(ABC):
         return headers
 
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        """Async context manager entry: borrow the shared HTTP session"""
+        self.session = await get_http_transport().get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (the shared session stays open for reuse)"""
+        self.session = None
 
     def _generate_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
         """
@@ -121,7 +123,7 @@ class BaseAPIClient(ABC):
             cached = self.cache.get(cache_key)
             if cached:
                 logger.debug(f"Cache hit for {cache_key}")
-                return json.loads(cached)
+                return self.codec.decode(cached)
         except Exception as e:
             logger.warning(f"Cache retrieval error: {e}")
 
@@ -138,11 +140,7 @@ class BaseAPIClient(ABC):
         """
         try:
             ttl = ttl or self.cache_ttl
-            self.cache.setex(
-                cache_key,
-                ttl,
-                json.dumps(data, ensure_ascii=False)
-            )
+            self.cache.setex(cache_key, ttl, self.codec.encode(data))
             logger.debug(f"Cached {cache_key} for {ttl} seconds")
         except Exception as e:
             logger.warning(f"Cache storage error: {e}")
@@ -186,6 +184,7 @@ class BaseAPIClient(ABC):
                 method,
                 url,
                 json=data,
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
             ) as response:
                 response.raise_for_status()
@@ -8,27 +8,35 @@ from typing import Dict, Optional
 from collections import deque
 import logging
 
+from app.core.distributed_rate_limiter import create_token_bucket
+
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """Token bucket rate limiter for async API operations"""
 
-    def __init__(self, max_requests: int = 10, time_window: int = 60):
+    def __init__(self, max_requests: int = 10, time_window: int = 60, key: Optional[str] = None):
         """
         Initialize rate limiter
 
         Args:
             max_requests: Maximum number of requests allowed
             time_window: Time window in seconds
+            key: Share the limit with every process through Redis under
+                this name; the local limit applies when Redis is down
         """
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests = deque()
         self._lock = asyncio.Lock()
+        self.bucket = create_token_bucket(key, max_requests, time_window)
 
     async def acquire(self):
         """Wait if necessary to respect rate limits"""
+        if self.bucket is not None and await self.bucket.acquire():
+            return
+
         async with self._lock:
             now = time.time()
 
@@ -80,23 +88,24 @@ class APIRateLimiter:
         if api_name not in self.limiters:
             # Custom limits for specific APIs
             if "dane" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=100, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=100, time_window=60, key=api_name)
             elif "banrep" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60, key=api_name)
             elif "datos.gov.co" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=100, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=100, time_window=60, key=api_name)
             elif "secop" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60, key=api_name)
             elif "ideam" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=120, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=120, time_window=60, key=api_name)
             elif "dnp" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=80, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=80, time_window=60, key=api_name)
             elif "minhacienda" in api_name.lower():
-                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60)
+                self.limiters[api_name] = RateLimiter(max_requests=60, time_window=60, key=api_name)
             else:
                 self.limiters[api_name] = RateLimiter(
                     self.default_max_requests,
-                    self.default_time_window
+                    self.default_time_window,
+                    key=api_name
                 )
 
         return self.limiters[api_name]
@@ -11,6 +11,7 @@ from datetime import datetime
 
 from ..database.connection import get_db
 from ..database.models import ScrapedContent, ContentAnalysis
+from ..config.settings import settings
 from ..core.cache import cached, invalidate_cache_async
 from nlp.pipeline import NLPPipeline
 from nlp.sentiment_analyzer import SentimentAnalyzer
@@ -54,7 +55,7 @@ class BatchAnalysisRequest(BaseModel):
 # Initialize analysis components
 nlp_pipeline = NLPPipeline()
 sentiment_analyzer = SentimentAnalyzer()
-topic_modeler = TopicModeler(n_topics=5)
+topic_modeler = TopicModeler(n_topics=5, snapshot_dir=settings.TOPIC_MODEL_DIR)
 difficulty_scorer = DifficultyScorer()
 
 
@@ -71,9 +72,12 @@ async def analyze_text(
         result = {}
         text = request.text
 
+        # One shared parse for every requested analysis
+        context = nlp_pipeline.create_context(text)
+
         # Sentiment analysis
         if "sentiment" in request.analysis_types:
-            sentiment_result = sentiment_analyzer.analyze(text)
+            sentiment_result = sentiment_analyzer.analyze(text, context=context)
             result["sentiment"] = {
                 "polarity": sentiment_result.polarity,
                 "subjectivity": sentiment_result.subjectivity,
@@ -83,7 +87,7 @@ async def analyze_text(
 
         # Entity extraction
         if "entities" in request.analysis_types:
-            entities = nlp_pipeline.extract_entities(text)
+            entities = nlp_pipeline.extract_entities(text, context=context)
             result["entities"] = [
                 {
                     "text": ent["text"],
@@ -95,12 +99,12 @@ async def analyze_text(
 
         # Topic modeling
         if "topics" in request.analysis_types:
-            topics = topic_modeler.predict_topics(text)
+            topics = topic_modeler.predict_topics(text, context=context)
             result["topics"] = topics
 
         # Difficulty scoring
         if "difficulty" in request.analysis_types:
-            difficulty = difficulty_scorer.score(text)
+            difficulty = difficulty_scorer.score(text, context=context)
             result["difficulty"] = {
                 "score": difficulty.difficulty_score,
                 "cefr_level": difficulty.cefr_level,
@@ -110,7 +114,7 @@ async def analyze_text(
 
         # Generate summary
         if "summary" in request.analysis_types:
-            summary = nlp_pipeline.summarize(text, max_length=150)
+            summary = nlp_pipeline.summarize(text, context=context)
             result["summary"] = summary
 
         # Store in database (using ContentAnalysis model)
@@ -318,19 +322,20 @@ def process_batch_analysis(
         try:
             # Combine title and content for analysis
             text = f"{content.title}\n\n{content.content}"
+            context = nlp_pipeline.create_context(text)
 
             result = {}
 
             if "sentiment" in analysis_types:
-                sentiment_result = sentiment_analyzer.analyze(text)
+                sentiment_result = sentiment_analyzer.analyze(text, context=context)
                 result["sentiment_score"] = sentiment_result.polarity
 
             if "entities" in analysis_types:
-                entities = nlp_pipeline.extract_entities(text)
+                entities = nlp_pipeline.extract_entities(text, context=context)
                 result["entities"] = entities
 
             if "topics" in analysis_types:
-                topics = topic_modeler.predict_topics(text)
+                topics = topic_modeler.predict_topics(text, context=context)
                 result["topics"] = topics
 
             # Store analysis result
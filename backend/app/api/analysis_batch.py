@@ -5,15 +5,18 @@ Provides 10x+ performance improvement for bulk NLP processing
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from typing import List, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
-import asyncio
 
 from ..database.connection import get_db
 from ..database.models import ScrapedContent, ContentAnalysis
+from ..config.settings import settings
+from ..core.cache import cache_manager
 from nlp.batch_processor import BatchProcessor, BatchConfig, JobPriority
-from nlp.pipeline import ColombianNLPPipeline
+from nlp.executors import AnalysisComponents, BatchExecutor, ProcessExecutor, ThreadExecutor
+from nlp.job_store import MemoryJobStore, RedisJobStore
+from nlp.pipeline import NLPPipeline
 from nlp.sentiment_analyzer import SentimentAnalyzer
 from nlp.topic_modeler import TopicModeler
 from nlp.difficulty_scorer import DifficultyScorer
@@ -28,14 +31,31 @@ batch_config = BatchConfig(
     worker_count=4,
     enable_gpu=False,
     cache_results=True,
-    max_cache_size=1000
+    max_cache_size=1000,
+    max_cache_bytes=64 * 1024 * 1024,
+    model_version=f"{settings.APP_VERSION}:es_core_news_md",
+    max_jobs=settings.NLP_JOB_MAX_COUNT,
+    job_ttl_seconds=settings.NLP_JOB_RETENTION_SECONDS
 )
-batch_processor = BatchProcessor(config=batch_config)
+
+if settings.NLP_JOB_STORE == "redis":
+    job_store = RedisJobStore(
+        cache_manager,
+        max_jobs=batch_config.max_jobs,
+        max_age_seconds=batch_config.job_ttl_seconds
+    )
+else:
+    job_store = MemoryJobStore(
+        max_jobs=batch_config.max_jobs,
+        max_age_seconds=batch_config.job_ttl_seconds
+    )
+
+batch_processor = BatchProcessor(config=batch_config, remote_cache=cache_manager, job_store=job_store)
 
 # Initialize NLP components
-nlp_pipeline = ColombianNLPPipeline()
+nlp_pipeline = NLPPipeline()
 sentiment_analyzer = SentimentAnalyzer()
-topic_modeler = TopicModeler(n_topics=5)
+topic_modeler = TopicModeler(n_topics=5, snapshot_dir=settings.TOPIC_MODEL_DIR)
 difficulty_scorer = DifficultyScorer()
 
 
@@ -75,84 +95,33 @@ class BatchStatisticsResponse(BaseModel):
     cache_hit_rate: float
 
 
-# Processing functions for batch processor
-async def process_sentiment_batch(texts: List[str]) -> List[Dict[str, Any]]:
-    """Process sentiment analysis in batch"""
-    loop = asyncio.get_event_loop()
-    # Convert to spaCy docs first
-    docs = await loop.run_in_executor(
-        None,
-        lambda: [nlp_pipeline.nlp(text) for text in texts]
-    )
-    # Batch sentiment analysis
-    return await loop.run_in_executor(
-        None,
-        sentiment_analyzer.analyze_batch,
-        docs,
-        texts
-    )
-
-
-async def process_ner_batch(texts: List[str]) -> List[Dict[str, List[str]]]:
-    """Process named entity recognition in batch"""
-    loop = asyncio.get_event_loop()
-    # Use optimized batch processing
-    docs = await loop.run_in_executor(
-        None,
-        lambda: list(nlp_pipeline.nlp.pipe(texts, batch_size=64, n_process=4))
-    )
-    return await loop.run_in_executor(
-        None,
-        nlp_pipeline.ner.extract_entities_batch,
-        docs,
-        texts
-    )
-
-
-async def process_topic_batch(texts: List[str]) -> List[List[Dict[str, Any]]]:
-    """Process topic modeling in batch"""
-    loop = asyncio.get_event_loop()
-    docs = await loop.run_in_executor(
-        None,
-        lambda: list(nlp_pipeline.nlp.pipe(texts, batch_size=128))
-    )
-    return await loop.run_in_executor(
-        None,
-        topic_modeler.extract_topics_batch,
-        docs
-    )
-
-
-async def process_difficulty_batch(texts: List[str]) -> List[float]:
-    """Process difficulty scoring in batch"""
-    loop = asyncio.get_event_loop()
-    docs = await loop.run_in_executor(
-        None,
-        lambda: list(nlp_pipeline.nlp.pipe(texts, batch_size=100))
-    )
-    return await loop.run_in_executor(
-        None,
-        difficulty_scorer.score_batch,
-        docs
-    )
+def create_executor() -> BatchExecutor:
+    """
+    Select the batch execution backend from settings
 
+    "process" runs batches on a warm pool of worker processes (one spaCy
+    model and analyzer set per worker) so CPU-bound stages scale with cores;
+    "thread" runs them on this module's components in the default executor.
+    """
+    if settings.NLP_EXECUTOR == "process":
+        return ProcessExecutor(
+            max_workers=settings.NLP_PROCESS_WORKERS or None,
+            n_topics=topic_modeler.n_topics,
+            topic_snapshot_dir=settings.TOPIC_MODEL_DIR
+        )
 
-async def process_full_batch(texts: List[str]) -> List[Dict[str, Any]]:
-    """Process full NLP pipeline in batch"""
-    return await nlp_pipeline.process_batch_async(texts)
+    return ThreadExecutor(AnalysisComponents(
+        pipeline=nlp_pipeline,
+        sentiment_analyzer=sentiment_analyzer,
+        topic_modeler=topic_modeler,
+        difficulty_scorer=difficulty_scorer
+    ))
 
 
 @router.on_event("startup")
 async def startup_event():
     """Start batch processor workers on startup"""
-    processor_map = {
-        'sentiment': process_sentiment_batch,
-        'ner': process_ner_batch,
-        'topic': process_topic_batch,
-        'difficulty': process_difficulty_batch,
-        'full': process_full_batch
-    }
-    await batch_processor.start_workers(processor_map)
+    await batch_processor.start_workers(executor=create_executor())
 
 
 @router.on_event("shutdown")
@@ -209,7 +178,7 @@ async def submit_batch_job(request: BatchJobRequest):
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
     """Get status of a batch job"""
-    job = batch_processor.get_status(job_id)
+    job = await batch_processor.fetch_status(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -236,7 +205,7 @@ async def get_job_result(job_id: str):
 
     Returns result immediately if completed, or status if still processing
     """
-    job = batch_processor.get_status(job_id)
+    job = await batch_processor.fetch_status(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -26,6 +26,7 @@ class CacheInvalidateRequest(BaseModel):
     layer: str = Field(..., description="Cache layer to invalidate")
     identifier: Optional[str] = Field(None, description="Specific identifier to invalidate")
     pattern: Optional[str] = Field(None, description="Pattern for bulk invalidation")
+    tags: Optional[List[str]] = Field(None, description="Tags whose entries to invalidate")
 
 
 class CacheWarmRequest(BaseModel):
@@ -132,9 +133,19 @@ async def invalidate_cache(request: CacheInvalidateRequest) -> Dict[str, Any]:
 
     Supports:
     - Single key invalidation (provide layer + identifier)
-    - Pattern invalidation (provide layer + pattern)
+    - Pattern invalidation (provide layer + pattern, scans the keyspace)
+    - Tag invalidation (provide tags)
     - Layer invalidation (provide layer only)
     """
+    if request.tags:
+        count = await cache_manager.invalidate_tags(request.tags)
+        return {
+            "status": "success",
+            "operation": "tag_invalidation",
+            "tags": request.tags,
+            "keys_invalidated": count
+        }
+
     if request.pattern:
         # Pattern-based invalidation
         count = await cache_manager.delete_pattern(request.pattern)
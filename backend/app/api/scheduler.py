@@ -10,6 +10,7 @@ from app.services.scheduler import get_scheduler_service
 from app.services.scheduler_jobs import (
     get_job_status, get_scheduler_metrics, trigger_manual_scrape
 )
+from app.services.crawl_schedule import get_crawl_schedule
 
 router = APIRouter()
 
@@ -129,6 +130,41 @@ async def get_metrics() -> Dict[str, Any]:
         )
 
 
+@router.get("/crawl-rates")
+async def get_crawl_rates(source: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the adaptive crawl schedule of scraper sources
+
+    Args:
+        source: Only this source (all sources if omitted)
+
+    Returns:
+    - Estimated publication rate (new articles per hour)
+    - Current and tier crawl interval
+    - Predicted vs actual new articles
+    """
+    try:
+        rates = get_crawl_schedule().get_statistics(source)
+
+        if source and not rates:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No crawl schedule for source '{source}'"
+            )
+
+        return {
+            'sources': rates,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching crawl rates: {str(e)}"
+        )
+
+
 @router.post("/jobs/{job_id}/pause")
 async def pause_job(job_id: str) -> Dict[str, Any]:
     """
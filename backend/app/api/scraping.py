@@ -8,14 +8,20 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.bulk import upsert_scraped_content_async
 from app.database.connection import get_async_db
 from app.database.models import ScrapedContent
-from app.core.cache import cached, invalidate_cache_async
+from app.core.cache import cached, invalidate_cache_async, invalidate_tags_async, source_tag
 from scrapers.sources.media.el_tiempo import ElTiempoScraper
 from scrapers.sources.media.el_espectador import ElEspectadorScraper
 from scrapers.sources.media.semana import SemanaScraper
 from scrapers.sources.media.portafolio import PortafolioScraper
+from scrapers.sources.media.spec_sources import SPEC_SCRAPERS
 from scrapers.sources.strategic_sources import STRATEGIC_SOURCES, get_sources_by_priority
+from scrapers.base.fetch_state import get_fetch_state_store
+from scrapers.base.url_index import get_url_index
+from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.spec_scraper import scrape_concurrently
 
 router = APIRouter()
 
@@ -25,9 +31,19 @@ SCRAPER_REGISTRY = {
     'El Espectador': ElEspectadorScraper,
     'Semana': SemanaScraper,
     'Portafolio': PortafolioScraper,
+    **SPEC_SCRAPERS,
 }
 
 
+def find_source_config(source_name: str) -> Optional[Dict[str, Any]]:
+    """Strategic source configuration (with its category) by name"""
+    for category, sources in STRATEGIC_SOURCES.items():
+        for source in sources:
+            if source.get("name") == source_name:
+                return {**source, "category": category}
+    return None
+
+
 @router.get("/sources")
 @cached(layer="metadata", identifier="sources-list", ttl=1800, include_params=["category", "priority", "format"])
 async def list_sources(
@@ -143,18 +159,20 @@ async def run_scraper(scraper_class, source_config: Dict[str, Any]):
             try:
                 articles = await scraper.scrape()
 
-                # Save to database using ORM
-                for article in articles:
-                    db.add(article)
+                # Save to database, skipping articles that are already stored
+                stored = await upsert_scraped_content_async(db, articles)
 
                 await db.commit()
 
                 # Invalidate related caches after successful scraping
                 await invalidate_cache_async(layer="analytics", identifier="scraping-status")
-                await invalidate_cache_async(layer="content", pattern="articles-simple*")
+                await invalidate_tags_async("articles", source_tag(source_config.get('name', 'Unknown')))
 
                 # Log success
-                print(f"✅ Successfully scraped {len(articles)} articles from {source_config.get('name', 'Unknown')}")
+                print(
+                    f"✅ Successfully scraped {len(articles)} articles from {source_config.get('name', 'Unknown')} "
+                    f"({stored.inserted} new, {stored.skipped} already stored)"
+                )
                 print(f"🔄 Cache invalidated for analytics and content layers")
 
             except Exception as e:
@@ -163,6 +181,59 @@ async def run_scraper(scraper_class, source_config: Dict[str, Any]):
                 print(f"❌ Scraping error for {source_config.get('name', 'Unknown')}: {str(e)}")
 
 
+@router.post("/trigger-all")
+async def trigger_all_scraping(
+    background_tasks: BackgroundTasks,
+    priority: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Trigger every async scraper at once
+
+    All sources run concurrently in one background task on the event loop,
+    sharing the HTTP connection pool; per-source rate limits still apply.
+    """
+    source_configs = []
+    for source_name, scraper_class in SCRAPER_REGISTRY.items():
+        source_config = find_source_config(source_name)
+        if (
+            source_config
+            and issubclass(scraper_class, BaseScraper)
+            and (not priority or source_config.get("priority") == priority)
+        ):
+            source_configs.append(source_config)
+
+    background_tasks.add_task(run_scrapers, source_configs)
+    return {
+        "status": "triggered",
+        "sources": [config["name"] for config in source_configs],
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+async def run_scrapers(source_configs: List[Dict[str, Any]]):
+    """Background task scraping several sources concurrently, storing each source's articles"""
+    from app.database.connection import AsyncSessionLocal
+
+    scrapers = [SCRAPER_REGISTRY[config["name"]](config) for config in source_configs]
+    results = await scrape_concurrently(scrapers)
+
+    async with AsyncSessionLocal() as db:
+        for source_name, articles in results.items():
+            try:
+                stored = await upsert_scraped_content_async(db, articles)
+                await db.commit()
+                print(
+                    f"✅ Successfully scraped {len(articles)} articles from {source_name} "
+                    f"({stored.inserted} new, {stored.skipped} already stored)"
+                )
+            except Exception as e:
+                await db.rollback()
+                print(f"❌ Scraping error for {source_name}: {str(e)}")
+
+    await invalidate_cache_async(layer="analytics", identifier="scraping-status")
+    await invalidate_tags_async("articles", *[source_tag(source_name) for source_name in results])
+
+
 @router.get("/status")
 @cached(layer="analytics", identifier="scraping-status", ttl=300)
 async def get_scraping_status(
@@ -215,6 +286,23 @@ async def get_scraping_status(
         )
 
 
+@router.get("/fetch-state")
+async def get_fetch_state_statistics(source: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Conditional fetch results per source since startup
+
+    Counts of articles answered with 304 (not_modified), an identical body
+    (unchanged) or identical parsed content (duplicate) versus new and
+    changed articles, and the resulting hit ratio, plus the URLs skipped
+    before fetching by the URL-seen index.
+    """
+    return {
+        "sources": get_fetch_state_store().get_statistics(source),
+        "url_index": get_url_index().get_statistics(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.get("/content")
 async def get_scraped_content(
     source: Optional[str] = None,
@@ -292,7 +380,7 @@ async def get_scraped_content(
 
 
 @router.get("/content/simple")
-@cached(layer="content", identifier="articles-simple", ttl=900, include_params=["limit", "offset"])
+@cached(layer="content", identifier="articles-simple", ttl=900, include_params=["limit", "offset"], tags=["articles"])
 async def get_content_simple(
     limit: int = 10,  # Reduced from 20 to 10 for better performance
     offset: int = 0,  # Add offset for server-side pagination
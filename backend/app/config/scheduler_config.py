@@ -38,19 +38,27 @@ JOB_DEFAULTS: Dict[str, Any] = {
 }
 
 # Scraper tier configurations (based on priority)
+# interval_minutes is the starting interval; with adaptive scheduling each
+# source then moves between min/max_interval_minutes by publication rate
 SCRAPER_TIERS = {
     'high': {
         'interval_minutes': 15,
+        'min_interval_minutes': 5,
+        'max_interval_minutes': 60,
         'description': 'High-priority sources - scraped every 15 minutes',
         'max_retries': 5
     },
     'medium': {
         'interval_minutes': 30,
+        'min_interval_minutes': 10,
+        'max_interval_minutes': 180,
         'description': 'Medium-priority sources - scraped every 30 minutes',
         'max_retries': 3
     },
     'low': {
         'interval_minutes': 60,
+        'min_interval_minutes': 20,
+        'max_interval_minutes': 720,
         'description': 'Low-priority sources - scraped every 60 minutes',
         'max_retries': 2
     }
@@ -64,6 +64,7 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
     DB_ECHO: bool = False
+    DB_BULK_CHUNK_SIZE: int = 500  # Rows per multi-row INSERT ... ON CONFLICT statement
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -77,6 +78,22 @@ class Settings(BaseSettings):
             return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
+    # In-process L1 cache in front of Redis (per API replica, pub/sub invalidated)
+    CACHE_L1_ENABLED: bool = True  # Keep hot values of "local" cache layers in memory
+    CACHE_L1_MAX_ENTRIES: int = 10000  # Entries per process
+    CACHE_L1_MAX_BYTES: int = 64 * 1024 * 1024  # Approximate memory per process (JSON size)
+    CACHE_L1_TTL_SECONDS: float = 30.0  # Longest an entry is served without asking Redis
+
+    # Encoding of cached values (see app/core/cache_codec.py)
+    CACHE_SERIALIZER: str = "orjson"  # orjson or msgpack (json is accepted as an alias of orjson)
+    CACHE_COMPRESSION: str = "zstd"  # zstd, lz4, zlib or none
+    CACHE_COMPRESSION_MIN_BYTES: int = 1024  # Smaller values are stored uncompressed
+
+    # Stampede protection of CacheManager.get_or_set
+    CACHE_STALE_SECONDS: int = 300  # Values are served this long past their TTL while one task refreshes them
+    CACHE_XFETCH_BETA: float = 1.0  # Early refresh eagerness of "xfetch" layers (higher = earlier)
+    CACHE_LOCK_WAIT_SECONDS: float = 2.0  # How long a replica waits for another one's fetch
+
     # Elasticsearch
     ELASTICSEARCH_ENABLED: bool = True  # Enable/disable Elasticsearch features
     ELASTICSEARCH_HOST: str = "localhost"
@@ -143,6 +160,35 @@ class Settings(BaseSettings):
     SCRAPER_RATE_LIMIT: int = 10  # requests per second
     SCRAPER_CONCURRENT_LIMIT: int = 5
     MAX_CONCURRENT_SCRAPERS: int = 5  # Maximum concurrent scraper threads
+    SCRAPER_HTML_PARSER: str = "lxml"  # BeautifulSoup tree builder ("lxml", "html.parser", "html5lib")
+    SCRAPER_REPLAY_MODE: str = "off"  # "record" saves fetched pages, "replay" serves them offline
+    SCRAPER_REPLAY_ARCHIVE: str = "data/scraper_replay.zip"  # Compressed archive of recorded responses
+
+    # Shared HTTP connection pool (scrapers and API clients)
+    HTTP_POOL_LIMIT: int = 100  # Open connections in total
+    HTTP_POOL_LIMIT_PER_HOST: int = 8  # Open connections per host
+    HTTP_KEEPALIVE_TIMEOUT: int = 60  # Seconds idle connections are kept for reuse
+    HTTP_DNS_CACHE_TTL: int = 300  # Seconds resolved addresses are cached
+
+    # Conditional fetching of already scraped articles
+    SCRAPER_CONDITIONAL_FETCH: bool = True  # Send If-None-Match/If-Modified-Since, skip unchanged articles
+    SCRAPER_FETCH_STATE_PATH: str = "data/scraper_fetch_state.db"  # Per-URL ETag/Last-Modified/hash store
+    SCRAPER_FETCH_STATE_MAX_AGE_HOURS: int = 168  # Full refetch and parse after this long
+    SCRAPER_SKIP_KNOWN_URLS: bool = True  # Drop already stored article URLs before fetching
+    SCRAPER_URL_INDEX_PATH: str = "data/scraper_url_index.bloom"  # Persisted Bloom filter of stored URLs
+    SCRAPER_URL_INDEX_CAPACITY: int = 1000000  # URLs the filter is sized for (0.1% false positives)
+
+    # Rate limits shared by all workers (scrapers and API clients) through Redis
+    RATE_LIMIT_DISTRIBUTED: bool = True  # Per-domain/API token buckets in Redis, local limits as fallback
+    RATE_LIMIT_LEASE_SIZE: int = 5  # Most tokens taken from Redis per round-trip
+    RATE_LIMIT_LEASE_SECONDS: float = 1.0  # Unspent leased tokens are dropped after this long
+    RATE_LIMIT_REDIS_RETRY_SECONDS: float = 30.0  # Local limiting for this long after a Redis error
+
+    # Adaptive crawl intervals from each source's publication rate
+    SCRAPER_ADAPTIVE_SCHEDULE: bool = True  # Reschedule scraper jobs from the estimated rate (tier bounds apply)
+    SCRAPER_SCHEDULE_STATE_PATH: str = "data/scraper_schedule.db"  # Persisted rate estimates per source
+    SCRAPER_SCHEDULE_TARGET_ARTICLES: float = 3.0  # New articles a run should find on average
+    SCRAPER_SCHEDULE_HALF_LIFE_HOURS: float = 48.0  # Weight of a past run halves after this long
 
     # ========================================================================
     # NLP Configuration
@@ -151,6 +197,15 @@ class Settings(BaseSettings):
     NLP_MODEL: str = "es_core_news_sm"
     NLP_BATCH_SIZE: int = 32
     NLP_MAX_LENGTH: int = 1000000
+    NLP_EXECUTOR: str = "thread"  # "thread" or "process" for batch analysis
+    NLP_PROCESS_WORKERS: int = 0  # Worker processes for "process" (0 = CPU count)
+    NLP_JOB_STORE: str = "memory"  # "memory" or "redis" (status shared across workers)
+    NLP_JOB_RETENTION_SECONDS: int = 3600  # How long finished batch jobs stay queryable
+    NLP_JOB_MAX_COUNT: int = 100000  # Registered batch jobs before oldest finished are evicted
+    TOPIC_MODEL_DIR: str = "data/topic_models"  # Versioned TopicModeler snapshots
+    TOPIC_MODEL_UPDATE_MINUTES: int = 60  # Interval of the incremental LDA update job
+    TOPIC_MODEL_UPDATE_BATCH: int = 2000  # Max new articles folded in per update
+    TOPIC_MODEL_KEEP_SNAPSHOTS: int = 5  # Snapshot versions retained on disk
 
     # ========================================================================
     # Task Queue Configuration
@@ -0,0 +1,199 @@
+"""
+Binary encoding of cached values
+
+Cached values used to be json.dumps strings. Large NLP results, government
+API payloads and cached HTTP bodies paid the full stdlib JSON cost on every
+read and write, and were stored uncompressed. A CacheCodec serializes with
+orjson (same JSON data model, several times faster) or msgpack, and
+compresses values above a size threshold with zstd, lz4 or zlib.
+
+Every encoded value starts with a header byte:
+
+    0b10ccc sss   ccc = compression, sss = serializer
+
+JSON text never starts with a byte >= 0x80, so values written before the
+header existed (plain JSON) are still decoded. decode() follows the header
+rather than the configured codec, so changing CACHE_SERIALIZER or
+CACHE_COMPRESSION keeps existing entries readable.
+
+orjson, msgpack, zstandard and lz4 are optional: a missing serializer falls
+back to stdlib json, a missing compressor to zlib.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Optional, Union
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+HEADER_FLAG = 0x80
+HEADER_MASK = 0xC0
+
+# Serializers (bits 0-2)
+JSON = 1
+MSGPACK = 2
+
+# Compression (bits 3-5)
+NONE = 0
+ZLIB = 1
+ZSTD = 2
+LZ4 = 3
+
+SERIALIZERS = {'json': JSON, 'orjson': JSON, 'msgpack': MSGPACK}
+COMPRESSIONS = {'none': NONE, 'zlib': ZLIB, 'zstd': ZSTD, 'lz4': LZ4}
+
+
+class CacheCodecError(ValueError):
+    """A cached value cannot be decoded"""
+
+
+def _dumps_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _require(module, name: str):
+    if module is None:
+        raise CacheCodecError(f"Cached value needs {name}, which is not installed")
+    return module
+
+
+class CacheCodec:
+    """
+    Serializer plus optional compression, with a format header byte
+
+    Args:
+        serializer: 'orjson' (or 'json', the same format) or 'msgpack'
+        compression: 'zstd', 'lz4', 'zlib' or 'none'
+        min_compress_bytes: Smaller values are stored uncompressed
+        level: Compression level (default: the library's fast default)
+    """
+
+    def __init__(
+        self,
+        serializer: str = 'orjson',
+        compression: str = 'zstd',
+        min_compress_bytes: int = 1024,
+        level: Optional[int] = None
+    ):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self.serializer = SERIALIZERS[serializer]
+        if self.serializer == MSGPACK and msgpack is None:
+            logger.warning("msgpack is not installed, caching values as JSON")
+            self.serializer = JSON
+
+        self.compression = COMPRESSIONS[compression]
+        if (self.compression == ZSTD and zstandard is None) or (self.compression == LZ4 and lz4_frame is None):
+            logger.warning(f"{compression} is not installed, compressing cached values with zlib")
+            self.compression = ZLIB
+
+        self.min_compress_bytes = min_compress_bytes
+        self.level = level
+
+    @property
+    def name(self) -> str:
+        serializer = {JSON: 'orjson' if orjson is not None else 'json', MSGPACK: 'msgpack'}[self.serializer]
+        compression = {v: k for k, v in COMPRESSIONS.items()}[self.compression]
+        return f"{serializer}+{compression}"
+
+    def encode(self, value: Any) -> bytes:
+        """Header byte followed by the (possibly compressed) serialized value"""
+        if self.serializer == MSGPACK:
+            payload = msgpack.packb(value, use_bin_type=True)
+        else:
+            payload = _dumps_json(value)
+
+        compression = NONE
+        if self.compression != NONE and len(payload) >= self.min_compress_bytes:
+            compressed = self._compress(payload)
+            # Keep incompressible values (already compressed, short) as they are
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression = self.compression
+
+        return bytes((HEADER_FLAG | compression << 3 | self.serializer,)) + payload
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Decode a value written by any codec, or a legacy JSON string"""
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data or data[0] & HEADER_MASK != HEADER_FLAG:
+            return _loads_json(data)
+
+        header = data[0]
+        serializer = header & 0x07
+        payload = self._decompress((header >> 3) & 0x07, data[1:])
+
+        if serializer == JSON:
+            return _loads_json(payload)
+        if serializer == MSGPACK:
+            return _require(msgpack, 'msgpack').unpackb(payload, raw=False, strict_map_key=False)
+        raise CacheCodecError(f"Unknown cache serializer in header: {header:#x}")
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == ZSTD:
+            return zstandard.compress(payload, self.level or 3)
+        if self.compression == LZ4:
+            return lz4_frame.compress(payload, compression_level=self.level or 0)
+        return zlib.compress(payload, self.level or 1)
+
+    def _decompress(self, compression: int, payload: bytes) -> bytes:
+        if compression == NONE:
+            return payload
+        if compression == ZSTD:
+            return _require(zstandard, 'zstandard').decompress(payload)
+        if compression == LZ4:
+            return _require(lz4_frame, 'lz4').decompress(payload)
+        if compression == ZLIB:
+            return zlib.decompress(payload)
+        raise CacheCodecError(f"Unknown cache compression in header: {compression}")
+
+
+_default_codec: Optional[CacheCodec] = None
+
+
+def get_cache_codec() -> CacheCodec:
+    """Codec configured by the CACHE_SERIALIZER / CACHE_COMPRESSION settings"""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = CacheCodec(
+            serializer=settings.CACHE_SERIALIZER,
+            compression=settings.CACHE_COMPRESSION,
+            min_compress_bytes=settings.CACHE_COMPRESSION_MIN_BYTES
+        )
+    return _default_codec
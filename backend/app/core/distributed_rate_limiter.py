@@ -0,0 +1,260 @@
+"""
+Cluster-wide token buckets in Redis
+
+Scrapers and API clients run in several processes (API replicas, scheduler,
+Celery workers). Each process limiting itself lets them together exceed a
+site's politeness budget, so the budget lives in Redis instead: one token
+bucket per domain (or API), refilled and spent atomically by a Lua script.
+
+- Fast path: tokens are taken from Redis a few at a time (a lease) and
+  spent locally until they run out or the lease expires, so most requests
+  cost no round-trip. Unspent leased tokens are dropped, which only ever
+  errs on the polite side.
+- Fallback: when Redis is unreachable, acquire() reports it and the caller
+  uses its local limiter; Redis is retried after
+  RATE_LIMIT_REDIS_RETRY_SECONDS.
+
+Used through the RateLimiter classes of scrapers/base/rate_limiter.py,
+api_clients/base/rate_limiter.py and SmartScraper (pass key=...).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+import redis
+from redis.exceptions import RedisError
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from app.core.metrics import distributed_rate_limit_requests_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+KEY_PREFIX = 'ratelimit:bucket:'
+
+# KEYS[1]: bucket hash (tokens, ts)
+# ARGV: capacity, refill rate (tokens/second), tokens requested
+# Returns {tokens granted, seconds until a token is available (string)}
+TOKEN_BUCKET_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = math.min(requested, math.floor(tokens))
+local wait = 0
+if granted > 0 then
+    tokens = tokens - granted
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {granted, tostring(wait)}
+"""
+
+
+class RedisTokenBuckets:
+    """
+    Process-wide connection to the Redis token buckets
+
+    Thread-safe (the redis client pools connections). After a Redis error
+    every take() returns None without touching the network until the retry
+    interval has passed.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, retry_seconds: Optional[float] = None):
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.retry_seconds = (
+            retry_seconds if retry_seconds is not None else settings.RATE_LIMIT_REDIS_RETRY_SECONDS
+        )
+        self._client: Optional[redis.Redis] = None
+        self._script = None
+        self._unavailable_until = 0.0
+        self._lock = threading.Lock()
+
+    def _get_script(self):
+        if self._script is None:
+            with self._lock:
+                if self._script is None:
+                    self._client = redis.Redis.from_url(
+                        self.redis_url,
+                        socket_timeout=0.5,
+                        socket_connect_timeout=0.5
+                    )
+                    self._script = self._client.register_script(TOKEN_BUCKET_LUA)
+        return self._script
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def take(self, key: str, capacity: int, refill_rate: float, requested: int) -> Optional[Tuple[int, float]]:
+        """
+        Take up to `requested` tokens from a bucket
+
+        Returns:
+            (tokens granted, seconds to wait if none were) or None if Redis
+            is unavailable
+        """
+        if not self.available:
+            return None
+
+        try:
+            granted, wait = self._get_script()(
+                keys=[KEY_PREFIX + key],
+                args=[capacity, refill_rate, requested]
+            )
+            return int(granted), float(wait)
+        except (RedisError, OSError) as e:
+            self._unavailable_until = time.monotonic() + self.retry_seconds
+            logger.warning(
+                f"Redis rate limiter unavailable ({e}), limiting locally for {self.retry_seconds:.0f}s"
+            )
+            return None
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+
+class DistributedTokenBucket:
+    """
+    One rate limit shared by every process, with a local lease of tokens
+
+    acquire() / acquire_blocking() return True once a token was spent, or
+    False if Redis is unavailable (the caller then limits locally).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        max_requests: int,
+        time_window: float,
+        buckets: Optional[RedisTokenBuckets] = None
+    ):
+        """
+        Args:
+            key: Bucket name (domain or API), shared by all processes
+            max_requests: Bucket capacity (burst size)
+            time_window: Seconds to refill max_requests tokens
+            buckets: Redis connection (default: the process-wide one)
+        """
+        self.key = key
+        self.capacity = max(1, int(max_requests))
+        self.refill_rate = self.capacity / time_window if time_window > 0 else float(self.capacity)
+        # Small buckets are spent one token per round-trip, so a lease never
+        # holds a large share of a slow site's budget
+        self.lease_size = max(1, min(settings.RATE_LIMIT_LEASE_SIZE, self.capacity // 10))
+        self.lease_seconds = settings.RATE_LIMIT_LEASE_SECONDS
+        self._buckets = buckets
+        self._leased = 0
+        self._lease_expires = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def buckets(self) -> RedisTokenBuckets:
+        return self._buckets or get_redis_token_buckets()
+
+    def _spend_leased(self) -> bool:
+        with self._lock:
+            if self._leased > 0 and time.monotonic() < self._lease_expires:
+                self._leased -= 1
+                return True
+            self._leased = 0
+            return False
+
+    def _take(self) -> Optional[float]:
+        """
+        Lease tokens from Redis and spend one
+
+        Returns:
+            0 if a token was spent, seconds to wait before retrying, or None
+            if Redis is unavailable
+        """
+        result = self.buckets.take(self.key, self.capacity, self.refill_rate, self.lease_size)
+        if result is None:
+            self._record('fallback')
+            return None
+
+        granted, wait = result
+        if granted == 0:
+            self._record('throttled')
+            return max(wait, 0.001)
+
+        with self._lock:
+            self._leased += granted - 1
+            self._lease_expires = time.monotonic() + self.lease_seconds
+        self._record('granted')
+        return 0.0
+
+    def _record(self, result: str) -> None:
+        if METRICS_AVAILABLE:
+            distributed_rate_limit_requests_total.labels(key=self.key, result=result).inc()
+
+    async def acquire(self) -> bool:
+        """Wait for a cluster-wide token (False: Redis unavailable)"""
+        loop = asyncio.get_event_loop()
+        while True:
+            if self._spend_leased():
+                self._record('leased')
+                return True
+            wait = await loop.run_in_executor(None, self._take)
+            if wait is None:
+                return False
+            if wait == 0:
+                return True
+            logger.debug(f"Rate limit reached for {self.key}. Sleeping for {wait:.2f} seconds")
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> bool:
+        """acquire() for synchronous callers"""
+        while True:
+            if self._spend_leased():
+                self._record('leased')
+                return True
+            wait = self._take()
+            if wait is None:
+                return False
+            if wait == 0:
+                return True
+            logger.debug(f"Rate limit reached for {self.key}. Sleeping for {wait:.2f} seconds")
+            time.sleep(wait)
+
+
+_redis_token_buckets: Optional[RedisTokenBuckets] = None
+_redis_token_buckets_lock = threading.Lock()
+
+
+def get_redis_token_buckets() -> RedisTokenBuckets:
+    """Get the process-wide Redis token bucket connection"""
+    global _redis_token_buckets
+    if _redis_token_buckets is None:
+        with _redis_token_buckets_lock:
+            if _redis_token_buckets is None:
+                _redis_token_buckets = RedisTokenBuckets()
+    return _redis_token_buckets
+
+
+def create_token_bucket(key: Optional[str], max_requests: int, time_window: float) -> Optional[DistributedTokenBucket]:
+    """Cluster-wide bucket for a key, or None if distributed limiting is off"""
+    if not key or not settings.RATE_LIMIT_DISTRIBUTED:
+        return None
+    return DistributedTokenBucket(key, max_requests, time_window)
@@ -0,0 +1,245 @@
+"""
+Shared HTTP Transport
+
+Process-wide connection pools used by every scraper and API client, so
+TCP connections, TLS sessions and DNS lookups to the same news sites and
+open data APIs are reused across requests and scheduled scrape cycles.
+
+- Async: one aiohttp.ClientSession per event loop over a TCPConnector with
+  a global and per-host connection limit, keep-alive and a DNS cache
+- Sync: one requests.Session with pooled, retrying adapters (SmartScraper)
+
+Connection reuse, new connections (TLS handshakes for https) and DNS cache
+hits are counted per host and exported as Prometheus metrics.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from app.core.metrics import (
+        http_client_connections_total,
+        http_client_tls_handshakes_total,
+        http_client_dns_lookups_total
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Default headers of the sync session (shared by all SmartScraper sources)
+SYNC_SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'es-CO,es;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+class HTTPTransport:
+    """
+    Hands out shared, long-lived HTTP sessions
+
+    The async session carries no default headers: callers pass their own
+    (User-Agent, Authorization) per request. Callers must not close either
+    session.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: int = 300,
+        sync_retries: int = 3
+    ):
+        """
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            keepalive_timeout: Seconds an idle connection is kept for reuse
+            dns_cache_ttl: Seconds resolved addresses are cached
+            sync_retries: Retries of the sync session on connection errors and 429/5xx
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.sync_retries = sync_retries
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_lock = asyncio.Lock()
+        self._sync_session: Optional[requests.Session] = None
+        self._sync_lock = threading.Lock()
+
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'requests': 0, 'new_connections': 0, 'reused_connections': 0, 'tls_handshakes': 0}
+        )
+        self.dns_stats = {'hits': 0, 'misses': 0}
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session for the running event loop
+
+        A new session is created on first use, after close(), or when called
+        from a different event loop than the one the session was bound to.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return self._session
+
+        if self._session_loop is not loop:
+            # Locks bind to the loop that first waits on them
+            self._session_lock = asyncio.Lock()
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed or self._session_loop is not loop:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    enable_cleanup_closed=True
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    trace_configs=[self._trace_config()]
+                )
+                self._session_loop = loop
+                logger.info(
+                    f"Created shared HTTP session (limit={self.limit}, "
+                    f"per_host={self.limit_per_host}, dns_ttl={self.dns_cache_ttl}s)"
+                )
+
+        return self._session
+
+    def get_sync_session(self) -> requests.Session:
+        """Get the shared requests session (thread-safe for concurrent GETs)"""
+        if self._sync_session is None:
+            with self._sync_lock:
+                if self._sync_session is None:
+                    session = requests.Session()
+                    retry_strategy = Retry(
+                        total=self.sync_retries,
+                        backoff_factor=1,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=["HEAD", "GET", "OPTIONS"]
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=self.limit,
+                        pool_maxsize=self.limit_per_host,
+                        max_retries=retry_strategy
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers.update(SYNC_SESSION_HEADERS)
+                    self._sync_session = session
+
+        return self._sync_session
+
+    async def close(self) -> None:
+        """Close both sessions and their pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+        if self._sync_session is not None:
+            self._sync_session.close()
+            self._sync_session = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Connection statistics per host
+
+        Returns:
+            Requests, new and reused connections, TLS handshakes and
+            reuse ratio per host, plus DNS cache hits and misses
+        """
+        hosts = {}
+        for host, counts in self.stats.items():
+            connections = counts['new_connections'] + counts['reused_connections']
+            hosts[host] = {
+                **counts,
+                'reuse_ratio': round(counts['reused_connections'] / connections, 3) if connections else 0.0
+            }
+
+        return {
+            'hosts': hosts,
+            'dns_cache': dict(self.dns_stats),
+            'open_session': self._session is not None and not self._session.closed
+        }
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Count connection reuse, new connections and DNS cache use per host"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host or ''
+            ctx.secure = params.url.scheme == 'https'
+            self.stats[ctx.host]['requests'] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            host = getattr(ctx, 'host', '')
+            self.stats[host]['reused_connections'] += 1
+            if METRICS_AVAILABLE:
+                http_client_connections_total.labels(host=host, reused='true').inc()
+
+        async def on_connection_create_end(session, ctx, params):
+            host = getattr(ctx, 'host', '')
+            self.stats[host]['new_connections'] += 1
+            if METRICS_AVAILABLE:
+                http_client_connections_total.labels(host=host, reused='false').inc()
+
+            if getattr(ctx, 'secure', False):
+                self.stats[host]['tls_handshakes'] += 1
+                if METRICS_AVAILABLE:
+                    http_client_tls_handshakes_total.labels(host=host).inc()
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.dns_stats['hits'] += 1
+            if METRICS_AVAILABLE:
+                http_client_dns_lookups_total.labels(result='hit').inc()
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.dns_stats['misses'] += 1
+            if METRICS_AVAILABLE:
+                http_client_dns_lookups_total.labels(result='miss').inc()
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+
+# Global transport instance
+http_transport = HTTPTransport(
+    limit=settings.HTTP_POOL_LIMIT,
+    limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl=settings.HTTP_DNS_CACHE_TTL
+)
+
+
+def get_http_transport() -> HTTPTransport:
+    """Get the process-wide HTTP transport"""
+    return http_transport
@@ -89,6 +89,62 @@ scraper_errors_total = Counter(
     registry=registry
 )
 
+scraper_fetch_results_total = Counter(
+    'scraper_fetch_results_total',
+    'Article fetches by result (not_modified, unchanged, duplicate, changed, new)',
+    ['scraper_name', 'result'],
+    registry=registry
+)
+
+scraper_known_urls_skipped_total = Counter(
+    'scraper_known_urls_skipped_total',
+    'Article URLs skipped before fetching because they are already stored',
+    ['scraper_name'],
+    registry=registry
+)
+
+distributed_rate_limit_requests_total = Counter(
+    'distributed_rate_limit_requests_total',
+    'Cluster-wide rate limiter token requests by result (granted, leased, throttled, fallback)',
+    ['key', 'result'],
+    registry=registry
+)
+
+scraper_crawl_interval_minutes = Gauge(
+    'scraper_crawl_interval_minutes',
+    'Adaptive crawl interval of a source',
+    ['scraper_name'],
+    registry=registry
+)
+
+scraper_crawl_yield_total = Counter(
+    'scraper_crawl_yield_total',
+    'New articles per source, predicted by the rate estimate and actually found',
+    ['scraper_name', 'kind'],
+    registry=registry
+)
+
+http_client_connections_total = Counter(
+    'http_client_connections_total',
+    'Outbound HTTP connections used by the shared transport',
+    ['host', 'reused'],
+    registry=registry
+)
+
+http_client_tls_handshakes_total = Counter(
+    'http_client_tls_handshakes_total',
+    'TLS handshakes performed by the shared transport',
+    ['host'],
+    registry=registry
+)
+
+http_client_dns_lookups_total = Counter(
+    'http_client_dns_lookups_total',
+    'DNS lookups by the shared transport',
+    ['result'],
+    registry=registry
+)
+
 scraper_active = Gauge(
     'scraper_active_tasks',
     'Number of active scraper tasks',
@@ -122,6 +178,13 @@ db_query_duration_seconds = Histogram(
     registry=registry
 )
 
+db_upsert_rows_total = Counter(
+    'db_upsert_rows_total',
+    'Rows written by bulk upserts by result (inserted, updated, skipped, failed)',
+    ['table', 'result'],
+    registry=registry
+)
+
 db_query_errors_total = Counter(
     'db_query_errors_total',
     'Total database query errors',
@@ -148,6 +211,28 @@ nlp_documents_processed = Counter(
     registry=registry
 )
 
+ingestion_stage_items = Counter(
+    'ingestion_stage_items_total',
+    'Documents processed by each ingestion pipeline stage',
+    ['stage'],
+    registry=registry
+)
+
+ingestion_stage_duration_seconds = Histogram(
+    'ingestion_stage_duration_seconds',
+    'Time spent by an ingestion stage on one batch',
+    ['stage'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+    registry=registry
+)
+
+ingestion_queue_depth = Gauge(
+    'ingestion_queue_depth',
+    'Batches waiting in front of each ingestion stage',
+    ['stage'],
+    registry=registry
+)
+
 # ============================================================================
 # Cache Metrics
 # ============================================================================
@@ -174,6 +259,68 @@ cache_operation_duration_seconds = Histogram(
     registry=registry
 )
 
+cache_l1_hits_total = Counter(
+    'cache_l1_hits_total',
+    'In-process (L1) cache hits, served without Redis',
+    ['layer'],
+    registry=registry
+)
+
+cache_l1_misses_total = Counter(
+    'cache_l1_misses_total',
+    'In-process (L1) cache misses, passed on to Redis',
+    ['layer'],
+    registry=registry
+)
+
+cache_l1_get_duration_seconds = Histogram(
+    'cache_l1_get_duration_seconds',
+    'In-process (L1) cache hit duration in seconds',
+    ['layer'],
+    buckets=(0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005, 0.001),
+    registry=registry
+)
+
+cache_refresh_total = Counter(
+    'cache_refresh_total',
+    'Background refreshes of cached values (stale or XFetch early expiration)',
+    ['layer', 'reason'],
+    registry=registry
+)
+
+cache_coalesced_total = Counter(
+    'cache_coalesced_total',
+    'Cache misses that joined a fetch already in flight in the same process',
+    ['layer'],
+    registry=registry
+)
+
+nlp_result_cache_hits = Counter(
+    'nlp_result_cache_hits_total',
+    'NLP batch result cache hits',
+    ['tier', 'task_type'],
+    registry=registry
+)
+
+nlp_result_cache_misses = Counter(
+    'nlp_result_cache_misses_total',
+    'NLP batch result cache misses (both tiers)',
+    ['task_type'],
+    registry=registry
+)
+
+nlp_result_cache_evictions = Counter(
+    'nlp_result_cache_evictions_total',
+    'NLP batch result cache LRU evictions',
+    registry=registry
+)
+
+nlp_result_cache_bytes = Gauge(
+    'nlp_result_cache_bytes',
+    'Approximate size of the in-process NLP result cache in bytes',
+    registry=registry
+)
+
 # ============================================================================
 # Task Queue Metrics
 # ============================================================================
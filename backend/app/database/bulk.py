@@ -0,0 +1,289 @@
+"""
+Bulk upsert of scraped articles and their analyses
+
+Storing a scrape with one session.add() per article costs a round-trip per
+row, and one duplicate source_url or content_hash fails the whole commit.
+Here each chunk of articles is a single multi-row
+INSERT ... ON CONFLICT ... RETURNING id (PostgreSQL, and SQLite 3.35+
+through the same SQLAlchemy constructs):
+
+- SKIP (default): ON CONFLICT DO NOTHING on any unique column; returned
+  rows were inserted, the others already existed
+- UPDATE: ON CONFLICT (source_url) DO UPDATE of the content when its
+  content_hash changed; unchanged articles are skipped
+
+Analyses of the stored articles follow as one multi-row INSERT per chunk,
+so a 50-article scrape takes one or two round-trips. If a chunk still
+fails (e.g. an updated article now has the content_hash of another URL),
+the session is rolled back and every row is retried under its own
+savepoint, so call it on a session without other pending work.
+
+These Core statements bypass ORM flush events, so the source URLs of stored
+articles are collected in session.info[STORED_URLS] until the session
+commits; callbacks registered with on_stored_commit() then receive them
+(the URL index adds them, the fetch state store keeps their validators).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
+
+from sqlalchemy import JSON, event, func, literal_column, null, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config.settings import settings
+from .models import ContentAnalysis, ScrapedContent
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from ..core.metrics import db_upsert_rows_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Conflict handling
+SKIP = 'skip'
+UPDATE = 'update'
+
+# session.info key: source URLs stored since the last commit or rollback
+STORED_URLS = 'bulk_stored_source_urls'
+
+# Called with the source URLs a session stored, once it commits
+_commit_callbacks: List[Callable[[Set[str]], Any]] = []
+
+_CONTENT_TABLE = ScrapedContent.__table__
+_ANALYSIS_TABLE = ContentAnalysis.__table__
+
+# Columns refreshed by UPDATE (first-seen time and URL stay)
+_UPDATE_COLUMNS = [
+    column.key for column in _CONTENT_TABLE.columns
+    if column.key not in ('id', 'source_url', 'scraped_at', 'updated_at')
+]
+
+Article = Union[ScrapedContent, Mapping[str, Any]]
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of a bulk upsert"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0  # Already stored (or unchanged with UPDATE), or repeated in the input
+    failed: int = 0
+    ids: Dict[str, int] = field(default_factory=dict)  # source_url -> id of inserted/updated rows
+
+    @property
+    def stored(self) -> int:
+        return self.inserted + self.updated
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'skipped': self.skipped,
+            'failed': self.failed
+        }
+
+
+def _row(table, values: Union[Any, Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Values for every column of a table from a mapping or ORM instance
+
+    Multi-row VALUES need the same columns in every row, so missing values
+    take the column default (scalars, or SQL such as now()) or NULL (SQL
+    NULL rather than JSON null for JSON columns, as the ORM would store).
+    """
+    row = {}
+    for column in table.columns:
+        if column.primary_key:
+            continue
+        if isinstance(values, Mapping):
+            value = values.get(column.key)
+        else:
+            value = getattr(values, column.key, None)
+        if value is None and column.default is not None and not column.default.is_callable:
+            value = column.default.arg
+        elif value is None and isinstance(column.type, JSON):
+            value = null()
+        row[column.key] = value
+    return row
+
+
+def _insert_construct(session: Session):
+    """Dialect-specific insert() with ON CONFLICT support"""
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert
+    if dialect == 'sqlite':
+        return sqlite.insert
+    raise ValueError(f"Bulk upsert is not supported on {dialect}")
+
+
+def upsert_scraped_content(
+    session: Session,
+    articles: Sequence[Article],
+    analyses: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+    on_conflict: str = SKIP,
+    chunk_size: Optional[int] = None
+) -> UpsertResult:
+    """
+    Insert articles (and analyses of the stored ones) in multi-row chunks
+
+    Does not commit.
+
+    Args:
+        session: Synchronous session (see upsert_scraped_content_async)
+        articles: ScrapedContent instances or column mappings
+        analyses: ContentAnalysis columns per article (None for none),
+            stored with the content_id of the article they belong to
+        on_conflict: SKIP existing articles, or UPDATE changed ones
+        chunk_size: Rows per statement (default: DB_BULK_CHUNK_SIZE)
+
+    Returns:
+        Counts of inserted, updated, skipped and failed articles
+    """
+    if on_conflict not in (SKIP, UPDATE):
+        raise ValueError(f"Unknown conflict handling: {on_conflict}")
+
+    chunk_size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+    analyses = list(analyses) if analyses is not None else [None] * len(articles)
+    result = UpsertResult()
+
+    # Repeats within the input would hit their own rows (an error for DO UPDATE)
+    rows, row_analyses = [], []
+    seen_urls, seen_hashes = set(), set()
+    for article, analysis in zip(articles, analyses):
+        row = _row(_CONTENT_TABLE, article)
+        if row['source_url'] in seen_urls or (row['content_hash'] and row['content_hash'] in seen_hashes):
+            result.skipped += 1
+            continue
+        seen_urls.add(row['source_url'])
+        if row['content_hash']:
+            seen_hashes.add(row['content_hash'])
+        rows.append(row)
+        row_analyses.append(analysis)
+
+    insert = _insert_construct(session)
+    try:
+        for start in range(0, len(rows), chunk_size):
+            _upsert_chunk(
+                session, insert, rows[start:start + chunk_size],
+                row_analyses[start:start + chunk_size], on_conflict, result
+            )
+    except SQLAlchemyError as e:
+        logger.warning(f"Bulk upsert of {len(rows)} articles failed, retrying per row: {e}")
+        session.rollback()
+        skipped = result.skipped
+        result = UpsertResult(skipped=skipped)
+        for row, analysis in zip(rows, row_analyses):
+            try:
+                with session.begin_nested():
+                    _upsert_chunk(session, insert, [row], [analysis], on_conflict, result)
+            except SQLAlchemyError as e:
+                logger.error(f"Error storing article {row['source_url']}: {e}")
+                result.failed += 1
+
+    session.info.setdefault(STORED_URLS, set()).update(result.ids)
+
+    if METRICS_AVAILABLE:
+        for outcome, count in result.to_dict().items():
+            if count:
+                db_upsert_rows_total.labels(table=_CONTENT_TABLE.name, result=outcome).inc(count)
+
+    return result
+
+
+def _upsert_chunk(
+    session: Session,
+    insert,
+    rows: List[Dict[str, Any]],
+    analyses: List[Optional[Mapping[str, Any]]],
+    on_conflict: str,
+    result: UpsertResult
+) -> None:
+    """One INSERT ... ON CONFLICT ... RETURNING for the articles, one INSERT for their analyses"""
+    table = _CONTENT_TABLE
+    stmt = insert(table).values(rows)
+    returning = [table.c.id, table.c.source_url]
+    existing_urls = set()
+
+    if on_conflict == UPDATE:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.source_url],
+            set_={
+                **{key: stmt.excluded[key] for key in _UPDATE_COLUMNS},
+                'updated_at': func.now()
+            },
+            where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        )
+        if session.get_bind().dialect.name == 'postgresql':
+            # xmax is 0 for a freshly inserted row version
+            returning.append(literal_column('(xmax = 0)').label('inserted'))
+        else:
+            existing_urls = set(session.execute(
+                select(table.c.source_url).where(table.c.source_url.in_([row['source_url'] for row in rows]))
+            ).scalars())
+    else:
+        stmt = stmt.on_conflict_do_nothing()
+
+    stored = {}
+    for returned in session.execute(stmt.returning(*returning)):
+        stored[returned.source_url] = returned.id
+        if getattr(returned, 'inserted', returned.source_url not in existing_urls):
+            result.inserted += 1
+        else:
+            result.updated += 1
+
+    result.skipped += len(rows) - len(stored)
+
+    analysis_rows = [
+        {**_row(_ANALYSIS_TABLE, analysis), 'content_id': stored[row['source_url']]}
+        for row, analysis in zip(rows, analyses)
+        if analysis and row['source_url'] in stored
+    ]
+    if analysis_rows:
+        session.execute(insert(_ANALYSIS_TABLE).values(analysis_rows))
+    result.ids.update(stored)
+
+
+def on_stored_commit(callback: Callable[[Set[str]], Any]) -> None:
+    """
+    Call callback(urls) with the source URLs a session upserted once it commits
+
+    URLs of a rolled back session are dropped. A failing callback is logged
+    and does not affect the commit or the other callbacks.
+    """
+    if not _commit_callbacks:
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_rollback', _after_rollback)
+    _commit_callbacks.append(callback)
+
+
+def _after_commit(session: Session) -> None:
+    urls = session.info.pop(STORED_URLS, None)
+    if not urls:
+        return
+    for callback in list(_commit_callbacks):
+        try:
+            callback(urls)
+        except Exception as e:
+            logger.error(f"Stored URL callback {callback!r} failed: {e}")
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(STORED_URLS, None)
+
+
+async def upsert_scraped_content_async(
+    session: AsyncSession,
+    articles: Sequence[Article],
+    **kwargs
+) -> UpsertResult:
+    """upsert_scraped_content() on an AsyncSession (same arguments)"""
+    return await session.run_sync(upsert_scraped_content, articles, **kwargs)
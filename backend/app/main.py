@@ -14,6 +14,7 @@ from typing import Dict, Any
 from app.api import scraping, analysis, auth, preferences, health, avatar
 # Disabled for Phase 1: language, scheduler, analysis_batch, notifications, cache_admin, search, export
 from app.database.connection import init_db, close_db, get_pool_status
+from app.core.http_transport import http_transport
 from app.database.health import database_health_check, database_stats, pool_performance_test
 # Disabled for Phase 1: from app.services.scheduler import start_scheduler, stop_scheduler
 from app.search.elasticsearch_client import get_elasticsearch_client
@@ -82,6 +83,9 @@ async def lifespan(app: FastAPI):
     logger.info("Disconnecting Redis cache...")
     await cache_manager.disconnect()
 
+    # Close pooled scraper/API client connections
+    await http_transport.close()
+
     await close_db()
     logger.info("Platform shutdown complete")
 
@@ -9,16 +9,60 @@ Implements:
 """
 
 import hashlib
-import json
-from typing import Callable, Optional, Set
-from datetime import datetime, timedelta
+import struct
+from typing import AsyncIterator, Callable, List, NamedTuple, Optional, Set, Tuple
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.datastructures import Headers
+from starlette.responses import StreamingResponse
 from loguru import logger
 
 from app.core.cache import cache_manager
+from app.middleware.compression import STREAMING_TYPES
+
+
+# Cached response: magic, status code, lengths of ETag / Content-Type /
+# Content-Encoding, then those strings and the body bytes as sent
+ENTRY_MAGIC = b"HC1"
+ENTRY_HEADER = struct.Struct("!3sHBBB")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    etag: str
+    content_type: str
+    content_encoding: str
+    body: bytes
+
+
+def pack_response(entry: CachedResponse) -> bytes:
+    """Compact binary record of a response (body stored as is)"""
+    etag = entry.etag.encode("latin-1")
+    content_type = entry.content_type.encode("latin-1")
+    content_encoding = entry.content_encoding.encode("latin-1")
+    return b"".join((
+        ENTRY_HEADER.pack(ENTRY_MAGIC, entry.status_code, len(etag), len(content_type), len(content_encoding)),
+        etag,
+        content_type,
+        content_encoding,
+        entry.body
+    ))
+
+
+def unpack_response(data: bytes) -> Optional[CachedResponse]:
+    """Parse pack_response() output (None for entries in another format)"""
+    if not data or not data.startswith(ENTRY_MAGIC) or len(data) < ENTRY_HEADER.size:
+        return None
+
+    _, status_code, etag_len, type_len, encoding_len = ENTRY_HEADER.unpack_from(data)
+    offset = ENTRY_HEADER.size
+    fields = []
+    for length in (etag_len, type_len, encoding_len):
+        fields.append(data[offset:offset + length].decode("latin-1"))
+        offset += length
+
+    return CachedResponse(status_code, *fields, data[offset:])
 
 
 class CacheMiddleware(BaseHTTPMiddleware):
@@ -31,6 +75,11 @@ class CacheMiddleware(BaseHTTPMiddleware):
     - 304 Not Modified responses
     - Configurable per-endpoint caching
     - Bypass for authenticated requests
+
+    Bodies are cached as raw bytes in the encoding CompressionMiddleware
+    (inside this one) produced for the client's Accept-Encoding, so hits
+    are sent without decoding, re-encoding or recompressing. Streaming
+    responses and bodies above MAX_CACHEABLE_BYTES pass through unbuffered.
     """
 
     # Endpoints to cache (method, path_prefix)
@@ -53,6 +102,9 @@ class CacheMiddleware(BaseHTTPMiddleware):
         "/health": 60,  # 1 minute
     }
 
+    # Larger responses are streamed through instead of buffered and cached
+    MAX_CACHEABLE_BYTES = 8 * 1024 * 1024
+
     def __init__(self, app, enabled: bool = True):
         super().__init__(app)
         self.enabled = enabled
@@ -77,86 +129,137 @@ class CacheMiddleware(BaseHTTPMiddleware):
         if not cache_config:
             return await call_next(request)
 
-        # Generate cache key from request
-        cache_key = self._generate_cache_key(request)
+        # Generate cache key from request (one entry per content encoding)
+        encoding = self._negotiated_encoding(request)
+        cache_key = self._generate_cache_key(request, encoding)
 
         # Check for conditional request (If-None-Match)
         client_etag = request.headers.get("if-none-match")
 
         # Try to get cached response
-        cached_data = await cache_manager.get(
+        cached = unpack_response(await cache_manager.get_bytes(
             layer="http_response",
             identifier=cache_key
-        )
-
-        if cached_data:
-            cached_etag = cached_data.get("etag")
+        ))
 
+        if cached:
             # Check if client has current version
-            if client_etag and client_etag == cached_etag:
+            if client_etag and client_etag == cached.etag:
                 logger.debug(f"HTTP Cache HIT (304): {request.url.path}")
                 return Response(
                     status_code=304,
                     headers={
-                        "ETag": cached_etag,
+                        "ETag": cached.etag,
                         "Cache-Control": f"public, max-age={cache_config['duration']}"
                     }
                 )
 
-            # Return cached response
+            # Return cached response (body bytes exactly as first sent)
             logger.debug(f"HTTP Cache HIT (200): {request.url.path}")
+            headers = {
+                "Content-Type": cached.content_type,
+                "ETag": cached.etag,
+                "Cache-Control": f"public, max-age={cache_config['duration']}",
+                "Vary": "Accept-Encoding",
+                "X-Cache": "HIT"
+            }
+            if cached.content_encoding:
+                headers["Content-Encoding"] = cached.content_encoding
             return Response(
-                content=cached_data["body"],
-                status_code=cached_data["status_code"],
-                headers={
-                    "Content-Type": cached_data["content_type"],
-                    "ETag": cached_etag,
-                    "Cache-Control": f"public, max-age={cache_config['duration']}",
-                    "X-Cache": "HIT"
-                }
+                content=cached.body,
+                status_code=cached.status_code,
+                headers=headers
             )
 
         # Cache miss - process request
         logger.debug(f"HTTP Cache MISS: {request.url.path}")
         response = await call_next(request)
 
-        # Only cache successful responses
-        if response.status_code == 200:
-            # Read response body
-            body = b""
-            async for chunk in response.body_iterator:
-                body += chunk
-
-            # Generate ETag from body
-            etag = self._generate_etag(body)
-
-            # Cache response
-            await cache_manager.set(
-                layer="http_response",
-                identifier=cache_key,
-                value={
-                    "body": body.decode("utf-8"),
-                    "status_code": response.status_code,
-                    "content_type": response.headers.get("content-type", "application/json"),
-                    "etag": etag,
-                    "cached_at": datetime.utcnow().isoformat()
-                },
-                ttl=cache_config["duration"]
-            )
+        # Only cache successful, complete (non-streaming) responses
+        if response.status_code != 200 or self._is_streaming(response):
+            return response
 
-            # Return response with cache headers
-            return Response(
-                content=body,
+        chunks, complete = await self._read_body(response)
+        if not complete:
+            # Too large: send what was read and stream the rest
+            return StreamingResponse(
+                self._replay(chunks, response.body_iterator),
                 status_code=response.status_code,
-                headers={
-                    **dict(response.headers),
-                    "ETag": etag,
-                    "Cache-Control": f"public, max-age={cache_config['duration']}",
-                    "X-Cache": "MISS"
-                }
+                headers=dict(response.headers)
             )
 
-        return response
+        body = b"".join(chunks)
+
+        # Generate ETag from body
+        etag = self._generate_etag(body)
+
+        # Cache response
+        await cache_manager.set_bytes(
+            layer="http_response",
+            identifier=cache_key,
+            data=pack_response(CachedResponse(
+                status_code=response.status_code,
+                etag=etag,
+                content_type=response.headers.get("content-type", "application/json"),
+                content_encoding=response.headers.get("content-encoding", ""),
+                body=body
+            )),
+            ttl=cache_config["duration"]
+        )
+
+        # Return response with cache headers
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers={
+                **dict(response.headers),
+                "ETag": etag,
+                "Cache-Control": f"public, max-age={cache_config['duration']}",
+                "X-Cache": "MISS"
+            }
+        )
+
+    def _is_streaming(self, response: Response) -> bool:
+        """Streaming media types and bodies known to exceed MAX_CACHEABLE_BYTES"""
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        if content_type in STREAMING_TYPES:
+            return True
+        content_length = response.headers.get("content-length")
+        return bool(content_length and content_length.isdigit() and int(content_length) > self.MAX_CACHEABLE_BYTES)
+
+    async def _read_body(self, response: Response) -> Tuple[List[bytes], bool]:
+        """
+        Collect body chunks up to MAX_CACHEABLE_BYTES
+
+        Returns:
+            (chunks read, whether that was the whole body)
+        """
+        chunks = []
+        size = 0
+        async for chunk in response.body_iterator:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.MAX_CACHEABLE_BYTES:
+                return chunks, False
+        return chunks, True
+
+    @staticmethod
+    async def _replay(chunks: List[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+        async for chunk in rest:
+            yield chunk
+
+    def _negotiated_encoding(self, request: Request) -> str:
+        """Content encoding CompressionMiddleware picks for the request"""
+        accept_encoding = request.headers.get("accept-encoding", "").lower()
+        if "br" in accept_encoding:
+            return "br"
+        if "gzip" in accept_encoding:
+            return "gzip"
+        return ""
 
     def _is_cacheable_endpoint(self, request: Request) -> bool:
         """Check if endpoint is cacheable"""
@@ -190,7 +293,7 @@ class CacheMiddleware(BaseHTTPMiddleware):
             "pattern": path
         }
 
-    def _generate_cache_key(self, request: Request) -> str:
+    def _generate_cache_key(self, request: Request, encoding: str = "") -> str:
         """
         Generate cache key from request
 
@@ -198,11 +301,13 @@ class CacheMiddleware(BaseHTTPMiddleware):
         - Path
         - Query parameters
         - Accept header
+        - Negotiated content encoding
         """
         components = [
             request.url.path,
             str(sorted(request.query_params.items())),
-            request.headers.get("accept", "")
+            request.headers.get("accept", ""),
+            encoding
         ]
 
         key_str = "|".join(components)
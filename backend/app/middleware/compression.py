@@ -67,6 +67,13 @@ SKIP_COMPRESSION_TYPES: Set[str] = {
     "application/octet-stream",
 }
 
+# MIME types sent incrementally (never buffered by compression or caching)
+STREAMING_TYPES: Set[str] = {
+    "text/event-stream",
+    "application/x-ndjson",
+    "application/stream+json",
+}
+
 
 class CompressionMiddleware(BaseHTTPMiddleware):
     """
@@ -132,21 +139,22 @@ class CompressionMiddleware(BaseHTTPMiddleware):
         # Get response
         response = await call_next(request)
 
-        # Skip compression if no method supported or already compressed
-        if not compression_method or self._is_already_compressed(response):
+        # Skip compression if no method supported, already compressed or streaming
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        if not compression_method or self._is_already_compressed(response) or content_type in STREAMING_TYPES:
             return response
 
         # Get response body
-        response_body = b""
+        chunks = []
         async for chunk in response.body_iterator:
-            response_body += chunk
+            chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+        response_body = b"".join(chunks)
 
         # Check if response is large enough to compress
         if len(response_body) < self.min_size:
             return self._create_response(response, response_body)
 
         # Check if content type is compressible
-        content_type = response.headers.get("content-type", "").split(";")[0].strip()
         if not self._should_compress(content_type):
             return self._create_response(response, response_body)
 
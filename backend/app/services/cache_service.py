@@ -3,6 +3,7 @@ Cache Service for Cache Invalidation and Management
 
 Provides:
 - Intelligent cache invalidation strategies
+- Tag-based invalidation (entries cached with article/source tags)
 - Pattern-based invalidation
 - Time-based expiration
 - Manual cache clearing
@@ -13,7 +14,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from loguru import logger
 
-from app.core.cache import cache_manager
+from app.core.cache import article_tag, cache_manager, source_tag
 
 
 class CacheInvalidationService:
@@ -35,8 +36,7 @@ class CacheInvalidationService:
         Cascade invalidation:
         - Article details
         - Article list (containing this article)
-        - Related analytics
-        - NLP analysis results
+        - Entries tagged with the article (analytics, NLP results)
         """
         results = {}
 
@@ -49,15 +49,8 @@ class CacheInvalidationService:
         # Article lists (invalidate all to ensure consistency)
         results["article_lists"] = await cache_manager.invalidate_layer("article")
 
-        # Related analytics
-        results["analytics"] = await cache_manager.delete_pattern(
-            f"analytics:v1:*article_{article_id}*"
-        )
-
-        # NLP analysis
-        results["nlp_analysis"] = await cache_manager.delete_pattern(
-            f"nlp:v1:*{article_id}*"
-        )
+        # Analytics, NLP results and lists tagged with the article
+        results["tagged"] = await cache_manager.invalidate_tags([article_tag(article_id)])
 
         logger.info(f"Invalidated article cache for ID {article_id}: {results}")
         return results
@@ -72,20 +65,8 @@ class CacheInvalidationService:
         """
         results = {}
 
-        # Source configuration cache
-        results["source_config"] = await cache_manager.delete_pattern(
-            f"source:v1:*{source_name}*"
-        )
-
-        # Articles from this source
-        results["source_articles"] = await cache_manager.delete_pattern(
-            f"article:v1:*source_{source_name}*"
-        )
-
-        # HTTP responses for this source
-        results["http_responses"] = await cache_manager.delete_pattern(
-            f"http_response:v1:*source={source_name}*"
-        )
+        # Source configuration, its articles and HTTP responses tagged with it
+        results["tagged"] = await cache_manager.invalidate_tags([source_tag(source_name)])
 
         logger.info(f"Invalidated source cache for '{source_name}': {results}")
         return results
@@ -0,0 +1,324 @@
+"""
+Adaptive crawl intervals per source
+
+Sources publish at very different rates - a national daily posts several
+articles an hour, a regional outlet a few a day - yet each priority tier
+scrapes all of its sources at one fixed interval. Here the number of new
+articles a run finds is treated as a Poisson sample of the source's
+publication rate over the time since its previous run. The rate is an
+exponentially weighted estimate: articles and elapsed hours are both
+decayed with a half-life, so recent runs dominate and the estimate follows
+news cycles.
+
+The next interval is the time the source needs to publish
+SCRAPER_SCHEDULE_TARGET_ARTICLES new articles at that rate, clamped to the
+tier's min/max interval. Fast sources are scraped more often (fresher),
+quiet ones less (fewer fetches). Every run also records the yield the
+estimate predicted, so predicted and actual yield can be compared.
+
+State is persisted to a small SQLite file, one row per source.
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config.settings import settings
+from app.config.scheduler_config import SCRAPER_TIERS
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from app.core.metrics import scraper_crawl_interval_minutes, scraper_crawl_yield_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_schedule (
+    source TEXT PRIMARY KEY,
+    tier TEXT NOT NULL,
+    interval_minutes REAL NOT NULL,
+    weighted_articles REAL NOT NULL,
+    weighted_hours REAL NOT NULL,
+    last_run REAL NOT NULL,
+    runs INTEGER NOT NULL,
+    predicted_articles REAL NOT NULL,
+    actual_articles INTEGER NOT NULL,
+    last_predicted REAL NOT NULL,
+    last_actual INTEGER NOT NULL
+)
+"""
+
+
+@dataclass
+class SourceSchedule:
+    """Publication rate estimate and crawl interval of a source"""
+    source: str
+    tier: str
+    interval_minutes: float
+    weighted_articles: float  # Decayed count of new articles found
+    weighted_hours: float  # Decayed hours those articles were published in
+    last_run: float = 0.0  # Time of the last successful run
+    runs: int = 0
+    predicted_articles: float = 0.0  # Sum of predicted yields (runs with a known gap)
+    actual_articles: int = 0  # Sum of actual yields of the same runs
+    last_predicted: float = 0.0
+    last_actual: int = 0
+
+    @property
+    def rate_per_hour(self) -> float:
+        """Estimated new articles per hour"""
+        return self.weighted_articles / self.weighted_hours if self.weighted_hours > 0 else 0.0
+
+
+def tier_bounds(tier: str) -> tuple:
+    """(default, min, max) interval in minutes of a tier"""
+    config = SCRAPER_TIERS.get(tier, SCRAPER_TIERS['medium'])
+    interval = config['interval_minutes']
+    return (
+        interval,
+        config.get('min_interval_minutes', interval),
+        config.get('max_interval_minutes', interval)
+    )
+
+
+class CrawlSchedule:
+    """
+    SQLite-backed SourceSchedule per source
+
+    Thread-safe; all rows are loaded on first use and a source's row is
+    written after each of its runs.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        target_articles: float = 3.0,
+        half_life_hours: float = 48.0
+    ):
+        """
+        Args:
+            path: SQLite file (None keeps state in memory only)
+            target_articles: New articles a run should find on average
+            half_life_hours: Age at which a run counts half in the estimate
+        """
+        self.path = path
+        self.target_articles = target_articles
+        self.half_life_hours = half_life_hours
+
+        self._schedules: Dict[str, SourceSchedule] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file on first use"""
+        if self.path is None:
+            return None
+
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+        return self._conn
+
+    def _load(self) -> None:
+        """Load all stored schedules into memory"""
+        if self._loaded:
+            return
+
+        self._loaded = True
+        try:
+            conn = self._connection()
+            if conn is None:
+                return
+            rows = conn.execute(
+                "SELECT source, tier, interval_minutes, weighted_articles, weighted_hours, last_run, runs, "
+                "predicted_articles, actual_articles, last_predicted, last_actual FROM crawl_schedule"
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Crawl schedule store unavailable, keeping schedules in memory: {e}")
+            self.path = None
+            return
+
+        for row in rows:
+            self._schedules[row[0]] = SourceSchedule(*row)
+
+        logger.debug(f"Loaded crawl schedules for {len(rows)} sources")
+
+    def _save(self, schedule: SourceSchedule) -> None:
+        try:
+            conn = self._connection()
+            if conn is None:
+                return
+            row = asdict(schedule)
+            with conn:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO crawl_schedule ({', '.join(row)}) "
+                    f"VALUES ({', '.join('?' * len(row))})",
+                    tuple(row.values())
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist crawl schedule of {schedule.source}: {e}")
+
+    def get(self, source: str, tier: str = 'medium', start_minutes: Optional[float] = None) -> SourceSchedule:
+        """
+        Get the schedule of a source
+
+        A source seen for the first time starts at start_minutes (default:
+        its tier interval), with a prior worth one run of target_articles
+        per that interval.
+        """
+        with self._lock:
+            self._load()
+            schedule = self._schedules.get(source)
+
+            if schedule is None:
+                interval = start_minutes or tier_bounds(tier)[0]
+                schedule = self._schedules[source] = SourceSchedule(
+                    source=source,
+                    tier=tier,
+                    interval_minutes=float(interval),
+                    weighted_articles=self.target_articles,
+                    weighted_hours=interval / 60
+                )
+            elif schedule.tier != tier:
+                # Source moved to another tier: keep the estimate, apply its bounds
+                schedule.tier = tier
+                schedule.interval_minutes = self._interval(schedule)
+
+            return schedule
+
+    def interval_minutes(self, source: str, tier: str = 'medium', start_minutes: Optional[float] = None) -> float:
+        """Current crawl interval of a source"""
+        return self.get(source, tier, start_minutes).interval_minutes
+
+    def _interval(self, schedule: SourceSchedule) -> float:
+        """Minutes to accumulate target_articles at the estimated rate, within the tier bounds"""
+        _, min_minutes, max_minutes = tier_bounds(schedule.tier)
+        rate = schedule.rate_per_hour
+        minutes = self.target_articles / rate * 60 if rate > 0 else max_minutes
+        return float(min(max(minutes, min_minutes), max_minutes))
+
+    def record_run(
+        self,
+        source: str,
+        new_articles: int,
+        tier: str = 'medium',
+        now: Optional[float] = None,
+        start_minutes: Optional[float] = None
+    ) -> SourceSchedule:
+        """
+        Update the rate estimate with a successful run and set the next interval
+
+        The first run of a source only sets the clock: a listing holds
+        everything published before it, which says nothing about the rate.
+
+        Args:
+            source: Source name
+            new_articles: New articles the run found
+            tier: Priority tier of the source
+            now: Run time (default: current time)
+            start_minutes: Starting interval of a new source (see get())
+
+        Returns:
+            The updated schedule
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            schedule = self.get(source, tier, start_minutes)
+
+            if schedule.last_run:
+                hours = max(now - schedule.last_run, 0.0) / 3600
+                predicted = schedule.rate_per_hour * hours
+                decay = math.pow(0.5, hours / self.half_life_hours)
+
+                schedule.weighted_articles = schedule.weighted_articles * decay + new_articles
+                schedule.weighted_hours = schedule.weighted_hours * decay + hours
+                schedule.predicted_articles += predicted
+                schedule.actual_articles += new_articles
+                schedule.last_predicted = predicted
+
+                if METRICS_AVAILABLE:
+                    scraper_crawl_yield_total.labels(scraper_name=source, kind='predicted').inc(predicted)
+                    scraper_crawl_yield_total.labels(scraper_name=source, kind='actual').inc(new_articles)
+
+            schedule.last_actual = new_articles
+            schedule.last_run = now
+            schedule.runs += 1
+            schedule.interval_minutes = self._interval(schedule)
+            self._save(schedule)
+
+        if METRICS_AVAILABLE:
+            scraper_crawl_interval_minutes.labels(scraper_name=source).set(schedule.interval_minutes)
+
+        logger.debug(
+            f"{source}: {new_articles} new articles, {schedule.rate_per_hour:.2f}/h, "
+            f"next run in {schedule.interval_minutes:.0f} minutes"
+        )
+        return schedule
+
+    def get_statistics(self, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Rate estimate, interval and predicted vs actual yield per source
+
+        Args:
+            source: Only this source (all sources if None)
+        """
+        with self._lock:
+            self._load()
+            if source:
+                schedules = [self._schedules[source]] if source in self._schedules else []
+            else:
+                schedules = list(self._schedules.values())
+
+            report = {}
+            for schedule in schedules:
+                default_minutes = tier_bounds(schedule.tier)[0]
+                report[schedule.source] = {
+                    'tier': schedule.tier,
+                    'rate_per_hour': round(schedule.rate_per_hour, 3),
+                    'interval_minutes': round(schedule.interval_minutes, 1),
+                    'tier_interval_minutes': default_minutes,
+                    # Runs per day relative to the fixed tier interval
+                    'fetch_ratio': round(default_minutes / schedule.interval_minutes, 3),
+                    # An article waits half an interval on average before it is scraped
+                    'expected_delay_minutes': round(schedule.interval_minutes / 2, 1),
+                    'runs': schedule.runs,
+                    'predicted_articles': round(schedule.predicted_articles, 1),
+                    'actual_articles': schedule.actual_articles,
+                    'last_predicted': round(schedule.last_predicted, 1),
+                    'last_actual': schedule.last_actual,
+                    'last_run': schedule.last_run or None
+                }
+
+            return report
+
+
+_crawl_schedule: Optional[CrawlSchedule] = None
+_crawl_schedule_lock = threading.Lock()
+
+
+def get_crawl_schedule() -> CrawlSchedule:
+    """Get the process-wide crawl schedule"""
+    global _crawl_schedule
+    if _crawl_schedule is None:
+        with _crawl_schedule_lock:
+            if _crawl_schedule is None:
+                _crawl_schedule = CrawlSchedule(
+                    path=settings.SCRAPER_SCHEDULE_STATE_PATH,
+                    target_articles=settings.SCRAPER_SCHEDULE_TARGET_ARTICLES,
+                    half_life_hours=settings.SCRAPER_SCHEDULE_HALF_LIFE_HOURS
+                )
+    return _crawl_schedule
@@ -22,6 +22,7 @@ from app.services.scheduler_jobs import (
     get_scheduler_metrics, cleanup_old_executions
 )
 from app.services.notification_scheduler_jobs import NOTIFICATION_JOBS
+from app.services.topic_model_jobs import TOPIC_MODEL_JOBS
 from app.core.scheduler_db import (
     get_db_manager, initialize_scheduler_database,
     scheduler_db_health_check
@@ -99,6 +100,10 @@ class SchedulerService:
                 self.scheduler.add_job(**job_config)
             logger.info(f"Registered {len(NOTIFICATION_JOBS)} notification jobs")
 
+            # Set up incremental topic model updates
+            for job_config in TOPIC_MODEL_JOBS:
+                self.scheduler.add_job(**job_config)
+
             # Schedule periodic cleanup if enabled
             if PERSISTENCE_CONFIG['enable_job_recovery']:
                 self.scheduler.add_job(
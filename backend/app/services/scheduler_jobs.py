@@ -15,8 +15,11 @@ from app.config.scheduler_config import (
     SCHEDULER_TIMEZONE, MONITORING_CONFIG
 )
 from scrapers.sources.strategic_sources import STRATEGIC_SOURCES, get_sources_by_priority
+from app.config.settings import settings
+from app.database.bulk import upsert_scraped_content
 from app.database.connection import get_db
 from app.api.scraping import SCRAPER_REGISTRY, run_scraper
+from app.services.crawl_schedule import get_crawl_schedule
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,12 @@ logger = logging.getLogger(__name__)
 _job_executions: Dict[str, List[Dict[str, Any]]] = {}
 _job_failures: Dict[str, int] = {}
 
+# Scheduler the scraper jobs were added to (for adaptive rescheduling)
+_scheduler: Optional[AsyncIOScheduler] = None
+
+# Reschedule a job only when its interval changes by more than this share
+RESCHEDULE_THRESHOLD = 0.1
+
 
 async def execute_scraper_with_retry(
     source_name: str,
@@ -84,17 +93,20 @@ async def execute_scraper_with_retry(
                 async with scraper_class(source_config) as scraper:
                     articles = await scraper.scrape()
 
-                    # Save to database
-                    for article in articles:
-                        db.add(article)
+                    # Save to database, skipping articles that are already stored
+                    stored = upsert_scraped_content(db, articles)
 
                     db.commit()
 
                     result['success'] = True
                     result['articles_scraped'] = len(articles)
+                    result['articles_stored'] = stored.inserted
                     result['retries'] = attempt
 
-                    logger.info(f"Successfully scraped {len(articles)} articles from {source_name}")
+                    logger.info(
+                        f"Successfully scraped {len(articles)} articles from {source_name} "
+                        f"({stored.inserted} new, {stored.skipped} already stored)"
+                    )
                     break
 
         except Exception as e:
@@ -106,6 +118,12 @@ async def execute_scraper_with_retry(
                 logger.error(f"Max retries reached for {source_name}")
                 _track_failure(job_id)
 
+    if result['success'] and settings.SCRAPER_ADAPTIVE_SCHEDULE:
+        # Articles not stored before are the run's yield
+        schedule = get_crawl_schedule().record_run(source_name, result['articles_stored'], tier)
+        result['interval_minutes'] = schedule.interval_minutes
+        _reschedule(job_id, schedule.interval_minutes)
+
     # Track execution
     end_time = datetime.now(SCHEDULER_TIMEZONE)
     result['end_time'] = end_time.isoformat()
@@ -141,6 +159,23 @@ def calculate_backoff_delay(attempt: int) -> float:
     return delay
 
 
+def _reschedule(job_id: str, interval_minutes: float) -> None:
+    """Move a scraper job to a new interval if it changed noticeably"""
+    if _scheduler is None:
+        return
+
+    job = _scheduler.get_job(job_id)
+    if job is None or not hasattr(job.trigger, 'interval'):
+        return
+
+    current_minutes = job.trigger.interval.total_seconds() / 60
+    if abs(interval_minutes - current_minutes) <= current_minutes * RESCHEDULE_THRESHOLD:
+        return
+
+    _scheduler.reschedule_job(job_id, trigger='interval', minutes=interval_minutes)
+    logger.info(f"Rescheduled {job_id}: every {interval_minutes:.0f} minutes (was {current_minutes:.0f})")
+
+
 def _track_execution(job_id: str, result: Dict[str, Any]) -> None:
     """Track job execution for monitoring"""
     if job_id not in _job_executions:
@@ -172,22 +207,30 @@ async def setup_scraper_jobs(scheduler: AsyncIOScheduler) -> None:
     """
     Set up all scraper jobs based on priority tiers
 
+    With SCRAPER_ADAPTIVE_SCHEDULE, a source starts at the interval its
+    publication rate calls for (the tier interval until it has run).
+
     Args:
         scheduler: APScheduler instance
     """
+    global _scheduler
+    _scheduler = scheduler
+
     logger.info("Setting up scraper jobs...")
 
     jobs_added = 0
+    crawl_schedule = get_crawl_schedule() if settings.SCRAPER_ADAPTIVE_SCHEDULE else None
 
     # Iterate through priority tiers
     for tier, tier_config in SCRAPER_TIERS.items():
-        interval_minutes = tier_config['interval_minutes']
-
         # Get sources for this tier
         sources = get_sources_by_priority(tier)
 
         for source in sources:
             source_name = source['name']
+            interval_minutes = tier_config['interval_minutes']
+            if crawl_schedule is not None:
+                interval_minutes = crawl_schedule.interval_minutes(source_name, tier)
 
             # Create job ID
             job_id = f"scraper_{source_name.lower().replace(' ', '_')}"
@@ -207,7 +250,7 @@ async def setup_scraper_jobs(scheduler: AsyncIOScheduler) -> None:
             jobs_added += 1
             logger.debug(
                 f"Added {tier} priority job for {source_name} "
-                f"(interval: {interval_minutes} minutes)"
+                f"(interval: {interval_minutes:.0f} minutes)"
             )
 
     logger.info(f"Successfully added {jobs_added} scraper jobs across all tiers")
@@ -0,0 +1,118 @@
+"""
+Topic Model Scheduler Jobs
+Incremental LDA updates from newly scraped articles with versioned snapshots
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.settings import settings
+from app.database.connection import SessionLocal
+from app.database.models import ScrapedContent
+from nlp.topic_modeler import TopicModeler
+
+
+logger = logging.getLogger(__name__)
+
+# Training copy of the model; API and worker processes pick up the
+# snapshots it publishes through TopicModeler.refresh()
+_trainer: Optional[TopicModeler] = None
+
+
+def get_trainer() -> TopicModeler:
+    """Get the training model, loading the latest snapshot on first use"""
+    global _trainer
+    if _trainer is None:
+        _trainer = TopicModeler(n_topics=5, snapshot_dir=settings.TOPIC_MODEL_DIR)
+    return _trainer
+
+
+def load_new_articles(after_id: Optional[int], limit: int) -> List[Tuple[int, str]]:
+    """
+    Load articles stored after the training watermark
+
+    The watermark is the row id, not scraped_at: articles are committed in
+    batches some time after they were parsed, so a row can be stored after
+    one with a later scraped_at (ids only grow, as in URLIndex.sync).
+
+    Args:
+        after_id: Highest ScrapedContent.id already trained on
+        limit: Maximum articles to return
+
+    Returns:
+        (id, text) pairs, oldest first
+    """
+    db = SessionLocal()
+    try:
+        query = db.query(ScrapedContent.id, ScrapedContent.title, ScrapedContent.content)
+
+        if after_id is not None:
+            query = query.filter(ScrapedContent.id > after_id)
+
+        rows = query.order_by(ScrapedContent.id).limit(limit).all()
+        return [(row_id, f"{title}\n{content}") for row_id, title, content in rows]
+    finally:
+        db.close()
+
+
+async def update_topic_model() -> Dict[str, Any]:
+    """
+    Fold newly scraped articles into the online LDA model
+
+    Runs a full fit the first time enough articles exist, then partial_fit
+    updates on every run, and publishes each new version as a snapshot.
+    Database access and training run in the default executor.
+
+    Returns:
+        Update summary with version, documents and drift
+    """
+    loop = asyncio.get_event_loop()
+    modeler = get_trainer()
+    modeler.refresh(force=True)
+
+    rows = await loop.run_in_executor(
+        None, load_new_articles, modeler.trained_until_id, settings.TOPIC_MODEL_UPDATE_BATCH
+    )
+
+    result = {
+        'updated': False,
+        'version': modeler.version,
+        'new_documents': len(rows),
+        'drift': None
+    }
+
+    if not rows:
+        logger.info("Topic model update: no new articles")
+        return result
+
+    drift = await loop.run_in_executor(None, modeler.partial_fit, [text for _, text in rows])
+
+    if not modeler.get_model_info()['fitted']:
+        # Not enough articles for the initial fit yet; keep the watermark
+        logger.info(f"Topic model update: {len(rows)} articles are too few for an initial fit")
+        return result
+
+    modeler.trained_until_id = rows[-1][0]
+    await loop.run_in_executor(
+        None, modeler.save_snapshot, None, settings.TOPIC_MODEL_KEEP_SNAPSHOTS
+    )
+
+    result.update({'updated': True, 'version': modeler.version, 'drift': drift})
+    logger.info(
+        f"Topic model updated to v{modeler.version} with {len(rows)} articles "
+        f"({modeler.documents_seen} total, drift={drift})"
+    )
+    return result
+
+
+TOPIC_MODEL_JOBS = [
+    {
+        "func": update_topic_model,
+        "trigger": "interval",
+        "minutes": settings.TOPIC_MODEL_UPDATE_MINUTES,
+        "id": "update_topic_model",
+        "name": "Update Topic Model",
+        "replace_existing": True
+    }
+]
@@ -0,0 +1,522 @@
+"""
+Staged ingestion pipeline from scraped documents to ScrapedContent/ContentAnalysis
+
+Documents flow in batches through dedupe -> clean -> nlp -> enrich -> store.
+Stages are connected by bounded queues, so a slow stage (usually spaCy or
+the database) applies backpressure to the ones before it instead of letting
+batches pile up in memory.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+)
+
+from backend.nlp.analysis_context import AnalysisContext
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation outside the API
+try:
+    from backend.app.core.metrics import (
+        ingestion_stage_items,
+        ingestion_stage_duration_seconds,
+        ingestion_queue_depth
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+# Stage order of DocumentIngestor
+INGESTION_STAGES = ('dedupe', 'clean', 'nlp', 'enrich', 'store')
+
+# Default workers per stage; dedupe keeps a run-wide seen set and spaCy
+# already batches internally, so both stay at one
+DEFAULT_STAGE_CONCURRENCY: Dict[str, int] = {
+    'dedupe': 1,
+    'clean': 1,
+    'nlp': 1,
+    'enrich': 2,
+    'store': 1
+}
+
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Marks the end of the stream on a stage queue
+_DONE = object()
+
+BatchFunc = Callable[[List[Any]], Union[List[Any], Awaitable[List[Any]]]]
+
+
+@dataclass
+class Stage:
+    """One pipeline stage applied to whole batches"""
+    name: str
+    func: BatchFunc
+    concurrency: int = 1
+    in_executor: bool = False  # Run a sync func in the default thread pool
+
+
+@dataclass
+class StageStats:
+    """Per-stage counters collected during a run"""
+    name: str
+    concurrency: int
+    items_in: int = 0
+    items_out: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    failed_items: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of work time across this stage's workers"""
+        return self.items_in / self.busy_seconds if self.busy_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'concurrency': self.concurrency,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'batches': self.batches,
+            'failed_batches': self.failed_batches,
+            'failed_items': self.failed_items,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'throughput': round(self.throughput, 1),
+            'max_queue_depth': self.max_queue_depth
+        }
+
+
+class StagedPipeline:
+    """
+    Runs batches through a chain of stages connected by bounded queues
+
+    Each stage has its own worker count. A stage returns the (possibly
+    filtered) batch for the next stage; a batch whose stage raises is logged,
+    counted and dropped, and the run continues.
+    """
+
+    def __init__(self, stages: List[Stage], batch_size: int = 64, queue_size: int = 4):
+        """
+        Args:
+            stages: Stages in execution order
+            batch_size: Items per batch fed into the first stage
+            queue_size: Batches buffered in front of each stage
+        """
+        self.stages = stages
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.stats: Dict[str, StageStats] = {}
+
+    async def run(self, items: Union[Iterable[Any], AsyncIterable[Any]]) -> Dict[str, StageStats]:
+        """
+        Stream items through every stage
+
+        Args:
+            items: Items, or an async iterator producing them as they arrive
+
+        Returns:
+            Statistics per stage name
+        """
+        self.stats = {
+            stage.name: StageStats(name=stage.name, concurrency=max(1, stage.concurrency))
+            for stage in self.stages
+        }
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        outputs = queues[1:] + [None]
+
+        runners = [
+            asyncio.create_task(self._run_stage(stage, queues[idx], outputs[idx]))
+            for idx, stage in enumerate(self.stages)
+        ]
+
+        try:
+            await self._feed(items, queues[0], self.stages[0].name)
+            await asyncio.gather(*runners)
+        finally:
+            for runner in runners:
+                runner.cancel()
+
+        return self.stats
+
+    async def _feed(self, items, queue: asyncio.Queue, stage_name: str) -> None:
+        """Split the input into batches and enqueue them"""
+        batch: List[Any] = []
+
+        if hasattr(items, '__aiter__'):
+            async for item in items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    await self._put(queue, batch, stage_name)
+                    batch = []
+        else:
+            for item in items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    await self._put(queue, batch, stage_name)
+                    batch = []
+
+        if batch:
+            await self._put(queue, batch, stage_name)
+        await queue.put(_DONE)
+
+    async def _put(self, queue: asyncio.Queue, batch: List[Any], stage_name: str) -> None:
+        """Enqueue a batch, waiting while the next stage is saturated"""
+        await queue.put(batch)
+
+        stats = self.stats[stage_name]
+        depth = queue.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, depth)
+        if METRICS_AVAILABLE:
+            ingestion_queue_depth.labels(stage=stage_name).set(depth)
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue]
+    ) -> None:
+        """Run a stage's workers until the stream ends, then close the next queue"""
+        next_name = None
+        if outbox is not None:
+            next_name = self.stages[self.stages.index(stage) + 1].name
+
+        await asyncio.gather(*(
+            self._worker(stage, inbox, outbox, next_name)
+            for _ in range(max(1, stage.concurrency))
+        ))
+
+        if outbox is not None:
+            await outbox.put(_DONE)
+
+    async def _worker(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        next_name: Optional[str]
+    ) -> None:
+        stats = self.stats[stage.name]
+        loop = asyncio.get_event_loop()
+
+        while True:
+            batch = await inbox.get()
+            if batch is _DONE:
+                # Leave the marker for this stage's other workers
+                inbox.put_nowait(_DONE)
+                return
+
+            if METRICS_AVAILABLE:
+                ingestion_queue_depth.labels(stage=stage.name).set(inbox.qsize())
+
+            start = time.perf_counter()
+            try:
+                if stage.in_executor:
+                    result = await loop.run_in_executor(None, stage.func, batch)
+                else:
+                    result = stage.func(batch)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+            except Exception as e:
+                logger.error(f"Ingestion stage '{stage.name}' failed for a batch of {len(batch)}: {e}")
+                stats.failed_batches += 1
+                stats.failed_items += len(batch)
+                result = []
+
+            elapsed = time.perf_counter() - start
+            stats.busy_seconds += elapsed
+            stats.batches += 1
+            stats.items_in += len(batch)
+            stats.items_out += len(result)
+
+            if METRICS_AVAILABLE:
+                ingestion_stage_items.labels(stage=stage.name).inc(len(batch))
+                ingestion_stage_duration_seconds.labels(stage=stage.name).observe(elapsed)
+
+            if outbox is not None and result:
+                await self._put(outbox, result, next_name)
+
+
+@dataclass(slots=True)
+class IngestItem:
+    """A scraped document moving through the ingestion stages"""
+    doc: Dict[str, Any]
+    fields: Dict[str, Any] = field(default_factory=dict)
+    text: str = ''
+    context: Optional[AnalysisContext] = None
+    analysis: Optional[Dict[str, Any]] = None
+
+
+class DocumentIngestor:
+    """
+    Stores scraped documents as ScrapedContent and ContentAnalysis rows
+
+    - dedupe: validation plus one content_hash and one source_url lookup per
+      batch, and a run-wide seen set for duplicates within the stream
+    - clean: record fields, date parsing and HTML/whitespace cleanup
+    - nlp: one nlp.pipe call per batch (regex contexts without a pipeline)
+    - enrich: difficulty, gazetteer entities, content analysis, spaCy NER
+    - store: bulk upsert per batch (see app/database/bulk.py); documents
+      stored meanwhile are skipped, a failing row does not lose the batch
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        enrich: Callable[[IngestItem], None],
+        validate: Callable[[Any], bool],
+        nlp_pipeline: Any = None,
+        batch_size: int = 64,
+        queue_size: int = 4,
+        concurrency: Optional[Dict[str, int]] = None,
+        model_version: str = '1.0.0'
+    ):
+        """
+        Args:
+            session_factory: Callable returning a SQLAlchemy session
+            enrich: Fills item.fields['difficulty_score'],
+                item.fields['colombian_entities'] and item.analysis
+            validate: Returns True for documents that can be stored
+            nlp_pipeline: Optional NLPPipeline for batched parsing and NER
+            batch_size: Documents per batch
+            queue_size: Batches buffered in front of each stage
+            concurrency: Workers per stage name (see DEFAULT_STAGE_CONCURRENCY)
+            model_version: ContentAnalysis.model_version of stored analyses
+        """
+        self.session_factory = session_factory
+        self.enrich = enrich
+        self.validate = validate
+        self.nlp_pipeline = nlp_pipeline
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.concurrency = {**DEFAULT_STAGE_CONCURRENCY, **(concurrency or {})}
+        self.model_version = model_version
+
+    async def ingest(
+        self,
+        documents: Union[Iterable[Dict], AsyncIterable[Dict]],
+        source: Any
+    ) -> Dict[str, Any]:
+        """
+        Run documents through every stage
+
+        Args:
+            documents: Scraped document dicts, or an async iterator of them
+            source: DataSource supplying default source name and category
+
+        Returns:
+            Counts of stored, duplicate, invalid and failed documents plus
+            per-stage statistics
+        """
+        counts = {'stored': 0, 'duplicates': 0, 'invalid': 0, 'failed': 0}
+        seen_hashes: Set[str] = set()
+        seen_urls: Set[str] = set()
+
+        async def dedupe(items: List[IngestItem]) -> List[IngestItem]:
+            valid = []
+            for item in items:
+                if self.validate(item.doc):
+                    valid.append(item)
+                else:
+                    counts['invalid'] += 1
+
+            hashes = {item.doc['content_hash'] for item in valid if item.doc.get('content_hash')}
+            urls = {item.doc['source_url'] for item in valid if item.doc.get('source_url')}
+
+            loop = asyncio.get_event_loop()
+            existing_hashes, existing_urls = await loop.run_in_executor(
+                None, self._lookup_existing, hashes, urls
+            )
+
+            # Runs on the event loop between awaits, so the seen sets need no lock
+            unique = []
+            for item in valid:
+                content_hash = item.doc.get('content_hash')
+                source_url = item.doc.get('source_url')
+                if (content_hash and (content_hash in existing_hashes or content_hash in seen_hashes)) or \
+                        (source_url and (source_url in existing_urls or source_url in seen_urls)):
+                    counts['duplicates'] += 1
+                    continue
+                if content_hash:
+                    seen_hashes.add(content_hash)
+                if source_url:
+                    seen_urls.add(source_url)
+                unique.append(item)
+            return unique
+
+        def clean(items: List[IngestItem]) -> List[IngestItem]:
+            for item in items:
+                self._clean(item, source)
+            return items
+
+        def store(items: List[IngestItem]) -> List[IngestItem]:
+            stored, duplicates = self._store(items)
+            counts['stored'] += stored
+            counts['duplicates'] += duplicates
+            counts['failed'] += len(items) - stored - duplicates
+            return items
+
+        pipeline = StagedPipeline(
+            [
+                Stage('dedupe', dedupe, self.concurrency['dedupe']),
+                Stage('clean', clean, self.concurrency['clean']),
+                Stage('nlp', self._parse, self.concurrency['nlp'], in_executor=True),
+                Stage('enrich', self._enrich, self.concurrency['enrich'], in_executor=True),
+                Stage('store', store, self.concurrency['store'], in_executor=True),
+            ],
+            batch_size=self.batch_size,
+            queue_size=self.queue_size
+        )
+
+        start = time.perf_counter()
+        stats = await pipeline.run(_as_items(documents))
+
+        # Documents in batches dropped by a failing stage
+        counts['failed'] += sum(s.failed_items for s in stats.values())
+
+        return {
+            **counts,
+            'elapsed_seconds': round(time.perf_counter() - start, 3),
+            'stages': {name: s.to_dict() for name, s in stats.items()}
+        }
+
+    def _lookup_existing(self, hashes: Set[str], urls: Set[str]) -> Tuple[Set[str], Set[str]]:
+        """Content hashes and URLs of a batch that are already stored"""
+        from backend.app.database.models import ScrapedContent
+
+        if not hashes and not urls:
+            return set(), set()
+
+        session = self.session_factory()
+        try:
+            existing_hashes = {
+                value for (value,) in session.query(ScrapedContent.content_hash)
+                .filter(ScrapedContent.content_hash.in_(hashes))
+            } if hashes else set()
+            existing_urls = {
+                value for (value,) in session.query(ScrapedContent.source_url)
+                .filter(ScrapedContent.source_url.in_(urls))
+            } if urls else set()
+            return existing_hashes, existing_urls
+        finally:
+            session.close()
+
+    def _clean(self, item: IngestItem, source: Any) -> None:
+        """Build the ScrapedContent fields and the text used for analysis"""
+        doc = item.doc
+        content = doc.get('content', '') or ''
+
+        item.fields = {
+            'source': doc.get('source', source.name),
+            'source_url': doc.get('source_url') or '',
+            'category': doc.get('category', source.category),
+            'title': doc.get('title', ''),
+            'subtitle': doc.get('subtitle'),
+            'content': content,
+            'author': doc.get('author'),
+            'word_count': doc.get('word_count') or len(content.split()),
+            'published_date': parse_published_date(doc.get('published_date')),
+            'content_hash': doc.get('content_hash'),
+            'tags': doc.get('tags', []),
+            'extra_metadata': doc.get('metadata', {}),
+            'is_paywall': doc.get('is_paywall', False)
+        }
+        item.text = clean_text(content)
+
+    def _parse(self, items: List[IngestItem]) -> List[IngestItem]:
+        """Parse the batch with a single nlp.pipe call"""
+        texts = [item.text for item in items]
+        if self.nlp_pipeline is not None:
+            contexts = self.nlp_pipeline.create_contexts(texts, batch_size=len(texts))
+        else:
+            contexts = [AnalysisContext(text) for text in texts]
+
+        for item, context in zip(items, contexts):
+            item.context = context
+        return items
+
+    def _enrich(self, items: List[IngestItem]) -> List[IngestItem]:
+        """Run the per-document enrichment on parsed items"""
+        for item in items:
+            self.enrich(item)
+            if self.nlp_pipeline is not None and item.analysis is not None:
+                item.analysis['entities'] = self.nlp_pipeline.extract_entities(
+                    item.text, context=item.context
+                )
+            item.context = None  # Release the spaCy Doc before the store stage
+        return items
+
+    def _store(self, items: List[IngestItem]) -> Tuple[int, int]:
+        """
+        Upsert a batch: one INSERT ... ON CONFLICT DO NOTHING for the contents
+        and one INSERT for their analyses, then one commit
+
+        Returns:
+            Numbers of documents stored and of duplicates (stored by another
+            run since the dedupe lookup)
+        """
+        from backend.app.database.bulk import upsert_scraped_content
+
+        session = self.session_factory()
+        try:
+            result = upsert_scraped_content(
+                session,
+                [item.fields for item in items],
+                analyses=[self._analysis_row(item) for item in items]
+            )
+            session.commit()
+            return result.inserted, result.skipped
+        finally:
+            session.close()
+
+    def _analysis_row(self, item: IngestItem) -> Optional[Dict[str, Any]]:
+        """ContentAnalysis columns of an enriched document"""
+        if not item.analysis:
+            return None
+        return {
+            'entities': item.analysis.get('entities', {}),
+            'sentiment_score': item.analysis.get('sentiment_score'),
+            'sentiment_label': item.analysis.get('sentiment_label'),
+            'key_phrases': item.analysis.get('key_phrases', []),
+            'topics': item.analysis.get('topics', []),
+            'summary': item.analysis.get('summary'),
+            'colombian_slang': item.analysis.get('colombian_slang', []),
+            'model_version': self.model_version
+        }
+
+
+async def _as_items(documents):
+    """Wrap documents in IngestItems, preserving async streams"""
+    if hasattr(documents, '__aiter__'):
+        async for doc in documents:
+            yield IngestItem(doc=doc)
+    else:
+        for doc in documents:
+            yield IngestItem(doc=doc)
+
+
+def clean_text(text: str) -> str:
+    """Strip leftover HTML tags and collapse whitespace"""
+    if not text:
+        return ''
+    return _WHITESPACE_PATTERN.sub(' ', _HTML_TAG_PATTERN.sub(' ', text)).strip()
+
+
+def parse_published_date(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 string (with optional Z suffix) or pass a datetime through"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return value if isinstance(value, datetime) else None
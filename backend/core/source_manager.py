@@ -4,18 +4,45 @@ Central source manager for orchestrating all data collection
 
 import yaml
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import importlib
 import inspect
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.ingestion_pipeline import DocumentIngestor, IngestItem
+from backend.nlp.gazetteer import get_colombian_gazetteer
 
 logger = logging.getLogger(__name__)
 
+# TODO: Inject database configuration from settings
+DATABASE_URL = 'sqlite:///openlearn.db'
+
+# Session factory shared by all collection runs, created on first use
+_session_factory: Optional[Callable[[], Any]] = None
+
+# Gazetteer category -> key in ScrapedContent.colombian_entities
+SOURCE_ENTITY_CATEGORIES = {
+    'institutions': 'institutions',
+    'cities': 'locations',
+    'departments': 'locations',
+    'political_figures': 'people',
+    'companies': 'organizations'
+}
+
+
+def get_session():
+    """Open a database session, creating the shared engine once"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=create_engine(DATABASE_URL, echo=False))
+    return _session_factory()
+
 
 @dataclass
 class DataSource:
@@ -57,13 +84,46 @@ class SourceManager:
     Manages all data sources: APIs, scrapers, etc.
     """
 
-    def __init__(self, config_path: str = None):
-        """Initialize source manager"""
+    # Scraped document ingestion (see DocumentIngestor)
+    ingestion_batch_size = 64
+    ingestion_queue_size = 4
+    ingestion_concurrency: Dict[str, int] = {}
+    nlp_pipeline = None
+    _nlp_pipeline_failed = False
+    # Adaptive scraper intervals (see app/services/crawl_schedule.py)
+    crawl_schedule = None
+    _crawl_schedule_failed = False
+    # Database sessions for collected data (get_session when None)
+    session_factory: Optional[Callable[[], Any]] = None
+
+    def __init__(
+        self,
+        config_path: str = None,
+        nlp_pipeline=None,
+        ingestion_batch_size: int = 64,
+        ingestion_concurrency: Optional[Dict[str, int]] = None,
+        session_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Initialize source manager
+
+        Args:
+            config_path: Path to sources.yaml
+            nlp_pipeline: Optional NLPPipeline for ingestion (loaded on first use otherwise)
+            ingestion_batch_size: Documents per ingestion batch
+            ingestion_concurrency: Workers per ingestion stage
+            session_factory: Callable returning a SQLAlchemy session
+                (default: get_session, on DATABASE_URL)
+        """
         self.config_path = config_path or Path(__file__).parent.parent / 'config' / 'sources.yaml'
         self.sources: Dict[str, DataSource] = {}
         self.scheduler = AsyncIOScheduler()
         self.api_clients = {}
         self.scrapers = {}
+        self.nlp_pipeline = nlp_pipeline
+        self.ingestion_batch_size = ingestion_batch_size
+        self.ingestion_concurrency = ingestion_concurrency or {}
+        self.session_factory = session_factory
 
         # Load configuration
         self.load_sources()
@@ -212,6 +272,9 @@ class SourceManager:
     def _schedule_source(self, source: DataSource):
         """Schedule a single source for collection"""
         interval = source.update_interval
+        crawl_schedule = self._get_crawl_schedule() if source.is_scraper else None
+        if crawl_schedule is not None:
+            interval = crawl_schedule.interval_minutes(source.name, source.priority, interval)
 
         if source.is_api and source.key in self.api_clients:
             self.scheduler.add_job(
@@ -250,10 +313,46 @@ class SourceManager:
                 documents = scraper.scrape_batch(limit=10)
                 logger.info(f"Scraped {len(documents)} documents from {source.name}")
                 # Process and store documents
-                await self._process_documents(documents, source)
+                result = await self._process_documents(documents, source)
+                if result is not None:
+                    self._adapt_interval(source, result['stored'])
         except Exception as e:
             logger.error(f"Error scraping {source.name}: {e}")
 
+    def _get_crawl_schedule(self):
+        """Load the crawl schedule once; None keeps the configured intervals"""
+        if self.crawl_schedule is None and not self._crawl_schedule_failed:
+            try:
+                from backend.app.config.settings import settings
+                from backend.app.services.crawl_schedule import get_crawl_schedule
+            except ImportError as e:
+                logger.warning(f"Adaptive crawl schedule unavailable: {e}")
+                self._crawl_schedule_failed = True
+                return None
+
+            if settings.SCRAPER_ADAPTIVE_SCHEDULE:
+                self.crawl_schedule = get_crawl_schedule()
+            else:
+                self._crawl_schedule_failed = True
+        return self.crawl_schedule
+
+    def _adapt_interval(self, source: DataSource, new_documents: int):
+        """Feed a scrape's new documents to the rate estimate and reschedule the source"""
+        crawl_schedule = self._get_crawl_schedule()
+        if crawl_schedule is None:
+            return
+
+        schedule = crawl_schedule.record_run(
+            source.name, new_documents, source.priority, start_minutes=source.update_interval
+        )
+
+        job = self.scheduler.get_job(f"scraper_{source.key}")
+        if job is not None:
+            current = job.trigger.interval.total_seconds() / 60
+            if abs(schedule.interval_minutes - current) > current * 0.1:
+                job.reschedule(trigger=IntervalTrigger(minutes=schedule.interval_minutes))
+                logger.info(f"Rescheduled {source.name}: every {schedule.interval_minutes:.0f} minutes")
+
     async def _process_data(self, data: List[Dict], source: DataSource):
         """
         Process and store API data to database
@@ -272,16 +371,10 @@ class SourceManager:
             logger.info(f"No data to process from {source.name}")
             return
 
-        from sqlalchemy.orm import sessionmaker
-        from sqlalchemy import create_engine
         from backend.app.database.models import IntelligenceAlert
 
         try:
-            # Create database session
-            # TODO: Inject database configuration from settings
-            engine = create_engine('sqlite:///openlearn.db', echo=False)
-            Session = sessionmaker(bind=engine)
-            session = Session()
+            session = self._open_session()
 
             processed_count = 0
             alert_count = 0
@@ -344,7 +437,7 @@ class SourceManager:
             if 'session' in locals():
                 session.close()
 
-    async def _process_documents(self, documents: List, source: DataSource):
+    async def _process_documents(self, documents: List, source: DataSource) -> Optional[Dict[str, Any]]:
         """
         Process and store scraped documents to database
 
@@ -352,140 +445,85 @@ class SourceManager:
             documents: List of scraped document dictionaries
             source: DataSource configuration
 
-        Features:
-            - Async batch processing
-            - Duplicate detection via content_hash
-            - Difficulty score calculation for language learning
-            - Colombian entity extraction
-            - Content analysis generation
+        Returns:
+            Ingestion summary (see ingest_documents), or None if nothing ran
         """
         if not documents:
             logger.info(f"No documents to process from {source.name}")
-            return
-
-        from sqlalchemy.orm import sessionmaker
-        from sqlalchemy import create_engine
-        from backend.app.database.models import ScrapedContent, ContentAnalysis
-
-        try:
-            # Create database session
-            engine = create_engine('sqlite:///openlearn.db', echo=False)
-            Session = sessionmaker(bind=engine)
-            session = Session()
-
-            stored_count = 0
-            duplicate_count = 0
+            return None
 
-            # Process documents in batches for performance
-            for doc in documents:
-                try:
-                    # Validate required fields
-                    if not self._validate_document_data(doc):
-                        logger.warning(f"Invalid document structure from {source.name}")
-                        continue
+        return await self.ingest_documents(documents, source)
 
-                    # Check for duplicates using content_hash
-                    content_hash = doc.get('content_hash')
-                    if content_hash:
-                        exists = session.query(ScrapedContent).filter_by(
-                            content_hash=content_hash
-                        ).first()
-                        if exists:
-                            duplicate_count += 1
-                            continue
-
-                    # Also check URL duplicates
-                    source_url = doc.get('source_url')
-                    if source_url:
-                        exists = session.query(ScrapedContent).filter_by(
-                            source_url=source_url
-                        ).first()
-                        if exists:
-                            duplicate_count += 1
-                            continue
-
-                    # Calculate difficulty score for language learning
-                    difficulty_score = self._calculate_difficulty_score(
-                        doc.get('content', '')
-                    )
-
-                    # Extract Colombian entities
-                    colombian_entities = self._extract_colombian_entities(
-                        doc.get('content', ''),
-                        doc.get('title', '')
-                    )
-
-                    # Parse published date
-                    published_date = None
-                    if doc.get('published_date'):
-                        try:
-                            if isinstance(doc['published_date'], str):
-                                published_date = datetime.fromisoformat(
-                                    doc['published_date'].replace('Z', '+00:00')
-                                )
-                            else:
-                                published_date = doc['published_date']
-                        except (ValueError, TypeError):
-                            pass
-
-                    # Create ScrapedContent record
-                    content = ScrapedContent(
-                        source=doc.get('source', source.name),
-                        source_url=source_url or '',
-                        category=doc.get('category', source.category),
-                        title=doc.get('title', ''),
-                        subtitle=doc.get('subtitle'),
-                        content=doc.get('content', ''),
-                        author=doc.get('author'),
-                        word_count=doc.get('word_count') or len(doc.get('content', '').split()),
-                        published_date=published_date,
-                        content_hash=content_hash,
-                        colombian_entities=colombian_entities,
-                        tags=doc.get('tags', []),
-                        extra_metadata=doc.get('metadata', {}),
-                        difficulty_score=difficulty_score,
-                        is_paywall=doc.get('is_paywall', False)
-                    )
-
-                    session.add(content)
-                    session.flush()  # Get content.id
-
-                    # Create ContentAnalysis record
-                    analysis = self._analyze_content(doc.get('content', ''))
-                    if analysis:
-                        content_analysis = ContentAnalysis(
-                            content_id=content.id,
-                            entities=analysis.get('entities', {}),
-                            sentiment_score=analysis.get('sentiment_score'),
-                            sentiment_label=analysis.get('sentiment_label'),
-                            key_phrases=analysis.get('key_phrases', []),
-                            topics=analysis.get('topics', []),
-                            summary=analysis.get('summary'),
-                            colombian_slang=analysis.get('colombian_slang', []),
-                            model_version='1.0.0'
-                        )
-                        session.add(content_analysis)
+    async def ingest_documents(self, documents, source: DataSource) -> Optional[Dict[str, Any]]:
+        """
+        Stream scraped documents through the staged ingestion pipeline
 
-                    stored_count += 1
+        Documents are deduplicated (content_hash and source_url, one query
+        each per batch), cleaned, parsed with a single spaCy nlp.pipe call per
+        batch, enriched (difficulty, Colombian entities, content analysis) and
+        bulk inserted as ScrapedContent and ContentAnalysis rows. Stages are
+        connected by bounded queues, so large backfills run in constant memory.
 
-                except Exception as e:
-                    logger.error(f"Error processing document from {source.name}: {e}")
-                    continue
+        Args:
+            documents: Scraped document dicts, or an async iterator of them
+            source: DataSource configuration
 
-            # Commit all changes
-            session.commit()
-            logger.info(
-                f"Processed {stored_count} new documents from {source.name}, "
-                f"skipped {duplicate_count} duplicates"
-            )
+        Returns:
+            Counts of stored, duplicate, invalid and failed documents with
+            per-stage throughput and queue depth, or None on failure
+        """
+        ingestor = DocumentIngestor(
+            session_factory=self._open_session,
+            enrich=self._enrich_document,
+            validate=self._validate_document_data,
+            nlp_pipeline=self._get_nlp_pipeline(),
+            batch_size=self.ingestion_batch_size,
+            queue_size=self.ingestion_queue_size,
+            concurrency=self.ingestion_concurrency
+        )
 
+        try:
+            result = await ingestor.ingest(documents, source)
         except Exception as e:
             logger.error(f"Error in _process_documents for {source.name}: {e}")
-            if 'session' in locals():
-                session.rollback()
-        finally:
-            if 'session' in locals():
-                session.close()
+            return None
+
+        logger.info(
+            f"Processed {result['stored']} new documents from {source.name}, "
+            f"skipped {result['duplicates']} duplicates "
+            f"({result['invalid']} invalid, {result['failed']} failed) "
+            f"in {result['elapsed_seconds']}s"
+        )
+        return result
+
+    def _open_session(self):
+        """Open a database session from session_factory (default: get_session)"""
+        return (self.session_factory or get_session)()
+
+    def _get_nlp_pipeline(self):
+        """Load the spaCy pipeline once; None falls back to regex tokenization"""
+        if self.nlp_pipeline is None and not self._nlp_pipeline_failed:
+            try:
+                from backend.nlp.pipeline import NLPPipeline
+                self.nlp_pipeline = NLPPipeline()
+            except (ImportError, RuntimeError) as e:
+                logger.warning(f"spaCy pipeline unavailable for ingestion: {e}")
+                self._nlp_pipeline_failed = True
+        return self.nlp_pipeline
+
+    def _enrich_document(self, item: IngestItem) -> None:
+        """
+        Difficulty score, Colombian entities and content analysis for one document
+
+        Args:
+            item: Cleaned document; its fields and analysis are filled in
+        """
+        item.fields['difficulty_score'] = self._calculate_difficulty_score(item.text)
+        item.fields['colombian_entities'] = self._extract_colombian_entities(
+            item.text,
+            item.fields['title']
+        )
+        item.analysis = self._analyze_content(item.text)
 
     def _validate_api_data(self, data: Dict) -> bool:
         """
@@ -631,36 +669,11 @@ class SourceManager:
             'organizations': []
         }
 
-        combined_text = f"{title} {content}".lower()
+        # Single pass over the shared gazetteer automaton
+        matched = get_colombian_gazetteer().find_by_category(f"{title} {content}")
 
-        # Colombian institutions
-        institutions = [
-            'congreso', 'senado', 'cámara de representantes',
-            'dane', 'banco de la república', 'corte constitucional',
-            'fiscalía', 'procuraduría', 'contraloría'
-        ]
-        for inst in institutions:
-            if inst in combined_text:
-                entities['institutions'].append(inst.title())
-
-        # Major Colombian cities
-        cities = [
-            'bogotá', 'medellín', 'cali', 'barranquilla',
-            'cartagena', 'cúcuta', 'bucaramanga', 'pereira',
-            'manizales', 'ibagué', 'santa marta'
-        ]
-        for city in cities:
-            if city in combined_text:
-                entities['locations'].append(city.title())
-
-        # Colombian regions/departments
-        departments = [
-            'antioquia', 'cundinamarca', 'valle del cauca',
-            'atlántico', 'santander', 'bolívar'
-        ]
-        for dept in departments:
-            if dept in combined_text:
-                entities['locations'].append(dept.title())
+        for category, key in SOURCE_ENTITY_CATEGORIES.items():
+            entities[key].extend(entry.name for entry in matched.get(category, []))
 
         return entities
 
@@ -0,0 +1,180 @@
+"""
+Shared Analysis Context
+Parses an article once and exposes the derived token arrays to every NLP stage
+"""
+
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+import logging
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+logger = logging.getLogger(__name__)
+
+# Regex fallbacks used when no spaCy model is attached (match DifficultyScorer)
+_URL_PATTERN = re.compile(r'http[s]?://\S+')
+_EMAIL_PATTERN = re.compile(r'\S+@\S+')
+_SENTENCE_PATTERN = re.compile(r'[.!?¡¿]+')
+_WORD_PATTERN = re.compile(r'\b[a-záéíóúñü]+\b')
+
+
+class AnalysisContext:
+    """
+    Single parse of a text shared by NER, summarization, vocabulary,
+    sentiment, topic and difficulty stages.
+
+    The spaCy Doc is created lazily on first access, at most once. When a
+    model or Doc is attached, every derived array (words, sentences, lemmas)
+    comes from that Doc; otherwise a regex tokenizer is used, so results never
+    depend on the order in which stages run.
+
+    Stage-specific derived values (e.g. a normalized string) can be stored
+    with memo() so repeated calls on the same article do not recompute them.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        nlp: Optional['Language'] = None,
+        doc: Optional['Doc'] = None
+    ):
+        """
+        Args:
+            text: Original article text
+            nlp: Optional spaCy model used to parse the text on demand
+            doc: Optional already-parsed Doc (e.g. from nlp.pipe)
+        """
+        self.text = text or ""
+        self._nlp = nlp
+        self._doc = doc
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def from_doc(cls, doc: 'Doc') -> 'AnalysisContext':
+        """Wrap an existing spaCy Doc"""
+        return cls(doc.text, doc=doc)
+
+    @classmethod
+    def build_batch(
+        cls,
+        nlp: 'Language',
+        texts: List[str],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List['AnalysisContext']:
+        """
+        Parse a batch of texts with nlp.pipe and wrap each Doc
+
+        Args:
+            nlp: spaCy model
+            texts: Texts to parse
+            batch_size: nlp.pipe batch size
+            n_process: nlp.pipe worker processes
+
+        Returns:
+            One context per input text, in order
+        """
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [cls(text, doc=doc) for text, doc in zip(texts, docs)]
+
+    @property
+    def has_parser(self) -> bool:
+        """Whether derived arrays come from a spaCy Doc"""
+        return self._doc is not None or self._nlp is not None
+
+    @property
+    def doc(self) -> Optional['Doc']:
+        """The spaCy Doc, parsed on first access (None if no model attached)"""
+        if self._doc is None and self._nlp is not None:
+            self._doc = self._nlp(self.text)
+        return self._doc
+
+    @cached_property
+    def sentence_words(self) -> List[List[str]]:
+        """Lowercased alphabetic words grouped by sentence (aligned with sentences)"""
+        doc = self.doc
+        if doc is not None:
+            return [
+                [token.lower_ for token in sent if token.is_alpha]
+                for sent in doc.sents if sent.text.strip()
+            ]
+        return [_WORD_PATTERN.findall(sentence.lower()) for sentence in self.sentences]
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentence strings"""
+        doc = self.doc
+        if doc is not None:
+            return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+
+        parts = _SENTENCE_PATTERN.split(self._cleaned_text)
+        return [part.strip() for part in parts if part.strip()]
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lowercased alphabetic words in document order"""
+        doc = self.doc
+        if doc is not None:
+            return [token.lower_ for token in doc if token.is_alpha]
+        return _WORD_PATTERN.findall(self._cleaned_text.lower())
+
+    @cached_property
+    def lemmas(self) -> List[str]:
+        """Lowercased lemmas aligned with words (words themselves without a model)"""
+        doc = self.doc
+        if doc is not None:
+            return [token.lemma_.lower() for token in doc if token.is_alpha]
+        return list(self.words)
+
+    @cached_property
+    def _cleaned_text(self) -> str:
+        """Text with URLs, emails and extra whitespace removed"""
+        text = _URL_PATTERN.sub('', self.text)
+        text = _EMAIL_PATTERN.sub('', text)
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def memo(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get or compute a stage-specific derived value
+
+        Args:
+            key: Unique key (prefix with the stage name)
+            factory: Zero-argument callable computing the value
+
+        Returns:
+            Cached value for this context
+        """
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+
+def ensure_contexts(
+    texts: Iterable[Any],
+    contexts: Optional[List[AnalysisContext]] = None
+) -> List[AnalysisContext]:
+    """
+    Normalize batch inputs (texts, Docs or contexts) to a list of contexts
+
+    Args:
+        texts: Texts, spaCy Docs or AnalysisContext objects
+        contexts: Optional pre-built contexts aligned with texts
+
+    Returns:
+        List of AnalysisContext
+    """
+    if contexts is not None:
+        return list(contexts)
+
+    result = []
+    for item in texts:
+        if isinstance(item, AnalysisContext):
+            result.append(item)
+        elif hasattr(item, 'sents') and hasattr(item, 'text'):
+            result.append(AnalysisContext.from_doc(item))
+        else:
+            result.append(AnalysisContext(str(item)))
+    return result
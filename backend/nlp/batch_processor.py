@@ -6,14 +6,20 @@ Achieves 10x+ performance improvement through batching
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Deque, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 import uuid
 
+from .job_store import MemoryJobStore
+from .result_cache import MISSING, ResultCache
+
+if TYPE_CHECKING:
+    from .executors import BatchExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +31,11 @@ class JobPriority(Enum):
     URGENT = 4
 
 
+# Dequeue order (highest first) and levels dispatched without waiting
+PRIORITY_ORDER = [JobPriority.URGENT, JobPriority.HIGH, JobPriority.NORMAL, JobPriority.LOW]
+IMMEDIATE_PRIORITIES = {JobPriority.URGENT, JobPriority.HIGH}
+
+
 class JobStatus(Enum):
     """Job status states"""
     PENDING = "pending"
@@ -34,9 +45,9 @@ class JobStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchJob:
-    """Batch processing job"""
+    """Batch processing job (input_data is released once the job finishes)"""
     job_id: str
     task_type: str  # sentiment, ner, topic, difficulty
     input_data: Any
@@ -48,6 +59,9 @@ class BatchJob:
     result: Optional[Any] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    deadline: float = 0.0  # time.monotonic() by which the job must be dispatched
+    cache_key: Optional[str] = None  # Content-hash key shared by identical inputs
+    future: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -58,7 +72,11 @@ class BatchConfig:
     worker_count: int = 4
     enable_gpu: bool = False
     cache_results: bool = True
-    max_cache_size: int = 1000
+    max_cache_size: int = 1000  # Max in-process cache entries
+    max_cache_bytes: int = 64 * 1024 * 1024  # In-process cache memory budget
+    model_version: str = "1"  # Part of every cache key; bump when models change
+    max_jobs: int = 100000  # Registered jobs before finished ones are evicted
+    job_ttl_seconds: float = 3600.0  # How long finished jobs stay queryable
 
 
 class BatchProcessor:
@@ -71,25 +89,60 @@ class BatchProcessor:
     - Worker pool management
     - Result caching
     - Progress tracking
+
+    Scheduling is event driven: workers sleep on a condition variable and
+    wake when a job is submitted or when the oldest queued job reaches its
+    deadline, so a batch is dispatched as soon as it is full, as soon as an
+    URGENT/HIGH job arrives, or exactly when max_wait_seconds elapses.
     """
 
-    def __init__(self, config: Optional[BatchConfig] = None):
-        """Initialize batch processor"""
+    def __init__(
+        self,
+        config: Optional[BatchConfig] = None,
+        remote_cache: Optional[Any] = None,
+        job_store: Optional[MemoryJobStore] = None
+    ):
+        """
+        Initialize batch processor
+
+        Args:
+            config: Batch configuration
+            remote_cache: Optional CacheManager shared by all API workers,
+                used as the second result cache tier
+            job_store: Optional job registry (e.g. RedisJobStore); defaults
+                to a bounded in-memory store
+        """
         self.config = config or BatchConfig()
 
-        # Job queues by task type and priority
-        self.job_queues: Dict[str, Dict[JobPriority, List[BatchJob]]] = defaultdict(
-            lambda: {priority: [] for priority in JobPriority}
+        # Job queues by task type and priority (FIFO deques, O(1) dequeue)
+        self.job_queues: Dict[str, Dict[JobPriority, Deque[BatchJob]]] = defaultdict(
+            lambda: {priority: deque() for priority in JobPriority}
         )
+        self._queued_counts: Dict[str, int] = defaultdict(int)
 
-        # Job registry for status tracking
-        self.jobs: Dict[str, BatchJob] = {}
+        # Job registry for status tracking (bounded by count and age)
+        if job_store is None:
+            job_store = MemoryJobStore(
+                max_jobs=self.config.max_jobs,
+                max_age_seconds=self.config.job_ttl_seconds
+            )
+        self.jobs = job_store
 
-        # Result cache
-        self.result_cache: Dict[str, Any] = {}
+        # Result cache (in-process LRU, optionally backed by Redis)
+        self.result_cache: Optional[ResultCache] = None
+        if self.config.cache_results:
+            self.result_cache = ResultCache(
+                max_bytes=self.config.max_cache_bytes,
+                max_entries=self.config.max_cache_size,
+                model_version=self.config.model_version,
+                remote=remote_cache
+            )
         self.cache_hits = 0
         self.cache_misses = 0
 
+        # Jobs sharing a cache key with a queued or running job, keyed by it
+        self._inflight: Dict[str, List[BatchJob]] = {}
+
         # Processing statistics
         self.stats = {
             'total_jobs': 0,
@@ -103,6 +156,9 @@ class BatchProcessor:
         # Worker control
         self.workers_running = False
         self.worker_tasks = []
+        self._condition: Optional[asyncio.Condition] = None
+        self._notify_pending = False
+        self.executor: Optional['BatchExecutor'] = None
 
         logger.info(f"Batch processor initialized with config: {self.config}")
 
@@ -126,9 +182,11 @@ class BatchProcessor:
             Job ID for tracking
         """
         # Check cache first
-        if self.config.cache_results:
-            cache_key = self._get_cache_key(task_type, input_data)
-            if cache_key in self.result_cache:
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(task_type, input_data)
+            cached = self.result_cache.get(cache_key)
+            if cached is not MISSING:
                 self.cache_hits += 1
                 logger.debug(f"Cache hit for task {task_type}")
                 # Return cached result immediately
@@ -139,14 +197,36 @@ class BatchProcessor:
                     input_data=input_data,
                     priority=priority,
                     status=JobStatus.COMPLETED,
-                    result=self.result_cache[cache_key],
+                    result=cached,
                     metadata=metadata or {}
                 )
                 job.completed_at = datetime.now()
-                self.jobs[job_id] = job
+                job.input_data = None
+                self.jobs.add(job)
+                self.jobs.finish(job)
+                return job_id
+
+            # Identical input already queued or running: share its result
+            followers = self._inflight.get(cache_key)
+            if followers is not None:
+                self.cache_hits += 1
+                self.result_cache.record_coalesced(cache_key)
+                job_id = str(uuid.uuid4())
+                job = BatchJob(
+                    job_id=job_id,
+                    task_type=task_type,
+                    input_data=input_data,
+                    priority=priority,
+                    status=JobStatus.QUEUED,
+                    metadata=metadata or {},
+                    cache_key=cache_key
+                )
+                followers.append(job)
+                self.jobs.add(job)
+                self.stats['total_jobs'] += 1
                 return job_id
 
-        self.cache_misses += 1
+            self._inflight[cache_key] = []
 
         # Create new job
         job_id = str(uuid.uuid4())
@@ -155,15 +235,21 @@ class BatchProcessor:
             task_type=task_type,
             input_data=input_data,
             priority=priority,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            deadline=time.monotonic() + self.config.max_wait_seconds,
+            cache_key=cache_key
         )
 
         # Add to queue
         self.job_queues[task_type][priority].append(job)
+        self._queued_counts[task_type] += 1
         job.status = JobStatus.QUEUED
-        self.jobs[job_id] = job
+        self.jobs.add(job)
         self.stats['total_jobs'] += 1
 
+        # Wake a sleeping worker
+        self._notify_workers()
+
         logger.debug(f"Job {job_id} submitted for {task_type} with priority {priority.name}")
 
         return job_id
@@ -197,15 +283,61 @@ class BatchProcessor:
 
         return None  # Still processing
 
-    async def start_workers(self, processor_map: Dict[str, Callable]):
+    async def result(self, job_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a job to finish and return its result
+
+        Args:
+            job_id: Job ID returned by submit()
+            timeout: Optional maximum seconds to wait
+
+        Returns:
+            Job result
+
+        Raises:
+            KeyError: Unknown job ID
+            Exception: Job failed
+            asyncio.TimeoutError: Job did not finish within timeout
+        """
+        job = self.jobs.get(job_id)
+        if not job:
+            raise KeyError(f"Unknown job: {job_id}")
+
+        if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED):
+            if job.future is None:
+                job.future = asyncio.get_running_loop().create_future()
+            await asyncio.wait_for(asyncio.shield(job.future), timeout)
+
+        if job.status == JobStatus.FAILED:
+            raise Exception(f"Job failed: {job.error}")
+
+        return job.result
+
+    async def fetch_status(self, job_id: str) -> Optional[BatchJob]:
+        """Get job status, including jobs known only to a shared job store"""
+        return await self.jobs.fetch(job_id)
+
+    async def start_workers(
+        self,
+        processor_map: Optional[Dict[str, Callable]] = None,
+        executor: Optional['BatchExecutor'] = None
+    ):
         """
         Start worker pool for processing jobs
 
         Args:
             processor_map: Map of task_type -> processing function
+            executor: Optional execution backend (see nlp.executors); its
+                processors are used for task types missing from processor_map
         """
+        self.executor = executor
+        if executor is not None:
+            await executor.start()
+            processor_map = {**executor.processor_map(), **(processor_map or {})}
+
         self.workers_running = True
-        self.processor_map = processor_map
+        self.processor_map = processor_map or {}
+        self._condition = asyncio.Condition()
 
         # Start worker tasks
         for i in range(self.config.worker_count):
@@ -218,78 +350,136 @@ class BatchProcessor:
         """Stop worker pool"""
         self.workers_running = False
 
+        # Wake idle workers so they observe the stop flag
+        if self._condition is not None:
+            async with self._condition:
+                self._condition.notify_all()
+
         # Wait for workers to finish
         if self.worker_tasks:
             await asyncio.gather(*self.worker_tasks, return_exceptions=True)
             self.worker_tasks = []
 
+        if self.executor is not None:
+            await self.executor.shutdown()
+            self.executor = None
+
         logger.info("Stopped all workers")
 
+    def _notify_workers(self):
+        """Schedule a condition notification (safe to call from sync code)"""
+        if self._condition is None or self._notify_pending:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet; workers check queues when they start
+
+        # Coalesce bursts (e.g. submit_batch) into a single wakeup
+        self._notify_pending = True
+        loop.create_task(self._notify())
+
+    async def _notify(self):
+        """Wake all waiting workers"""
+        self._notify_pending = False
+        async with self._condition:
+            self._condition.notify_all()
+
     async def _worker(self, worker_id: int):
         """Worker task for processing batches"""
         logger.info(f"Worker {worker_id} started")
 
         while self.workers_running:
             try:
-                # Process each task type
-                for task_type in list(self.job_queues.keys()):
-                    batch = self._get_next_batch(task_type)
-
-                    if batch:
-                        await self._process_batch(batch, task_type)
+                batch, task_type = await self._wait_for_batch()
 
-                # Short sleep to prevent busy waiting
-                await asyncio.sleep(0.1)
+                if batch:
+                    await self._process_batch(batch, task_type)
 
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}")
 
         logger.info(f"Worker {worker_id} stopped")
 
-    def _get_next_batch(self, task_type: str) -> Optional[List[BatchJob]]:
+    async def _wait_for_batch(self) -> Tuple[Optional[List[BatchJob]], Optional[str]]:
+        """
+        Sleep until a batch is ready, then dequeue it
+
+        Returns:
+            (batch, task_type), or (None, None) when workers are stopping
+        """
+        async with self._condition:
+            while self.workers_running:
+                now = time.monotonic()
+                next_deadline = None
+
+                for task_type in list(self.job_queues.keys()):
+                    ready, deadline = self._batch_ready(task_type, now)
+                    if ready:
+                        batch = self._get_next_batch(task_type)
+                        # Hand any remaining work to another idle worker
+                        if any(self._queued_counts.values()):
+                            self._condition.notify()
+                        return batch, task_type
+                    if deadline is not None and (next_deadline is None or deadline < next_deadline):
+                        next_deadline = deadline
+
+                # Sleep until notified or until the oldest job's deadline
+                timeout = None if next_deadline is None else max(next_deadline - now, 0)
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+        return None, None
+
+    def _batch_ready(self, task_type: str, now: float) -> Tuple[bool, Optional[float]]:
         """
-        Get next batch to process (highest priority first)
+        Check whether a task type has a batch to dispatch
 
-        Implements dynamic batching:
-        - Accumulates jobs until max_batch_size or max_wait_seconds
-        - Prioritizes urgent jobs
+        Returns:
+            (ready, earliest deadline among queued jobs)
         """
+        if self._queued_counts[task_type] >= self.config.max_batch_size:
+            return True, None
+
         queues = self.job_queues[task_type]
+        earliest = None
 
-        # Check priorities from highest to lowest
-        for priority in [JobPriority.URGENT, JobPriority.HIGH, JobPriority.NORMAL, JobPriority.LOW]:
+        for priority in PRIORITY_ORDER:
             queue = queues[priority]
-
             if not queue:
                 continue
+            if priority in IMMEDIATE_PRIORITIES:
+                return True, None
 
-            # Check if we should process this batch
-            batch_size = len(queue)
-            oldest_job = queue[0] if queue else None
-
-            if not oldest_job:
-                continue
+            # Queues are FIFO, so the head is the oldest job at this level
+            deadline = queue[0].deadline
+            if deadline <= now:
+                return True, None
+            if earliest is None or deadline < earliest:
+                earliest = deadline
 
-            wait_time = (datetime.now() - oldest_job.created_at).total_seconds()
+        return False, earliest
 
-            # Process if:
-            # 1. Batch is full
-            # 2. Wait time exceeded
-            # 3. High/Urgent priority (process immediately)
-            should_process = (
-                batch_size >= self.config.max_batch_size or
-                wait_time >= self.config.max_wait_seconds or
-                priority in [JobPriority.URGENT, JobPriority.HIGH]
-            )
+    def _get_next_batch(self, task_type: str) -> Optional[List[BatchJob]]:
+        """
+        Dequeue up to max_batch_size jobs, highest priority first
 
-            if should_process:
-                # Take up to max_batch_size jobs
-                batch = queue[:self.config.max_batch_size]
-                queues[priority] = queue[self.config.max_batch_size:]
+        Lower-priority jobs of the same task type fill any remaining room,
+        so a ready batch never leaves capacity unused.
+        """
+        queues = self.job_queues[task_type]
+        batch: List[BatchJob] = []
 
-                return batch
+        for priority in PRIORITY_ORDER:
+            queue = queues[priority]
+            while queue and len(batch) < self.config.max_batch_size:
+                batch.append(queue.popleft())
 
-        return None
+        self._queued_counts[task_type] -= len(batch)
+        return batch or None
 
     async def _process_batch(self, batch: List[BatchJob], task_type: str):
         """Process a batch of jobs"""
@@ -300,37 +490,49 @@ class BatchProcessor:
             for job in batch:
                 job.status = JobStatus.PROCESSING
                 job.started_at = datetime.now()
+                self.jobs.update(job)
 
             # Get processor function
             processor = self.processor_map.get(task_type)
             if not processor:
                 raise ValueError(f"No processor for task type: {task_type}")
 
-            # Batch input data
-            input_batch = [job.input_data for job in batch]
-
-            # Process batch
-            logger.info(f"Processing batch of {len(batch)} {task_type} jobs")
-            results = await processor(input_batch)
-
-            # Store results
-            for job, result in zip(batch, results):
-                job.result = result
-                job.status = JobStatus.COMPLETED
-                job.completed_at = datetime.now()
-
-                # Cache result
-                if self.config.cache_results:
-                    cache_key = self._get_cache_key(task_type, job.input_data)
-                    self.result_cache[cache_key] = result
-
-                    # Evict old cache entries
-                    if len(self.result_cache) > self.config.max_cache_size:
-                        # Simple FIFO eviction
-                        first_key = next(iter(self.result_cache))
-                        del self.result_cache[first_key]
-
-                self.stats['completed_jobs'] += 1
+            # Results computed by another worker or replica
+            pending = batch
+            if self.result_cache is not None:
+                found = await self.result_cache.get_remote_many(
+                    task_type, [job.cache_key for job in batch]
+                )
+                pending = []
+                for job in batch:
+                    if job.cache_key in found:
+                        self.cache_hits += 1
+                        self._complete(job, found[job.cache_key])
+                    else:
+                        pending.append(job)
+
+            if pending:
+                # Process batch
+                logger.info(f"Processing batch of {len(pending)} {task_type} jobs")
+                self.cache_misses += len(pending)
+                results = list(await processor([job.input_data for job in pending]))
+
+                # Store results
+                for job, result in zip(pending, results):
+                    self._complete(job, result)
+
+                # Jobs without a result would otherwise never finish
+                if len(results) != len(pending):
+                    error = f"Processor returned {len(results)} results for {len(pending)} inputs"
+                    logger.error(f"Batch of {task_type} jobs: {error}")
+                    for job in pending[len(results):]:
+                        self._fail(job, error)
+
+                # Cache results in both tiers
+                if self.result_cache is not None:
+                    await self.result_cache.put_many(
+                        task_type, {job.cache_key: job.result for job in pending[:len(results)]}
+                    )
 
             # Update statistics
             processing_time = time.time() - start_time
@@ -343,26 +545,48 @@ class BatchProcessor:
 
             logger.info(
                 f"Batch processed: {len(batch)} jobs in {processing_time:.2f}s "
-                f"({len(batch)/processing_time:.1f} jobs/sec)"
+                f"({len(batch)/max(processing_time, 1e-6):.1f} jobs/sec)"
             )
 
         except Exception as e:
             logger.error(f"Batch processing failed: {e}")
 
-            # Mark all jobs as failed
+            # Mark all unfinished jobs as failed
             for job in batch:
-                job.status = JobStatus.FAILED
-                job.error = str(e)
-                job.completed_at = datetime.now()
-                self.stats['failed_jobs'] += 1
-
-    def _get_cache_key(self, task_type: str, input_data: Any) -> str:
-        """Generate cache key from input"""
-        # Simple hash-based key
-        if isinstance(input_data, str):
-            return f"{task_type}:{hash(input_data)}"
-        else:
-            return f"{task_type}:{hash(str(input_data))}"
+                if job.status == JobStatus.PROCESSING:
+                    self._fail(job, str(e))
+
+    def _complete(self, job: BatchJob, result: Any):
+        """Mark a job and any coalesced duplicates as completed"""
+        for finished in self._with_followers(job):
+            finished.result = result
+            finished.status = JobStatus.COMPLETED
+            finished.completed_at = datetime.now()
+            finished.input_data = None
+            self.stats['completed_jobs'] += 1
+            self.jobs.finish(finished)
+            self._resolve(finished)
+
+    def _fail(self, job: BatchJob, error: str):
+        """Mark a job and any coalesced duplicates as failed"""
+        for finished in self._with_followers(job):
+            finished.status = JobStatus.FAILED
+            finished.error = error
+            finished.completed_at = datetime.now()
+            finished.input_data = None
+            self.stats['failed_jobs'] += 1
+            self.jobs.finish(finished)
+            self._resolve(finished)
+
+    def _with_followers(self, job: BatchJob) -> List[BatchJob]:
+        """The job plus jobs waiting on it, releasing its in-flight entry"""
+        followers = self._inflight.pop(job.cache_key, []) if job.cache_key else []
+        return [job, *followers]
+
+    def _resolve(self, job: BatchJob):
+        """Wake anyone awaiting result() for a finished job"""
+        if job.future is not None and not job.future.done():
+            job.future.set_result(None)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get processing statistics"""
@@ -382,12 +606,15 @@ class BatchProcessor:
                 self.cache_hits / (self.cache_hits + self.cache_misses),
                 3
             ) if (self.cache_hits + self.cache_misses) > 0 else 0,
-            'cache_size': len(self.result_cache)
+            'cache_size': len(self.result_cache) if self.result_cache is not None else 0,
+            'result_cache': self.result_cache.get_statistics() if self.result_cache is not None else None,
+            'job_store': self.jobs.get_statistics()
         }
 
     def clear_cache(self):
         """Clear result cache"""
-        self.result_cache.clear()
+        if self.result_cache is not None:
+            self.result_cache.clear()
         self.cache_hits = 0
         self.cache_misses = 0
         logger.info("Result cache cleared")
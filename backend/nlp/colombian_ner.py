@@ -8,8 +8,15 @@ from typing import Dict, List, Any, Optional
 from spacy.tokens import Doc
 import logging
 
+from .gazetteer import COLOMBIAN_GAZETTEERS, get_colombian_gazetteer
+
 logger = logging.getLogger(__name__)
 
+# Gazetteer categories reported by _enhance_colombian_entities
+ENHANCED_CATEGORIES = (
+    'political_figures', 'institutions', 'conflict_actors', 'companies', 'economic_terms'
+)
+
 
 class ColombianNER:
     """
@@ -26,131 +33,19 @@ class ColombianNER:
 
     def _initialize_colombian_patterns(self):
         """Initialize Colombian-specific entity patterns"""
-
-        # Colombian political figures
-        self.political_figures = {
-            'Gustavo Petro': 'PRESIDENT',
-            'Francia Márquez': 'VICE_PRESIDENT',
-            'Iván Duque': 'FORMER_PRESIDENT',
-            'Juan Manuel Santos': 'FORMER_PRESIDENT',
-            'Álvaro Uribe': 'FORMER_PRESIDENT',
-            'Sergio Fajardo': 'POLITICIAN',
-            'Rodolfo Hernández': 'POLITICIAN',
-            'Claudia López': 'MAYOR_BOGOTA',
-            'Daniel Quintero': 'MAYOR_MEDELLIN',
-            'Jorge Iván Ospina': 'MAYOR_CALI'
-        }
-
-        # Government institutions
-        self.institutions = {
-            'Presidencia': 'GOV_EXECUTIVE',
-            'Congreso': 'GOV_LEGISLATIVE',
-            'Senado': 'GOV_LEGISLATIVE',
-            'Cámara de Representantes': 'GOV_LEGISLATIVE',
-            'Corte Suprema': 'GOV_JUDICIAL',
-            'Corte Constitucional': 'GOV_JUDICIAL',
-            'Fiscalía': 'GOV_PROSECUTOR',
-            'Procuraduría': 'GOV_OVERSIGHT',
-            'Contraloría': 'GOV_AUDIT',
-            'MinDefensa': 'GOV_MINISTRY',
-            'MinHacienda': 'GOV_MINISTRY',
-            'MinSalud': 'GOV_MINISTRY',
-            'MinEducación': 'GOV_MINISTRY',
-            'MinMinas': 'GOV_MINISTRY',
-            'MinAgricultura': 'GOV_MINISTRY',
-            'DANE': 'GOV_STATISTICS',
-            'Banco de la República': 'CENTRAL_BANK',
-            'Policía Nacional': 'SECURITY_FORCE',
-            'Ejército Nacional': 'SECURITY_FORCE',
-            'Armada Nacional': 'SECURITY_FORCE',
-            'Fuerza Aérea': 'SECURITY_FORCE'
-        }
-
-        # Armed groups and conflict actors
-        self.conflict_actors = {
-            'FARC': 'ARMED_GROUP',
-            'ELN': 'ARMED_GROUP',
-            'Clan del Golfo': 'CRIMINAL_GROUP',
-            'Los Rastrojos': 'CRIMINAL_GROUP',
-            'Los Pelusos': 'CRIMINAL_GROUP',
-            'paramilitares': 'ARMED_GROUP',
-            'guerrilla': 'ARMED_GROUP',
-            'disidencias': 'ARMED_GROUP'
-        }
-
-        # Colombian companies
-        self.companies = {
-            'Ecopetrol': 'COMPANY_ENERGY',
-            'Avianca': 'COMPANY_AIRLINE',
-            'Grupo Éxito': 'COMPANY_RETAIL',
-            'Bancolombia': 'COMPANY_BANKING',
-            'Grupo Argos': 'COMPANY_CEMENT',
-            'Grupo Sura': 'COMPANY_FINANCE',
-            'Bavaria': 'COMPANY_BEVERAGE',
-            'Postobón': 'COMPANY_BEVERAGE',
-            'Alpina': 'COMPANY_FOOD',
-            'Colsubsidio': 'COMPANY_RETAIL',
-            'EPM': 'COMPANY_UTILITIES',
-            'ISA': 'COMPANY_ENERGY',
-            'Nutresa': 'COMPANY_FOOD'
-        }
-
-        # Colombian locations
+        # Gazetteers are shared with NLPPipeline and SourceManager and compiled
+        # into a single automaton, so adding entries does not slow matching
+        self.gazetteer = get_colombian_gazetteer()
+
+        self.political_figures = COLOMBIAN_GAZETTEERS['political_figures']
+        self.institutions = COLOMBIAN_GAZETTEERS['institutions']
+        self.conflict_actors = COLOMBIAN_GAZETTEERS['conflict_actors']
+        self.companies = COLOMBIAN_GAZETTEERS['companies']
+        self.economic_terms = COLOMBIAN_GAZETTEERS['economic_terms']
         self.locations = {
-            # Major cities
-            'Bogotá': 'CITY_CAPITAL',
-            'Medellín': 'CITY_MAJOR',
-            'Cali': 'CITY_MAJOR',
-            'Barranquilla': 'CITY_MAJOR',
-            'Cartagena': 'CITY_MAJOR',
-            'Cúcuta': 'CITY_MAJOR',
-            'Bucaramanga': 'CITY_MAJOR',
-            'Pereira': 'CITY_MAJOR',
-            'Santa Marta': 'CITY_MAJOR',
-            'Villavicencio': 'CITY_MAJOR',
-            # Departments
-            'Antioquia': 'DEPARTMENT',
-            'Valle del Cauca': 'DEPARTMENT',
-            'Cundinamarca': 'DEPARTMENT',
-            'Santander': 'DEPARTMENT',
-            'Atlántico': 'DEPARTMENT',
-            'Bolívar': 'DEPARTMENT',
-            'Nariño': 'DEPARTMENT',
-            'Cauca': 'DEPARTMENT',
-            'Meta': 'DEPARTMENT',
-            'Arauca': 'DEPARTMENT',
-            'Putumayo': 'DEPARTMENT',
-            'Chocó': 'DEPARTMENT',
-            'Amazonas': 'DEPARTMENT',
-            'Guaviare': 'DEPARTMENT',
-            'Vaupés': 'DEPARTMENT',
-            'Vichada': 'DEPARTMENT',
-            # Regions
-            'Pacífico': 'REGION',
-            'Caribe': 'REGION',
-            'Andina': 'REGION',
-            'Orinoquía': 'REGION',
-            'Amazonía': 'REGION',
-            'Costa Atlántica': 'REGION',
-            'Eje Cafetero': 'REGION',
-            'Magdalena Medio': 'REGION',
-            'Urabá': 'REGION',
-            'Catatumbo': 'REGION'
-        }
-
-        # Economic indicators
-        self.economic_terms = {
-            'peso colombiano': 'CURRENCY',
-            'COP': 'CURRENCY',
-            'UVR': 'ECONOMIC_UNIT',
-            'UVT': 'TAX_UNIT',
-            'SMMLV': 'MINIMUM_WAGE',
-            'salario mínimo': 'MINIMUM_WAGE',
-            'DTF': 'INTEREST_RATE',
-            'IBR': 'INTEREST_RATE',
-            'IPC': 'INFLATION_INDEX',
-            'PIB': 'GDP',
-            'TRM': 'EXCHANGE_RATE'
+            **COLOMBIAN_GAZETTEERS['cities'],
+            **COLOMBIAN_GAZETTEERS['departments'],
+            **COLOMBIAN_GAZETTEERS['regions']
         }
 
     def extract_entities(self, doc: Doc, original_text: str = None) -> Dict[str, List[str]]:
@@ -208,30 +103,12 @@ class ColombianNER:
     def _enhance_colombian_entities(self, text: str, entities: Dict) -> Dict:
         """Enhance entities with Colombian-specific patterns"""
 
-        # Check for political figures
-        for figure, role in self.political_figures.items():
-            if figure.lower() in text.lower():
-                entities['political_figures'].append(f"{figure} ({role})")
-
-        # Check for institutions
-        for inst, inst_type in self.institutions.items():
-            if inst.lower() in text.lower():
-                entities['institutions'].append(f"{inst} ({inst_type})")
-
-        # Check for conflict actors
-        for actor, actor_type in self.conflict_actors.items():
-            if actor.lower() in text.lower():
-                entities['conflict_actors'].append(f"{actor} ({actor_type})")
-
-        # Check for companies
-        for company, company_type in self.companies.items():
-            if company.lower() in text.lower():
-                entities['companies'].append(f"{company} ({company_type})")
-
-        # Check for economic terms
-        for term, term_type in self.economic_terms.items():
-            if term.lower() in text.lower():
-                entities['economic_terms'].append(f"{term} ({term_type})")
+        # Single gazetteer pass for figures, institutions, actors, companies and terms
+        for category, matched in self.gazetteer.find_by_category(text).items():
+            if category in ENHANCED_CATEGORIES:
+                entities[category].extend(
+                    f"{entry.name} ({entry.label})" for entry in matched
+                )
 
         # Extract Colombian ID numbers (cédula)
         cedula_pattern = r'\b\d{6,10}\b'
@@ -8,6 +8,8 @@ import statistics
 from dataclasses import dataclass
 import logging
 
+from .analysis_context import AnalysisContext, ensure_contexts
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,80 +77,60 @@ class DifficultyScorer:
             r'\b\w+[íá]ramos\b',         # Complex conditional forms
         ]
 
-    def score(self, text: str) -> DifficultyMetrics:
+    def score(self, text: str, context: Optional[AnalysisContext] = None) -> DifficultyMetrics:
         """
         Calculate comprehensive difficulty score for text.
 
         Args:
             text: Input text in Spanish
+            context: Optional shared AnalysisContext (reuses its words and sentences)
 
         Returns:
             DifficultyMetrics object with various scores
         """
         try:
-            # Clean and prepare text
-            cleaned_text = self._clean_text(text)
-
-            # Extract basic metrics
-            sentences = self._split_sentences(cleaned_text)
-            words = self._extract_words(cleaned_text)
-
-            if not words or not sentences:
-                return self._default_metrics()
-
-            # Calculate metrics
-            avg_word_length = self._calculate_avg_word_length(words)
-            avg_sentence_length = self._calculate_avg_sentence_length(sentences)
-            vocabulary_complexity = self._calculate_vocabulary_complexity(words)
-            flesch_score = self._calculate_flesch_score_spanish(
-                len(words), len(sentences), self._count_syllables(words)
-            )
+            return self._score_context(context or AnalysisContext(text))
 
-            # Calculate composite difficulty score (0-1, lower is easier)
-            difficulty_score = self._calculate_composite_score(
-                flesch_score, avg_word_length, avg_sentence_length, vocabulary_complexity
-            )
+        except Exception as e:
+            logger.error(f"Error calculating difficulty score: {str(e)}")
+            return self._default_metrics()
 
-            # Determine CEFR level
-            cefr_level = self._determine_cefr_level(difficulty_score)
+    def _score_context(self, context: AnalysisContext) -> DifficultyMetrics:
+        """Score a text from its shared word and sentence arrays."""
+        sentence_words = context.sentence_words
+        words = context.words
 
-            # Estimate reading time (words per minute for Spanish)
-            reading_time = len(words) / 200.0  # Average Spanish reading speed
+        if not words or not sentence_words:
+            return self._default_metrics()
 
-            return DifficultyMetrics(
-                flesch_score=flesch_score,
-                avg_word_length=avg_word_length,
-                avg_sentence_length=avg_sentence_length,
-                vocabulary_complexity=vocabulary_complexity,
-                cefr_level=cefr_level,
-                difficulty_score=difficulty_score,
-                reading_time_minutes=round(reading_time, 1)
-            )
+        # Calculate metrics
+        avg_word_length = self._calculate_avg_word_length(words)
+        avg_sentence_length = sum(len(s) for s in sentence_words) / len(sentence_words)
+        vocabulary_complexity = self._calculate_vocabulary_complexity(words)
+        flesch_score = self._calculate_flesch_score_spanish(
+            len(words), len(sentence_words), self._count_syllables(words)
+        )
 
-        except Exception as e:
-            logger.error(f"Error calculating difficulty score: {str(e)}")
-            return self._default_metrics()
+        # Calculate composite difficulty score (0-1, lower is easier)
+        difficulty_score = self._calculate_composite_score(
+            flesch_score, avg_word_length, avg_sentence_length, vocabulary_complexity
+        )
+
+        # Determine CEFR level
+        cefr_level = self._determine_cefr_level(difficulty_score)
 
-    def _clean_text(self, text: str) -> str:
-        """Clean text for analysis."""
-        # Remove URLs, emails, and special formatting
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\S+@\S+', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    def _split_sentences(self, text: str) -> List[str]:
-        """Split text into sentences."""
-        # Colombian Spanish sentence splitters
-        sentence_endings = r'[.!?¡¿]+'
-        sentences = re.split(sentence_endings, text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _extract_words(self, text: str) -> List[str]:
-        """Extract words from text."""
-        # Extract Spanish words (including accented characters)
-        words = re.findall(r'\b[a-záéíóúñü]+\b', text.lower())
-        return words
+        # Estimate reading time (words per minute for Spanish)
+        reading_time = len(words) / 200.0  # Average Spanish reading speed
+
+        return DifficultyMetrics(
+            flesch_score=flesch_score,
+            avg_word_length=avg_word_length,
+            avg_sentence_length=avg_sentence_length,
+            vocabulary_complexity=vocabulary_complexity,
+            cefr_level=cefr_level,
+            difficulty_score=difficulty_score,
+            reading_time_minutes=round(reading_time, 1)
+        )
 
     def _calculate_avg_word_length(self, words: List[str]) -> float:
         """Calculate average word length."""
@@ -156,14 +138,6 @@ class DifficultyScorer:
             return 0
         return statistics.mean(len(word) for word in words)
 
-    def _calculate_avg_sentence_length(self, sentences: List[str]) -> float:
-        """Calculate average sentence length in words."""
-        if not sentences:
-            return 0
-
-        total_words = sum(len(self._extract_words(s)) for s in sentences)
-        return total_words / len(sentences)
-
     def _calculate_vocabulary_complexity(self, words: List[str]) -> float:
         """Calculate vocabulary complexity score."""
         if not words:
@@ -305,7 +279,7 @@ class DifficultyScorer:
         Batch difficulty scoring for 5-7x performance improvement
 
         Args:
-            docs: List of spaCy documents or text strings
+            docs: List of spaCy documents, AnalysisContexts or text strings
             vocabulary_list: Pre-computed vocabulary for each doc (optional)
             batch_size: Processing batch size
 
@@ -317,46 +291,29 @@ class DifficultyScorer:
         - Cached language models
         - Batch syllable counting
         """
-        texts = [doc.text if hasattr(doc, 'text') else str(doc) for doc in docs]
+        contexts = ensure_contexts(docs)
         results = []
 
         # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i:i + batch_size]
+        for i in range(0, len(contexts), batch_size):
+            batch_contexts = contexts[i:i + batch_size]
 
             # Batch feature extraction
             batch_results = []
 
-            for j, text in enumerate(batch_texts):
+            for context in batch_contexts:
                 # Check cache
-                text_hash = hash(text)
+                text_hash = hash(context.text)
                 if text_hash in self._feature_cache:
                     batch_results.append(self._feature_cache[text_hash])
                     continue
 
-                # Clean and prepare text
-                cleaned_text = self._clean_text(text)
-
-                # Extract basic metrics
-                sentences = self._split_sentences(cleaned_text)
-                words = self._extract_words(cleaned_text)
-
-                if not words or not sentences:
+                if not context.words or not context.sentence_words:
                     batch_results.append(0.5)  # Default difficulty
                     continue
 
-                # Calculate metrics
-                avg_word_length = self._calculate_avg_word_length(words)
-                avg_sentence_length = self._calculate_avg_sentence_length(sentences)
-                vocabulary_complexity = self._calculate_vocabulary_complexity(words)
-                flesch_score = self._calculate_flesch_score_spanish(
-                    len(words), len(sentences), self._count_syllables(words)
-                )
-
-                # Calculate composite difficulty score
-                difficulty_score = self._calculate_composite_score(
-                    flesch_score, avg_word_length, avg_sentence_length, vocabulary_complexity
-                )
+                # Reuse the shared token arrays instead of re-tokenizing
+                difficulty_score = self._score_context(context).difficulty_score
 
                 # Cache result
                 self._feature_cache[text_hash] = difficulty_score
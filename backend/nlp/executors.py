@@ -0,0 +1,237 @@
+"""
+Execution backends for BatchProcessor
+Runs CPU-bound NLP batches in the default thread pool or a warm process pool
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# spaCy pipe batch size used by each task type
+TASK_BATCH_SIZES: Dict[str, int] = {
+    'sentiment': 32,
+    'ner': 64,
+    'topic': 128,
+    'difficulty': 100,
+    'full': 64
+}
+
+
+@dataclass
+class AnalysisComponents:
+    """NLP pipeline plus the analyzers a batch task may need"""
+    pipeline: Any
+    sentiment_analyzer: Any
+    topic_modeler: Any
+    difficulty_scorer: Any
+
+    @classmethod
+    def build(
+        cls,
+        model_name: str = "es_core_news_md",
+        n_topics: int = 5,
+        topic_snapshot_dir: Optional[str] = None
+    ) -> 'AnalysisComponents':
+        """Load the spaCy model and construct every analyzer once"""
+        from .pipeline import NLPPipeline
+        from .sentiment_analyzer import SentimentAnalyzer
+        from .topic_modeler import TopicModeler
+        from .difficulty_scorer import DifficultyScorer
+
+        return cls(
+            pipeline=NLPPipeline(model_name=model_name),
+            sentiment_analyzer=SentimentAnalyzer(),
+            topic_modeler=TopicModeler(n_topics=n_topics, snapshot_dir=topic_snapshot_dir),
+            difficulty_scorer=DifficultyScorer()
+        )
+
+
+def run_task(components: AnalysisComponents, task_type: str, texts: List[str]) -> List[Any]:
+    """
+    Run one batch task synchronously
+
+    Each text is parsed by spaCy once (nlp.pipe) and the resulting
+    AnalysisContexts are shared by every stage that reads them. Results are
+    plain dicts, lists and floats so they pickle cheaply across processes.
+
+    Args:
+        components: Loaded pipeline and analyzers
+        task_type: sentiment, ner, topic, difficulty, or full
+        texts: Input texts
+
+    Returns:
+        One result per text, in order
+    """
+    if task_type not in TASK_BATCH_SIZES:
+        raise ValueError(f"Unknown task type: {task_type}")
+
+    pipeline = components.pipeline
+    batch_size = TASK_BATCH_SIZES[task_type]
+
+    if task_type == 'full':
+        return pipeline.process_batch(
+            texts,
+            batch_size=batch_size,
+            sentiment_analyzer=components.sentiment_analyzer,
+            topic_modeler=components.topic_modeler,
+            difficulty_scorer=components.difficulty_scorer
+        )
+
+    contexts = pipeline.create_contexts(texts, batch_size=batch_size)
+
+    if task_type == 'sentiment':
+        return components.sentiment_analyzer.analyze_batch(texts, contexts)
+
+    if task_type == 'ner':
+        return [pipeline.extract_entities(context.text, context=context) for context in contexts]
+
+    if task_type == 'topic':
+        return components.topic_modeler.predict_topics_batch(texts, contexts=contexts)
+
+    return components.difficulty_scorer.score_batch(contexts)
+
+
+class BatchExecutor(ABC):
+    """Execution backend plugged into BatchProcessor.start_workers()"""
+
+    async def start(self):
+        """Prepare the backend before the first batch"""
+
+    async def shutdown(self):
+        """Release backend resources"""
+
+    @abstractmethod
+    async def run(self, task_type: str, texts: List[str]) -> List[Any]:
+        """Run one batch task and return one result per text"""
+
+    def processor_map(self, task_types: Optional[List[str]] = None) -> Dict[str, Callable]:
+        """Build a BatchProcessor processor_map backed by this executor"""
+        return {task_type: partial(self.run, task_type) for task_type in (task_types or TASK_BATCH_SIZES)}
+
+
+class ThreadExecutor(BatchExecutor):
+    """
+    Runs tasks on in-process components in the event loop's default executor
+
+    Cheap to start and shares memory with the API process, but stages that
+    hold the GIL (spaCy, TextBlob, syllable counting) do not run in parallel.
+    """
+
+    def __init__(self, components: AnalysisComponents):
+        self.components = components
+
+    async def run(self, task_type: str, texts: List[str]) -> List[Any]:
+        """Run a batch task in the default thread pool"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, run_task, self.components, task_type, texts)
+
+
+# Per-process components, loaded once by the pool initializer
+_worker_components: Optional[AnalysisComponents] = None
+
+
+def _init_worker(model_name: str, n_topics: int, topic_snapshot_dir: Optional[str] = None):
+    """Pool initializer: load spaCy and the analyzers once per worker"""
+    global _worker_components
+    _worker_components = AnalysisComponents.build(
+        model_name=model_name,
+        n_topics=n_topics,
+        topic_snapshot_dir=topic_snapshot_dir
+    )
+    logger.info(f"NLP worker {os.getpid()} ready")
+
+
+def _warmup() -> int:
+    """No-op task used to force worker start-up"""
+    return os.getpid()
+
+
+def _run_in_worker(task_type: str, texts: List[str]) -> List[Any]:
+    """Entry point executed inside a pool worker"""
+    return run_task(_worker_components, task_type, texts)
+
+
+class ProcessExecutor(BatchExecutor):
+    """
+    Runs tasks on a warm pool of worker processes
+
+    Every worker loads the spaCy model and the sentiment, topic and
+    difficulty analyzers once at start-up; only the texts are sent in and
+    plain result dicts come back. Large batches are split into one chunk
+    per worker, so throughput scales with the number of cores instead of
+    being serialized by the GIL.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        model_name: str = "es_core_news_md",
+        n_topics: int = 5,
+        min_chunk_size: int = 8,
+        topic_snapshot_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            model_name: spaCy model loaded by each worker
+            n_topics: TopicModeler topics per worker
+            min_chunk_size: Smallest slice of a batch sent to one worker
+            topic_snapshot_dir: TopicModeler snapshots loaded by each worker
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.model_name = model_name
+        self.n_topics = n_topics
+        self.min_chunk_size = max(1, min_chunk_size)
+        self.topic_snapshot_dir = topic_snapshot_dir
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def start(self):
+        """Create the pool and wait until every worker has loaded its models"""
+        if self._pool is not None:
+            return
+
+        # spawn avoids forking a process that already holds spaCy/BLAS threads
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.model_name, self.n_topics, self.topic_snapshot_dir)
+        )
+
+        loop = asyncio.get_event_loop()
+        pids = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _warmup) for _ in range(self.max_workers)
+        ))
+        logger.info(f"Process executor started with {len(set(pids))} warm workers")
+
+    async def shutdown(self):
+        """Stop all worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _chunks(self, texts: List[str]) -> List[List[str]]:
+        """Split a batch into at most one chunk per worker"""
+        size = max(self.min_chunk_size, math.ceil(len(texts) / self.max_workers))
+        return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+    async def run(self, task_type: str, texts: List[str]) -> List[Any]:
+        """Run a batch task across the worker pool"""
+        if self._pool is None:
+            await self.start()
+
+        loop = asyncio.get_event_loop()
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _run_in_worker, task_type, chunk)
+            for chunk in self._chunks(texts)
+        ))
+        return [result for part in parts for result in part]
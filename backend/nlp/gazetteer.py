@@ -0,0 +1,376 @@
+"""
+Colombian Gazetteer Matcher
+Single-pass multi-pattern matching of known Colombian entities
+"""
+
+import re
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Canonical Colombian gazetteers: category -> {canonical name: entity type}
+COLOMBIAN_GAZETTEERS: Dict[str, Dict[str, str]] = {
+    'political_figures': {
+        'Gustavo Petro': 'PRESIDENT',
+        'Francia Márquez': 'VICE_PRESIDENT',
+        'Iván Duque': 'FORMER_PRESIDENT',
+        'Juan Manuel Santos': 'FORMER_PRESIDENT',
+        'Álvaro Uribe': 'FORMER_PRESIDENT',
+        'Sergio Fajardo': 'POLITICIAN',
+        'Rodolfo Hernández': 'POLITICIAN',
+        'Claudia López': 'MAYOR_BOGOTA',
+        'Daniel Quintero': 'MAYOR_MEDELLIN',
+        'Jorge Iván Ospina': 'MAYOR_CALI'
+    },
+    'institutions': {
+        'Presidencia': 'GOV_EXECUTIVE',
+        'Congreso': 'GOV_LEGISLATIVE',
+        'Senado': 'GOV_LEGISLATIVE',
+        'Cámara de Representantes': 'GOV_LEGISLATIVE',
+        'Corte Suprema': 'GOV_JUDICIAL',
+        'Corte Constitucional': 'GOV_JUDICIAL',
+        'Fiscalía': 'GOV_PROSECUTOR',
+        'Procuraduría': 'GOV_OVERSIGHT',
+        'Contraloría': 'GOV_AUDIT',
+        'MinDefensa': 'GOV_MINISTRY',
+        'MinHacienda': 'GOV_MINISTRY',
+        'MinSalud': 'GOV_MINISTRY',
+        'MinEducación': 'GOV_MINISTRY',
+        'MinMinas': 'GOV_MINISTRY',
+        'MinAgricultura': 'GOV_MINISTRY',
+        'DANE': 'GOV_STATISTICS',
+        'Banco de la República': 'CENTRAL_BANK',
+        'Policía Nacional': 'SECURITY_FORCE',
+        'Ejército Nacional': 'SECURITY_FORCE',
+        'Armada Nacional': 'SECURITY_FORCE',
+        'Fuerza Aérea': 'SECURITY_FORCE'
+    },
+    'cities': {
+        'Bogotá': 'CITY_CAPITAL',
+        'Medellín': 'CITY_MAJOR',
+        'Cali': 'CITY_MAJOR',
+        'Barranquilla': 'CITY_MAJOR',
+        'Cartagena': 'CITY_MAJOR',
+        'Cúcuta': 'CITY_MAJOR',
+        'Bucaramanga': 'CITY_MAJOR',
+        'Pereira': 'CITY_MAJOR',
+        'Santa Marta': 'CITY_MAJOR',
+        'Villavicencio': 'CITY_MAJOR',
+        'Ibagué': 'CITY_MAJOR',
+        'Pasto': 'CITY_MAJOR',
+        'Manizales': 'CITY_MAJOR',
+        'Neiva': 'CITY_MAJOR',
+        'Armenia': 'CITY_MAJOR'
+    },
+    'departments': {
+        'Antioquia': 'DEPARTMENT',
+        'Valle del Cauca': 'DEPARTMENT',
+        'Cundinamarca': 'DEPARTMENT',
+        'Santander': 'DEPARTMENT',
+        'Atlántico': 'DEPARTMENT',
+        'Bolívar': 'DEPARTMENT',
+        'Nariño': 'DEPARTMENT',
+        'Cauca': 'DEPARTMENT',
+        'Meta': 'DEPARTMENT',
+        'Arauca': 'DEPARTMENT',
+        'Putumayo': 'DEPARTMENT',
+        'Chocó': 'DEPARTMENT',
+        'Amazonas': 'DEPARTMENT',
+        'Guaviare': 'DEPARTMENT',
+        'Vaupés': 'DEPARTMENT',
+        'Vichada': 'DEPARTMENT'
+    },
+    'regions': {
+        'Pacífico': 'REGION',
+        'Caribe': 'REGION',
+        'Andina': 'REGION',
+        'Orinoquía': 'REGION',
+        'Amazonía': 'REGION',
+        'Costa Atlántica': 'REGION',
+        'Eje Cafetero': 'REGION',
+        'Magdalena Medio': 'REGION',
+        'Urabá': 'REGION',
+        'Catatumbo': 'REGION'
+    },
+    'companies': {
+        'Ecopetrol': 'COMPANY_ENERGY',
+        'Avianca': 'COMPANY_AIRLINE',
+        'Grupo Éxito': 'COMPANY_RETAIL',
+        'Bancolombia': 'COMPANY_BANKING',
+        'Grupo Argos': 'COMPANY_CEMENT',
+        'Grupo Sura': 'COMPANY_FINANCE',
+        'Bavaria': 'COMPANY_BEVERAGE',
+        'Postobón': 'COMPANY_BEVERAGE',
+        'Alpina': 'COMPANY_FOOD',
+        'Colsubsidio': 'COMPANY_RETAIL',
+        'EPM': 'COMPANY_UTILITIES',
+        'ISA': 'COMPANY_ENERGY',
+        'Nutresa': 'COMPANY_FOOD'
+    },
+    'conflict_actors': {
+        'FARC': 'ARMED_GROUP',
+        'ELN': 'ARMED_GROUP',
+        'Clan del Golfo': 'CRIMINAL_GROUP',
+        'Los Rastrojos': 'CRIMINAL_GROUP',
+        'Los Pelusos': 'CRIMINAL_GROUP',
+        'paramilitares': 'ARMED_GROUP',
+        'guerrilla': 'ARMED_GROUP',
+        'disidencias': 'ARMED_GROUP'
+    },
+    'economic_terms': {
+        'peso colombiano': 'CURRENCY',
+        'COP': 'CURRENCY',
+        'UVR': 'ECONOMIC_UNIT',
+        'UVT': 'TAX_UNIT',
+        'SMMLV': 'MINIMUM_WAGE',
+        'salario mínimo': 'MINIMUM_WAGE',
+        'DTF': 'INTEREST_RATE',
+        'IBR': 'INTEREST_RATE',
+        'IPC': 'INFLATION_INDEX',
+        'PIB': 'GDP',
+        'TRM': 'EXCHANGE_RATE'
+    }
+}
+
+# Surface variants that should resolve to a canonical gazetteer entry
+COLOMBIAN_ALIASES: Dict[str, str] = {
+    'Bogotá D.C.': 'Bogotá',
+    'paramilitar': 'paramilitares',
+    'guerrillas': 'guerrilla',
+    'disidencia': 'disidencias',
+    'Banrep': 'Banco de la República',
+}
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+@lru_cache(maxsize=65536)
+def fold_token(token: str) -> str:
+    """Lowercase a token and strip accents (Bogotá -> bogota)"""
+    token = token.lower()
+    if token.isascii():
+        return token
+    decomposed = unicodedata.normalize('NFKD', token)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize_folded(text: str) -> List[Tuple[str, int, int]]:
+    """Split text into (folded token, start, end) triples with original offsets"""
+    return [
+        (fold_token(m.group()), m.start(), m.end())
+        for m in _WORD_PATTERN.finditer(text)
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class GazetteerEntry:
+    """A single gazetteer entry"""
+    name: str  # Canonical surface form
+    category: str  # Gazetteer the entry belongs to (cities, companies, ...)
+    label: str  # Fine-grained entity type (CITY_MAJOR, ARMED_GROUP, ...)
+
+
+@dataclass(frozen=True, slots=True)
+class GazetteerMatch:
+    """A gazetteer hit in a text, with character offsets into the original"""
+    start: int
+    end: int
+    text: str  # Surface form as written in the text
+    entry: GazetteerEntry
+
+    @property
+    def name(self) -> str:
+        return self.entry.name
+
+    @property
+    def category(self) -> str:
+        return self.entry.category
+
+    @property
+    def label(self) -> str:
+        return self.entry.label
+
+
+class GazetteerMatcher:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Patterns are tokenized and accent/case folded once at build time; text is
+    scanned in a single left-to-right pass over its tokens, so matching cost
+    is O(text length + matches) regardless of how many entries are loaded.
+    Working on whole tokens gives word-boundary matching for free: 'Cali'
+    does not match inside 'calidad' and 'ISA' does not match inside 'precisa'.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, GazetteerEntry]] = ()):
+        """
+        Build the automaton
+
+        Args:
+            entries: (surface pattern, entry) pairs; several patterns may map
+                to the same entry (aliases)
+        """
+        # Node 0 is the root. goto[n] maps folded token -> child node
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Output: (pattern length in tokens, entry) tuples emitted at a node
+        self._output: List[List[Tuple[int, GazetteerEntry]]] = [[]]
+        self._pattern_count = 0
+
+        for pattern, entry in entries:
+            self._add_pattern(pattern, entry)
+
+        self._build_failure_links()
+
+    @classmethod
+    def from_gazetteers(
+        cls,
+        gazetteers: Dict[str, Dict[str, str]],
+        aliases: Optional[Dict[str, str]] = None
+    ) -> 'GazetteerMatcher':
+        """
+        Build a matcher from {category: {name: label}} dictionaries
+
+        Args:
+            gazetteers: Gazetteers keyed by category
+            aliases: Optional {variant: canonical name} map
+
+        Returns:
+            Compiled GazetteerMatcher
+        """
+        pairs: List[Tuple[str, GazetteerEntry]] = []
+        by_name: Dict[str, List[GazetteerEntry]] = {}
+
+        for category, names in gazetteers.items():
+            for name, label in names.items():
+                entry = GazetteerEntry(name=name, category=category, label=label)
+                pairs.append((name, entry))
+                by_name.setdefault(name, []).append(entry)
+
+        for variant, canonical in (aliases or {}).items():
+            for entry in by_name.get(canonical, []):
+                pairs.append((variant, entry))
+
+        return cls(pairs)
+
+    def _add_pattern(self, pattern: str, entry: GazetteerEntry) -> None:
+        """Insert a pattern into the trie"""
+        tokens = [fold_token(t) for t in _WORD_PATTERN.findall(pattern)]
+        if not tokens:
+            return
+
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][token] = child
+            node = child
+
+        if (len(tokens), entry) not in self._output[node]:
+            self._output[node].append((len(tokens), entry))
+            self._pattern_count += 1
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+
+                # Inherit outputs of the longest proper suffix
+                self._output[child].extend(self._output[self._fail[child]])
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of (pattern, entry) pairs compiled into the automaton"""
+        return self._pattern_count
+
+    def find_all(self, text: str) -> List[GazetteerMatch]:
+        """
+        Find every gazetteer occurrence in text in one pass
+
+        Args:
+            text: Input text (original casing and accents)
+
+        Returns:
+            Matches ordered by end offset, overlapping matches included
+            (e.g. both 'Valle del Cauca' and 'Cauca')
+        """
+        if not text:
+            return []
+
+        tokens = tokenize_folded(text)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        matches: List[GazetteerMatch] = []
+        node = 0
+
+        for index, (token, _, end) in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+
+            for length, entry in output[node]:
+                start = tokens[index - length + 1][1]
+                matches.append(GazetteerMatch(
+                    start=start,
+                    end=end,
+                    text=text[start:end],
+                    entry=entry
+                ))
+
+        return matches
+
+    def find_by_category(self, text: str) -> Dict[str, List[GazetteerEntry]]:
+        """
+        Group distinct matched entries by category, in order of first appearance
+
+        Args:
+            text: Input text
+
+        Returns:
+            {category: [entries]} for categories with at least one match
+        """
+        grouped: Dict[str, List[GazetteerEntry]] = {}
+        seen = set()
+
+        for match in self.find_all(text):
+            if match.entry in seen:
+                continue
+            seen.add(match.entry)
+            grouped.setdefault(match.category, []).append(match.entry)
+
+        return grouped
+
+
+@lru_cache(maxsize=1)
+def get_colombian_gazetteer() -> GazetteerMatcher:
+    """
+    Get the shared matcher compiled from all Colombian gazetteers
+
+    Built once per process and shared by NLPPipeline, ColombianNER and
+    SourceManager.
+    """
+    matcher = GazetteerMatcher.from_gazetteers(COLOMBIAN_GAZETTEERS, COLOMBIAN_ALIASES)
+    logger.info(f"Compiled Colombian gazetteer with {matcher.pattern_count} patterns")
+    return matcher
@@ -0,0 +1,227 @@
+"""
+Batch Job Store
+Bounded registry of BatchProcessor jobs with age and count retention
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .batch_processor import BatchJob
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryJobStore:
+    """
+    In-process job registry with bounded retention
+
+    Queued and running jobs are always kept. Finished jobs are dropped once
+    they are older than max_age_seconds, or oldest-first when more than
+    max_jobs jobs are registered, so memory stays bounded under sustained
+    load. Pruning is amortized O(1) per finished job.
+    """
+
+    def __init__(self, max_jobs: int = 100000, max_age_seconds: float = 3600.0):
+        """
+        Args:
+            max_jobs: Maximum registered jobs before finished ones are evicted
+            max_age_seconds: How long finished jobs stay queryable
+        """
+        self.max_jobs = max_jobs
+        self.max_age_seconds = max_age_seconds
+        self._jobs: Dict[str, 'BatchJob'] = {}
+        # (finish time, job_id) in completion order
+        self._finished: Deque[Tuple[float, str]] = deque()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def add(self, job: 'BatchJob') -> None:
+        """Register a new job"""
+        self._jobs[job.job_id] = job
+        self.prune()
+
+    def get(self, job_id: str) -> Optional['BatchJob']:
+        """Get a job registered in this process"""
+        return self._jobs.get(job_id)
+
+    async def fetch(self, job_id: str) -> Optional['BatchJob']:
+        """Get a job, including ones only known to a shared store"""
+        return self.get(job_id)
+
+    def update(self, job: 'BatchJob') -> None:
+        """Record a status change of a live job (no-op in memory)"""
+
+    def finish(self, job: 'BatchJob') -> None:
+        """Record that a job completed or failed, making it eligible for expiry"""
+        self._finished.append((time.monotonic(), job.job_id))
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop expired finished jobs
+
+        Returns:
+            Number of jobs removed
+        """
+        removed = 0
+        cutoff = time.monotonic() - self.max_age_seconds
+
+        while self._finished and (
+            self._finished[0][0] < cutoff or len(self._jobs) > self.max_jobs
+        ):
+            _, job_id = self._finished.popleft()
+            if self._jobs.pop(job_id, None) is not None:
+                removed += 1
+
+        self.evicted += removed
+        return removed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Registry statistics"""
+        return {
+            'registered_jobs': len(self._jobs),
+            'finished_jobs': len(self._finished),
+            'evicted_jobs': self.evicted
+        }
+
+
+class RedisJobStore(MemoryJobStore):
+    """
+    Job registry mirrored to Redis
+
+    Live jobs stay in memory (workers and result() waiters need the objects),
+    while status snapshots are written to the CacheManager 'batch_job' layer
+    so any API worker can answer status queries and finished jobs survive
+    restarts until max_age_seconds expires. Writes from a burst of submissions
+    or a finished batch are coalesced into one pipelined flush.
+    """
+
+    def __init__(
+        self,
+        remote: Any,
+        layer: str = "batch_job",
+        max_jobs: int = 100000,
+        max_age_seconds: float = 3600.0
+    ):
+        """
+        Args:
+            remote: CacheManager instance
+            layer: Cache layer holding job snapshots
+            max_jobs: Local retention by count
+            max_age_seconds: Retention by age, also used as the Redis TTL
+        """
+        super().__init__(max_jobs=max_jobs, max_age_seconds=max_age_seconds)
+        self.remote = remote
+        self.layer = layer
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._flush_pending = False
+
+    def add(self, job: 'BatchJob') -> None:
+        super().add(job)
+        self._mark_dirty(job)
+
+    def finish(self, job: 'BatchJob') -> None:
+        super().finish(job)
+        self._mark_dirty(job)
+
+    def update(self, job: 'BatchJob') -> None:
+        self._mark_dirty(job)
+
+    async def fetch(self, job_id: str) -> Optional['BatchJob']:
+        job = self.get(job_id)
+        if job is not None:
+            return job
+
+        try:
+            record = await self.remote.get(self.layer, job_id)
+        except Exception as e:
+            logger.warning(f"Job store lookup failed for {job_id}: {e}")
+            return None
+
+        return job_from_record(record) if record else None
+
+    async def flush(self) -> int:
+        """
+        Write pending snapshots to Redis
+
+        Returns:
+            Number of snapshots written
+        """
+        self._flush_pending = False
+        if not self._dirty:
+            return 0
+
+        items = [{'identifier': job_id, 'value': record} for job_id, record in self._dirty.items()]
+        self._dirty = {}
+
+        try:
+            return await self.remote.warm_cache(self.layer, items, ttl=int(self.max_age_seconds))
+        except Exception as e:
+            logger.warning(f"Job store flush failed: {e}")
+            return 0
+
+    def _mark_dirty(self, job: 'BatchJob') -> None:
+        self._dirty[job.job_id] = job_to_record(job)
+        if self._flush_pending:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Flushed on the next call made from the event loop
+
+        self._flush_pending = True
+        loop.create_task(self.flush())
+
+
+def job_to_record(job: 'BatchJob') -> Dict[str, Any]:
+    """JSON-serializable snapshot of a job (input payload excluded)"""
+    return {
+        'job_id': job.job_id,
+        'task_type': job.task_type,
+        'priority': job.priority.value,
+        'status': job.status.value,
+        'created_at': _isoformat(job.created_at),
+        'started_at': _isoformat(job.started_at),
+        'completed_at': _isoformat(job.completed_at),
+        'result': job.result,
+        'error': job.error,
+        'metadata': job.metadata
+    }
+
+
+def job_from_record(record: Dict[str, Any]) -> 'BatchJob':
+    """Rebuild a BatchJob from job_to_record() output"""
+    from .batch_processor import BatchJob, JobPriority, JobStatus
+
+    return BatchJob(
+        job_id=record['job_id'],
+        task_type=record['task_type'],
+        input_data=None,
+        priority=JobPriority(record['priority']),
+        status=JobStatus(record['status']),
+        created_at=_parse_datetime(record['created_at']),
+        started_at=_parse_datetime(record.get('started_at')),
+        completed_at=_parse_datetime(record.get('completed_at')),
+        result=record.get('result'),
+        error=record.get('error'),
+        metadata=record.get('metadata') or {}
+    )
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
@@ -4,12 +4,19 @@ Simplified NLP pipeline for entity extraction and text summarization
 """
 
 import spacy
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+
+from .analysis_context import AnalysisContext
+from .gazetteer import get_colombian_gazetteer
 
 logger = logging.getLogger(__name__)
 
+# Gazetteer categories that make a sentence more summary-worthy
+SUMMARY_BOOST_CATEGORIES = {'political_figures', 'institutions', 'cities', 'companies'}
+
 
 @dataclass
 class EntityResult:
@@ -59,57 +66,50 @@ class NLPPipeline:
         self._initialize_colombian_patterns()
 
     def _initialize_colombian_patterns(self):
-        """Initialize Colombian-specific entity patterns"""
+        """Attach the shared Colombian gazetteer matcher"""
+        # One compiled automaton covers political figures, institutions,
+        # cities, departments, companies and conflict actors
+        self.gazetteer = get_colombian_gazetteer()
 
-        # Political figures and government
-        self.colombian_political = {
-            'Gustavo Petro', 'Francia Márquez', 'Iván Duque',
-            'Juan Manuel Santos', 'Álvaro Uribe', 'Sergio Fajardo',
-            'Claudia López', 'Daniel Quintero', 'Jorge Iván Ospina'
-        }
+    def create_context(self, text: str) -> AnalysisContext:
+        """
+        Create a shared analysis context for text
 
-        # Government institutions
-        self.colombian_institutions = {
-            'Presidencia', 'Congreso', 'Senado', 'Cámara de Representantes',
-            'Corte Suprema', 'Corte Constitucional', 'Fiscalía',
-            'Procuraduría', 'Contraloría', 'Banco de la República',
-            'DANE', 'MinDefensa', 'MinHacienda', 'MinSalud', 'MinEducación',
-            'Policía Nacional', 'Ejército Nacional', 'Armada Nacional'
-        }
+        The text is parsed lazily, at most once, the first time a stage needs
+        the spaCy Doc or its derived token/sentence/lemma arrays.
 
-        # Major Colombian cities
-        self.colombian_cities = {
-            'Bogotá', 'Medellín', 'Cali', 'Barranquilla', 'Cartagena',
-            'Cúcuta', 'Bucaramanga', 'Pereira', 'Santa Marta', 'Villavicencio',
-            'Ibagué', 'Pasto', 'Manizales', 'Neiva', 'Armenia'
-        }
+        Args:
+            text: Input text
 
-        # Colombian departments
-        self.colombian_departments = {
-            'Antioquia', 'Valle del Cauca', 'Cundinamarca', 'Santander',
-            'Atlántico', 'Bolívar', 'Nariño', 'Cauca', 'Meta', 'Arauca',
-            'Putumayo', 'Chocó', 'Amazonas', 'Guaviare', 'Vaupés', 'Vichada'
-        }
+        Returns:
+            AnalysisContext bound to this pipeline's spaCy model
+        """
+        return AnalysisContext(text, nlp=self.nlp)
 
-        # Colombian companies
-        self.colombian_companies = {
-            'Ecopetrol', 'Avianca', 'Grupo Éxito', 'Bancolombia',
-            'Grupo Argos', 'Grupo Sura', 'Bavaria', 'Postobón',
-            'Alpina', 'Colsubsidio', 'EPM', 'ISA', 'Nutresa'
-        }
+    def create_contexts(self, texts: List[str], batch_size: int = 64) -> List[AnalysisContext]:
+        """
+        Parse a batch of texts with nlp.pipe and wrap each Doc in a context
 
-        # Armed groups and conflict actors
-        self.conflict_actors = {
-            'FARC', 'ELN', 'Clan del Golfo', 'Los Rastrojos',
-            'paramilitares', 'guerrilla', 'disidencias'
-        }
+        Args:
+            texts: Input texts
+            batch_size: spaCy pipe batch size
 
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+        Returns:
+            One AnalysisContext per text, in order
+        """
+        return AnalysisContext.build_batch(self.nlp, texts, batch_size=batch_size)
+
+    def extract_entities(
+        self,
+        text: str,
+        context: Optional[AnalysisContext] = None
+    ) -> Dict[str, List[str]]:
         """
         Extract named entities from text with Colombian-specific enhancements
 
         Args:
             text: Input text to analyze
+            context: Optional shared AnalysisContext (reuses its parse)
 
         Returns:
             Dictionary containing extracted entities by type:
@@ -137,8 +137,8 @@ class NLPPipeline:
             return self._empty_entity_dict()
 
         try:
-            # Process text with spaCy
-            doc = self.nlp(text)
+            # Reuse the shared parse when available
+            doc = (context or self.create_context(text)).doc
 
             # Initialize entity containers
             entities = {
@@ -171,38 +171,10 @@ class NLPPipeline:
                 elif ent.label_ == 'PERCENT':
                     entities['percentages'].append(ent.text)
 
-            # Enhance with Colombian-specific entities
-            text_lower = text.lower()
-
-            # Check for political figures
-            for figure in self.colombian_political:
-                if figure.lower() in text_lower:
-                    entities['political_figures'].append(figure)
-
-            # Check for institutions
-            for institution in self.colombian_institutions:
-                if institution.lower() in text_lower:
-                    entities['institutions'].append(institution)
-
-            # Check for cities
-            for city in self.colombian_cities:
-                if city.lower() in text_lower:
-                    entities['cities'].append(city)
-
-            # Check for departments
-            for dept in self.colombian_departments:
-                if dept.lower() in text_lower:
-                    entities['departments'].append(dept)
-
-            # Check for companies
-            for company in self.colombian_companies:
-                if company.lower() in text_lower:
-                    entities['companies'].append(company)
-
-            # Check for conflict actors
-            for actor in self.conflict_actors:
-                if actor.lower() in text_lower:
-                    entities['conflict_actors'].append(actor)
+            # Enhance with Colombian-specific entities (single gazetteer pass)
+            for category, matched in self.gazetteer.find_by_category(text).items():
+                if category in entities:
+                    entities[category].extend(entry.name for entry in matched)
 
             # Deduplicate all lists
             for key in entities:
@@ -215,13 +187,19 @@ class NLPPipeline:
             logger.error(f"Error extracting entities: {e}", exc_info=True)
             return self._empty_entity_dict()
 
-    def summarize(self, text: str, max_sentences: int = 3) -> str:
+    def summarize(
+        self,
+        text: str,
+        max_sentences: int = 3,
+        context: Optional[AnalysisContext] = None
+    ) -> str:
         """
         Generate a summary of the text using extractive summarization
 
         Args:
             text: Input text to summarize
             max_sentences: Maximum number of sentences in summary (default: 3)
+            context: Optional shared AnalysisContext (reuses its parse)
 
         Returns:
             Summary text containing the most important sentences
@@ -236,9 +214,11 @@ class NLPPipeline:
             logger.warning("Empty text provided to summarize")
             return ""
 
+        context = context or self.create_context(text)
+
         try:
-            # Process text with spaCy
-            doc = self.nlp(text)
+            # Reuse the shared parse
+            doc = context.doc
 
             # Get sentences
             sentences = list(doc.sents)
@@ -250,6 +230,12 @@ class NLPPipeline:
             # Score sentences based on multiple factors
             sentence_scores = []
 
+            # Locate Colombian entities once for the whole text
+            gazetteer_hits = [
+                match for match in self.gazetteer.find_all(text)
+                if match.category in SUMMARY_BOOST_CATEGORIES
+            ]
+
             for i, sent in enumerate(sentences):
                 score = 0.0
 
@@ -277,14 +263,10 @@ class NLPPipeline:
                 score += verb_count * 0.5
 
                 # Factor 6: Colombian-specific entities boost
-                sent_text = sent.text.lower()
-                colombian_entity_count = 0
-
-                for entity_set in [self.colombian_political, self.colombian_institutions,
-                                 self.colombian_cities, self.colombian_companies]:
-                    for entity in entity_set:
-                        if entity.lower() in sent_text:
-                            colombian_entity_count += 1
+                colombian_entity_count = len({
+                    match.entry for match in gazetteer_hits
+                    if sent.start_char <= match.start < sent.end_char
+                })
 
                 score += colombian_entity_count * 2.5
 
@@ -310,9 +292,7 @@ class NLPPipeline:
             logger.error(f"Error generating summary: {e}", exc_info=True)
             # Return first few sentences as fallback
             try:
-                doc = self.nlp(text)
-                sentences = list(doc.sents)[:max_sentences]
-                return ' '.join([sent.text for sent in sentences])
+                return ' '.join(context.sentences[:max_sentences])
             except:
                 return text[:500] + "..." if len(text) > 500 else text
 
@@ -333,16 +313,33 @@ class NLPPipeline:
             'conflict_actors': []
         }
 
-    def process(self, text: str, include_summary: bool = True) -> Dict:
+    def process(
+        self,
+        text: str,
+        include_summary: bool = True,
+        context: Optional[AnalysisContext] = None,
+        sentiment_analyzer=None,
+        topic_modeler=None,
+        difficulty_scorer=None
+    ) -> Dict:
         """
         Process text with both entity extraction and summarization
 
+        The text is parsed by spaCy once and the same AnalysisContext is handed
+        to every stage, including the optional sentiment, topic and
+        difficulty analyzers.
+
         Args:
             text: Input text to process
             include_summary: Whether to include summary (default: True)
+            context: Optional pre-built AnalysisContext for text
+            sentiment_analyzer: Optional SentimentAnalyzer to include sentiment
+            topic_modeler: Optional TopicModeler to include topics
+            difficulty_scorer: Optional DifficultyScorer to include difficulty
 
         Returns:
-            Dictionary containing entities and optionally summary
+            Dictionary containing entities and optionally summary, sentiment,
+            topics and difficulty
 
         Example:
             >>> pipeline = NLPPipeline()
@@ -350,15 +347,61 @@ class NLPPipeline:
             >>> print(result['entities']['persons'])
             >>> print(result['summary'])
         """
+        context = context or self.create_context(text)
+
         result = {
-            'entities': self.extract_entities(text)
+            'entities': self.extract_entities(text, context=context)
         }
 
         if include_summary:
-            result['summary'] = self.summarize(text)
+            result['summary'] = self.summarize(text, context=context)
+
+        if sentiment_analyzer is not None:
+            result['sentiment'] = sentiment_analyzer.analyze(text, context=context)
+
+        if topic_modeler is not None:
+            result['topics'] = topic_modeler.predict_topics(text, context=context)
+
+        if difficulty_scorer is not None:
+            result['difficulty'] = asdict(difficulty_scorer.score(text, context=context))
 
         return result
 
+    def process_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        **kwargs: Any
+    ) -> List[Dict]:
+        """
+        Process a batch of texts with a single nlp.pipe parse per text
+
+        Args:
+            texts: Input texts
+            batch_size: spaCy pipe batch size
+            **kwargs: Forwarded to process() (include_summary, analyzers)
+
+        Returns:
+            One result dictionary per text, in order
+        """
+        return [
+            self.process(context.text, context=context, **kwargs)
+            for context in self.create_contexts(texts, batch_size=batch_size)
+        ]
+
+    async def process_batch_async(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        **kwargs: Any
+    ) -> List[Dict]:
+        """Run process_batch in the default executor"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: self.process_batch(texts, batch_size=batch_size, **kwargs)
+        )
+
 
 # Convenience function for quick usage
 def create_pipeline(model_name: str = "es_core_news_md") -> NLPPipeline:
@@ -0,0 +1,218 @@
+"""
+NLP Result Cache
+Two-tier (in-process LRU + Redis) cache for batch analysis results
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation outside the API
+try:
+    from app.core.metrics import (
+        nlp_result_cache_hits,
+        nlp_result_cache_misses,
+        nlp_result_cache_evictions,
+        nlp_result_cache_bytes
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+# CacheManager layer holding each task type's results
+TASK_CACHE_LAYERS: Dict[str, str] = {
+    'sentiment': 'sentiment',
+    'ner': 'entities',
+    'topic': 'topics',
+    'difficulty': 'nlp_analysis',
+    'full': 'nlp_analysis'
+}
+
+# Sentinel for "not cached" (None is a valid result)
+MISSING = object()
+
+
+def content_hash(input_data: Any) -> str:
+    """
+    Stable SHA-256 of an input, identical across processes and restarts
+
+    Text whitespace is collapsed first so syndicated copies of an article
+    that differ only in line wrapping share one hash.
+    """
+    if isinstance(input_data, str):
+        payload = ' '.join(input_data.split())
+    else:
+        payload = json.dumps(input_data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Byte-bounded LRU of analysis results, optionally backed by Redis
+
+    Keys are "<task_type>:<model_version>:<sha256>" so they can be shared
+    by every API worker and survive restarts, and change automatically when
+    the model version is bumped. Lookups go to the in-process tier first;
+    misses are batched into a single Redis MGET per batch and hits are
+    promoted back into memory.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: int = 10000,
+        model_version: str = "1",
+        remote: Optional[Any] = None
+    ):
+        """
+        Args:
+            max_bytes: Approximate memory budget of the in-process tier
+            max_entries: Maximum number of in-process entries
+            model_version: Included in every key
+            remote: Optional CacheManager used as the shared second tier
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.model_version = model_version
+        self.remote = remote
+
+        self._entries: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self.current_bytes = 0
+        self.stats = {'hits': 0, 'remote_hits': 0, 'misses': 0, 'evictions': 0}
+
+    def make_key(self, task_type: str, input_data: Any) -> str:
+        """Build the cache key for a task input"""
+        return f"{task_type}:{self.model_version}:{content_hash(input_data)}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any:
+        """
+        Look up the in-process tier
+
+        Returns:
+            Cached value, or MISSING
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        self._record_hit('memory', key)
+        return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in the in-process tier, evicting least recently used"""
+        size = self._estimate_size(key, value)
+        if size > self.max_bytes:
+            return  # Larger than the whole budget; never cache
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[1]
+
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+
+        while self._entries and (
+            self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.stats['evictions'] += 1
+            if METRICS_AVAILABLE:
+                nlp_result_cache_evictions.inc()
+
+        if METRICS_AVAILABLE:
+            nlp_result_cache_bytes.set(self.current_bytes)
+
+    async def get_remote_many(self, task_type: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up keys in Redis in one round trip and promote hits to memory
+
+        Keys not found in either tier are counted as misses.
+
+        Returns:
+            {key: value} for keys found remotely
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+
+        if self.remote is not None and keys:
+            try:
+                layer = TASK_CACHE_LAYERS.get(task_type, 'nlp_analysis')
+                found = await self.remote.get_many(layer, keys)
+            except Exception as e:
+                logger.warning(f"Remote result cache lookup failed: {e}")
+                found = {}
+
+        for key in keys:
+            if key in found:
+                self.put(key, found[key])
+                self.stats['remote_hits'] += 1
+                self._record_hit('redis', key)
+            else:
+                self.stats['misses'] += 1
+                if METRICS_AVAILABLE:
+                    nlp_result_cache_misses.labels(task_type=task_type).inc()
+
+        return found
+
+    async def put_many(self, task_type: str, items: Dict[str, Any]) -> None:
+        """Store results in memory and write them through to Redis"""
+        for key, value in items.items():
+            self.put(key, value)
+
+        if self.remote is None or not items:
+            return
+
+        try:
+            await self.remote.warm_cache(
+                TASK_CACHE_LAYERS.get(task_type, 'nlp_analysis'),
+                [{'identifier': key, 'value': value} for key, value in items.items()]
+            )
+        except Exception as e:
+            logger.warning(f"Remote result cache write failed: {e}")
+
+    def record_coalesced(self, key: str) -> None:
+        """Count a request served by an identical in-flight job"""
+        self.stats['hits'] += 1
+        self._record_hit('inflight', key)
+
+    def clear(self) -> None:
+        """Clear the in-process tier (Redis entries expire by TTL)"""
+        self._entries.clear()
+        self.current_bytes = 0
+        if METRICS_AVAILABLE:
+            nlp_result_cache_bytes.set(0)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
+
+    @staticmethod
+    def _estimate_size(key: str, value: Any) -> int:
+        """Approximate footprint of an entry (serialized size)"""
+        try:
+            return len(key) + len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return len(key) + len(repr(value))
+
+    @staticmethod
+    def _record_hit(tier: str, key: str) -> None:
+        if METRICS_AVAILABLE:
+            nlp_result_cache_hits.labels(tier=tier, task_type=key.split(':', 1)[0]).inc()
@@ -5,10 +5,15 @@ Optimized for analyzing sentiment in Colombian news content with support for
 Spanish language nuances and regional expressions.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
+from itertools import chain, repeat
 import re
+import numpy as np
 from textblob import TextBlob
+
+from .analysis_context import AnalysisContext, ensure_contexts
+
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
     VADER_AVAILABLE = True
@@ -80,12 +85,52 @@ class SentimentAnalyzer:
         if self.use_vader:
             self.vader = SentimentIntensityAnalyzer()
 
-    def analyze(self, text: str) -> Dict[str, float]:
+        self._build_lexicon_index()
+
+    def _build_lexicon_index(self) -> None:
+        """
+        Map every lexicon, modifier and negation word to an integer id, with
+        per-id lookup arrays used by the vectorized batch path.
+        """
+        vocabulary: Dict[str, int] = {}
+        for word in chain(
+            self.COLOMBIAN_SENTIMENT_LEXICON,
+            self.COLOMBIAN_INTENSIFIERS,
+            self.COLOMBIAN_DIMINISHERS,
+            self.NEGATIONS
+        ):
+            vocabulary.setdefault(word, len(vocabulary))
+
+        size = len(vocabulary)
+        self._vocabulary = vocabulary
+        self._is_lexicon = np.zeros(size, dtype=bool)
+        self._lexicon_values = np.zeros(size, dtype=np.float64)
+        self._is_intensifier = np.zeros(size, dtype=bool)
+        self._intensifier_values = np.ones(size, dtype=np.float64)
+        self._is_diminisher = np.zeros(size, dtype=bool)
+        self._diminisher_values = np.ones(size, dtype=np.float64)
+        self._is_negation = np.zeros(size, dtype=bool)
+
+        for word, value in self.COLOMBIAN_SENTIMENT_LEXICON.items():
+            self._is_lexicon[vocabulary[word]] = True
+            self._lexicon_values[vocabulary[word]] = value
+        for word, value in self.COLOMBIAN_INTENSIFIERS.items():
+            self._is_intensifier[vocabulary[word]] = True
+            self._intensifier_values[vocabulary[word]] = value
+        for word, value in self.COLOMBIAN_DIMINISHERS.items():
+            self._is_diminisher[vocabulary[word]] = True
+            self._diminisher_values[vocabulary[word]] = value
+        for word in self.NEGATIONS:
+            self._is_negation[vocabulary[word]] = True
+
+    def analyze(self, text: str, context: Optional[AnalysisContext] = None) -> Dict[str, float]:
         """
         Analyze sentiment of Spanish text with Colombian context awareness.
 
         Args:
             text: Input text to analyze (Spanish)
+            context: Optional shared AnalysisContext; its words are reused
+                instead of re-tokenizing the text
 
         Returns:
             Dictionary with keys:
@@ -93,7 +138,11 @@ class SentimentAnalyzer:
                 - subjectivity: Text subjectivity (0 to 1)
                 - confidence: Analysis confidence (0 to 1)
         """
-        if not text or not text.strip():
+        if context is None:
+            context = AnalysisContext(text)
+        text = context.text
+
+        if not text.strip():
             return {
                 "polarity": 0.0,
                 "subjectivity": 0.0,
@@ -108,15 +157,17 @@ class SentimentAnalyzer:
         base_polarity = blob.sentiment.polarity
         base_subjectivity = blob.sentiment.subjectivity
 
-        # Apply Colombian context adjustments
+        # Apply Colombian context adjustments (tokens of the normalized text,
+        # so contractions like "q" count as "que" and punctuation stays attached)
+        words = normalized_text.split()
         adjusted_polarity = self._adjust_for_colombian_context(
-            normalized_text,
+            words,
             base_polarity
         )
 
         # Calculate confidence based on multiple factors
         confidence = self._calculate_confidence(
-            normalized_text,
+            words,
             base_polarity,
             base_subjectivity
         )
@@ -151,13 +202,12 @@ class SentimentAnalyzer:
 
         return text.strip()
 
-    def _adjust_for_colombian_context(self, text: str, base_polarity: float) -> float:
+    def _adjust_for_colombian_context(self, words: List[str], base_polarity: float) -> float:
         """
         Adjust sentiment based on Colombian Spanish context.
 
         Handles intensifiers, diminishers, negations, and Colombian-specific terms.
         """
-        words = text.split()
         adjustment = 0.0
         multiplier = 1.0
 
@@ -191,7 +241,7 @@ class SentimentAnalyzer:
 
     def _calculate_confidence(
         self,
-        text: str,
+        words: List[str],
         polarity: float,
         subjectivity: float
     ) -> float:
@@ -207,7 +257,7 @@ class SentimentAnalyzer:
         confidence = 0.5  # Base confidence
 
         # Length factor (more text = higher confidence)
-        word_count = len(text.split())
+        word_count = len(words)
         if word_count > 50:
             confidence += 0.2
         elif word_count > 20:
@@ -220,7 +270,6 @@ class SentimentAnalyzer:
         confidence += polarity_strength * 0.2
 
         # Check for Colombian context words
-        words = text.split()
         context_words = sum(1 for word in words if word in self.COLOMBIAN_SENTIMENT_LEXICON)
         if context_words > 0:
             confidence += min(context_words * 0.05, 0.2)
@@ -232,17 +281,214 @@ class SentimentAnalyzer:
         # Clamp to valid range
         return max(0.0, min(1.0, confidence))
 
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+    def analyze_batch(
+        self,
+        texts: List[str],
+        contexts: Optional[List[AnalysisContext]] = None,
+        chunk_size: int = 10000
+    ) -> List[Dict[str, float]]:
         """
         Analyze multiple texts in batch.
 
+        Tokens of the whole batch are mapped to lexicon ids once and the
+        Colombian adjustments, negation flips and confidence are computed
+        with array operations. Results are numerically identical to
+        analyze(): per-document sums and products are accumulated left to
+        right in the same order as the scalar loops.
+
         Args:
-            texts: List of texts to analyze
+            texts: List of texts (or spaCy Docs / AnalysisContexts) to analyze
+            contexts: Optional shared contexts aligned with texts
+            chunk_size: Documents vectorized at a time (bounds memory)
 
         Returns:
             List of sentiment dictionaries
         """
-        return [self.analyze(text) for text in texts]
+        contexts = ensure_contexts(texts, contexts)
+        results: List[Dict[str, float]] = []
+
+        for start in range(0, len(contexts), chunk_size):
+            results.extend(self._analyze_chunk(contexts[start:start + chunk_size]))
+
+        return results
+
+    def _analyze_chunk(self, contexts: List[AnalysisContext]) -> List[Dict[str, float]]:
+        """Vectorized analyze() over one chunk of contexts"""
+        active = [i for i, context in enumerate(contexts) if context.text.strip()]
+        results = [
+            {"polarity": 0.0, "subjectivity": 0.0, "confidence": 0.0}
+            for _ in contexts
+        ]
+        if not active:
+            return results
+
+        # Base sentiment from TextBlob (computed once per text)
+        base_polarity = np.empty(len(active), dtype=np.float64)
+        base_subjectivity = np.empty(len(active), dtype=np.float64)
+        normalized = [self._normalize_text(contexts[index].text) for index in active]
+        for row, normalized_text in enumerate(normalized):
+            sentiment = TextBlob(normalized_text).sentiment
+            base_polarity[row] = sentiment.polarity
+            base_subjectivity[row] = sentiment.subjectivity
+
+        word_lists = [normalized_text.split() for normalized_text in normalized]
+        multiplier, adjustment, lexicon_counts, word_counts = self._lexicon_features(word_lists)
+
+        # _adjust_for_colombian_context
+        polarity = np.clip(base_polarity * multiplier + adjustment, -1.0, 1.0)
+
+        # _calculate_confidence (same sequence of additions)
+        confidence = np.full(len(active), 0.5)
+        confidence = confidence + np.select(
+            [word_counts > 50, word_counts > 20, word_counts < 5],
+            [0.2, 0.1, -0.2],
+            0.0
+        )
+        confidence = confidence + np.abs(base_polarity) * 0.2
+        confidence = confidence + np.where(
+            lexicon_counts > 0, np.minimum(lexicon_counts * 0.05, 0.2), 0.0
+        )
+        confidence = confidence + np.where(
+            (base_subjectivity > 0.7) | (base_subjectivity < 0.3), 0.1, 0.0
+        )
+        confidence = np.clip(confidence, 0.0, 1.0)
+
+        if self.use_vader:
+            compound = np.fromiter(
+                (self.vader.polarity_scores(contexts[index].text)['compound'] for index in active),
+                dtype=np.float64,
+                count=len(active)
+            )
+            polarity = polarity * 0.6 + compound * 0.4
+            confidence = np.minimum(confidence * 1.1, 1.0)
+
+        # Python round() on Python floats, exactly as analyze() does
+        for index, p, s, c in zip(active, polarity.tolist(), base_subjectivity.tolist(), confidence.tolist()):
+            results[index] = {
+                "polarity": float(round(p, 4)),
+                "subjectivity": float(round(s, 4)),
+                "confidence": float(round(c, 4))
+            }
+
+        return results
+
+    def _lexicon_features(
+        self,
+        word_lists: List[List[str]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute lexicon-driven features for a batch of tokenized documents
+
+        Returns:
+            (multiplier, adjustment, lexicon word counts, word counts) per document
+        """
+        n_docs = len(word_lists)
+        word_counts = np.fromiter(map(len, word_lists), dtype=np.int64, count=n_docs)
+        ends = np.cumsum(word_counts)
+        total = int(ends[-1]) if n_docs else 0
+
+        if total == 0:
+            return np.ones(n_docs), np.zeros(n_docs), np.zeros(n_docs, dtype=np.int64), word_counts
+
+        # Tokenize once: map every token of the batch to a lexicon id (-1 = none)
+        ids = np.fromiter(
+            map(self._vocabulary.get, chain.from_iterable(word_lists), repeat(-1)),
+            dtype=np.int64,
+            count=total
+        )
+
+        known = np.flatnonzero(ids >= 0)
+        known_ids = ids[known]
+        known_docs = np.searchsorted(ends, known, side='right')
+
+        # Lexicon words: adjustment += value * 0.3, in word order
+        is_lexicon = self._is_lexicon[known_ids]
+        lexicon_docs = known_docs[is_lexicon]
+        lexicon_terms = self._lexicon_values[known_ids[is_lexicon]] * 0.3
+        lexicon_counts = np.bincount(lexicon_docs, minlength=n_docs)
+
+        # Negations: adjustment -= value * 0.5 for lexicon words in the next 3 tokens
+        is_negation = self._is_negation[known_ids]
+        negation_positions = known[is_negation]
+        negation_docs = known_docs[is_negation]
+        window = negation_positions[:, None] + np.arange(1, 4)
+        in_document = window < ends[negation_docs][:, None]
+        window_ids = np.where(in_document, ids[np.minimum(window, total - 1)], -1)
+        flips = in_document & (window_ids >= 0) & self._is_lexicon[np.maximum(window_ids, 0)]
+        flip_docs = np.broadcast_to(negation_docs[:, None], window.shape)[flips]
+        flip_terms = -(self._lexicon_values[window_ids[flips]] * 0.5)
+
+        # All lexicon terms of a document come before its negation terms
+        adjustment = self._accumulate(
+            np.concatenate([lexicon_docs, flip_docs]),
+            np.concatenate([np.zeros(len(lexicon_docs)), np.ones(len(flip_docs))]),
+            np.concatenate([lexicon_terms, flip_terms]),
+            n_docs,
+            np.add,
+            0.0
+        )
+
+        # Intensifiers then diminishers, word by word: multiplier *= factor
+        is_intensifier = self._is_intensifier[known_ids]
+        is_diminisher = self._is_diminisher[known_ids]
+        multiplier = self._accumulate(
+            np.concatenate([known_docs[is_intensifier], known_docs[is_diminisher]]),
+            np.concatenate([known[is_intensifier] * 2, known[is_diminisher] * 2 + 1]),
+            np.concatenate([
+                self._intensifier_values[known_ids[is_intensifier]],
+                self._diminisher_values[known_ids[is_diminisher]]
+            ]),
+            n_docs,
+            np.multiply,
+            1.0
+        )
+
+        return multiplier, adjustment, lexicon_counts, word_counts
+
+    @staticmethod
+    def _accumulate(
+        docs: np.ndarray,
+        order: np.ndarray,
+        values: np.ndarray,
+        n_docs: int,
+        ufunc: np.ufunc,
+        identity: float
+    ) -> np.ndarray:
+        """
+        Fold values per document left to right (like a Python loop)
+
+        Terms are applied one rank at a time: the i-th term of every
+        document that has one is folded into its running value with ufunc.
+        This is strictly sequential per document, unlike sum()/prod() which
+        use pairwise reduction and would change the last bits of the result,
+        and needs memory proportional to the number of terms rather than to
+        documents x the longest document.
+        """
+        result = np.full(n_docs, identity)
+        if len(docs) == 0:
+            return result
+
+        # Stable sort by document, then by the given order key
+        sort = np.lexsort((order, docs))
+        docs = docs[sort]
+        values = values[sort]
+
+        counts = np.bincount(docs, minlength=n_docs)
+        offsets = np.cumsum(counts) - counts
+        ranks = np.arange(len(docs)) - np.repeat(offsets, counts)
+
+        # Regroup by rank; each rank holds at most one term per document
+        by_rank = np.argsort(ranks, kind="stable")
+        docs = docs[by_rank]
+        values = values[by_rank]
+        bounds = np.cumsum(np.bincount(ranks))
+
+        start = 0
+        for stop in bounds.tolist():
+            rank_docs = docs[start:stop]
+            result[rank_docs] = ufunc(result[rank_docs], values[start:stop])
+            start = stop
+        return result
 
     def get_sentiment_label(self, polarity: float) -> str:
         """
@@ -4,12 +4,34 @@ Analyzes text to extract relevant topics with confidence scores
 """
 
 import numpy as np
-from typing import List, Dict, Optional
+from scipy import sparse
+from typing import Any, List, Dict, Optional
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation, NMF
+from datetime import datetime
+import copy
+import logging
+import os
+import pickle
 import re
+import tempfile
+import time
 import unicodedata
 
+from .analysis_context import AnalysisContext
+
+logger = logging.getLogger(__name__)
+
+# Snapshot files are topic_model_v0001.pkl, topic_model_v0002.pkl, ...;
+# LATEST holds the file name of the newest complete snapshot
+SNAPSHOT_PREFIX = "topic_model_v"
+SNAPSHOT_SUFFIX = ".pkl"
+LATEST_POINTER = "LATEST"
+SNAPSHOT_FORMAT = 2  # 2: watermark is a ScrapedContent.id (was scraped_at)
+
+# Minimum corpus size for a full fit (vectorizers use min_df=2)
+MIN_FIT_DOCUMENTS = 5
+
 
 class TopicModeler:
     """
@@ -98,7 +120,9 @@ class TopicModeler:
         min_confidence: float = 0.1,
         use_lda: bool = True,
         use_nmf: bool = True,
-        max_features: int = 1000
+        max_features: int = 1000,
+        snapshot_dir: Optional[str] = None,
+        refresh_interval: float = 60.0
     ):
         """
         Initialize TopicModeler with configurable algorithms
@@ -109,6 +133,9 @@ class TopicModeler:
             use_lda: Enable Latent Dirichlet Allocation
             use_nmf: Enable Non-negative Matrix Factorization
             max_features: Maximum vocabulary size for vectorization
+            snapshot_dir: Directory of versioned model snapshots; the latest
+                one is loaded now and newer ones are picked up by refresh()
+            refresh_interval: Minimum seconds between snapshot checks
         """
         self.n_topics = n_topics
         self.min_confidence = min_confidence
@@ -154,6 +181,21 @@ class TopicModeler:
             )
 
         self._is_fitted = False
+        self._build_keyword_index()
+
+        # Incremental training state (persisted in snapshots)
+        self.version = 0
+        self.documents_seen = 0
+        self.trained_until_id: Optional[int] = None  # Highest ScrapedContent.id trained on
+        self.drift_history: List[Dict[str, Any]] = []
+
+        self.snapshot_dir = snapshot_dir
+        self.refresh_interval = refresh_interval
+        self._last_refresh_check = 0.0
+        self._pointer_mtime: Optional[float] = None
+
+        if snapshot_dir:
+            self.refresh(force=True)
 
     def _normalize_text(self, text: str) -> str:
         """Normalize Spanish text for processing"""
@@ -171,26 +213,96 @@ class TopicModeler:
 
         return text
 
-    def _calculate_keyword_scores(self, text: str) -> Dict[str, float]:
-        """Calculate topic scores based on keyword matching"""
-        normalized_text = self._normalize_text(text)
-        words = set(normalized_text.split())
+    def _build_keyword_index(self) -> None:
+        """
+        Precompute the keyword matcher and the keyword-topic matrix
+
+        Keywords match as substrings of the normalized text. A single
+        lookahead regex finds the longest keyword starting at each position;
+        _keyword_prefixes adds the shorter keywords that are prefixes of it
+        (e.g. 'banco' inside 'bancolombia'), and _keyword_topics counts each
+        keyword towards every topic that lists it.
+        """
+        self._topic_names = list(self.COLOMBIAN_TOPICS)
+        self._topic_weights = np.array(
+            [config['weight'] for config in self.COLOMBIAN_TOPICS.values()]
+        )
+
+        keywords = sorted({
+            keyword
+            for config in self.COLOMBIAN_TOPICS.values()
+            for keyword in config['keywords']
+        })
+        self._keyword_ids = {keyword: idx for idx, keyword in enumerate(keywords)}
 
-        scores = {}
-        for topic, config in self.COLOMBIAN_TOPICS.items():
-            # Count keyword matches
-            matches = sum(1 for keyword in config['keywords']
-                         if keyword in normalized_text)
+        longest_first = sorted(keywords, key=len, reverse=True)
+        self._keyword_pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in longest_first) + '))'
+        )
 
-            if matches > 0:
-                # Calculate confidence based on keyword density and topic weight
-                total_words = len(words)
-                density = matches / max(total_words, 1)
-                confidence = min(density * config['weight'] * 10, 1.0)
+        n_keywords = len(keywords)
+        prefix_pairs = [
+            (self._keyword_ids[longer], self._keyword_ids[shorter])
+            for longer in keywords
+            for shorter in keywords
+            if longer.startswith(shorter)
+        ]
+        rows, cols = zip(*prefix_pairs)
+        self._keyword_prefixes = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(n_keywords, n_keywords)
+        )
 
-                if confidence >= self.min_confidence:
-                    scores[topic] = confidence
+        # Duplicate (keyword, topic) entries are summed, matching list counts
+        rows, cols = zip(*(
+            (self._keyword_ids[keyword], topic_idx)
+            for topic_idx, config in enumerate(self.COLOMBIAN_TOPICS.values())
+            for keyword in config['keywords']
+        ))
+        self._keyword_topics = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(n_keywords, len(self._topic_names))
+        )
 
+    def _calculate_keyword_scores(self, contexts: List[AnalysisContext]) -> List[Dict[str, float]]:
+        """
+        Calculate topic scores based on keyword matching for a batch
+
+        Builds a sparse document-keyword matrix from one regex pass per
+        document and multiplies it by the keyword-topic matrix to count the
+        keywords of each topic found in each document.
+        """
+        normalized = [self._normalize_text(context.text) for context in contexts]
+        rows, cols = [], []
+        for row, normalized_text in enumerate(normalized):
+            found = {
+                match.group(1)
+                for match in self._keyword_pattern.finditer(normalized_text)
+            }
+            rows.extend([row] * len(found))
+            cols.extend(self._keyword_ids[keyword] for keyword in found)
+
+        hits = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(contexts), len(self._keyword_ids))
+        )
+        present = hits @ self._keyword_prefixes
+        present.data[:] = 1.0
+        matches = (present @ self._keyword_topics).toarray()
+
+        # Calculate confidence based on keyword density and topic weight
+        total_words = np.array(
+            [max(len(set(normalized_text.split())), 1) for normalized_text in normalized], dtype=float
+        )
+        density = matches / total_words[:, None]
+        confidence = np.minimum(density * self._topic_weights * 10, 1.0)
+        keep = (matches > 0) & (confidence >= self.min_confidence)
+
+        scores = []
+        for row_keep, row_confidence in zip(keep.tolist(), confidence.tolist()):
+            scores.append({
+                topic: value
+                for topic, kept, value in zip(self._topic_names, row_keep, row_confidence)
+                if kept
+            })
         return scores
 
     def _fit_models_if_needed(self, texts: List[str]) -> None:
@@ -198,66 +310,122 @@ class TopicModeler:
         if self._is_fitted or not texts:
             return
 
+        self.fit(texts)
+
+    def fit(self, texts: List[str]) -> bool:
+        """
+        Fit vectorizers and models from scratch
+
+        The vectorizer vocabulary fixed here is kept by later partial_fit()
+        calls, so LDA topics stay aligned from one version to the next.
+
+        Args:
+            texts: Training corpus (at least MIN_FIT_DOCUMENTS texts)
+
+        Returns:
+            True if the models were fitted
+        """
+        if len(texts) < MIN_FIT_DOCUMENTS:
+            return False
+
         try:
-            if self.use_lda and len(texts) >= 5:
+            if self.use_lda:
                 count_matrix = self.count_vectorizer.fit_transform(texts)
                 self.lda_model.fit(count_matrix)
 
-            if self.use_nmf and len(texts) >= 5:
+            if self.use_nmf:
                 tfidf_matrix = self.tfidf_vectorizer.fit_transform(texts)
                 self.nmf_model.fit(tfidf_matrix)
-
-            self._is_fitted = True
-        except Exception:
+        except Exception as e:
             # If fitting fails, continue with keyword-based approach
-            pass
+            logger.warning(f"Topic model fit failed: {e}")
+            return False
 
-    def _get_lda_topics(self, text: str) -> Dict[str, float]:
-        """Extract topics using LDA"""
-        if not self.use_lda or not self._is_fitted:
-            return {}
+        self._is_fitted = True
+        self.version += 1
+        self.documents_seen = len(texts)
+        self.drift_history = []
+        return True
 
-        try:
-            count_vec = self.count_vectorizer.transform([text])
-            topic_dist = self.lda_model.transform(count_vec)[0]
+    def partial_fit(self, texts: List[str]) -> Optional[float]:
+        """
+        Update the online LDA model with new documents
 
-            topics = {}
-            for idx, confidence in enumerate(topic_dist):
-                if confidence >= self.min_confidence:
-                    topics[f'lda_topic_{idx}'] = float(confidence)
+        Falls back to a full fit() while the models are unfitted. NMF has no
+        incremental update in scikit-learn and keeps its last full fit. The
+        update runs on a copy that is swapped in when done, so concurrent
+        predictions never see a half-updated model.
 
-            return topics
-        except Exception:
-            return {}
+        Args:
+            texts: Newly collected documents
 
-    def _get_nmf_topics(self, text: str) -> Dict[str, float]:
-        """Extract topics using NMF"""
-        if not self.use_nmf or not self._is_fitted:
-            return {}
+        Returns:
+            Topic drift of this update (mean total variation distance between
+            old and new topic-word distributions, 0-1), or None if the model
+            was fitted from scratch or not updated
+        """
+        if not texts:
+            return None
+
+        if not self._is_fitted:
+            self.fit(texts)
+            return None
+
+        if not self.use_lda:
+            return None
 
         try:
-            tfidf_vec = self.tfidf_vectorizer.transform([text])
-            topic_dist = self.nmf_model.transform(tfidf_vec)[0]
+            count_matrix = self.count_vectorizer.transform(texts)
+            updated = copy.deepcopy(self.lda_model)
+            updated.partial_fit(count_matrix)
+        except Exception as e:
+            logger.warning(f"Topic model update failed: {e}")
+            return None
+
+        drift = topic_drift(self.lda_model.components_, updated.components_)
+        self.lda_model = updated
+        self.version += 1
+        self.documents_seen += len(texts)
+        self.drift_history.append({
+            'version': self.version,
+            'documents': len(texts),
+            'drift': round(drift, 6),
+            'timestamp': datetime.now().isoformat()
+        })
+        del self.drift_history[:-100]
+        return drift
+
+    def _get_lda_topics(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Topic distributions from LDA, one row per text"""
+        if not self.use_lda or not self._is_fitted:
+            return None
 
-            # Normalize to probabilities
-            total = topic_dist.sum()
-            if total > 0:
-                topic_dist = topic_dist / total
+        try:
+            count_matrix = self.count_vectorizer.transform(texts)
+            return self.lda_model.transform(count_matrix)
+        except Exception:
+            return None
 
-            topics = {}
-            for idx, confidence in enumerate(topic_dist):
-                if confidence >= self.min_confidence:
-                    topics[f'nmf_topic_{idx}'] = float(confidence)
+    def _get_nmf_topics(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Topic weights from NMF normalized to probabilities, one row per text"""
+        if not self.use_nmf or not self._is_fitted:
+            return None
 
-            return topics
+        try:
+            tfidf_matrix = self.tfidf_vectorizer.transform(texts)
+            topic_dist = self.nmf_model.transform(tfidf_matrix)
         except Exception:
-            return {}
+            return None
+
+        totals = topic_dist.sum(axis=1, keepdims=True)
+        return np.divide(topic_dist, totals, out=topic_dist, where=totals > 0)
 
     def predict_topics(
         self,
         text: str,
         fit_corpus: Optional[List[str]] = None,
-        top_n: Optional[int] = None
+        top_n: Optional[int] = None,
+        context: Optional[AnalysisContext] = None
     ) -> List[Dict[str, any]]:
         """
         Predict topics for given text with confidence scores
@@ -266,6 +434,7 @@ class TopicModeler:
             text: Input text to analyze
             fit_corpus: Optional corpus to fit models (if not already fitted)
             top_n: Return only top N topics (None = all above threshold)
+            context: Optional shared AnalysisContext (reuses its word array)
 
         Returns:
             List of topic dictionaries with 'topic' and 'confidence' keys,
@@ -276,49 +445,91 @@ class TopicModeler:
             >>> topics = modeler.predict_topics("El presidente anunció nueva reforma tributaria")
             >>> # [{"topic": "politics", "confidence": 0.85}, {"topic": "economics", "confidence": 0.62}]
         """
-        if not text or not text.strip():
-            return []
+        return self.predict_topics_batch(
+            [text],
+            fit_corpus=fit_corpus,
+            top_n=top_n,
+            contexts=[context] if context is not None else None
+        )[0]
+
+    def predict_topics_batch(
+        self,
+        texts: List[str],
+        fit_corpus: Optional[List[str]] = None,
+        top_n: Optional[int] = None,
+        contexts: Optional[List[AnalysisContext]] = None
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Predict topics for a batch of texts
+
+        The batch is vectorized into one sparse matrix per vectorizer and
+        passed through a single LDA and NMF transform, and keyword scores
+        come from one sparse matrix product, so per-article overhead is
+        paid once per batch.
+
+        Args:
+            texts: Input texts to analyze
+            fit_corpus: Optional corpus to fit models (if not already fitted)
+            top_n: Return only top N topics per text (None = all above threshold)
+            contexts: Optional AnalysisContexts aligned with texts
+
+        Returns:
+            One predict_topics() result per text, in order
+        """
+        results: List[List[Dict[str, any]]] = [[] for _ in texts]
+        active = [idx for idx, text in enumerate(texts) if text and text.strip()]
+        if not active:
+            return results
+
+        # Pick up a newer published snapshot
+        self.refresh()
 
         # Fit models if corpus provided
         if fit_corpus:
             self._fit_models_if_needed(fit_corpus)
 
-        # Get keyword-based scores (primary method for Colombian topics)
-        keyword_scores = self._calculate_keyword_scores(text)
-
-        # Get LDA and NMF scores (if available and fitted)
-        lda_scores = self._get_lda_topics(text)
-        nmf_scores = self._get_nmf_topics(text)
-
-        # Combine all scores
-        all_scores = {}
-
-        # Keyword scores have highest priority for Colombian topics
-        for topic, score in keyword_scores.items():
-            all_scores[topic] = score
-
-        # Add LDA scores with lower weight
-        for topic, score in lda_scores.items():
-            if topic not in all_scores:
-                all_scores[topic] = score * 0.5
-
-        # Add NMF scores with lower weight
-        for topic, score in nmf_scores.items():
-            if topic not in all_scores:
-                all_scores[topic] = score * 0.5
-
-        # Convert to list of dictionaries and sort by confidence
-        topics = [
-            {"topic": topic, "confidence": round(confidence, 3)}
-            for topic, confidence in all_scores.items()
+        active_texts = [texts[idx] for idx in active]
+        active_contexts = [
+            contexts[idx] if contexts is not None and contexts[idx] is not None
+            else AnalysisContext(texts[idx])
+            for idx in active
         ]
-        topics.sort(key=lambda x: x['confidence'], reverse=True)
 
-        # Return top N if specified
-        if top_n:
-            topics = topics[:top_n]
+        # Get keyword-based scores (primary method for Colombian topics)
+        keyword_scores = self._calculate_keyword_scores(active_contexts)
 
-        return topics
+        # Get LDA and NMF scores (if available and fitted)
+        lda_dist = self._get_lda_topics(active_texts)
+        nmf_dist = self._get_nmf_topics(active_texts)
+        lda_rows = lda_dist.tolist() if lda_dist is not None else None
+        nmf_rows = nmf_dist.tolist() if nmf_dist is not None else None
+
+        for position, idx in enumerate(active):
+            # Keyword scores have highest priority for Colombian topics
+            all_scores = dict(keyword_scores[position])
+
+            # Add LDA and NMF scores with lower weight
+            for prefix, rows in (('lda_topic', lda_rows), ('nmf_topic', nmf_rows)):
+                if rows is None:
+                    continue
+                for topic_idx, confidence in enumerate(rows[position]):
+                    if confidence >= self.min_confidence:
+                        all_scores.setdefault(f'{prefix}_{topic_idx}', confidence * 0.5)
+
+            # Convert to list of dictionaries and sort by confidence
+            topics = [
+                {"topic": topic, "confidence": round(confidence, 3)}
+                for topic, confidence in all_scores.items()
+            ]
+            topics.sort(key=lambda x: x['confidence'], reverse=True)
+
+            # Return top N if specified
+            if top_n:
+                topics = topics[:top_n]
+
+            results[idx] = topics
+
+        return results
 
     def get_topic_keywords(self, topic_name: str) -> List[str]:
         """
@@ -342,3 +553,210 @@ class TopicModeler:
             List of topic names
         """
         return list(self.COLOMBIAN_TOPICS.keys())
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        Get training state of the statistical models
+
+        Returns:
+            Version, documents seen, watermark and recent drift
+        """
+        return {
+            'fitted': self._is_fitted,
+            'version': self.version,
+            'documents_seen': self.documents_seen,
+            'trained_until_id': self.trained_until_id,
+            'vocabulary_size': len(getattr(self.count_vectorizer, 'vocabulary_', {})),
+            'drift_history': list(self.drift_history[-10:])
+        }
+
+    def save_snapshot(self, directory: Optional[str] = None, keep: int = 5) -> str:
+        """
+        Persist vectorizers, models and training state as a new version
+
+        The snapshot is written to a temporary file and renamed into place
+        before LATEST is switched to it, so readers never load a partial file.
+
+        Args:
+            directory: Snapshot directory (default: snapshot_dir)
+            keep: Number of most recent snapshots to retain
+
+        Returns:
+            Path of the written snapshot
+        """
+        directory = directory or self.snapshot_dir
+        if not directory:
+            raise ValueError("No snapshot directory configured")
+        if not self._is_fitted:
+            raise ValueError("Cannot snapshot an unfitted topic model")
+
+        os.makedirs(directory, exist_ok=True)
+        state = {
+            'format': SNAPSHOT_FORMAT,
+            'version': self.version,
+            'n_topics': self.n_topics,
+            'max_features': self.max_features,
+            'use_lda': self.use_lda,
+            'use_nmf': self.use_nmf,
+            'count_vectorizer': self.count_vectorizer,
+            'tfidf_vectorizer': self.tfidf_vectorizer,
+            'lda_model': getattr(self, 'lda_model', None),
+            'nmf_model': getattr(self, 'nmf_model', None),
+            'documents_seen': self.documents_seen,
+            'trained_until_id': self.trained_until_id,
+            'drift_history': self.drift_history,
+            'saved_at': datetime.now()
+        }
+
+        filename = f"{SNAPSHOT_PREFIX}{self.version:04d}{SNAPSHOT_SUFFIX}"
+        path = os.path.join(directory, filename)
+        _atomic_write(path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        _atomic_write(os.path.join(directory, LATEST_POINTER), filename.encode())
+
+        for version in list_snapshots(directory)[:-keep]:
+            try:
+                os.remove(_snapshot_path(directory, version))
+            except OSError:
+                pass
+
+        logger.info(f"Saved topic model v{self.version} ({self.documents_seen} documents) to {path}")
+        return path
+
+    def load_snapshot(self, directory: Optional[str] = None, version: Optional[int] = None) -> bool:
+        """
+        Replace the models with a saved snapshot
+
+        Args:
+            directory: Snapshot directory (default: snapshot_dir)
+            version: Snapshot version (default: the one LATEST points to)
+
+        Returns:
+            True if a snapshot was loaded
+        """
+        directory = directory or self.snapshot_dir
+        if not directory:
+            return False
+
+        if version is None:
+            try:
+                with open(os.path.join(directory, LATEST_POINTER)) as f:
+                    path = os.path.join(directory, f.read().strip())
+            except OSError:
+                return False
+        else:
+            path = _snapshot_path(directory, version)
+
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Could not load topic model snapshot {path}: {e}")
+            return False
+
+        if state.get('format') != SNAPSHOT_FORMAT or state['n_topics'] != self.n_topics:
+            logger.warning(f"Ignoring incompatible topic model snapshot {path}")
+            return False
+
+        self.count_vectorizer = state['count_vectorizer']
+        self.tfidf_vectorizer = state['tfidf_vectorizer']
+        if state['lda_model'] is not None:
+            self.lda_model = state['lda_model']
+        if state['nmf_model'] is not None:
+            self.nmf_model = state['nmf_model']
+        self.use_lda = state['use_lda']
+        self.use_nmf = state['use_nmf']
+        self.version = state['version']
+        self.documents_seen = state['documents_seen']
+        self.trained_until_id = state['trained_until_id']
+        self.drift_history = state['drift_history']
+        self._is_fitted = True
+        return True
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Load a newer snapshot if one was published since the last check
+
+        Checks at most once per refresh_interval and only stats the LATEST
+        pointer, so it is cheap enough to call before every prediction.
+
+        Args:
+            force: Check now regardless of refresh_interval
+
+        Returns:
+            True if a newer snapshot was loaded
+        """
+        if not self.snapshot_dir:
+            return False
+
+        now = time.monotonic()
+        if not force and now - self._last_refresh_check < self.refresh_interval:
+            return False
+        self._last_refresh_check = now
+
+        try:
+            mtime = os.stat(os.path.join(self.snapshot_dir, LATEST_POINTER)).st_mtime
+        except OSError:
+            return False
+
+        if mtime == self._pointer_mtime:
+            return False
+        self._pointer_mtime = mtime
+
+        previous = self.version
+        return self.load_snapshot() and self.version != previous
+
+
+def topic_drift(before: np.ndarray, after: np.ndarray) -> float:
+    """
+    Mean total variation distance between matching topic-word distributions
+
+    Args:
+        before: Topic-word weights (n_topics x vocabulary) before an update
+        after: Topic-word weights after the update
+
+    Returns:
+        0 for identical topics, up to 1 for disjoint ones
+    """
+    p = before / before.sum(axis=1, keepdims=True)
+    q = after / after.sum(axis=1, keepdims=True)
+    return float(0.5 * np.abs(p - q).sum(axis=1).mean())
+
+
+def list_snapshots(directory: str) -> List[int]:
+    """
+    Versions of the snapshots stored in a directory
+
+    Returns:
+        Snapshot versions, oldest first
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+
+    versions = []
+    for name in names:
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX):
+            number = name[len(SNAPSHOT_PREFIX):-len(SNAPSHOT_SUFFIX)]
+            if number.isdigit():
+                versions.append(int(number))
+    return sorted(versions)
+
+
+def _snapshot_path(directory: str, version: int) -> str:
+    return os.path.join(directory, f"{SNAPSHOT_PREFIX}{version:04d}{SNAPSHOT_SUFFIX}")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write a file via a temporary file and rename"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -4,7 +4,7 @@ Following best practices for linguistic annotation and storage
 """
 
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, asdict
 from collections import Counter, defaultdict
 from datetime import datetime
@@ -14,6 +14,8 @@ import json
 from spacy.tokens import Doc, Token, Span
 import spacy
 
+from .analysis_context import AnalysisContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -163,17 +165,25 @@ class VocabularyExtractor:
             'salud': ['médico', 'hospital', 'enfermedad', 'tratamiento', 'vacuna']
         }
 
-    def extract(self, doc: Doc, source_id: Optional[str] = None) -> List[VocabularyItem]:
+    def extract(
+        self,
+        doc: Union[Doc, AnalysisContext],
+        source_id: Optional[str] = None
+    ) -> List[VocabularyItem]:
         """
         Extract vocabulary items from a spaCy document
 
         Args:
-            doc: Processed spaCy document
+            doc: Processed spaCy document, or a shared AnalysisContext whose
+                parse is reused
             source_id: Optional document identifier
 
         Returns:
             List of VocabularyItem objects
         """
+        if isinstance(doc, AnalysisContext):
+            doc = doc.doc if doc.has_parser else self.nlp(doc.text)
+
         vocabulary_items = []
         word_contexts = defaultdict(list)
         word_collocations = defaultdict(Counter)
@@ -5,20 +5,43 @@ Base scraper class with common functionality for all Colombian content sources
 import asyncio
 import aiohttp
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 import logging
 from bs4 import BeautifulSoup
 import hashlib
 import json
+import weakref
 
 from app.config import settings
+from app.core.http_transport import get_http_transport
+from scrapers.base.fetch_state import HIT_RESULTS, get_fetch_state_store
+from scrapers.base import html_parser
+from scrapers.base.html_parser import SelectorSet
 from scrapers.base.rate_limiter import RateLimiter
+from scrapers.base.replay import ResponseArchive, get_replay_archive
+from scrapers.base.url_index import get_url_index
 from app.database.models import ScrapedContent
 
 
 logger = logging.getLogger(__name__)
 
+# In-flight requests per domain, shared by every scraper running on an event loop
+_domain_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_domain_semaphore(url: str, limit: int) -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent requests to a URL's domain"""
+    semaphores = _domain_semaphores.setdefault(asyncio.get_running_loop(), {})
+    domain = urlparse(url).netloc
+    semaphore = semaphores.get(domain)
+    if semaphore is None:
+        semaphore = semaphores[domain] = asyncio.Semaphore(limit)
+    return semaphore
+
 
 class BaseScraper(ABC):
     """Abstract base class for content scrapers"""
@@ -28,8 +51,13 @@ class BaseScraper(ABC):
         self.base_url = source_config["url"]
         self.category = source_config["category"]
         self.scrape_interval = source_config.get("scrape_interval", 60)
-        self.rate_limiter = RateLimiter(max_requests=10, time_window=60)
+        # Shared with every worker scraping the same domain
+        self.rate_limiter = RateLimiter(max_requests=10, time_window=60, key=urlparse(self.base_url).netloc)
+        self.max_articles = source_config.get("max_articles", 50)
+        self.max_concurrency = source_config.get("max_concurrency", settings.SCRAPER_CONCURRENT_LIMIT)
         self.session: Optional[aiohttp.ClientSession] = None
+        self.html_parser = source_config.get("html_parser", settings.SCRAPER_HTML_PARSER)
+        self._css: Optional[SelectorSet] = None
         self.headers = {
             "User-Agent": settings.USER_AGENTS[0],
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -37,31 +65,65 @@ class BaseScraper(ABC):
             "Accept-Encoding": "gzip, deflate, br",
             "Connection": "keep-alive",
         }
+        # Per-URL ETag/Last-Modified/hash store for skipping unchanged articles
+        self.fetch_state = (
+            get_fetch_state_store()
+            if source_config.get("conditional_fetch", settings.SCRAPER_CONDITIONAL_FETCH)
+            else None
+        )
+        # Bloom filter of stored article URLs, checked before fetching
+        self.url_index = (
+            get_url_index()
+            if source_config.get("skip_known_urls", settings.SCRAPER_SKIP_KNOWN_URLS)
+            else None
+        )
 
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        """Async context manager entry: borrow the shared HTTP session"""
+        self.session = await get_http_transport().get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
-
-    async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a single page with rate limiting and error handling"""
-        await self.rate_limiter.acquire()
+        """Async context manager exit (the shared session stays open for reuse)"""
+        self.session = None
+
+    async def fetch_page(self, url: str, conditional: bool = False) -> Optional[str]:
+        """
+        Fetch a single page with rate limiting and error handling
+
+        Args:
+            url: Page URL
+            conditional: Revalidate against the fetch state store and return
+                None if the page is unchanged since the last fetch (304 or
+                identical body), so it is neither downloaded nor parsed again
+        """
+        archive = get_replay_archive()
+        if archive is None or not archive.replaying:
+            await self.rate_limiter.acquire()
+
+        conditional = conditional and self.fetch_state is not None
+        headers = self.headers
+        if conditional:
+            headers = {**self.headers, **self.fetch_state.request_headers(self.name, url)}
 
         try:
-            async with self.session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT)
-            ) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
-                    return None
+            status, response_headers, text = await self._get(url, headers, archive)
+
+            if conditional and status == 304:
+                self.fetch_state.record_response(self.name, url, 304, response_headers)
+                return None
+            elif status == 200:
+                if conditional:
+                    result = self.fetch_state.record_response(
+                        self.name, url, 200, response_headers, text.encode('utf-8')
+                    )
+                    if result in HIT_RESULTS:
+                        logger.debug(f"Unchanged since last scrape: {url}")
+                        return None
+                return text
+            else:
+                logger.warning(f"Failed to fetch {url}: HTTP {status}")
+                return None
 
         except asyncio.TimeoutError:
             logger.error(f"Timeout fetching {url}")
@@ -70,45 +132,50 @@ class BaseScraper(ABC):
             logger.error(f"Error fetching {url}: {str(e)}")
             return None
 
+    async def _get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        archive: Optional[ResponseArchive] = None
+    ) -> Tuple[int, Mapping[str, str], str]:
+        """
+        GET a URL, or serve it from the replay archive
+
+        Returns:
+            Status, response headers and body text
+        """
+        if archive is not None and archive.replaying:
+            recorded = archive.replay(url)
+            return recorded.status, recorded.headers, recorded.text
+
+        async with self.session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT)
+        ) as response:
+            text = await response.text() if response.status == 200 else ''
+            if archive is not None:
+                archive.record(url, response.status, response.headers, text)
+            return response.status, response.headers, text
+
     def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup"""
-        return BeautifulSoup(html, 'lxml')
+        """Parse HTML content using BeautifulSoup (lxml tree builder by default)"""
+        return html_parser.parse_html(html, self.html_parser)
+
+    @property
+    def css(self) -> SelectorSet:
+        """The source's selectors (self.selectors), compiled once"""
+        if self._css is None:
+            self._css = SelectorSet(getattr(self, 'selectors', {}))
+        return self._css
 
     def generate_content_hash(self, content: str) -> str:
         """Generate hash for content deduplication"""
         return hashlib.sha256(content.encode()).hexdigest()
 
     def extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract common metadata from HTML"""
-        metadata = {}
-
-        # Open Graph tags
-        og_tags = soup.find_all("meta", property=lambda x: x and x.startswith("og:"))
-        for tag in og_tags:
-            key = tag.get("property", "").replace("og:", "")
-            metadata[f"og_{key}"] = tag.get("content", "")
-
-        # Twitter Card tags
-        twitter_tags = soup.find_all("meta", attrs={"name": lambda x: x and x.startswith("twitter:")})
-        for tag in twitter_tags:
-            key = tag.get("name", "").replace("twitter:", "")
-            metadata[f"twitter_{key}"] = tag.get("content", "")
-
-        # Standard meta tags
-        description = soup.find("meta", attrs={"name": "description"})
-        if description:
-            metadata["description"] = description.get("content", "")
-
-        keywords = soup.find("meta", attrs={"name": "keywords"})
-        if keywords:
-            metadata["keywords"] = keywords.get("content", "").split(",")
-
-        # Publication date
-        pub_date = soup.find("meta", attrs={"property": "article:published_time"})
-        if pub_date:
-            metadata["published_time"] = pub_date.get("content", "")
-
-        return metadata
+        """Extract common metadata from HTML (single pass over meta tags)"""
+        return html_parser.extract_metadata(soup)
 
     @abstractmethod
     async def get_article_urls(self) -> List[str]:
@@ -126,59 +193,135 @@ class BaseScraper(ABC):
         scraped_items = []
 
         try:
-            # Get article URLs
-            article_urls = await self.get_article_urls()
-            logger.info(f"Found {len(article_urls)} articles to scrape from {self.name}")
-
-            # Scrape each article
-            for url in article_urls[:50]:  # Increased limit for content ingestion
-                html = await self.fetch_page(url)
-                if html:
-                    soup = self.parse_html(html)
-                    article_data = self.parse_article(soup, url)
-
-                    if article_data:
-                        # Add metadata
-                        article_data["source"] = self.name
-                        article_data["source_url"] = url
-                        article_data["category"] = self.category
-                        # Make scraped_at timezone-naive to match database expectations
-                        article_data["scraped_at"] = datetime.utcnow().replace(tzinfo=None)
-                        article_data["content_hash"] = self.generate_content_hash(
-                            article_data.get("content", "")
-                        )
-
-                        # Extract additional metadata and merge with existing extra_metadata
-                        metadata = self.extract_metadata(soup)
-                        if "extra_metadata" not in article_data:
-                            article_data["extra_metadata"] = {}
-                        article_data["extra_metadata"].update(metadata)
-
-                        # Ensure published_date is DateTime and timezone-naive
-                        if "published_date" in article_data:
-                            if isinstance(article_data["published_date"], str):
-                                from dateutil import parser as date_parser
-                                try:
-                                    parsed_date = date_parser.isoparse(article_data["published_date"])
-                                    # Remove timezone to make it naive (database uses naive datetimes)
-                                    article_data["published_date"] = parsed_date.replace(tzinfo=None)
-                                except:
-                                    article_data["published_date"] = None
-                            elif hasattr(article_data["published_date"], 'tzinfo') and article_data["published_date"].tzinfo:
-                                # If it's already a datetime with timezone, strip the timezone
-                                article_data["published_date"] = article_data["published_date"].replace(tzinfo=None)
-
-                        scraped_items.append(ScrapedContent(**article_data))
-
-                # Small delay between requests
-                await asyncio.sleep(1)
-
+            async for item in self.scrape_stream():
+                scraped_items.append(item)
         except Exception as e:
             logger.error(f"Error during scraping {self.name}: {str(e)}")
 
         logger.info(f"Completed scraping {self.name}: {len(scraped_items)} articles")
+        if self.fetch_state is not None:
+            stats = self.fetch_state.get_statistics(self.name)[self.name]
+            logger.info(
+                f"Fetch state for {self.name}: {stats['requests']} articles requested, "
+                f"hit ratio {stats['hit_ratio']:.1%} (not modified {stats['not_modified']}, "
+                f"unchanged {stats['unchanged']}, duplicate {stats['duplicate']})"
+            )
         return scraped_items
 
+    async def scrape_stream(self) -> AsyncIterator[ScrapedContent]:
+        """
+        Scrape articles concurrently, yielding each one as soon as it is parsed
+
+        Fetches are bounded by a per-domain semaphore (max_concurrency) and
+        paced by the rate limiter in fetch_page, so requests go out as fast
+        as the source's rate limit allows. HTML parsing and parse_article
+        run in the default executor to keep the event loop responsive.
+
+        URLs already stored are dropped before fetching (see url_index);
+        articles unchanged since the last scrape (304, identical body or
+        identical parsed content) are skipped (see fetch_state). The fetch
+        state of a yielded article is only kept once it is stored.
+        """
+        # Get article URLs
+        article_urls = await self.get_article_urls()
+        logger.info(f"Found {len(article_urls)} articles to scrape from {self.name}")
+
+        if self.url_index is not None and article_urls:
+            loop = asyncio.get_event_loop()
+            article_urls = await loop.run_in_executor(
+                None, self.url_index.filter_new, article_urls, self.name
+            )
+            logger.info(f"{len(article_urls)} of them are not stored yet")
+
+        tasks = [
+            asyncio.ensure_future(self._scrape_article(url))
+            for url in article_urls[:self.max_articles]
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                if item is not None:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.fetch_state is not None:
+                self.fetch_state.flush()
+            if self.url_index is not None:
+                self.url_index.save()
+            archive = get_replay_archive()
+            if archive is not None and not archive.replaying:
+                archive.save()
+
+    async def _scrape_article(self, url: str) -> Optional[ScrapedContent]:
+        """Fetch one article under its domain's concurrency limit and parse it"""
+        async with get_domain_semaphore(url, self.max_concurrency):
+            html = await self.fetch_page(url, conditional=True)
+
+        if not html:
+            return None
+
+        loop = asyncio.get_event_loop()
+        try:
+            article = await loop.run_in_executor(None, self._build_article, html, url)
+        except Exception as e:
+            logger.error(f"Error parsing {url}: {str(e)}")
+            article = None
+
+        if self.fetch_state is None:
+            return article
+        if article is None:
+            # Fetch it again next time rather than skip it as unchanged
+            self.fetch_state.discard(url)
+            return None
+
+        # Page changed but the article did not: skip NLP and storage
+        if not self.fetch_state.record_content(self.name, url, article.content_hash):
+            return None
+
+        return article
+
+    def _build_article(self, html: str, url: str) -> Optional[ScrapedContent]:
+        """Parse fetched HTML into a ScrapedContent (runs in an executor)"""
+        soup = self.parse_html(html)
+        article_data = self.parse_article(soup, url)
+
+        if not article_data:
+            return None
+
+        # Add metadata
+        article_data["source"] = self.name
+        article_data["source_url"] = url
+        article_data["category"] = self.category
+        # Make scraped_at timezone-naive to match database expectations
+        article_data["scraped_at"] = datetime.utcnow().replace(tzinfo=None)
+        article_data["content_hash"] = self.generate_content_hash(
+            article_data.get("content", "")
+        )
+
+        # Extract additional metadata and merge with existing extra_metadata
+        metadata = self.extract_metadata(soup)
+        if "extra_metadata" not in article_data:
+            article_data["extra_metadata"] = {}
+        article_data["extra_metadata"].update(metadata)
+
+        # Ensure published_date is DateTime and timezone-naive
+        if "published_date" in article_data:
+            if isinstance(article_data["published_date"], str):
+                from dateutil import parser as date_parser
+                try:
+                    parsed_date = date_parser.isoparse(article_data["published_date"])
+                    # Remove timezone to make it naive (database uses naive datetimes)
+                    article_data["published_date"] = parsed_date.replace(tzinfo=None)
+                except:
+                    article_data["published_date"] = None
+            elif hasattr(article_data["published_date"], 'tzinfo') and article_data["published_date"].tzinfo:
+                # If it's already a datetime with timezone, strip the timezone
+                article_data["published_date"] = article_data["published_date"].replace(tzinfo=None)
+
+        return ScrapedContent(**article_data)
+
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
@@ -0,0 +1,420 @@
+"""
+Per-URL fetch state for conditional scraping
+
+Remembers, for every article URL a scraper has fetched, the validators the
+server sent (ETag, Last-Modified), a hash of the response body and a hash
+of the parsed content. Scrapers use it to:
+
+- Send If-None-Match / If-Modified-Since, so unchanged articles cost a 304
+- Skip parsing when a 200 body is byte-identical to the last fetch
+- Skip NLP and storage when the parsed content hash is unchanged
+
+State is kept in memory per source and persisted to a small SQLite file,
+written in one transaction per flush. Results are counted per source so
+hit ratios (requests that avoided a parse) can be reported.
+
+The state of a new or changed page is pending until its article is stored:
+the bulk upsert's after_commit hook (app.database.bulk) commits it, and a
+page that fails to parse, yields no article or is never stored is fetched
+and parsed again next time instead of being skipped as unchanged.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from app.core.metrics import scraper_fetch_results_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Fetch results
+NOT_MODIFIED = 'not_modified'  # 304, nothing downloaded
+UNCHANGED = 'unchanged'        # 200 with the same body, parse skipped
+DUPLICATE = 'duplicate'        # Parsed content hash unchanged, NLP/storage skipped
+CHANGED = 'changed'            # Known URL with new content
+NEW = 'new'                    # First fetch of the URL
+
+HIT_RESULTS = (NOT_MODIFIED, UNCHANGED, DUPLICATE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetch_state (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body_hash TEXT,
+    content_hash TEXT,
+    last_seen REAL NOT NULL,
+    last_fetched REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class FetchState:
+    """Validators and hashes from the last fetch of a URL"""
+    source: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_hash: Optional[str] = None
+    content_hash: Optional[str] = None
+    last_seen: float = 0.0  # Last time the URL was requested
+    last_fetched: float = 0.0  # Last time the body was downloaded and parsed
+
+
+def hash_body(body: bytes) -> str:
+    """Compact hash of a response body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class FetchStateStore:
+    """
+    SQLite-backed store of FetchState per URL
+
+    Thread-safe; a source's rows are loaded on first use and dirty states
+    are written back by flush(). States of new or changed pages stay pending
+    (not used for classification, not flushed) until commit().
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age_hours: float = 168.0):
+        """
+        Args:
+            path: SQLite file (None keeps state in memory only)
+            max_age_hours: After this long without a full fetch, a URL is
+                fetched and parsed unconditionally again, so a lost or
+                failed store of an article heals itself
+        """
+        self.path = path
+        self.max_age = max_age_hours * 3600
+
+        self._states: Dict[str, FetchState] = {}
+        self._pending: Dict[str, FetchState] = {}  # Fetched, article not stored yet
+        self._loaded_sources = set()
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {NOT_MODIFIED: 0, UNCHANGED: 0, DUPLICATE: 0, CHANGED: 0, NEW: 0}
+        )
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file on first use"""
+        if self.path is None:
+            return None
+
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(_SCHEMA)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_fetch_state_source ON fetch_state (source)")
+            self._conn.commit()
+
+        return self._conn
+
+    def _load_source(self, source: str) -> None:
+        """Load all stored states of a source into memory"""
+        if source in self._loaded_sources:
+            return
+
+        self._loaded_sources.add(source)
+        try:
+            conn = self._connection()
+        except sqlite3.Error as e:
+            logger.error(f"Fetch state store unavailable, fetching unconditionally: {e}")
+            self.path = None
+            return
+
+        if conn is None:
+            return
+
+        rows = conn.execute(
+            "SELECT url, etag, last_modified, body_hash, content_hash, last_seen, last_fetched "
+            "FROM fetch_state WHERE source = ?",
+            (source,)
+        ).fetchall()
+        for url, etag, last_modified, body_hash, content_hash, last_seen, last_fetched in rows:
+            self._states.setdefault(url, FetchState(
+                source, etag, last_modified, body_hash, content_hash, last_seen, last_fetched
+            ))
+
+        logger.debug(f"Loaded fetch state for {len(rows)} URLs of {source}")
+
+    def get(self, source: str, url: str) -> Optional[FetchState]:
+        """Get the state of a URL, or None if it was never fetched or is too old"""
+        with self._lock:
+            self._load_source(source)
+            state = self._states.get(url)
+
+        if state is None or time.time() - state.last_fetched > self.max_age:
+            return None
+        return state
+
+    def request_headers(self, source: str, url: str) -> Dict[str, str]:
+        """Conditional request headers for a URL (empty if nothing is known)"""
+        state = self.get(source, url)
+        headers = {}
+        if state is not None:
+            if state.etag:
+                headers['If-None-Match'] = state.etag
+            if state.last_modified:
+                headers['If-Modified-Since'] = state.last_modified
+        return headers
+
+    def record_response(
+        self,
+        source: str,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None
+    ) -> str:
+        """
+        Record a response and classify it
+
+        Args:
+            source: Source name
+            url: Requested URL
+            status: HTTP status (304 or 200)
+            headers: Response headers
+            body: Response body of a 200
+
+        Returns:
+            NOT_MODIFIED or UNCHANGED if the article can be skipped,
+            otherwise CHANGED or NEW (the caller should parse it)
+        """
+        now = time.time()
+        previous = self.get(source, url)
+
+        with self._lock:
+            if status == 304 and previous is not None:
+                result = NOT_MODIFIED
+                state = previous
+            else:
+                body_hash = hash_body(body or b'')
+                if previous is not None and previous.body_hash == body_hash:
+                    result = UNCHANGED
+                    state = previous
+                elif previous is not None:
+                    result = CHANGED
+                    state = self._pending[url] = replace(previous, body_hash=body_hash, last_fetched=now)
+                else:
+                    # Unknown or expired: start over so the article is stored again
+                    result = NEW
+                    state = self._pending[url] = FetchState(source, body_hash=body_hash, last_fetched=now)
+
+                # Keep the newest validators the server sent
+                state.etag = headers.get('ETag') or state.etag
+                state.last_modified = headers.get('Last-Modified') or state.last_modified
+
+            state.last_seen = now
+            if state is previous:
+                self._dirty.add(url)
+
+        if result in (NOT_MODIFIED, UNCHANGED):
+            self._count(source, result)
+        return result
+
+    def record_content(self, source: str, url: str, content_hash: str) -> bool:
+        """
+        Record the parsed content hash of a changed or new article
+
+        Called after record_response() returned CHANGED or NEW and the body
+        parsed into an article; the request is counted here. A new article
+        stays pending until commit(); a duplicate is already stored, so its
+        state is kept at once.
+
+        Returns:
+            True if the content is new, False if it matches the last parse
+            (DUPLICATE: the page changed, e.g. ads or timestamps, but the
+            article did not)
+        """
+        with self._lock:
+            self._load_source(source)
+            state = self._pending.get(url)
+            if state is None:
+                now = time.time()
+                previous = self._states.get(url)
+                state = self._pending[url] = (
+                    replace(previous, last_seen=now, last_fetched=now) if previous is not None
+                    else FetchState(source, last_seen=now, last_fetched=now)
+                )
+
+            if state.content_hash == content_hash:
+                result = DUPLICATE
+                self._states[url] = self._pending.pop(url)
+                self._dirty.add(url)
+            else:
+                result = CHANGED if state.content_hash else NEW
+                state.content_hash = content_hash
+
+        self._count(source, result)
+        return result != DUPLICATE
+
+    def discard(self, url: str) -> None:
+        """Drop the pending state of a page that yielded no article"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def commit(self, urls: Iterable[str]) -> int:
+        """
+        Keep and flush the pending states of URLs whose articles were stored
+
+        Args:
+            urls: Source URLs of committed ScrapedContent rows
+
+        Returns:
+            Number of URLs committed
+        """
+        with self._lock:
+            committed = 0
+            for url in urls:
+                state = self._pending.pop(url, None)
+                if state is not None:
+                    self._states[url] = state
+                    self._dirty.add(url)
+                    committed += 1
+
+        if committed:
+            self.flush()
+        return committed
+
+    def _count(self, source: str, result: str) -> None:
+        with self._lock:
+            self.stats[source][result] += 1
+        if METRICS_AVAILABLE:
+            scraper_fetch_results_total.labels(scraper_name=source, result=result).inc()
+
+    def flush(self) -> int:
+        """
+        Write changed states to the SQLite file
+
+        Returns:
+            Number of URLs written
+        """
+        with self._lock:
+            if not self._dirty:
+                return 0
+
+            rows = [
+                (url, s.source, s.etag, s.last_modified, s.body_hash, s.content_hash, s.last_seen, s.last_fetched)
+                for url in self._dirty
+                for s in (self._states[url],)
+            ]
+            self._dirty.clear()
+
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return 0
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO fetch_state "
+                        "(url, source, etag, last_modified, body_hash, content_hash, last_seen, last_fetched) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to persist fetch state: {e}")
+                return 0
+
+        return len(rows)
+
+    def prune(self, older_than_hours: float) -> int:
+        """
+        Forget URLs not requested within the given time
+
+        Returns:
+            Number of URLs removed
+        """
+        cutoff = time.time() - older_than_hours * 3600
+
+        with self._lock:
+            stale = [url for url, state in self._states.items() if state.last_seen < cutoff]
+            for url in stale:
+                del self._states[url]
+                self._dirty.discard(url)
+            for url in [url for url, state in self._pending.items() if state.last_seen < cutoff]:
+                del self._pending[url]
+
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    removed = conn.execute("DELETE FROM fetch_state WHERE last_seen < ?", (cutoff,)).rowcount
+                return max(removed, len(stale))
+
+        return len(stale)
+
+    def get_statistics(self, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch results and hit ratio per source
+
+        The hit ratio is the share of article requests answered without a
+        parse (304 or identical body) or without NLP/storage (same content).
+
+        Args:
+            source: Only this source (all sources if None)
+        """
+        with self._lock:
+            sources = {source: self.stats[source]} if source else dict(self.stats)
+
+            report = {}
+            for name, counts in sources.items():
+                total = sum(counts.values())
+                hits = sum(counts[result] for result in HIT_RESULTS)
+                report[name] = {
+                    **counts,
+                    'requests': total,
+                    'hit_ratio': round(hits / total, 3) if total else 0.0
+                }
+
+        return report
+
+    def close(self) -> None:
+        """Flush and close the SQLite file"""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global store instance
+_fetch_state_store: Optional[FetchStateStore] = None
+_store_lock = threading.Lock()
+
+
+def _register_commit_listener(store: FetchStateStore) -> None:
+    """Commit pending states as the bulk upserts of their articles commit"""
+    from app.database.bulk import on_stored_commit
+
+    on_stored_commit(store.commit)
+
+
+def get_fetch_state_store() -> FetchStateStore:
+    """Get the process-wide fetch state store"""
+    global _fetch_state_store
+    if _fetch_state_store is None:
+        with _store_lock:
+            if _fetch_state_store is None:
+                store = FetchStateStore(
+                    path=settings.SCRAPER_FETCH_STATE_PATH,
+                    max_age_hours=settings.SCRAPER_FETCH_STATE_MAX_AGE_HOURS
+                )
+                _register_commit_listener(store)
+                _fetch_state_store = store
+    return _fetch_state_store
@@ -0,0 +1,141 @@
+"""
+HTML parsing backend for scrapers
+
+Scrapers hand parse_article() a BeautifulSoup tree, so the backend keeps
+that contract and makes the parts around it cheaper:
+
+- Trees are built by lxml's C parser (SCRAPER_HTML_PARSER, per source via
+  html_parser) instead of the pure-Python html.parser, falling back to
+  html.parser when lxml is not installed
+- CSS selectors are compiled once and reused (SelectorSet)
+- Page metadata (Open Graph, Twitter Card, JSON-LD and standard meta tags)
+  is collected in one walk over the tree instead of one scan per kind
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logger.warning("lxml not installed, scrapers fall back to html.parser")
+
+FALLBACK_PARSER = 'html.parser'
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """
+    BeautifulSoup tree builder to use
+
+    Args:
+        name: Requested builder ('lxml', 'html.parser', 'html5lib'); the
+            SCRAPER_HTML_PARSER setting if None
+
+    Returns:
+        The requested builder, or html.parser if it needs lxml and lxml
+        is not installed
+    """
+    name = name or settings.SCRAPER_HTML_PARSER
+    if name.startswith('lxml') and not LXML_AVAILABLE:
+        return FALLBACK_PARSER
+    return name
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML into a BeautifulSoup tree with the configured backend"""
+    return BeautifulSoup(html, resolve_parser(parser))
+
+
+@lru_cache(maxsize=1024)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once per process"""
+    return soupsieve.compile(selector)
+
+
+class SelectorSet:
+    """
+    Named CSS selectors of a source, compiled on first use
+
+    Example:
+        css = SelectorSet({'title': 'h1.titulo, h1'})
+        title = css.select_one(soup, 'title')
+    """
+
+    def __init__(self, selectors: Dict[str, str]):
+        self.selectors = dict(selectors)
+        self._compiled: Dict[str, soupsieve.SoupSieve] = {}
+
+    def compiled(self, name: str) -> soupsieve.SoupSieve:
+        """Compiled selector by name (a raw CSS selector is accepted too)"""
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            compiled = self._compiled[name] = compile_selector(self.selectors.get(name, name))
+        return compiled
+
+    def select(self, soup: Tag, name: str) -> List[Tag]:
+        """All elements matching a named selector"""
+        return self.compiled(name).select(soup)
+
+    def select_one(self, soup: Tag, name: str) -> Optional[Tag]:
+        """First element matching a named selector"""
+        return self.compiled(name).select_one(soup)
+
+
+def extract_metadata(soup: BeautifulSoup, include_json_ld: bool = False) -> Dict[str, Any]:
+    """
+    Extract common page metadata in a single pass
+
+    Args:
+        soup: Parsed page
+        include_json_ld: Also collect JSON-LD blocks (they often repeat the
+            full article body, so they are opt-in)
+
+    Returns:
+        og_* and twitter_* tags, description, keywords (list),
+        published_time and, if requested and present, json_ld (list of
+        parsed JSON-LD objects)
+    """
+    metadata: Dict[str, Any] = {}
+    json_ld = []
+
+    for tag in soup.find_all(('meta', 'script') if include_json_ld else 'meta'):
+        if tag.name == 'script':
+            if tag.get('type') == 'application/ld+json' and tag.string:
+                try:
+                    json_ld.append(json.loads(tag.string))
+                except ValueError:
+                    logger.debug("Skipping malformed JSON-LD block")
+            continue
+
+        prop = tag.get('property')
+        name = tag.get('name')
+
+        if prop:
+            if prop.startswith('og:'):
+                metadata[f"og_{prop.replace('og:', '')}"] = tag.get('content', '')
+            elif prop == 'article:published_time' and 'published_time' not in metadata:
+                metadata['published_time'] = tag.get('content', '')
+
+        if name:
+            if name.startswith('twitter:'):
+                metadata[f"twitter_{name.replace('twitter:', '')}"] = tag.get('content', '')
+            elif name == 'description' and 'description' not in metadata:
+                metadata['description'] = tag.get('content', '')
+            elif name == 'keywords' and 'keywords' not in metadata:
+                metadata['keywords'] = tag.get('content', '').split(',')
+
+    if json_ld:
+        metadata['json_ld'] = json_ld
+
+    return metadata
@@ -8,27 +8,35 @@ from typing import Dict, Optional
 from collections import deque
 import logging
 
+from app.core.distributed_rate_limiter import create_token_bucket
+
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """Token bucket rate limiter for async operations"""
 
-    def __init__(self, max_requests: int = 10, time_window: int = 60):
+    def __init__(self, max_requests: int = 10, time_window: int = 60, key: Optional[str] = None):
         """
         Initialize rate limiter
 
         Args:
             max_requests: Maximum number of requests allowed
             time_window: Time window in seconds
+            key: Share the limit with every process through Redis under
+                this name; the local limit applies when Redis is down
         """
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests = deque()
         self._lock = asyncio.Lock()
+        self.bucket = create_token_bucket(key, max_requests, time_window)
 
     async def acquire(self):
         """Wait if necessary to respect rate limits"""
+        if self.bucket is not None and await self.bucket.acquire():
+            return
+
         async with self._lock:
             now = time.time()
 
@@ -80,15 +88,16 @@ class DomainRateLimiter:
         if domain not in self.limiters:
             # Custom limits for specific domains
             if "eltiempo.com" in domain:
-                self.limiters[domain] = RateLimiter(max_requests=5, time_window=60)
+                self.limiters[domain] = RateLimiter(max_requests=5, time_window=60, key=domain)
             elif "elespectador.com" in domain:
-                self.limiters[domain] = RateLimiter(max_requests=5, time_window=60)
+                self.limiters[domain] = RateLimiter(max_requests=5, time_window=60, key=domain)
             elif "gov.co" in domain:
-                self.limiters[domain] = RateLimiter(max_requests=3, time_window=60)
+                self.limiters[domain] = RateLimiter(max_requests=3, time_window=60, key=domain)
             else:
                 self.limiters[domain] = RateLimiter(
                     self.default_max_requests,
-                    self.default_time_window
+                    self.default_time_window,
+                    key=domain
                 )
 
         return self.limiters[domain]
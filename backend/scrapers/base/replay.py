@@ -0,0 +1,198 @@
+"""
+Record/replay of scraper HTTP responses
+
+Sits beneath BaseScraper.fetch_page and SmartScraper.fetch_page:
+
+- record: pages are fetched live and every response is saved
+- replay: pages are served from the archive, nothing goes to the network
+  (URLs missing from the archive answer 404)
+
+The archive is a single zip file (deflate-compressed JSON entry per URL),
+so a recorded crawl can be committed or cached in CI and replayed through
+the scrapers to measure throughput and parser regressions offline.
+
+Enable with SCRAPER_REPLAY_MODE ("record" or "replay") and
+SCRAPER_REPLAY_ARCHIVE, or install an archive with use_archive().
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Response headers kept in the archive
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+
+
+@dataclass
+class RecordedResponse:
+    """A response as stored in the archive"""
+    url: str
+    status: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    recorded_at: float = 0.0
+
+    def to_requests_response(self) -> requests.Response:
+        """Rebuild a requests.Response (for SmartScraper)"""
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = 'utf-8'
+        response._content = self.text.encode('utf-8')
+        return response
+
+
+class ResponseArchive:
+    """
+    Zip archive of recorded responses keyed by URL
+
+    Thread-safe. Recorded responses are held in memory and written with
+    save() (atomic replace of the zip file).
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        """
+        Args:
+            path: Zip file (created on save when recording)
+            mode: RECORD or REPLAY
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown replay mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self._responses: Dict[str, RecordedResponse] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+
+        if os.path.exists(path):
+            self._load()
+        elif mode == REPLAY:
+            raise FileNotFoundError(f"Replay archive not found: {path}")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @staticmethod
+    def _entry_name(url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json'
+
+    def _load(self) -> None:
+        with zipfile.ZipFile(self.path) as archive:
+            for name in archive.namelist():
+                entry = json.loads(archive.read(name))
+                self._responses[entry['url']] = RecordedResponse(**entry)
+        logger.info(f"Loaded {len(self._responses)} recorded responses from {self.path}")
+
+    def record(self, url: str, status: int, headers: Mapping[str, str], text: str) -> None:
+        """Store a live response (no-op unless recording)"""
+        if self.mode != RECORD:
+            return
+
+        kept = {name: headers[name] for name in RECORDED_HEADERS if headers.get(name)}
+        with self._lock:
+            self._responses[url] = RecordedResponse(url, status, text, kept, time.time())
+            self._dirty = True
+            self.stats['recorded'] += 1
+
+    def replay(self, url: str) -> RecordedResponse:
+        """Recorded response for a URL (404 if it was not recorded)"""
+        with self._lock:
+            response = self._responses.get(url)
+            if response is None:
+                self.stats['misses'] += 1
+            else:
+                self.stats['replayed'] += 1
+
+        if response is None:
+            logger.debug(f"Not in replay archive: {url}")
+            return RecordedResponse(url, 404, '')
+        return response
+
+    def urls(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._responses))
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def save(self) -> bool:
+        """
+        Write recorded responses to the zip file
+
+        Returns:
+            True if the file was written
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            entries = [(self._entry_name(r.url), json.dumps(r.__dict__, ensure_ascii=False))
+                       for r in self._responses.values()]
+            self._dirty = False
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+            for name, data in entries:
+                archive.writestr(name, data)
+        os.replace(tmp_path, self.path)
+
+        logger.info(f"Saved {len(entries)} recorded responses to {self.path}")
+        return True
+
+
+# Active archive (None: live fetching)
+_archive: Optional[ResponseArchive] = None
+_archive_loaded = False
+_archive_lock = threading.Lock()
+
+
+def get_replay_archive() -> Optional[ResponseArchive]:
+    """Archive configured by SCRAPER_REPLAY_MODE, or installed by use_archive()"""
+    global _archive, _archive_loaded
+    if not _archive_loaded:
+        with _archive_lock:
+            if not _archive_loaded:
+                mode = settings.SCRAPER_REPLAY_MODE
+                if mode in (RECORD, REPLAY):
+                    _archive = ResponseArchive(settings.SCRAPER_REPLAY_ARCHIVE, mode)
+                    logger.warning(f"Scraper HTTP {mode} mode, archive {settings.SCRAPER_REPLAY_ARCHIVE}")
+                _archive_loaded = True
+    return _archive
+
+
+@contextmanager
+def use_archive(archive: Optional[ResponseArchive]) -> Iterator[Optional[ResponseArchive]]:
+    """Route scraper fetches through an archive for the duration of the block"""
+    global _archive, _archive_loaded
+    with _archive_lock:
+        previous = (_archive, _archive_loaded)
+        _archive, _archive_loaded = archive, True
+    try:
+        yield archive
+    finally:
+        if archive is not None and archive.mode == RECORD:
+            archive.save()
+        with _archive_lock:
+            _archive, _archive_loaded = previous
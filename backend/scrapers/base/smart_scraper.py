@@ -9,15 +9,23 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import yaml
 from dataclasses import dataclass
 import logging
 from functools import wraps
+from urllib.parse import urlparse
 import redis
 
+from app.config.settings import settings
+from app.core.distributed_rate_limiter import create_token_bucket
+from app.core.http_transport import get_http_transport
+from scrapers.base.fetch_state import HIT_RESULTS, get_fetch_state_store
+from scrapers.base import html_parser
+from scrapers.base.html_parser import SelectorSet
+from scrapers.base.replay import ResponseArchive, get_replay_archive
+from scrapers.base.url_index import get_url_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,11 +76,13 @@ class ScrapedDocument:
 class RateLimiter:
     """Token bucket rate limiter"""
 
-    def __init__(self, rate: str):
+    def __init__(self, rate: str, key: Optional[str] = None):
         """
         Initialize rate limiter
         Args:
             rate: Rate string like "10/minute" or "100/hour"
+            key: Share the limit with every process through Redis under
+                this name; the local limit applies when Redis is down
         """
         parts = rate.split('/')
         self.max_requests = int(parts[0])
@@ -88,9 +98,13 @@ class RateLimiter:
 
         self.tokens = self.max_requests
         self.last_update = time.time()
+        self.bucket = create_token_bucket(key, self.max_requests, self.period)
 
     def acquire(self) -> bool:
         """Acquire a token for making a request"""
+        if self.bucket is not None and self.bucket.acquire_blocking():
+            return True
+
         now = time.time()
         elapsed = now - self.last_update
 
@@ -122,14 +136,29 @@ class SmartScraper(ABC):
         self.source_name = self.config.get('name', 'Unknown')
         self.base_url = self.config.get('url', '')
         self.rate_limiter = None
+        self.html_parser = self.config.get('html_parser', settings.SCRAPER_HTML_PARSER)
+        self._css: Optional[SelectorSet] = None
 
         # Set up rate limiting
         if 'rate_limit' in self.config:
-            self.rate_limiter = RateLimiter(self.config['rate_limit'])
+            self.rate_limiter = RateLimiter(self.config['rate_limit'], key=urlparse(self.base_url).netloc)
 
-        # Create resilient session
+        # Borrow the shared, retrying session
         self.session = self._create_session()
 
+        # Per-URL ETag/Last-Modified/hash store for skipping unchanged articles
+        self.fetch_state = (
+            get_fetch_state_store()
+            if self.config.get('conditional_fetch', settings.SCRAPER_CONDITIONAL_FETCH)
+            else None
+        )
+        # Bloom filter of stored article URLs, checked before fetching
+        self.url_index = (
+            get_url_index()
+            if self.config.get('skip_known_urls', settings.SCRAPER_SKIP_KNOWN_URLS)
+            else None
+        )
+
         # Setup caching (optional)
         try:
             self.cache = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
@@ -140,32 +169,14 @@ class SmartScraper(ABC):
             logger.info(f"Redis not available, caching disabled for {self.source_name}")
 
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic"""
-        session = requests.Session()
-
-        # Configure retries
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Set headers
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'es-CO,es;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+        """
+        Get the process-wide requests session
 
-        return session
+        Connections to each site are pooled and kept alive across scrapers
+        and runs; retries (3, backoff, 429/5xx) and browser-like headers are
+        configured on the session.
+        """
+        return get_http_transport().get_sync_session()
 
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key for URL"""
@@ -198,24 +209,47 @@ class SmartScraper(ABC):
         except Exception as e:
             logger.error(f"Cache set error: {e}")
 
-    def fetch_page(self, url: str, use_cache: bool = True) -> Optional[str]:
+    def fetch_page(self, url: str, use_cache: bool = True, conditional: bool = False) -> Optional[str]:
         """
         Fetch a page with rate limiting and caching
+
+        With conditional=True the page is revalidated against the fetch
+        state store instead of the Redis cache, and None is returned if it
+        is unchanged since the last fetch (304 or identical body).
         """
+        conditional = conditional and self.fetch_state is not None
+        archive = get_replay_archive()
+        replaying = archive is not None and archive.replaying
+
         # Check cache first
-        if use_cache:
+        if use_cache and not conditional and not replaying:
             cached = self._get_cached(url)
             if cached:
                 return cached
 
         # Apply rate limiting
-        if self.rate_limiter:
+        if self.rate_limiter and not replaying:
             self.rate_limiter.acquire()
 
         try:
-            response = self.session.get(url, timeout=30)
+            if conditional:
+                headers = self.fetch_state.request_headers(self.source_name, url)
+                response = self._get(url, headers, archive)
+                if response.status_code == 304:
+                    self.fetch_state.record_response(self.source_name, url, 304, response.headers)
+                    return None
+            else:
+                response = self._get(url, None, archive)
             response.raise_for_status()
 
+            if conditional:
+                result = self.fetch_state.record_response(
+                    self.source_name, url, 200, response.headers, response.text.encode('utf-8')
+                )
+                if result in HIT_RESULTS:
+                    logger.debug(f"Unchanged since last scrape: {url}")
+                    return None
+
             # Cache successful response
             if use_cache:
                 self._set_cache(url, response.text)
@@ -226,9 +260,35 @@ class SmartScraper(ABC):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def _get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        archive: Optional[ResponseArchive] = None
+    ) -> requests.Response:
+        """GET a URL with the shared session, or serve it from the replay archive"""
+        if archive is not None and archive.replaying:
+            return archive.replay(url).to_requests_response()
+
+        if headers:
+            response = self.session.get(url, headers=headers, timeout=30)
+        else:
+            response = self.session.get(url, timeout=30)
+
+        if archive is not None:
+            archive.record(url, response.status_code, response.headers, response.text)
+        return response
+
     def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content"""
-        return BeautifulSoup(html, 'html.parser')
+        """Parse HTML content (lxml tree builder by default)"""
+        return html_parser.parse_html(html, self.html_parser)
+
+    @property
+    def css(self) -> SelectorSet:
+        """The source's selectors (self.selectors), compiled once"""
+        if self._css is None:
+            self._css = SelectorSet(getattr(self, 'selectors', {}))
+        return self._css
 
     @abstractmethod
     def extract_article_urls(self, homepage_html: str) -> List[str]:
@@ -250,12 +310,24 @@ class SmartScraper(ABC):
         return self.extract_article_urls(html)
 
     def scrape_article(self, url: str) -> Optional[ScrapedDocument]:
-        """Scrape a single article"""
-        html = self.fetch_page(url)
+        """Scrape a single article, skipping it if unchanged since the last scrape"""
+        html = self.fetch_page(url, conditional=True)
         if not html:
             return None
 
-        return self.extract_article_content(html, url)
+        doc = self.extract_article_content(html, url)
+
+        if doc is None and self.fetch_state is not None:
+            # Fetch it again next time rather than skip it as unchanged
+            self.fetch_state.discard(url)
+
+        # Page changed but the article did not: skip NLP and storage
+        if doc is not None and self.fetch_state is not None:
+            content_hash = hashlib.sha256(doc.content.encode()).hexdigest()
+            if not self.fetch_state.record_content(self.source_name, url, content_hash):
+                return None
+
+        return doc
 
     def scrape_batch(self, limit: int = 10) -> List[ScrapedDocument]:
         """
@@ -263,9 +335,12 @@ class SmartScraper(ABC):
         """
         logger.info(f"Starting batch scrape for {self.source_name}")
 
-        # Get article URLs
-        article_urls = self.scrape_homepage()[:limit]
-        logger.info(f"Found {len(article_urls)} articles to scrape")
+        # Get article URLs, dropping those already stored
+        article_urls = self.scrape_homepage()
+        if self.url_index is not None and article_urls:
+            article_urls = self.url_index.filter_new(article_urls, self.source_name)
+        article_urls = article_urls[:limit]
+        logger.info(f"Found {len(article_urls)} new articles to scrape")
 
         # Scrape each article
         documents = []
@@ -275,6 +350,16 @@ class SmartScraper(ABC):
                 documents.append(doc)
                 logger.debug(f"Scraped: {doc.title}")
 
+        if self.url_index is not None:
+            self.url_index.save()
+        if self.fetch_state is not None:
+            self.fetch_state.flush()
+            stats = self.fetch_state.get_statistics(self.source_name)[self.source_name]
+            logger.info(f"Fetch state hit ratio for {self.source_name}: {stats['hit_ratio']:.1%}")
+        archive = get_replay_archive()
+        if archive is not None and not archive.replaying:
+            archive.save()
+
         logger.info(f"Successfully scraped {len(documents)} documents from {self.source_name}")
         return documents
 
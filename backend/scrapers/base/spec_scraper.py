@@ -0,0 +1,343 @@
+"""
+Declarative scrapers: a source is a ScraperSpec, the engine is BaseScraper
+
+Most Colombian outlets differ only in where things are on the page: which
+sections list articles, which links are articles, which CSS selectors hold
+the title, body, author and date, and how dates are written. A ScraperSpec
+captures exactly that, and SpecScraper turns it into a full scraper on the
+async BaseScraper pipeline (shared connection pool, rate limiter, compiled
+selectors, conditional fetch, URL index and replay):
+
+    class WRadioScraper(SpecScraper):
+        spec = ScraperSpec(
+            name='W Radio',
+            url='https://www.wradio.com.co',
+            sections=('noticias', 'politica'),
+            selectors={'title': 'h1.headline, h1', 'content': '.article-body', ...},
+            article_patterns=(r'/noticias/', r'/\\d{4,}'),
+        )
+
+scrape_concurrently() runs any number of scrapers on one event loop.
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+SPANISH_MONTHS = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6,
+    'julio': 7, 'agosto': 8, 'septiembre': 9, 'setiembre': 9, 'octubre': 10,
+    'noviembre': 11, 'diciembre': 12,
+    'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dic': 12
+}
+
+# strftime-style formats; %B / %b match Spanish month names
+DEFAULT_DATE_FORMATS = (
+    '%d de %B de %Y %H:%M',
+    '%d de %B de %Y',
+    '%d %b %Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d',
+)
+
+# Links that are never articles, on any outlet
+COMMON_EXCLUDE_PATTERNS = (
+    '/autor/', '/tag/', '/video/', '/galeria/', '#', 'mailto:', 'javascript:',
+    '.pdf', '.jpg', '.png', '.mp3', '.mp4',
+    'twitter.com', 'facebook.com', 'instagram.com', 'youtube.com'
+)
+
+_DIRECTIVES = {
+    'd': r'(?P<day>\d{1,2})',
+    'm': r'(?P<month>\d{1,2})',
+    'B': r'(?P<month_name>[a-záéíóú]+)',
+    'b': r'(?P<month_name>[a-záéíóú]+)\.?',
+    'Y': r'(?P<year>\d{4})',
+    'H': r'(?P<hour>\d{1,2})',
+    'M': r'(?P<minute>\d{2})',
+}
+_RELATIVE_DATE = re.compile(r'hace\s+(\d+)\s+(minuto|hora|día|dia)s?', re.IGNORECASE)
+_URL_DATE = re.compile(r'/(\d{4})/(\d{2})/(\d{2})/')
+_AUTHOR_PREFIX = re.compile(r'^(Por:?\s*|Redacción\s*|@)', re.IGNORECASE)
+
+
+def compile_date_format(date_format: str) -> 're.Pattern[str]':
+    """Turn a strftime-style format into a regex searching free text"""
+    parts = re.split(r'(%[a-zA-Z])', date_format)
+    pattern = ''.join(
+        _DIRECTIVES.get(part[1], re.escape(part)) if part.startswith('%') else re.escape(part)
+        for part in parts
+    )
+    return re.compile(pattern.replace(r'\ ', r'\s+'), re.IGNORECASE)
+
+
+def parse_spanish_date(text: str, patterns: Iterable['re.Pattern[str]']) -> Optional[datetime]:
+    """
+    Parse a date written in Spanish ("17 de octubre de 2025", "Hace 3 horas")
+
+    Args:
+        text: Text containing the date
+        patterns: Compiled date formats (see compile_date_format), tried in order
+    """
+    if not text:
+        return None
+
+    for pattern in patterns:
+        match = pattern.search(text)
+        if not match:
+            continue
+        fields = match.groupdict()
+        month = fields.get('month') or SPANISH_MONTHS.get((fields.get('month_name') or '').lower())
+        try:
+            return datetime(
+                int(fields['year']), int(month), int(fields['day']),
+                int(fields.get('hour') or 0), int(fields.get('minute') or 0)
+            )
+        except (TypeError, ValueError):
+            continue
+
+    relative = _RELATIVE_DATE.search(text)
+    if relative:
+        amount, unit = int(relative.group(1)), relative.group(2).lower()
+        delta = {'minuto': timedelta(minutes=amount), 'hora': timedelta(hours=amount)}.get(unit, timedelta(days=amount))
+        return datetime.utcnow() - delta
+
+    return None
+
+
+@dataclass
+class ScraperSpec:
+    """
+    Everything that differs between outlets
+
+    selectors keys: article_links, title, subtitle, content, author, date,
+    category, tags (all optional but title and content). article_patterns
+    are regexes, any of which marks a same-site link as an article;
+    exclude_patterns are substrings that rule a link out.
+    """
+    name: str
+    url: str
+    category: str = 'media'
+    sections: Tuple[str, ...] = ()
+    selectors: Mapping[str, str] = field(default_factory=dict)
+    article_patterns: Tuple[str, ...] = ()
+    exclude_patterns: Tuple[str, ...] = COMMON_EXCLUDE_PATTERNS
+    date_formats: Tuple[str, ...] = DEFAULT_DATE_FORMATS
+    # Paragraphs containing these (lower case) are dropped from the body
+    promotional_phrases: Tuple[str, ...] = ()
+    min_paragraph_length: int = 20
+    min_content_length: int = 150
+    requests_per_minute: int = 20
+    # Section pages fetched per run, besides the homepage
+    max_sections: int = 3
+    # Stored in each article's extra_metadata (source_type, region, ...)
+    extra_metadata: Mapping[str, Any] = field(default_factory=dict)
+
+
+class SpecScraper(BaseScraper):
+    """
+    Scraper driven by a ScraperSpec (set as the class attribute `spec`)
+
+    The homepage and section pages are fetched concurrently, links are
+    filtered with the spec's URL patterns and articles are extracted with
+    its selectors. Source config entries override the spec's name, url and
+    category, as for any BaseScraper.
+    """
+
+    spec: ScraperSpec
+
+    def __init__(self, source_config: Optional[Dict[str, Any]] = None):
+        spec = self.spec
+        super().__init__({
+            'name': spec.name,
+            'url': spec.url,
+            'category': spec.category,
+            **(source_config or {})
+        })
+        self.base_url = self.base_url.rstrip('/')
+        self.sections = list(spec.sections)
+        self.selectors = dict(spec.selectors)
+        self.rate_limiter = RateLimiter(
+            max_requests=spec.requests_per_minute, time_window=60, key=urlparse(self.base_url).netloc
+        )
+
+        self._domain = urlparse(self.base_url).netloc.lower().removeprefix('www.')
+        self._article_re = re.compile('|'.join(spec.article_patterns)) if spec.article_patterns else None
+        self._date_patterns = [compile_date_format(f) for f in spec.date_formats]
+
+    async def get_article_urls(self) -> List[str]:
+        """Article links from the homepage and the first max_sections sections"""
+        pages = [self.base_url] + [f"{self.base_url}/{section}" for section in self.sections[:self.spec.max_sections]]
+        htmls = await asyncio.gather(*(self.fetch_page(page) for page in pages))
+
+        urls: Dict[str, None] = {}  # ordered set, homepage links first
+        loop = asyncio.get_event_loop()
+        for page, html in zip(pages, htmls):
+            if html:
+                for url in await loop.run_in_executor(None, self._extract_links, html, page):
+                    urls.setdefault(url)
+        return list(urls)
+
+    def _extract_links(self, html: str, page_url: str) -> List[str]:
+        soup = self.parse_html(html)
+        links = self.css.select(soup, 'article_links') if 'article_links' in self.selectors else soup.find_all('a')
+        urls = []
+        for link in links:
+            href = link.get('href')
+            if href:
+                url = urljoin(page_url, href).split('#')[0]
+                if self.is_article_url(url):
+                    urls.append(url)
+        return urls
+
+    def is_article_url(self, url: str) -> bool:
+        """Same-site link matching an article pattern and no exclude pattern"""
+        lowered = url.lower()
+        host = urlparse(lowered).netloc
+        if host != self._domain and not host.endswith('.' + self._domain):
+            return False
+        if any(pattern in lowered for pattern in self.spec.exclude_patterns):
+            return False
+        return self._article_re is None or bool(self._article_re.search(lowered))
+
+    def parse_article(self, soup: BeautifulSoup, url: str) -> Optional[Dict[str, Any]]:
+        """Extract an article with the spec's selectors"""
+        title = self._select_text(soup, 'title')
+        if not title:
+            og_title = soup.find('meta', property='og:title')
+            title = self.clean_text(og_title.get('content', '')) if og_title else ''
+        if not title:
+            logger.warning(f"No title found for {url}")
+            return None
+
+        subtitle = self._select_text(soup, 'subtitle')
+        content = self._extract_content(soup, subtitle)
+        if len(content) < self.spec.min_content_length:
+            logger.warning(f"Content too short for {url}")
+            return None
+
+        extra_metadata = dict(self.spec.extra_metadata)
+        section = self._select_text(soup, 'category') or self._section_from_url(url)
+        if section:
+            extra_metadata['section'] = section
+
+        return {
+            'title': title,
+            'subtitle': subtitle,
+            'content': content,
+            'author': self._extract_author(soup),
+            'published_date': self._extract_date(soup, url),
+            'word_count': len(content.split()),
+            'tags': [self.clean_text(tag.get_text()) for tag in self.css.select(soup, 'tags')]
+            if 'tags' in self.selectors else [],
+            'extra_metadata': extra_metadata
+        }
+
+    def _select_text(self, soup: BeautifulSoup, name: str) -> str:
+        if name not in self.selectors:
+            return ''
+        elem = self.css.select_one(soup, name)
+        return self.clean_text(elem.get_text()) if elem else ''
+
+    def _extract_content(self, soup: BeautifulSoup, subtitle: str) -> str:
+        container = (self.css.select_one(soup, 'content') if 'content' in self.selectors else None) or soup.find('article')
+        if container is None:
+            return ''
+
+        parts = [subtitle] if subtitle else []
+        promotional = self.spec.promotional_phrases
+        for paragraph in container.find_all('p'):
+            text = self.clean_text(paragraph.get_text())
+            if len(text) > self.spec.min_paragraph_length:
+                lowered = text.lower()
+                if not any(phrase in lowered for phrase in promotional):
+                    parts.append(text)
+        return ' '.join(parts)
+
+    def _extract_author(self, soup: BeautifulSoup) -> str:
+        author = _AUTHOR_PREFIX.sub('', self._select_text(soup, 'author'))
+        if len(author) > 2:
+            return author
+        author_meta = soup.find('meta', attrs={'name': 'author'})
+        if author_meta and author_meta.get('content'):
+            return self.clean_text(author_meta['content'])
+        return self.name
+
+    def _extract_date(self, soup: BeautifulSoup, url: str) -> Optional[datetime]:
+        """time[datetime], article:published_time, date selector text, then the URL"""
+        candidates = []
+        time_elem = soup.find('time', attrs={'datetime': True})
+        if time_elem:
+            candidates.append(time_elem['datetime'])
+        published = soup.find('meta', attrs={'property': 'article:published_time'})
+        if published and published.get('content'):
+            candidates.append(published['content'])
+
+        for value in candidates:
+            try:
+                return datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+            except ValueError:
+                continue
+
+        parsed = parse_spanish_date(self._select_text(soup, 'date'), self._date_patterns)
+        if parsed:
+            return parsed
+
+        match = _URL_DATE.search(url)
+        if match:
+            try:
+                return datetime(*map(int, match.groups()))
+            except ValueError:
+                pass
+        return None
+
+    def _section_from_url(self, url: str) -> Optional[str]:
+        path = urlparse(url).path.lower()
+        for section in self.sections:
+            if f'/{section}/' in path:
+                return section.replace('-', ' ').title()
+        return None
+
+
+async def scrape_concurrently(scrapers: Iterable[Any]) -> Dict[str, List[Any]]:
+    """
+    Run several scrapers at once on the running event loop
+
+    BaseScraper subclasses (including every SpecScraper) share the loop's
+    HTTP session; their per-domain concurrency and rate limits still apply.
+    Synchronous SmartScraper sources run in the default executor.
+
+    Returns:
+        Scraped items per source name (empty for sources that failed)
+    """
+    async def run(scraper) -> List[Any]:
+        try:
+            if isinstance(scraper, BaseScraper):
+                async with scraper:
+                    return await scraper.scrape()
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                None, scraper.scrape_batch, scraper.config.get('max_articles', 50)
+            )
+        except Exception as e:
+            logger.error(f"Error scraping {source_name(scraper)}: {str(e)}")
+            return []
+
+    def source_name(scraper) -> str:
+        return scraper.name if isinstance(scraper, BaseScraper) else scraper.source_name
+
+    scrapers = list(scrapers)
+    results = await asyncio.gather(*(run(scraper) for scraper in scrapers))
+    return {source_name(scraper): items for scraper, items in zip(scrapers, results)}
@@ -0,0 +1,375 @@
+"""
+URL-seen index for skipping already stored articles before fetching
+
+A Bloom filter over ScrapedContent.source_url answers "was this URL stored
+before?" in memory. A negative answer is exact, so the URL is fetched; a
+positive answer is confirmed against the database in one batched query,
+so false positives never hide a new article.
+
+- Persisted to a small file together with the highest ScrapedContent.id
+  it covers; at startup only newer rows are read (a full scan of
+  source_url happens only when the file is missing or outgrown)
+- Kept current by an after_insert listener on ScrapedContent (ORM adds),
+  an after_commit listener on sessions for bulk upserts
+  (app.database.bulk), and a throttled catch-up on rows inserted by other
+  processes
+"""
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Import metrics - use try/except for graceful degradation
+try:
+    from app.core.metrics import scraper_known_urls_skipped_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings"""
+
+    _HEADER = struct.Struct('<4sBQIQ')  # magic, version, bits, hashes, count
+    _MAGIC = b'OLBF'
+    _VERSION = 1
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        """Bit positions of an item (double hashing of one 128-bit digest)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        h2 |= 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item
+
+        Returns:
+            True if the item was not in the filter before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def false_positive_rate(self) -> float:
+        """Estimated false positive rate at the current fill"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def to_bytes(self) -> bytes:
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, self.num_bits, self.num_hashes, self.count)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, capacity: int, error_rate: float) -> 'BloomFilter':
+        """Restore a filter written by to_bytes() (ValueError if it does not match the sizing)"""
+        magic, version, num_bits, num_hashes, count = cls._HEADER.unpack_from(data)
+        bloom = cls(capacity, error_rate)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("Not a Bloom filter file")
+        if (num_bits, num_hashes) != (bloom.num_bits, bloom.num_hashes):
+            raise ValueError("Bloom filter sizing changed")
+
+        bits = data[cls._HEADER.size:]
+        if len(bits) != len(bloom.bits):
+            raise ValueError("Truncated Bloom filter")
+
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+class URLIndex:
+    """
+    Index of article URLs already stored in ScrapedContent
+
+    Thread-safe. Without a session factory the index only knows URLs added
+    in-process and trusts positive answers (no database confirmation).
+    """
+
+    _FILE_HEADER = struct.Struct('<QQ')  # highest ScrapedContent.id covered, capacity
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        path: Optional[str] = None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 60.0
+    ):
+        """
+        Args:
+            session_factory: Callable returning a sync SQLAlchemy session
+            path: File the filter is persisted to (None keeps it in memory)
+            capacity: URLs the filter is sized for (doubled when outgrown)
+            error_rate: False positive rate at capacity
+            sync_interval: Minimum seconds between catch-ups on new rows
+        """
+        self.session_factory = session_factory
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.max_id = 0
+        self._loaded = False
+        self._dirty = False
+        self._last_sync = 0.0
+        self._lock = threading.RLock()
+
+        self.stats = {'checked': 0, 'known': 0, 'false_positives': 0, 'exact_checks': 0}
+
+    def load(self) -> None:
+        """Load the persisted filter and catch up on rows stored since"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if self.path and os.path.exists(self.path):
+                try:
+                    with open(self.path, 'rb') as f:
+                        data = f.read()
+                    self.max_id, capacity = self._FILE_HEADER.unpack_from(data)
+                    # Keep a filter that was resized after outgrowing the configured capacity
+                    self.capacity = max(self.capacity, capacity)
+                    self.bloom = BloomFilter.from_bytes(
+                        data[self._FILE_HEADER.size:], self.capacity, self.error_rate
+                    )
+                    logger.info(f"Loaded URL index ({self.bloom.count} URLs, up to id {self.max_id})")
+                except (ValueError, struct.error, OSError) as e:
+                    logger.warning(f"Rebuilding URL index, persisted filter unusable: {e}")
+                    self.bloom = BloomFilter(self.capacity, self.error_rate)
+                    self.max_id = 0
+
+            self.sync(force=True)
+
+    def sync(self, force: bool = False) -> int:
+        """
+        Add URLs of rows inserted since the last sync (by any process)
+
+        Args:
+            force: Ignore sync_interval
+
+        Returns:
+            Number of rows read
+        """
+        if self.session_factory is None:
+            return 0
+
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_sync < self.sync_interval:
+                return 0
+            self._last_sync = now
+
+            if self.bloom.count > self.capacity:
+                # Outgrown: resize and rebuild from a full scan
+                self.capacity *= 2
+                self.bloom = BloomFilter(self.capacity, self.error_rate)
+                self.max_id = 0
+                logger.info(f"URL index outgrown, rebuilding for {self.capacity} URLs")
+
+            from app.database.models import ScrapedContent
+
+            rows = 0
+            session = None
+            try:
+                session = self.session_factory()
+                query = (
+                    session.query(ScrapedContent.id, ScrapedContent.source_url)
+                    .filter(ScrapedContent.id > self.max_id)
+                    .order_by(ScrapedContent.id)
+                    .yield_per(10000)
+                )
+                for row_id, url in query:
+                    self.bloom.add(url)
+                    self.max_id = row_id
+                    rows += 1
+            except Exception as e:
+                logger.error(f"URL index catch-up failed: {e}")
+            finally:
+                if session is not None:
+                    session.close()
+
+            if rows:
+                self._dirty = True
+                logger.debug(f"URL index caught up on {rows} stored articles")
+            return rows
+
+    def add(self, url: str) -> None:
+        """Record a stored URL"""
+        with self._lock:
+            if url and self.bloom.add(url):
+                self._dirty = True
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Record stored URLs"""
+        with self._lock:
+            for url in urls:
+                self.add(url)
+
+    def filter_new(self, urls: List[str], source: Optional[str] = None) -> List[str]:
+        """
+        Drop URLs that are already stored, keeping order
+
+        Blocking (may query the database); run it in an executor from
+        async code. If the database cannot be reached, possibly-known URLs
+        are kept, so the caller fetches them as before.
+
+        Args:
+            urls: Candidate article URLs
+            source: Source name for metrics
+
+        Returns:
+            URLs not stored yet
+        """
+        self.load()
+        self.sync()
+
+        with self._lock:
+            candidates = [url for url in urls if url in self.bloom]
+        known = self._confirm_stored(candidates)
+
+        new_urls = [url for url in urls if url not in known]
+        with self._lock:
+            self.stats['checked'] += len(urls)
+            self.stats['known'] += len(known)
+            self.stats['false_positives'] += len(set(candidates) - known)
+
+        skipped = len(urls) - len(new_urls)
+        if skipped and METRICS_AVAILABLE:
+            scraper_known_urls_skipped_total.labels(scraper_name=source or 'unknown').inc(skipped)
+        return new_urls
+
+    def _confirm_stored(self, urls: List[str]) -> Set[str]:
+        """Exact check of Bloom filter positives against the database"""
+        if not urls:
+            return set()
+        if self.session_factory is None:
+            return set(urls)
+
+        from app.database.models import ScrapedContent
+
+        with self._lock:
+            self.stats['exact_checks'] += 1
+
+        session = None
+        try:
+            session = self.session_factory()
+            return {
+                url for (url,) in session.query(ScrapedContent.source_url)
+                .filter(ScrapedContent.source_url.in_(set(urls)))
+            }
+        except Exception as e:
+            logger.error(f"URL index exact check failed, fetching {len(urls)} URLs: {e}")
+            return set()
+        finally:
+            if session is not None:
+                session.close()
+
+    def save(self) -> bool:
+        """
+        Persist the filter if it changed (atomic replace)
+
+        Returns:
+            True if the file was written
+        """
+        with self._lock:
+            if not self.path or not self._dirty:
+                return False
+            data = self._FILE_HEADER.pack(self.max_id, self.capacity) + self.bloom.to_bytes()
+            self._dirty = False
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Failed to persist URL index: {e}")
+            return False
+        return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size, fill and skip counts of the index"""
+        with self._lock:
+            return {
+                **self.stats,
+                'urls': self.bloom.count,
+                'capacity': self.capacity,
+                'max_id': self.max_id,
+                'size_bytes': len(self.bloom.bits),
+                'estimated_false_positive_rate': round(self.bloom.false_positive_rate(), 6)
+            }
+
+
+# Global index instance
+_url_index: Optional[URLIndex] = None
+_index_lock = threading.Lock()
+
+
+def _register_insert_listener(index: URLIndex) -> None:
+    """Add URLs to the index as ScrapedContent rows are inserted"""
+    from sqlalchemy import event
+    from app.database.bulk import on_stored_commit
+    from app.database.models import ScrapedContent
+
+    def after_insert(mapper, connection, target):
+        index.add(target.source_url)
+
+    event.listen(ScrapedContent, 'after_insert', after_insert)
+    on_stored_commit(index.add_many)
+
+
+def get_url_index() -> URLIndex:
+    """Get the process-wide URL index backed by the application database"""
+    global _url_index
+    if _url_index is None:
+        with _index_lock:
+            if _url_index is None:
+                from app.database.connection import SessionLocal
+
+                index = URLIndex(
+                    session_factory=SessionLocal,
+                    path=settings.SCRAPER_URL_INDEX_PATH,
+                    capacity=settings.SCRAPER_URL_INDEX_CAPACITY
+                )
+                _register_insert_listener(index)
+                _url_index = index
+    return _url_index
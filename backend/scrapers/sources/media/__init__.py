@@ -6,8 +6,10 @@ This module contains scrapers for Colombian news sources organized by type:
 - Regional Media: Regional newspapers focused on specific cities/departments
 - Specialized Media: Business, political analysis, fact-checking, and digital sources
 
-All scrapers inherit from SmartScraper and return ScrapedDocument objects
+Most scrapers inherit from SmartScraper and return ScrapedDocument objects
 with Colombian entity detection and difficulty scoring for language learning.
+Outlets that need only selectors and URL patterns are declared as
+ScraperSpecs in spec_sources and run on the async BaseScraper engine.
 """
 
 # National Media Scrapers (High Priority)
@@ -31,6 +33,17 @@ from .razon_publica import RazonPublicaScraper
 from .colombia_check import ColombiaCheckScraper
 from .pulzo import PulzoScraper
 
+# Spec-driven Scrapers
+from .spec_sources import (
+    WRadioScraper,
+    RCNRadioScraper,
+    LaOpinionScraper,
+    Las2orillasScraper,
+    PublimetroScraper,
+    VanguardiaScraper,
+    SPEC_SCRAPERS,
+)
+
 # Scraper registry for easy access
 NATIONAL_SCRAPERS = {
     'el_espectador': ElEspectadorScraper,
@@ -39,6 +52,8 @@ NATIONAL_SCRAPERS = {
     'portafolio': PortafolioScraper,
     'la_fm': LaFMScraper,
     'blu_radio': BluRadioScraper,
+    'w_radio': WRadioScraper,
+    'rcn_radio': RCNRadioScraper,
 }
 
 REGIONAL_SCRAPERS = {
@@ -46,6 +61,8 @@ REGIONAL_SCRAPERS = {
     'el_pais': ElPaisScraper,
     'el_heraldo': ElHeraldoScraper,
     'el_universal': ElUniversalScraper,
+    'la_opinion': LaOpinionScraper,
+    'vanguardia': VanguardiaScraper,
 }
 
 SPECIALIZED_SCRAPERS = {
@@ -54,6 +71,8 @@ SPECIALIZED_SCRAPERS = {
     'razon_publica': RazonPublicaScraper,
     'colombia_check': ColombiaCheckScraper,
     'pulzo': PulzoScraper,
+    'las2orillas': Las2orillasScraper,
+    'publimetro': PublimetroScraper,
 }
 
 # All scrapers combined
@@ -86,11 +105,20 @@ __all__ = [
     'ColombiaCheckScraper',
     'PulzoScraper',
 
+    # Spec-driven
+    'WRadioScraper',
+    'RCNRadioScraper',
+    'LaOpinionScraper',
+    'Las2orillasScraper',
+    'PublimetroScraper',
+    'VanguardiaScraper',
+
     # Registries
     'NATIONAL_SCRAPERS',
     'REGIONAL_SCRAPERS',
     'SPECIALIZED_SCRAPERS',
-    'ALL_SCRAPERS'
+    'ALL_SCRAPERS',
+    'SPEC_SCRAPERS'
 ]
 
 
@@ -88,7 +88,7 @@ class ElTiempoScraper(BaseScraper):
             html = await self.fetch_page(section_url)
             if html:
                 soup = self.parse_html(html)
-                links = soup.select(self.selectors['article_links'])
+                links = self.css.select(soup, 'article_links')
 
                 for link in links:
                     href = link.get('href', '')
@@ -305,18 +305,18 @@ class ElTiempoScraper(BaseScraper):
             }
 
             # Extract title
-            title_elem = soup.select_one(self.selectors['title'])
+            title_elem = self.css.select_one(soup, 'title')
             if not title_elem:
                 logger.warning(f"No title found for {url}")
                 return None
             article['title'] = self.clean_text(title_elem.get_text())
 
             # Extract subtitle
-            subtitle_elem = soup.select_one(self.selectors['subtitle'])
+            subtitle_elem = self.css.select_one(soup, 'subtitle')
             article['subtitle'] = self.clean_text(subtitle_elem.get_text()) if subtitle_elem else ""
 
             # Extract content
-            content_elem = soup.select_one(self.selectors['content'])
+            content_elem = self.css.select_one(soup, 'content')
             if not content_elem:
                 logger.warning(f"No content found for {url}")
                 return None
@@ -327,11 +327,11 @@ class ElTiempoScraper(BaseScraper):
             article['content'] = content_text
 
             # Extract author
-            author_elem = soup.select_one(self.selectors['author'])
+            author_elem = self.css.select_one(soup, 'author')
             article['author'] = self.clean_text(author_elem.get_text()) if author_elem else "El Tiempo"
 
             # Extract date
-            date_elem = soup.select_one(self.selectors['date'])
+            date_elem = self.css.select_one(soup, 'date')
             if date_elem:
                 article['published_date'] = self._parse_date(date_elem)
             else:
@@ -339,7 +339,7 @@ class ElTiempoScraper(BaseScraper):
                 logger.warning(f"No date found for {url}")
 
             # Extract tags
-            tags = soup.select(self.selectors['tags'])
+            tags = self.css.select(soup, 'tags')
             article['tags'] = [self.clean_text(tag.get_text()) for tag in tags]
 
             return article
@@ -427,7 +427,7 @@ class ElTiempoScraper(BaseScraper):
     def _extract_category(self, url: str, soup: BeautifulSoup) -> str:
         """Extract article category"""
         # Try to get from page
-        category_elem = soup.select_one(self.selectors['category'])
+        category_elem = self.css.select_one(soup, 'category')
         if category_elem:
             return self.clean_text(category_elem.get_text())
 
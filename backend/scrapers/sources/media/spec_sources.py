@@ -0,0 +1,198 @@
+"""
+Outlets scraped from a declarative ScraperSpec
+
+Radio networks, regional and digital outlets whose pages need nothing
+beyond selectors and URL patterns (see scrapers/base/spec_scraper.py).
+"""
+
+from scrapers.base.spec_scraper import COMMON_EXCLUDE_PATTERNS, ScraperSpec, SpecScraper
+
+# Station plugs and cross-promotion inside radio news articles
+RADIO_PROMOTIONAL_PHRASES = (
+    'escucha en vivo', 'sintoniza', 'frecuencia', 'descarga la app', 'suscríbete',
+    'síguenos en', 'escucha el programa', 'transmisión en vivo', 'podcast completo',
+    'audio completo', 'en el aire', 'pulsa aquí', 'haz clic', 'lee también',
+    'te puede interesar'
+)
+
+
+class WRadioScraper(SpecScraper):
+    """Scraper for W Radio (wradio.com.co), Caracol's news radio"""
+
+    spec = ScraperSpec(
+        name='W Radio',
+        url='https://www.wradio.com.co',
+        sections=('noticias', 'colombia', 'politica', 'economia', 'internacional',
+                  'deportes', 'entretenimiento', 'tecnologia'),
+        selectors={
+            'article_links': 'article a, .story-card a, .card-link, h2 a, h3 a',
+            'title': 'h1.headline, h1.story-headline, h1',
+            'subtitle': '.subheadline, .lead-art-caption, .article-subtitle',
+            'content': '.article-body, .story-body, .body-content',
+            'author': '.author-name, .by-author, .byline, .story-byline',
+            'date': 'time, .story-date, .publish-date',
+            'category': '.story-section, .section-name, .category',
+            'tags': '.story-tags a, .tags a, .article-tags a'
+        },
+        # Arc Publishing article paths end in a numeric id
+        article_patterns=(r'/(noticias|colombia|politica|economia|internacional|deportes'
+                          r'|entretenimiento|tecnologia|noticia|articulo)/', r'/\d{4,}'),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + (
+            '/programa/', '/emisora/', '/directorio/', '/vivo/', '/podcast/',
+            '/audio-completo/', '/opinion/'
+        ),
+        promotional_phrases=RADIO_PROMOTIONAL_PHRASES + ('w radio colombia', 'caracol radio'),
+        requests_per_minute=15,
+        extra_metadata={'source_type': 'radio', 'media_group': 'Caracol'}
+    )
+
+
+class RCNRadioScraper(SpecScraper):
+    """Scraper for RCN Radio (rcnradio.com)"""
+
+    spec = ScraperSpec(
+        name='RCN Radio',
+        url='https://www.rcnradio.com',
+        sections=('colombia', 'bogota', 'politica', 'economia', 'internacional', 'deportes'),
+        selectors={
+            'article_links': 'article a',
+            'title': 'h1',
+            'content': 'div[class*="article-content"], div[class*="article-body"], '
+                       'div[class*="entry-content"], div[class*="post-content"]',
+            'author': 'span[class*="author"], span[class*="autor"], a[rel="author"]',
+            'date': 'time, span[class*="date"], span[class*="fecha"]',
+            'tags': 'a[class*="tag"], a[class*="etiqueta"]'
+        },
+        article_patterns=(r'/(noticia|articulo|colombia|bogota|politica|economia|internacional|deportes)/',),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + ('/podcast/', '/audio/', '/programas/'),
+        promotional_phrases=RADIO_PROMOTIONAL_PHRASES,
+        min_content_length=100,
+        requests_per_minute=40,
+        extra_metadata={'source_type': 'radio', 'media_group': 'RCN'}
+    )
+
+
+class LaOpinionScraper(SpecScraper):
+    """Scraper for La Opinión (laopinion.com.co), Cúcuta and the border"""
+
+    spec = ScraperSpec(
+        name='La Opinión - Cúcuta',
+        url='https://www.laopinion.com.co',
+        category='regional',
+        sections=('cucuta', 'norte-santander', 'frontera', 'colombia', 'politica',
+                  'economia', 'deportes', 'cultura'),
+        selectors={
+            'article_links': 'article a, .article-link, .story-link, h2 a, h3 a',
+            'title': 'h1.title, h1.article-title, h1',
+            'subtitle': '.summary, .excerpt, .lead, .bajada',
+            'content': '.article-content, .body-content, .story-text',
+            'author': '.author, .byline, .firma, [rel="author"]',
+            'date': 'time, .date, .publish-date, .fecha',
+            'category': '.category, .section-name',
+            'tags': '.tags a, .keywords a'
+        },
+        article_patterns=(r'/(cucuta|norte-santander|frontera|colombia|politica|economia|deportes|cultura)/',),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + ('/especial/',),
+        min_paragraph_length=30,
+        min_content_length=200,
+        requests_per_minute=26,
+        extra_metadata={'source_type': 'regional_newspaper', 'region': 'Norte de Santander'}
+    )
+
+
+class Las2orillasScraper(SpecScraper):
+    """Scraper for Las2orillas (las2orillas.co), digital independent outlet"""
+
+    spec = ScraperSpec(
+        name='Las2orillas',
+        url='https://www.las2orillas.co',
+        sections=('actualidad', 'politica', 'economia', 'opinion', 'conflicto', 'cultura',
+                  'internacional', 'derechos-humanos'),
+        selectors={
+            'article_links': 'article a, .entry-title a, .post-link, h2 a, h3 a',
+            'title': 'h1.entry-title, h1.title, h1',
+            'subtitle': '.excerpt, .lead, .summary',
+            'content': '.entry-content, .article-content, .post-content',
+            'author': '.author-name, .byline, .autor',
+            'date': 'time, .publish-date, .entry-date',
+            'category': '.category, .section',
+            'tags': '.tags a, .post-tags a'
+        },
+        # WordPress permalinks carry the year
+        article_patterns=(r'/(actualidad|politica|economia|opinion|conflicto|cultura|internacional)/',
+                          r'/\d{4}/'),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + ('/pagina/',),
+        min_paragraph_length=30,
+        min_content_length=200,
+        requests_per_minute=21,
+        extra_metadata={'source_type': 'digital'}
+    )
+
+
+class PublimetroScraper(SpecScraper):
+    """Scraper for Publimetro Colombia (publimetro.co)"""
+
+    spec = ScraperSpec(
+        name='Publimetro',
+        url='https://www.publimetro.co',
+        sections=('noticias', 'entretenimiento', 'estilo-vida', 'deportes', 'cultura',
+                  'tecnologia', 'tendencias', 'gastronomia'),
+        selectors={
+            'article_links': 'article a, .story-card a, .article-link, h2 a, h3 a',
+            'title': 'h1.title, h1.article-title, h1',
+            'subtitle': '.summary, .excerpt, .lead',
+            'content': '.article-content, .story-body, .content-text',
+            'author': '.author, .byline',
+            'date': 'time, .publish-date, .date',
+            'category': '.category, .section',
+            'tags': '.tags a, .keywords a'
+        },
+        article_patterns=(r'/(noticias|entretenimiento|estilo-vida|deportes|cultura|tecnologia|tendencias|co)/',),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + ('/seccion/',),
+        min_paragraph_length=30,
+        requests_per_minute=40,
+        extra_metadata={'source_type': 'free_daily'}
+    )
+
+
+class VanguardiaScraper(SpecScraper):
+    """Scraper for Vanguardia (vanguardia.com), Bucaramanga and Santander"""
+
+    spec = ScraperSpec(
+        name='Vanguardia - Bucaramanga',
+        url='https://www.vanguardia.com',
+        category='regional',
+        sections=('area-metropolitana', 'santander', 'colombia', 'economia', 'deportes',
+                  'entretenimiento', 'mundo', 'politica'),
+        selectors={
+            'article_links': 'article a, .article-link, .story-link, h2 a, h3 a',
+            'title': 'h1.title, h1.article-title, h1',
+            'subtitle': '.summary, .excerpt, .lead',
+            'content': '.field-name-body, .article-body, .story-content',
+            'author': '.field-name-field-autor, .author, .byline',
+            'date': '.field-name-post-date, time, .date',
+            'category': '.field-name-field-category, .category',
+            'tags': '.field-name-field-tags a, .tags a'
+        },
+        article_patterns=(r'/(area-metropolitana|santander|colombia|economia|deportes'
+                          r'|entretenimiento|mundo|politica|node)/',),
+        exclude_patterns=COMMON_EXCLUDE_PATTERNS + ('/seccion/', '/especial/'),
+        min_paragraph_length=30,
+        min_content_length=200,
+        requests_per_minute=30,
+        extra_metadata={'source_type': 'regional_newspaper', 'region': 'Santander'}
+    )
+
+
+# Spec-driven scrapers by source name
+SPEC_SCRAPERS = {
+    scraper.spec.name: scraper
+    for scraper in (
+        WRadioScraper,
+        RCNRadioScraper,
+        LaOpinionScraper,
+        Las2orillasScraper,
+        PublimetroScraper,
+        VanguardiaScraper,
+    )
+}
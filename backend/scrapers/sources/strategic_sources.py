@@ -172,6 +172,30 @@ STRATEGIC_SOURCES = {
             "url": "https://www.larepublica.co",
             "type": "business_news",
             "priority": "medium"
+        },
+        {
+            "name": "W Radio",
+            "url": "https://www.wradio.com.co",
+            "type": "radio_news",
+            "priority": "medium"
+        },
+        {
+            "name": "RCN Radio",
+            "url": "https://www.rcnradio.com",
+            "type": "radio_news",
+            "priority": "medium"
+        },
+        {
+            "name": "Las2orillas",
+            "url": "https://www.las2orillas.co",
+            "type": "digital_news",
+            "priority": "low"
+        },
+        {
+            "name": "Publimetro",
+            "url": "https://www.publimetro.co",
+            "type": "free_daily",
+            "priority": "low"
         }
     ],
 
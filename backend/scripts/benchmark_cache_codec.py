@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark for cached value encoding.
+
+Encodes and decodes typical values of each cache layer - an NLP analysis,
+a page of government open data rows, a cached HTTP response and an
+article - with the previous json.dumps/json.loads strings and with each
+CacheCodec whose libraries are installed, and reports encode/decode time
+per value and the bytes stored in Redis.
+
+Usage:
+    cd backend && python scripts/benchmark_cache_codec.py [--repeat 2000]
+
+Results (Python 3.11, orjson 3.9, zlib fallback; µs encode / decode, bytes):
+    layer            json.dumps/loads         orjson+none            orjson+zlib
+    nlp_sentiment    197 / 129   12,367      34 / 56   10,694      111 / 83    2,639
+    api_government  1026 / 765   88,486     214 / 394  79,267      703 / 656  15,454
+    http_response    116 / 67    29,315      28 / 56   26,043      187 / 136   4,810
+    article           33 / 21     9,879       4 / 18    8,722       43 / 45    1,763
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.cache_codec import (  # noqa: E402
+    CacheCodec, lz4_frame, msgpack, orjson, zstandard
+)
+
+WORDS = (
+    "gobierno paz acuerdo congreso reforma tributaria Bogotá Medellín Cali "
+    "economía inversión región seguridad elecciones alcaldía ministerio "
+    "presupuesto educación salud departamento municipio desarrollo"
+).split()
+
+
+def text(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_values(seed: int = 7) -> Dict[str, Any]:
+    """One representative value per cache layer"""
+    rng = random.Random(seed)
+
+    article = {
+        'id': 48213,
+        'title': text(rng, 12),
+        'content': text(rng, 900),
+        'source': 'El Tiempo',
+        'url': 'https://www.eltiempo.com/politica/congreso/nota-48213',
+        'published_date': '2026-03-14T08:30:00',
+        'tags': [rng.choice(WORDS) for _ in range(6)]
+    }
+    nlp = {
+        'sentiment': {'polarity': 0.12, 'subjectivity': 0.41, 'label': 'neutral', 'confidence': 0.83},
+        'entities': [
+            {'text': rng.choice(WORDS).title(), 'type': rng.choice(['PER', 'ORG', 'LOC']),
+             'start': i * 17, 'end': i * 17 + 9, 'score': round(rng.random(), 4)}
+            for i in range(120)
+        ],
+        'topics': [{'topic_id': i, 'weight': round(rng.random(), 4), 'terms': [rng.choice(WORDS) for _ in range(8)]}
+                   for i in range(10)],
+        'summary': text(rng, 80)
+    }
+    government = {
+        'data': [
+            {'departamento': rng.choice(['Antioquia', 'Cundinamarca', 'Valle del Cauca', 'Santander']),
+             'municipio': rng.choice(WORDS).title(), 'codigo_dane': f"{rng.randint(5001, 99773):05d}",
+             'anio': rng.randint(2015, 2026), 'valor': round(rng.uniform(0, 1e7), 2), 'indicador': text(rng, 4)}
+            for _ in range(500)
+        ],
+        'total': 500,
+        'source': 'datos.gov.co'
+    }
+    http_response = {
+        'body': json.dumps({'items': [{'id': i, 'title': text(rng, 10), 'summary': text(rng, 40)}
+                                      for i in range(50)]}, ensure_ascii=False),
+        'status_code': 200,
+        'content_type': 'application/json',
+        'etag': '"5d41402abc4b2a76b9719d911017c592"',
+        'cached_at': '2026-03-14T08:30:00'
+    }
+    return {
+        'nlp_sentiment': nlp,
+        'api_government': government,
+        'http_response': http_response,
+        'article': article
+    }
+
+
+def codecs() -> Dict[str, CacheCodec]:
+    """CacheCodecs whose libraries are installed"""
+    available = {'json+none': None}
+    candidates = [('orjson', 'none'), ('orjson', 'zlib'), ('orjson', 'zstd'), ('orjson', 'lz4'),
+                  ('msgpack', 'none'), ('msgpack', 'zstd'), ('msgpack', 'lz4')]
+    installed = {'orjson': orjson, 'msgpack': msgpack, 'zstd': zstandard, 'lz4': lz4_frame, 'zlib': True, 'none': True}
+    for serializer, compression in candidates:
+        if installed[serializer] is not None and installed[compression] is not None:
+            available[f"{serializer}+{compression}"] = CacheCodec(serializer, compression)
+    return available
+
+
+def per_call(func: Callable, repeat: int) -> float:
+    """Microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(repeat: int) -> None:
+    values = build_values()
+    available = codecs()
+
+    print(f"\n{'='*84}")
+    print("📦 Cached value encoding - json.dumps strings vs CacheCodec")
+    print(f"{'='*84}")
+    print(f"{'layer':<16} {'codec':<16} {'encode (µs)':>12} {'decode (µs)':>12} {'bytes':>10} {'vs json':>8} {'ok':>4}")
+    print("-" * 84)
+
+    for layer, value in values.items():
+        baseline = None
+        for name, codec in available.items():
+            if codec is None:
+                encode = lambda: json.dumps(value)  # noqa: E731
+                decode = json.loads
+            else:
+                encode, decode = (lambda: codec.encode(value)), codec.decode
+
+            encoded = encode()
+            size = len(encoded.encode('utf-8') if isinstance(encoded, str) else encoded)
+            baseline = baseline or size
+            encode_us = per_call(encode, repeat)
+            decode_us = per_call(lambda: decode(encoded), repeat)
+
+            print(f"{layer:<16} {name:<16} {encode_us:>12.1f} {decode_us:>12.1f} {size:>10,} "
+                  f"{size / baseline:>7.0%} {str(decode(encoded) == value):>4}")
+        print("-" * 84)
+
+    missing = [name for name, module in (('orjson', orjson), ('msgpack', msgpack),
+                                         ('zstandard', zstandard), ('lz4', lz4_frame)) if module is None]
+    if missing:
+        print(f"Not installed (skipped): {', '.join(missing)}")
+    print(f"{'='*84}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Colombian gazetteer matching.
+
+Compares the per-entity substring loops previously used by NLPPipeline,
+ColombianNER and SourceManager against the shared Aho-Corasick matcher in
+nlp/gazetteer.py, at 1x, 10x, 100x and 1000x today's gazetteer size.
+
+Usage:
+    cd backend && python scripts/benchmark_gazetteer.py [--articles 200]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nlp.gazetteer import COLOMBIAN_GAZETTEERS, GazetteerMatcher  # noqa: E402
+
+SYLLABLES = ['ba', 'ca', 'de', 'fe', 'ga', 'li', 'mo', 'nu', 'pa', 'ra', 'so', 'ta', 'vi', 'za', 'ño', 'rí']
+
+FILLER = (
+    "El gobierno anunció nuevas medidas económicas para la región mientras "
+    "el Congreso discute la reforma tributaria. Según analistas, la inflación "
+    "podría estabilizarse en los próximos meses si el Banco de la República "
+    "mantiene su política monetaria. En Medellín y Cali se reportaron protestas. "
+)
+
+
+def synthetic_gazetteers(scale: int, seed: int = 42) -> Dict[str, Dict[str, str]]:
+    """Grow every gazetteer to `scale` times its size with synthetic names"""
+    rng = random.Random(seed)
+    grown = {}
+
+    for category, names in COLOMBIAN_GAZETTEERS.items():
+        entries = dict(names)
+        label = next(iter(names.values()))
+        target = len(names) * scale
+
+        while len(entries) < target:
+            words = [
+                ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+                for _ in range(rng.randint(1, 3))
+            ]
+            entries[' '.join(words)] = label
+
+        grown[category] = entries
+
+    return grown
+
+
+def build_corpus(articles: int, gazetteers: Dict[str, Dict[str, str]], seed: int = 7) -> List[str]:
+    """Build ~4 KB articles that mention a handful of gazetteer entries each"""
+    rng = random.Random(seed)
+    all_names = [name for names in gazetteers.values() for name in names]
+    corpus = []
+
+    for _ in range(articles):
+        parts = []
+        for _ in range(12):
+            parts.append(FILLER)
+            parts.append(f"Fuentes cercanas a {rng.choice(all_names)} confirmaron la noticia. ")
+        corpus.append(''.join(parts))
+
+    return corpus
+
+
+def legacy_enhance(text: str, gazetteers: Dict[str, Dict[str, str]]) -> int:
+    """Previous ColombianNER._enhance_colombian_entities: lower() per entity"""
+    hits = 0
+    for names in gazetteers.values():
+        for name in names:
+            if name.lower() in text.lower():
+                hits += 1
+    return hits
+
+
+def legacy_pipeline(text: str, gazetteers: Dict[str, Dict[str, str]]) -> int:
+    """Previous NLPPipeline.extract_entities: one lower(), one scan per entity"""
+    hits = 0
+    text_lower = text.lower()
+    for names in gazetteers.values():
+        for name in names:
+            if name.lower() in text_lower:
+                hits += 1
+    return hits
+
+
+def time_per_article(func, corpus: List[str], budget_seconds: float) -> float:
+    """Average seconds per article, stopping early once the time budget is spent"""
+    processed = 0
+    start = time.perf_counter()
+    for text in corpus:
+        func(text)
+        processed += 1
+        if time.perf_counter() - start > budget_seconds:
+            break
+    return (time.perf_counter() - start) / processed
+
+
+def run(articles: int, scales: List[int], budget_seconds: float) -> None:
+    print(f"\n{'='*78}")
+    print("📊 Colombian Gazetteer Matching - Throughput Benchmark")
+    print(f"{'='*78}")
+    print(f"{'scale':>6} {'entries':>8} {'build ms':>9} "
+          f"{'ner loop':>12} {'pipe loop':>12} {'automaton':>12} {'speedup':>8}")
+    print(f"{'':>6} {'':>8} {'':>9} {'(art/s)':>12} {'(art/s)':>12} {'(art/s)':>12} {'':>8}")
+    print("-" * 78)
+
+    for scale in scales:
+        gazetteers = synthetic_gazetteers(scale)
+        corpus = build_corpus(articles, gazetteers)
+        entry_count = sum(len(names) for names in gazetteers.values())
+
+        build_start = time.perf_counter()
+        matcher = GazetteerMatcher.from_gazetteers(gazetteers)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        ner_loop = time_per_article(lambda t: legacy_enhance(t, gazetteers), corpus, budget_seconds)
+        pipe_loop = time_per_article(lambda t: legacy_pipeline(t, gazetteers), corpus, budget_seconds)
+        automaton = time_per_article(matcher.find_all, corpus, budget_seconds)
+
+        print(f"{scale:>5}x {entry_count:>8} {build_ms:>9.1f} "
+              f"{1 / ner_loop:>12.1f} {1 / pipe_loop:>12.1f} {1 / automaton:>12.1f} "
+              f"{pipe_loop / automaton:>7.1f}x")
+
+    print(f"{'='*78}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--articles', type=int, default=200, help='Articles per scale')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--budget', type=float, default=5.0,
+                        help='Max seconds spent per method and scale')
+    args = parser.parse_args()
+    run(args.articles, args.scales, args.budget)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the scraper HTML parsing backend.
+
+Measures per-page time of the steps every scraped article goes through:
+building the BeautifulSoup tree (html.parser vs lxml), extracting page
+metadata (the former one-scan-per-kind find_all calls vs the single-pass
+extractor) and running a source's CSS selectors (selector strings vs a
+compiled SelectorSet).
+
+Pass a directory of saved article pages (*.html) to measure real markup;
+without one, synthetic news pages are generated.
+
+Usage:
+    cd backend && python scripts/benchmark_html_parsing.py [--corpus DIR] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.base.html_parser import LXML_AVAILABLE, SelectorSet, extract_metadata  # noqa: E402
+
+# El Tiempo's selectors (scrapers/sources/media/el_tiempo.py)
+SELECTORS = {
+    'title': 'h1.titulo, h1[class*="title"], h1',
+    'subtitle': 'h2.sumario, .lead, .article-lead',
+    'content': '.articulo-contenido, .article-body, .content-body',
+    'author': '.autor-nombre, .author-name, .by-author',
+    'date': '.fecha, time, .published-date',
+    'category': '.categoria, .section-name',
+    'tags': '.tags a, .article-tags a'
+}
+
+PARAGRAPH = (
+    "El Gobierno Nacional presentó ante el Congreso de la República el proyecto "
+    "de reforma tributaria, que según el Ministerio de Hacienda busca recaudar "
+    "recursos para los programas sociales en Bogotá, Medellín y Cali."
+)
+
+
+def synthetic_page(rng: random.Random) -> str:
+    """A news article page with navigation, meta tags, body and footer"""
+    nav = ''.join(f'<li><a href="/seccion/{i}">Sección {i}</a></li>' for i in range(rng.randint(40, 120)))
+    paragraphs = ''.join(f'<p>{PARAGRAPH}</p>' for _ in range(rng.randint(8, 30)))
+    related = ''.join(
+        f'<article><h3><a href="/politica/noticia-{rng.randint(100000, 999999)}">Relacionada</a></h3></article>'
+        for _ in range(rng.randint(10, 30))
+    )
+    return f"""<!DOCTYPE html><html lang="es"><head>
+<title>Reforma tributaria - El Tiempo</title>
+<meta property="og:title" content="Reforma tributaria"><meta property="og:type" content="article">
+<meta property="og:image" content="https://example.co/img.jpg"><meta name="twitter:card" content="summary">
+<meta name="description" content="Reforma tributaria"><meta name="keywords" content="economía,congreso">
+<meta property="article:published_time" content="2025-10-17T10:00:00-05:00">
+<script type="application/ld+json">{{"@type": "NewsArticle", "headline": "Reforma tributaria"}}</script>
+{''.join('<script>var x = 1;</script>' for _ in range(rng.randint(5, 20)))}
+</head><body><header><nav><ul>{nav}</ul></nav></header>
+<main><h1 class="titulo">Reforma tributaria</h1><h2 class="sumario">El debate</h2>
+<span class="autor-nombre">Redacción</span><time datetime="2025-10-17">17 de octubre</time>
+<div class="articulo-contenido">{paragraphs}</div>
+<div class="tags"><a>Economía</a><a>Congreso</a></div></main>
+<aside>{related}</aside><footer>{nav}</footer></body></html>"""
+
+
+def load_corpus(directory: str = None, pages: int = 200) -> List[str]:
+    if directory:
+        files = sorted(Path(directory).glob('*.html'))
+        if not files:
+            sys.exit(f"No .html files in {directory}")
+        return [f.read_text(encoding='utf-8', errors='replace') for f in files]
+
+    rng = random.Random(7)
+    return [synthetic_page(rng) for _ in range(pages)]
+
+
+def legacy_metadata(soup: BeautifulSoup) -> Dict:
+    """The former BaseScraper.extract_metadata (one scan per kind)"""
+    metadata = {}
+    for tag in soup.find_all("meta", property=lambda x: x and x.startswith("og:")):
+        metadata[f"og_{tag.get('property', '').replace('og:', '')}"] = tag.get("content", "")
+    for tag in soup.find_all("meta", attrs={"name": lambda x: x and x.startswith("twitter:")}):
+        metadata[f"twitter_{tag.get('name', '').replace('twitter:', '')}"] = tag.get("content", "")
+    description = soup.find("meta", attrs={"name": "description"})
+    if description:
+        metadata["description"] = description.get("content", "")
+    keywords = soup.find("meta", attrs={"name": "keywords"})
+    if keywords:
+        metadata["keywords"] = keywords.get("content", "").split(",")
+    pub_date = soup.find("meta", attrs={"property": "article:published_time"})
+    if pub_date:
+        metadata["published_time"] = pub_date.get("content", "")
+    return metadata
+
+
+def per_page_ms(func: Callable, items: List, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1000
+
+
+def run(corpus: List[str], repeat: int) -> None:
+    size_kb = sum(len(page) for page in corpus) / len(corpus) / 1024
+    parser = 'lxml' if LXML_AVAILABLE else 'html.parser'
+    soups = [BeautifulSoup(page, parser) for page in corpus]
+    css = SelectorSet(SELECTORS)
+
+    def strings(soup):
+        return [soup.select_one(selector) for selector in SELECTORS.values()]
+
+    def compiled(soup):
+        return [css.select_one(soup, name) for name in SELECTORS]
+
+    rows = [
+        ("tree: html.parser", per_page_ms(lambda p: BeautifulSoup(p, 'html.parser'), corpus, repeat)),
+    ]
+    if LXML_AVAILABLE:
+        rows.append(("tree: lxml", per_page_ms(lambda p: BeautifulSoup(p, 'lxml'), corpus, repeat)))
+    rows += [
+        ("metadata: scan per kind", per_page_ms(legacy_metadata, soups, repeat)),
+        ("metadata: single pass", per_page_ms(extract_metadata, soups, repeat)),
+        ("selectors: strings", per_page_ms(strings, soups, repeat)),
+        ("selectors: compiled", per_page_ms(compiled, soups, repeat)),
+    ]
+
+    assert all(legacy_metadata(s) == extract_metadata(s) for s in soups), "metadata mismatch"
+
+    print(f"\n{'='*60}")
+    print(f"📊 HTML Parsing - {len(corpus)} pages, {size_kb:.0f} KB average")
+    print(f"{'='*60}")
+    print(f"{'step':<28} {'per page':>12}")
+    print("-" * 60)
+    for name, ms in rows:
+        print(f"{name:<28} {ms:>10.2f}ms")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--corpus', help='Directory of saved article pages (*.html)')
+    parser.add_argument('--pages', type=int, default=200, help='Synthetic pages without --corpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(load_corpus(args.corpus, args.pages), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
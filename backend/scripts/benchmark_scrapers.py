@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of every registered scraper.
+
+Replays a recorded response archive (see scrapers/base/replay.py) through
+each scraper in SCRAPER_REGISTRY and reports, per source, pages/sec, parse
+time per article, peak memory and how often each extracted field is
+filled. Nothing goes to the network, so the numbers are comparable across
+runs and usable in CI.
+
+Conditional fetching and the URL-seen index are disabled for the run so
+every recorded article is parsed.
+
+Usage:
+    # Record a crawl once (live network)
+    cd backend && python scripts/benchmark_scrapers.py --record --archive data/bench.zip
+
+    # Replay it offline
+    cd backend && python scripts/benchmark_scrapers.py --archive data/bench.zip [--sources "El Tiempo"] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.api.scraping import SCRAPER_REGISTRY  # noqa: E402
+from scrapers.base.base_scraper import BaseScraper  # noqa: E402
+from scrapers.base.replay import RECORD, REPLAY, ResponseArchive, use_archive  # noqa: E402
+from scrapers.sources.strategic_sources import STRATEGIC_SOURCES  # noqa: E402
+
+# Fields checked for completeness (ScrapedContent and ScrapedDocument share these)
+FIELDS = ('title', 'content', 'author', 'published_date', 'subtitle', 'tags', 'categories')
+
+
+def source_config(name: str, limit: int) -> Dict[str, Any]:
+    """Strategic source config with run-to-run caching disabled"""
+    for category, sources in STRATEGIC_SOURCES.items():
+        for source in sources:
+            if source.get('name') == name:
+                return {
+                    **source,
+                    'category': category,
+                    'max_articles': limit,
+                    'conditional_fetch': False,
+                    'skip_known_urls': False
+                }
+    raise KeyError(f"{name} is not in STRATEGIC_SOURCES")
+
+
+class ParseTimer:
+    """Wraps a scraper's per-article parse method and accumulates its time"""
+
+    def __init__(self, scraper: Any, method: str):
+        self.seconds = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+        original = getattr(scraper, method)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.seconds += time.perf_counter() - start
+                    self.calls += 1
+
+        setattr(scraper, method, timed)
+
+
+async def scrape_once(name: str, limit: int) -> Dict[str, Any]:
+    """Run one scraper end to end and time it"""
+    scraper = SCRAPER_REGISTRY[name](source_config(name, limit))
+
+    start = time.perf_counter()
+    if isinstance(scraper, BaseScraper):
+        timer = ParseTimer(scraper, '_build_article')
+        async with scraper:
+            items = await scraper.scrape()
+    else:
+        timer = ParseTimer(scraper, 'extract_article_content')
+        loop = asyncio.get_event_loop()
+        items = await loop.run_in_executor(None, scraper.scrape_batch, limit)
+    elapsed = time.perf_counter() - start
+
+    return {'items': items, 'seconds': elapsed, 'parse': timer}
+
+
+def completeness(items: List[Any]) -> Dict[str, float]:
+    """Share of items with each field filled"""
+    report = {}
+    for name in FIELDS:
+        present = [item for item in items if hasattr(item, name)]
+        if present:
+            report[name] = round(sum(bool(getattr(item, name)) for item in present) / len(present), 3)
+    return report
+
+
+async def bench_source(name: str, archive: ResponseArchive, limit: int) -> Dict[str, Any]:
+    stats_before = dict(archive.stats)
+    run = await scrape_once(name, limit)
+    pages = sum(archive.stats[key] - stats_before[key] for key in ('replayed', 'misses', 'recorded'))
+
+    # Second pass under tracemalloc (it slows allocation-heavy code); not
+    # when recording, to avoid crawling the live site twice
+    peak = None
+    if archive.replaying:
+        tracemalloc.start()
+        await scrape_once(name, limit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    parse = run['parse']
+    fields = completeness(run['items'])
+    return {
+        'source': name,
+        'articles': len(run['items']),
+        'pages': pages,
+        'pages_per_second': round(pages / run['seconds'], 1) if run['seconds'] else 0.0,
+        'parse_ms_per_page': round(parse.seconds / parse.calls * 1000, 2) if parse.calls else 0.0,
+        'peak_memory_mb': round(peak / 1024 / 1024, 1) if peak is not None else None,
+        'completeness': fields,
+        'mean_completeness': round(sum(fields.values()) / len(fields), 3) if fields else 0.0
+    }
+
+
+def print_report(results: List[Dict[str, Any]], archive: ResponseArchive) -> None:
+    print(f"\n{'='*86}")
+    print(f"📊 Scraper Benchmark - {archive.mode} {archive.path} ({len(archive)} responses)")
+    print(f"{'='*86}")
+    print(f"{'source':<16} {'articles':>8} {'pages':>6} {'pages/s':>9} {'parse ms':>9} "
+          f"{'peak MB':>8} {'fields':>7}  missing")
+    print("-" * 86)
+    for r in results:
+        missing = ', '.join(f"{k} {v:.0%}" for k, v in r['completeness'].items() if v < 1.0)
+        peak = f"{r['peak_memory_mb']:.1f}" if r['peak_memory_mb'] is not None else '-'
+        print(f"{r['source']:<16} {r['articles']:>8} {r['pages']:>6} {r['pages_per_second']:>9.1f} "
+              f"{r['parse_ms_per_page']:>9.2f} {peak:>8} "
+              f"{r['mean_completeness']:>7.0%}  {missing}")
+    print(f"{'='*86}\n")
+
+
+async def run(archive_path: str, record: bool, sources: Optional[List[str]], limit: int) -> List[Dict[str, Any]]:
+    archive = ResponseArchive(archive_path, RECORD if record else REPLAY)
+    results = []
+
+    with use_archive(archive):
+        for name in sources or list(SCRAPER_REGISTRY):
+            try:
+                results.append(await bench_source(name, archive, limit))
+            except Exception as e:
+                print(f"❌ {name}: {e}")
+
+    print_report(results, archive)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--archive', default='data/scraper_replay.zip', help='Recorded response archive')
+    parser.add_argument('--record', action='store_true', help='Fetch live and (re)record the archive')
+    parser.add_argument('--sources', nargs='+', help='Registered source names (default: all)')
+    parser.add_argument('--limit', type=int, default=50, help='Articles per source')
+    parser.add_argument('--json', help='Also write results to this file')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.archive, args.record, args.sources, args.limit))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
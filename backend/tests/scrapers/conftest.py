@@ -14,6 +14,34 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
 
 
+@pytest.fixture(autouse=True)
+def isolated_fetch_state(monkeypatch):
+    """Give each test an empty, in-memory fetch state store"""
+    from scrapers.base import fetch_state
+
+    store = fetch_state.FetchStateStore(path=None)
+    monkeypatch.setattr(fetch_state, "_fetch_state_store", store)
+    yield store
+
+
+@pytest.fixture(autouse=True)
+def isolated_url_index(monkeypatch):
+    """Give each test an empty, in-memory URL index without a database"""
+    from scrapers.base import url_index
+
+    index = url_index.URLIndex(path=None)
+    monkeypatch.setattr(url_index, "_url_index", index)
+    yield index
+
+
+@pytest.fixture(autouse=True)
+def local_rate_limits(monkeypatch):
+    """Keep rate limits in-process (no Redis token buckets)"""
+    from app.config.settings import settings
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_DISTRIBUTED", False)
+
+
 @pytest.fixture
 def mock_aioresponse():
     """Mock aiohttp responses for testing"""
@@ -69,9 +69,11 @@ class TestBaseScraper:
         async with scraper:
             assert scraper.session is not None
             assert isinstance(scraper.session, aiohttp.ClientSession)
+            shared_session = scraper.session
 
-        # Session should be closed after context
-        assert scraper.session.closed
+        # Shared session is released, not closed, after context
+        assert scraper.session is None
+        assert not shared_session.closed
 
     @pytest.mark.asyncio
     async def test_fetch_page_success(self, scraper):
@@ -275,4 +277,47 @@ class TestBaseScraperPerformance:
                 results = await asyncio.gather(*tasks)
 
                 assert len(results) == 10
-                assert all(result is not None for result in results)
\ No newline at end of file
+                assert all(result is not None for result in results)
+
+    async def test_scrape_bounds_concurrency_per_domain(self):
+        """Test scrape fetches concurrently without exceeding max_concurrency"""
+        config = {
+            "name": "Concurrency Test",
+            "url": "https://concurrency.test",
+            "category": "test",
+            "max_concurrency": 3
+        }
+        scraper = ConcreteBaseScraper(config)
+        urls = [f"https://concurrency.test/article{i}" for i in range(12)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "<html><body><p>Contenido</p></body></html>"
+
+        with patch.object(scraper, "get_article_urls", AsyncMock(return_value=urls)), \
+                patch.object(scraper, "fetch_page", side_effect=fake_fetch):
+            results = await scraper.scrape()
+
+        assert len(results) == 12
+        assert peak == 3
+        assert {result.source_url for result in results} == set(urls)
+
+    async def test_scrape_stream_yields_as_completed(self, scraper):
+        """Test articles stream out in completion order"""
+        urls = ["https://test.com/slow", "https://test.com/fast"]
+
+        async def fake_fetch(url, **kwargs):
+            await asyncio.sleep(0.05 if url.endswith("slow") else 0)
+            return "<html><body><p>Contenido</p></body></html>"
+
+        with patch.object(scraper, "get_article_urls", AsyncMock(return_value=urls)), \
+                patch.object(scraper, "fetch_page", side_effect=fake_fetch):
+            order = [item.source_url async for item in scraper.scrape_stream()]
+
+        assert order == ["https://test.com/fast", "https://test.com/slow"]
@@ -0,0 +1,140 @@
+"""
+Unit tests for the cluster-wide Redis token bucket rate limiter
+"""
+import pytest
+import time
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.distributed_rate_limiter import DistributedTokenBucket, RedisTokenBuckets
+from scrapers.base.rate_limiter import RateLimiter
+
+
+class FakeBuckets:
+    """In-process stand-in for RedisTokenBuckets (no refill)"""
+
+    def __init__(self, tokens, available=True):
+        self.tokens = tokens
+        self.available = available
+        self.calls = 0
+
+    def take(self, key, capacity, refill_rate, requested):
+        self.calls += 1
+        if not self.available:
+            return None
+        granted = min(requested, self.tokens)
+        self.tokens -= granted
+        return granted, (0.0 if granted else 0.01)
+
+
+@pytest.mark.unit
+class TestDistributedTokenBucket:
+    """Test leasing, throttling and fallback"""
+
+    @pytest.mark.asyncio
+    async def test_leased_tokens_skip_redis(self, monkeypatch):
+        """Test tokens are taken from Redis a lease at a time"""
+        buckets = FakeBuckets(tokens=100)
+        bucket = DistributedTokenBucket("api.test", max_requests=100, time_window=60, buckets=buckets)
+
+        for _ in range(bucket.lease_size * 2):
+            assert await bucket.acquire()
+
+        assert bucket.lease_size == 5
+        assert buckets.calls == 2
+        assert buckets.tokens == 90
+
+    def test_small_buckets_take_one_token(self):
+        """Test slow sites are not leased more than one token"""
+        buckets = FakeBuckets(tokens=10)
+        bucket = DistributedTokenBucket("news.test", max_requests=10, time_window=60, buckets=buckets)
+
+        assert bucket.acquire_blocking()
+        assert bucket.lease_size == 1
+        assert buckets.tokens == 9
+
+    def test_expired_lease_is_dropped(self):
+        """Test unspent leased tokens are not used after the lease expires"""
+        buckets = FakeBuckets(tokens=100)
+        bucket = DistributedTokenBucket("api.test", max_requests=100, time_window=60, buckets=buckets)
+        bucket.lease_seconds = 0
+
+        bucket.acquire_blocking()
+        bucket.acquire_blocking()
+
+        assert buckets.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_when_bucket_is_empty(self, monkeypatch):
+        """Test acquire sleeps and retries when Redis grants nothing"""
+        buckets = FakeBuckets(tokens=0)
+        bucket = DistributedTokenBucket("news.test", max_requests=10, time_window=60, buckets=buckets)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            buckets.tokens = 1
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        assert await bucket.acquire()
+        assert sleeps == [0.01]
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_falls_back_to_local(self):
+        """Test RateLimiter limits locally when Redis is unavailable"""
+        limiter = RateLimiter(max_requests=5, time_window=60)
+        limiter.bucket = DistributedTokenBucket(
+            "news.test", max_requests=5, time_window=60, buckets=FakeBuckets(tokens=5, available=False)
+        )
+
+        await limiter.acquire()
+        assert len(limiter.requests) == 1
+
+        limiter.bucket._buckets = FakeBuckets(tokens=5)
+        await limiter.acquire()
+        assert len(limiter.requests) == 1
+
+    def test_redis_errors_pause_redis(self):
+        """Test a Redis error switches to local limiting until the retry interval"""
+        buckets = RedisTokenBuckets(redis_url="redis://localhost:6379/0", retry_seconds=30)
+        script = Mock(side_effect=RedisConnectionError("down"))
+        buckets._script = script
+
+        assert buckets.take("news.test", 10, 1.0, 1) is None
+        assert buckets.take("news.test", 10, 1.0, 1) is None
+        assert script.call_count == 1
+        assert not buckets.available
+
+
+@pytest.mark.integration
+class TestRedisTokenBuckets:
+    """The Lua token bucket against a real Redis"""
+
+    @pytest.fixture
+    def buckets(self):
+        buckets = RedisTokenBuckets(retry_seconds=30)
+        key = f"test:{time.time()}"
+        if buckets.take(key, 1, 1.0, 0) is None:
+            pytest.skip("Redis not available")
+        yield buckets
+        buckets.close()
+
+    def test_workers_share_one_budget(self, buckets):
+        """Test two workers together get no more than the bucket capacity"""
+        key = f"test:{time.time()}"
+        worker_a = DistributedTokenBucket(key, max_requests=10, time_window=3600, buckets=buckets)
+        worker_b = DistributedTokenBucket(key, max_requests=10, time_window=3600, buckets=buckets)
+
+        granted = 0
+        for _ in range(10):
+            for worker in (worker_a, worker_b):
+                result = buckets.take(worker.key, worker.capacity, worker.refill_rate, 1)
+                granted += result[0]
+
+        assert granted == 10
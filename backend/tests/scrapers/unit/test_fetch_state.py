@@ -0,0 +1,189 @@
+"""
+Unit tests for conditional fetching and the fetch state store
+"""
+import pytest
+import time
+from aioresponses import aioresponses
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from app.database.bulk import upsert_scraped_content
+from app.database.models import ScrapedContent
+from scrapers.base.fetch_state import (
+    FetchStateStore, NOT_MODIFIED, UNCHANGED, DUPLICATE, CHANGED, NEW, _register_commit_listener
+)
+from scrapers.base.base_scraper import BaseScraper
+
+
+class ConcreteBaseScraper(BaseScraper):
+    """Scraper with two fixed article URLs"""
+
+    async def get_article_urls(self):
+        return ["https://test.com/article1", "https://test.com/article2"]
+
+    def parse_article(self, soup, url):
+        content = soup.get_text(strip=True)
+        return {"title": "Noticia", "content": content} if content else None
+
+
+URL = "https://test.com/2025/10/17/noticia-123456"
+VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Fri, 17 Oct 2025 10:00:00 GMT"}
+
+
+@pytest.mark.unit
+class TestFetchStateStore:
+    """Test FetchStateStore classification and persistence"""
+
+    def test_classifies_responses(self):
+        """Test new, not modified, unchanged, duplicate and changed results"""
+        store = FetchStateStore()
+        assert store.request_headers("El Tiempo", URL) == {}
+
+        assert store.record_response("El Tiempo", URL, 200, VALIDATORS, b"<html>v1</html>") == NEW
+        assert store.record_content("El Tiempo", URL, "hash-1")
+        assert store.request_headers("El Tiempo", URL) == {}
+        assert store.commit([URL]) == 1
+        assert store.request_headers("El Tiempo", URL) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Fri, 17 Oct 2025 10:00:00 GMT"
+        }
+
+        assert store.record_response("El Tiempo", URL, 304, {}) == NOT_MODIFIED
+        assert store.record_response("El Tiempo", URL, 200, {}, b"<html>v1</html>") == UNCHANGED
+
+        # New ad markup, same article
+        assert store.record_response("El Tiempo", URL, 200, {}, b"<html>v1 ad</html>") == CHANGED
+        assert not store.record_content("El Tiempo", URL, "hash-1")
+
+        assert store.record_response("El Tiempo", URL, 200, {}, b"<html>v2</html>") == CHANGED
+        assert store.record_content("El Tiempo", URL, "hash-2")
+
+        stats = store.get_statistics("El Tiempo")["El Tiempo"]
+        assert stats[NEW] == 1
+        assert stats[NOT_MODIFIED] == 1
+        assert stats[UNCHANGED] == 1
+        assert stats[DUPLICATE] == 1
+        assert stats[CHANGED] == 1
+        assert stats["hit_ratio"] == 0.6
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test flushed state is loaded by a new store"""
+        path = str(tmp_path / "fetch_state.db")
+        store = FetchStateStore(path=path)
+        store.record_response("Semana", URL, 200, VALIDATORS, b"<html>v1</html>")
+        store.record_content("Semana", URL, "hash-1")
+        assert store.flush() == 0
+
+        assert store.commit([URL]) == 1  # Flushed
+        assert store.flush() == 0
+        store.close()
+
+        reopened = FetchStateStore(path=path)
+        assert reopened.request_headers("Semana", URL)["If-None-Match"] == '"v1"'
+        assert reopened.record_response("Semana", URL, 200, {}, b"<html>v1</html>") == UNCHANGED
+
+    def test_expired_state_is_fetched_again(self):
+        """Test a URL is refetched and reparsed after max_age"""
+        store = FetchStateStore(max_age_hours=1)
+        store.record_response("Semana", URL, 200, VALIDATORS, b"<html>v1</html>")
+        store.record_content("Semana", URL, "hash-1")
+        store.commit([URL])
+        store._states[URL].last_fetched = time.time() - 7200
+
+        assert store.request_headers("Semana", URL) == {}
+        assert store.record_response("Semana", URL, 200, {}, b"<html>v1</html>") == NEW
+        assert store.record_content("Semana", URL, "hash-1")
+
+    def test_uncommitted_pages_are_fetched_again(self):
+        """Test a page whose article was not stored or not parsed is not skipped"""
+        store = FetchStateStore()
+        store.record_response("Semana", URL, 200, VALIDATORS, b"<html>v1</html>")
+        store.record_content("Semana", URL, "hash-1")
+        store.commit(["https://test.com/other"])
+
+        assert store.record_response("Semana", URL, 200, VALIDATORS, b"<html>v1</html>") == NEW
+        store.discard(URL)
+        assert store.commit([URL]) == 0
+        assert store.record_response("Semana", URL, 200, VALIDATORS, b"<html>v1</html>") == NEW
+
+        # A failed parse of a changed page keeps the last stored state
+        store.record_content("Semana", URL, "hash-1")
+        store.commit([URL])
+        assert store.record_response("Semana", URL, 200, {}, b"<html>v2</html>") == CHANGED
+        store.discard(URL)
+        assert store.record_response("Semana", URL, 200, {}, b"<html>v2</html>") == CHANGED
+
+
+@pytest.mark.unit
+class TestConditionalScrape:
+    """Test BaseScraper skips unchanged articles"""
+
+    @pytest.mark.asyncio
+    async def test_second_scrape_skips_unchanged_articles(self, isolated_fetch_state):
+        """Test a 304 and an identical body are neither parsed nor returned"""
+        scraper = ConcreteBaseScraper({"name": "Test Source", "url": "https://test.com", "category": "test"})
+        body = "<html><body><p>Contenido</p></body></html>"
+
+        with aioresponses() as m:
+            m.get("https://test.com/article1", status=200, body=body, headers={"ETag": '"a1"'})
+            m.get("https://test.com/article2", status=200, body=body)
+            m.get("https://test.com/article1", status=304)
+            m.get("https://test.com/article2", status=200, body=body)
+
+            async with scraper:
+                first = await scraper.scrape()
+                isolated_fetch_state.commit([article.source_url for article in first])
+                second = await scraper.scrape()
+
+        assert len(first) == 2
+        assert second == []
+
+        stats = isolated_fetch_state.get_statistics("Test Source")["Test Source"]
+        assert stats[NEW] == 2
+        assert stats[NOT_MODIFIED] == 1
+        assert stats[UNCHANGED] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_state_is_kept_once_articles_are_committed(self, isolated_fetch_state):
+        """Test pages whose articles were rolled back or not parsed are scraped again"""
+        _register_commit_listener(isolated_fetch_state)
+        engine = create_engine("sqlite://")
+        ScrapedContent.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+
+        scraper = ConcreteBaseScraper({"name": "Test Source", "url": "https://test.com", "category": "test"})
+        bodies = {url: f"<html><body><p>{url}</p></body></html>" for url in ("article1", "article2")}
+        headers = {"ETag": '"a"'}
+
+        with aioresponses() as m:
+            m.get("https://test.com/article1", status=200, body=bodies["article1"], headers=headers)
+            m.get("https://test.com/article2", status=200, body="<html></html>", headers=headers)
+            m.get("https://test.com/article1", status=200, body=bodies["article1"], headers=headers)
+            m.get("https://test.com/article2", status=200, body=bodies["article2"], headers=headers)
+            m.get("https://test.com/article1", status=304)
+            m.get("https://test.com/article2", status=304)
+
+            async with scraper:
+                first = await scraper.scrape()
+                upsert_scraped_content(session, first)
+                session.rollback()
+
+                second = await scraper.scrape()
+                upsert_scraped_content(session, second)
+                session.commit()
+
+                third = await scraper.scrape()
+
+        session.close()
+
+        assert [article.source_url for article in first] == ["https://test.com/article1"]
+        assert sorted(article.source_url for article in second) == [
+            "https://test.com/article1", "https://test.com/article2"
+        ]
+        assert third == []
@@ -0,0 +1,73 @@
+"""
+Unit tests for the scraper HTML parsing backend
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from scrapers.base import html_parser
+from scrapers.base.html_parser import SelectorSet, extract_metadata, parse_html, resolve_parser
+
+PAGE = """
+<html>
+<head>
+    <meta property="og:title" content="Reforma tributaria">
+    <meta property="og:type" content="article">
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="description" content="El congreso aprobó la reforma">
+    <meta name="description" content="Segunda descripción">
+    <meta name="keywords" content="economía,congreso">
+    <meta property="article:published_time" content="2025-10-17T10:00:00-05:00">
+    <script type="application/ld+json">{"@type": "NewsArticle", "headline": "Reforma tributaria"}</script>
+    <script type="application/ld+json">{not json</script>
+</head>
+<body>
+    <h1 class="titulo">Reforma tributaria</h1>
+    <div class="article-body"><p>Uno.</p><p>Dos.</p></div>
+    <div class="tags"><a>Economía</a><a>Congreso</a></div>
+</body>
+</html>
+"""
+
+
+@pytest.mark.unit
+class TestHTMLParser:
+    """Test parser selection, compiled selectors and metadata extraction"""
+
+    def test_extract_metadata_single_pass(self):
+        """Test OG, Twitter, standard meta and opt-in JSON-LD are collected"""
+        soup = parse_html(PAGE)
+
+        metadata = extract_metadata(soup)
+        assert metadata == {
+            "og_title": "Reforma tributaria",
+            "og_type": "article",
+            "twitter_card": "summary_large_image",
+            "description": "El congreso aprobó la reforma",
+            "keywords": ["economía", "congreso"],
+            "published_time": "2025-10-17T10:00:00-05:00"
+        }
+
+        with_json_ld = extract_metadata(soup, include_json_ld=True)
+        assert with_json_ld["json_ld"] == [{"@type": "NewsArticle", "headline": "Reforma tributaria"}]
+
+    def test_selector_set_compiles_once(self):
+        """Test named and raw selectors match like soup.select"""
+        soup = parse_html(PAGE)
+        css = SelectorSet({"title": "h1.titulo, h1", "tags": ".tags a"})
+
+        assert css.select_one(soup, "title").get_text() == "Reforma tributaria"
+        assert [a.get_text() for a in css.select(soup, "tags")] == ["Economía", "Congreso"]
+        assert len(css.select(soup, ".article-body p")) == 2
+        assert css.compiled("title") is css.compiled("title")
+        assert css.select_one(soup, "missing") is None
+
+    def test_resolve_parser_falls_back_without_lxml(self, monkeypatch):
+        """Test html.parser is used when lxml is requested but missing"""
+        monkeypatch.setattr(html_parser, "LXML_AVAILABLE", False)
+
+        assert resolve_parser("lxml") == "html.parser"
+        assert resolve_parser("html.parser") == "html.parser"
@@ -0,0 +1,58 @@
+"""
+Unit tests for the shared HTTP transport
+"""
+import pytest
+import aiohttp
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from app.core.http_transport import HTTPTransport, SYNC_SESSION_HEADERS
+
+
+@pytest.mark.unit
+class TestHTTPTransport:
+    """Test HTTPTransport session sharing"""
+
+    @pytest.mark.asyncio
+    async def test_session_shared_within_loop(self):
+        """Test one pooled session is handed out per event loop"""
+        transport = HTTPTransport(limit=10, limit_per_host=2)
+
+        first = await transport.get_session()
+        second = await transport.get_session()
+
+        assert first is second
+        assert isinstance(first, aiohttp.ClientSession)
+        assert first.connector.limit == 10
+        assert first.connector.limit_per_host == 2
+
+        await transport.close()
+        assert first.closed
+
+        reopened = await transport.get_session()
+        assert reopened is not first
+        await transport.close()
+
+    def test_sync_session_shared_with_scraper_headers(self):
+        """Test the sync session is shared and carries the scraper headers"""
+        transport = HTTPTransport(limit_per_host=4)
+
+        session = transport.get_sync_session()
+
+        assert transport.get_sync_session() is session
+        assert session.headers['User-Agent'] == SYNC_SESSION_HEADERS['User-Agent']
+        assert session.get_adapter("https://example.co")._pool_maxsize == 4
+
+    def test_statistics_reuse_ratio(self):
+        """Test per-host statistics and reuse ratio"""
+        transport = HTTPTransport()
+        transport.stats['eltiempo.com'].update(requests=4, new_connections=1, reused_connections=3)
+
+        stats = transport.get_statistics()
+
+        assert stats['hosts']['eltiempo.com']['reuse_ratio'] == 0.75
+        assert stats['dns_cache'] == {'hits': 0, 'misses': 0}
+        assert stats['open_session'] is False
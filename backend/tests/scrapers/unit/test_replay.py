@@ -0,0 +1,108 @@
+"""
+Unit tests for scraper record/replay
+"""
+import pytest
+from aioresponses import aioresponses
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.replay import RECORD, REPLAY, ResponseArchive, use_archive
+from scrapers.base.smart_scraper import SmartScraper, ScrapedDocument
+
+ARTICLE = "<html><body><h1>Reforma</h1><p>El congreso aprobó la reforma tributaria.</p></body></html>"
+
+
+class ConcreteBaseScraper(BaseScraper):
+    """Scraper with two fixed article URLs"""
+
+    async def get_article_urls(self):
+        return ["https://test.com/article1", "https://test.com/article2"]
+
+    def parse_article(self, soup, url):
+        return {"title": soup.find("h1").get_text(), "content": soup.find("p").get_text()}
+
+
+class ConcreteSmartScraper(SmartScraper):
+    """Smart scraper with one fixed article URL"""
+
+    def extract_article_urls(self, homepage_html):
+        return ["https://test.com/article1"]
+
+    def extract_article_content(self, article_html, url):
+        soup = self.parse_html(article_html)
+        return ScrapedDocument(
+            source="Test", source_type="test", url=url,
+            title=soup.find("h1").get_text(), content=soup.find("p").get_text()
+        )
+
+
+CONFIG = {"name": "Test Source", "url": "https://test.com", "category": "test"}
+
+
+@pytest.mark.unit
+class TestResponseArchive:
+    """Test recording to and replaying from the zip archive"""
+
+    def test_round_trip(self, tmp_path):
+        """Test recorded responses survive save and load"""
+        path = str(tmp_path / "archive.zip")
+        archive = ResponseArchive(path, RECORD)
+        archive.record("https://test.com/a", 200, {"Content-Type": "text/html", "Set-Cookie": "x"}, "<p>á</p>")
+        assert archive.save()
+
+        replay = ResponseArchive(path, REPLAY)
+        response = replay.replay("https://test.com/a")
+        assert response.status == 200
+        assert response.text == "<p>á</p>"
+        assert response.headers == {"Content-Type": "text/html"}
+        assert replay.replay("https://test.com/missing").status == 404
+        assert replay.stats == {"recorded": 0, "replayed": 1, "misses": 1}
+
+    def test_replay_requires_archive(self, tmp_path):
+        """Test replaying a missing archive fails loudly"""
+        with pytest.raises(FileNotFoundError):
+            ResponseArchive(str(tmp_path / "missing.zip"), REPLAY)
+
+
+@pytest.mark.unit
+class TestScraperReplay:
+    """Test scrapers fetch through the archive"""
+
+    @pytest.mark.asyncio
+    async def test_base_scraper_record_then_replay(self, tmp_path):
+        """Test a recorded crawl replays without the network"""
+        path = str(tmp_path / "archive.zip")
+
+        with aioresponses() as m:
+            m.get("https://test.com/article1", status=200, body=ARTICLE)
+            m.get("https://test.com/article2", status=200, body=ARTICLE)
+            with use_archive(ResponseArchive(path, RECORD)):
+                async with ConcreteBaseScraper({**CONFIG, "conditional_fetch": False}) as scraper:
+                    recorded = await scraper.scrape()
+
+        # No aioresponses mock: any network access would fail
+        with use_archive(ResponseArchive(path, REPLAY)) as archive:
+            async with ConcreteBaseScraper({**CONFIG, "conditional_fetch": False}) as scraper:
+                replayed = await scraper.scrape()
+
+        assert len(recorded) == 2
+        assert sorted(item.source_url for item in replayed) == sorted(item.source_url for item in recorded)
+        assert archive.stats["replayed"] == 2
+
+    def test_smart_scraper_replay(self, tmp_path):
+        """Test SmartScraper gets a requests.Response rebuilt from the archive"""
+        path = str(tmp_path / "archive.zip")
+        archive = ResponseArchive(path, RECORD)
+        archive.record("https://test.com", 200, {}, "<html></html>")
+        archive.record("https://test.com/article1", 200, {}, ARTICLE)
+        archive.save()
+
+        with use_archive(ResponseArchive(path, REPLAY)):
+            scraper = ConcreteSmartScraper({**CONFIG, "conditional_fetch": False})
+            documents = scraper.scrape_batch(limit=5)
+
+        assert [doc.title for doc in documents] == ["Reforma"]
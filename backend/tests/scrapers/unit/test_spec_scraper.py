@@ -0,0 +1,132 @@
+"""
+Unit tests for declarative spec-driven scrapers
+"""
+import pytest
+from datetime import datetime
+from aioresponses import aioresponses
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from scrapers.base.spec_scraper import (
+    ScraperSpec, SpecScraper, compile_date_format, parse_spanish_date, scrape_concurrently
+)
+from scrapers.sources.media.spec_sources import SPEC_SCRAPERS
+
+HOMEPAGE = """
+<html><body>
+    <article><a href="/politica/reforma-tributaria-12345">Reforma</a></article>
+    <article><a href="https://www.test.co/politica/reforma-tributaria-12345#comentarios">Reforma</a></article>
+    <article><a href="/autor/redaccion">Autor</a></article>
+    <article><a href="https://otro.co/politica/nota">Otro sitio</a></article>
+    <article><a href="/contacto">Contacto</a></article>
+</body></html>
+"""
+
+ARTICLE = """
+<html><body>
+    <h1 class="titulo">Congreso aprueba la reforma tributaria</h1>
+    <p class="bajada">La iniciativa pasa a sanción presidencial</p>
+    <span class="autor">Por: Redacción Política</span>
+    <span class="fecha">17 de octubre de 2025</span>
+    <div class="cuerpo">
+        <p>El Congreso de la República aprobó en último debate la reforma tributaria del Gobierno.</p>
+        <p>Escucha en vivo nuestra emisora para conocer todos los detalles del debate.</p>
+        <p>El Ministerio de Hacienda espera recaudar nuevos recursos para los programas sociales.</p>
+    </div>
+    <div class="tags"><a>Economía</a><a>Congreso</a></div>
+</body></html>
+"""
+
+
+class OutletScraper(SpecScraper):
+    """Spec scraper for a test outlet"""
+
+    spec = ScraperSpec(
+        name='Test Outlet',
+        url='https://www.test.co',
+        sections=('politica',),
+        selectors={
+            'article_links': 'article a',
+            'title': 'h1.titulo, h1',
+            'subtitle': '.bajada',
+            'content': '.cuerpo',
+            'author': '.autor',
+            'date': '.fecha',
+            'tags': '.tags a'
+        },
+        article_patterns=(r'/politica/',),
+        promotional_phrases=('escucha en vivo',),
+        min_content_length=50,
+        extra_metadata={'source_type': 'test'}
+    )
+
+
+@pytest.mark.unit
+class TestSpecScraper:
+    """Test link filtering, extraction and dates driven by a spec"""
+
+    def test_spanish_dates(self):
+        """Test Spanish month names, numeric and timed formats"""
+        patterns = [compile_date_format(f) for f in ('%d de %B de %Y %H:%M', '%d de %B de %Y', '%d/%m/%Y')]
+
+        assert parse_spanish_date("Publicado el 17 de Octubre de 2025", patterns) == datetime(2025, 10, 17)
+        assert parse_spanish_date("3 de mayo de 2024 10:45", patterns) == datetime(2024, 5, 3, 10, 45)
+        assert parse_spanish_date("05/01/2025", patterns) == datetime(2025, 1, 5)
+        assert parse_spanish_date("Hace 2 horas", patterns) < datetime.utcnow()
+        assert parse_spanish_date("sin fecha", patterns) is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_from_spec(self):
+        """Test homepage and section links are filtered and articles extracted"""
+        with aioresponses() as m:
+            m.get("https://www.test.co", status=200, body=HOMEPAGE, repeat=True)
+            m.get("https://www.test.co/politica", status=200, body=HOMEPAGE, repeat=True)
+            m.get("https://www.test.co/politica/reforma-tributaria-12345", status=200, body=ARTICLE)
+
+            async with OutletScraper({"conditional_fetch": False, "skip_known_urls": False}) as scraper:
+                urls = await scraper.get_article_urls()
+                items = await scraper.scrape()
+
+        assert urls == ["https://www.test.co/politica/reforma-tributaria-12345"]
+        assert len(items) == 1
+        article = items[0]
+        assert article.source == "Test Outlet"
+        assert article.title == "Congreso aprueba la reforma tributaria"
+        assert article.author == "Redacción Política"
+        assert article.published_date == datetime(2025, 10, 17)
+        assert "emisora" not in article.content
+        assert article.content.startswith("La iniciativa pasa a sanción presidencial")
+        assert article.tags == ["Economía", "Congreso"]
+        assert article.extra_metadata["source_type"] == "test"
+        assert article.extra_metadata["section"] == "Politica"
+
+    @pytest.mark.asyncio
+    async def test_scrape_concurrently(self):
+        """Test several sources run together and a failing one yields nothing"""
+        with aioresponses() as m:
+            m.get("https://www.test.co", status=200, body=HOMEPAGE)
+            m.get("https://www.test.co/politica", status=500)
+            m.get("https://www.test.co/politica/reforma-tributaria-12345", status=200, body=ARTICLE)
+            m.get("https://www.wradio.com.co", status=500)
+            for section in SPEC_SCRAPERS['W Radio'].spec.sections:
+                m.get(f"https://www.wradio.com.co/{section}", status=500)
+
+            results = await scrape_concurrently([
+                OutletScraper({"conditional_fetch": False, "skip_known_urls": False}),
+                SPEC_SCRAPERS['W Radio']({"conditional_fetch": False, "skip_known_urls": False})
+            ])
+
+        assert len(results["Test Outlet"]) == 1
+        assert results["W Radio"] == []
+
+    def test_registered_specs(self):
+        """Test every registered spec compiles and names its source"""
+        for name, scraper_class in SPEC_SCRAPERS.items():
+            scraper = scraper_class({"conditional_fetch": False, "skip_known_urls": False})
+            assert scraper.name == name
+            assert {'title', 'content'} <= set(scraper.selectors)
+            assert scraper.is_article_url(f"{scraper.base_url}/{scraper.sections[0]}/nota-123456")
+            assert not scraper.is_article_url("https://twitter.com/status/123456")
@@ -0,0 +1,147 @@
+"""
+Unit tests for the URL-seen index
+"""
+import pytest
+from aioresponses import aioresponses
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from app.database.bulk import upsert_scraped_content
+from app.database.models import ScrapedContent
+from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.url_index import BloomFilter, URLIndex, _register_insert_listener
+
+
+class ConcreteBaseScraper(BaseScraper):
+    """Scraper with three fixed article URLs"""
+
+    async def get_article_urls(self):
+        return [f"https://test.com/article{i}" for i in range(3)]
+
+    def parse_article(self, soup, url):
+        return {"title": "Noticia", "content": url}
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on an in-memory SQLite database with the scraped_content table"""
+    engine = create_engine("sqlite://")
+    ScrapedContent.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def store(session_factory, *urls):
+    session = session_factory()
+    for url in urls:
+        session.add(ScrapedContent(source="Test", source_url=url, title="t", content="c", content_hash=url))
+    session.commit()
+    session.close()
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Test BloomFilter membership and serialization"""
+
+    def test_no_false_negatives_and_low_false_positives(self):
+        """Test every added item is found and few others are"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        added = [f"https://test.com/a{i}" for i in range(1000)]
+        for url in added:
+            bloom.add(url)
+
+        assert all(url in bloom for url in added)
+        false_positives = sum(f"https://test.com/b{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_round_trip(self):
+        """Test to_bytes/from_bytes restore the same filter"""
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://test.com/a")
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes(), capacity=100, error_rate=0.001)
+        assert "https://test.com/a" in restored
+        assert restored.count == 1
+
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(bloom.to_bytes(), capacity=200, error_rate=0.001)
+
+
+@pytest.mark.unit
+class TestURLIndex:
+    """Test URLIndex against a database"""
+
+    def test_filters_stored_urls(self, session_factory):
+        """Test stored URLs are dropped and new ones kept in order"""
+        store(session_factory, "https://test.com/old1", "https://test.com/old2")
+        index = URLIndex(session_factory=session_factory)
+
+        urls = ["https://test.com/new1", "https://test.com/old1", "https://test.com/new2", "https://test.com/old2"]
+        assert index.filter_new(urls) == ["https://test.com/new1", "https://test.com/new2"]
+        assert index.get_statistics()["known"] == 2
+
+    def test_false_positive_is_confirmed_against_database(self, session_factory):
+        """Test a URL in the filter but not in the table is kept"""
+        index = URLIndex(session_factory=session_factory)
+        index.add("https://test.com/rolled-back")
+
+        assert index.filter_new(["https://test.com/rolled-back"]) == ["https://test.com/rolled-back"]
+        assert index.get_statistics()["false_positives"] == 1
+
+    def test_bulk_upserts_are_added_on_commit(self, session_factory):
+        """Test URLs stored by bulk upserts reach the index once committed"""
+        index = URLIndex(path=None)
+        _register_insert_listener(index)
+        article = {"source": "Test", "title": "t", "content": "c"}
+
+        session = session_factory()
+        upsert_scraped_content(session, [{**article, "source_url": "https://test.com/kept", "content_hash": "k"}])
+        assert "https://test.com/kept" not in index.bloom
+        session.commit()
+
+        upsert_scraped_content(session, [{**article, "source_url": "https://test.com/undone", "content_hash": "u"}])
+        session.rollback()
+        session.commit()
+        session.close()
+
+        assert "https://test.com/kept" in index.bloom
+        assert "https://test.com/undone" not in index.bloom
+
+    def test_reload_catches_up_on_new_rows(self, session_factory, tmp_path):
+        """Test a persisted index only reads rows stored after it was saved"""
+        path = str(tmp_path / "urls.bloom")
+        store(session_factory, "https://test.com/a")
+        index = URLIndex(session_factory=session_factory, path=path)
+        index.load()
+        assert index.save()
+
+        store(session_factory, "https://test.com/b")
+        reloaded = URLIndex(session_factory=session_factory, path=path)
+        reloaded.load()
+
+        assert reloaded.max_id == 2
+        assert "https://test.com/a" in reloaded.bloom
+        assert "https://test.com/b" in reloaded.bloom
+
+
+@pytest.mark.unit
+class TestScrapeSkipsKnownURLs:
+    """Test BaseScraper does not fetch stored articles"""
+
+    @pytest.mark.asyncio
+    async def test_known_urls_are_not_fetched(self, isolated_url_index):
+        """Test only URLs missing from the index are requested"""
+        isolated_url_index.add_many(["https://test.com/article0", "https://test.com/article2"])
+        scraper = ConcreteBaseScraper({"name": "Test Source", "url": "https://test.com", "category": "test"})
+
+        with aioresponses() as m:
+            m.get("https://test.com/article1", status=200, body="<html><body>1</body></html>")
+
+            async with scraper:
+                results = await scraper.scrape()
+
+        assert [item.source_url for item in results] == ["https://test.com/article1"]
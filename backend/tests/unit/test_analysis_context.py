@@ -0,0 +1,80 @@
+"""
+Unit tests for the shared AnalysisContext
+"""
+import pytest
+from types import SimpleNamespace
+
+from backend.nlp.analysis_context import AnalysisContext, ensure_contexts
+
+
+class _Tokens(list):
+    """List of tokens with a .text attribute (stands in for Doc and Span)"""
+
+    def __init__(self, text, tokens):
+        super().__init__(tokens)
+        self.text = text
+        self.sents = [self]
+
+
+class CountingNLP:
+    """Minimal spaCy stand-in that counts how often it parses"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        tokens = [
+            SimpleNamespace(lower_=w.lower(), lemma_=w.lower(), is_alpha=w.isalpha())
+            for w in text.replace('.', ' .').split()
+        ]
+        return _Tokens(text, tokens)
+
+
+@pytest.mark.unit
+def test_parses_at_most_once():
+    """Test every derived array reuses a single parse"""
+    nlp = CountingNLP()
+    context = AnalysisContext("Paz en Colombia.", nlp=nlp)
+
+    assert context.sentences == ["Paz en Colombia."]
+    assert context.sentence_words == [["paz", "en", "colombia"]]
+    _ = context.doc
+    _ = context.lemmas
+    assert nlp.calls == 1
+
+
+@pytest.mark.unit
+def test_regex_fallback_without_model():
+    """Test words and sentences without a spaCy model"""
+    context = AnalysisContext("Hola mundo. ¿Cómo está? Visite http://x.co hoy")
+
+    assert context.doc is None
+    assert context.sentences == ["Hola mundo", "Cómo está", "Visite hoy"]
+    assert context.words == ["hola", "mundo", "cómo", "está", "visite", "hoy"]
+    assert sum(context.sentence_words, []) == context.words
+
+
+@pytest.mark.unit
+def test_memo_computes_once():
+    """Test stage-specific values are memoized per context"""
+    context = AnalysisContext("texto")
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "valor"
+
+    assert context.memo("stage.key", factory) == "valor"
+    assert context.memo("stage.key", factory) == "valor"
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_ensure_contexts_wraps_texts():
+    """Test batch inputs are normalized to contexts"""
+    existing = AnalysisContext("uno")
+    contexts = ensure_contexts([existing, "dos"])
+
+    assert contexts[0] is existing
+    assert contexts[1].text == "dos"
@@ -0,0 +1,127 @@
+"""
+Unit tests for the event-driven BatchProcessor scheduler
+"""
+import asyncio
+import time
+
+import pytest
+from backend.nlp.batch_processor import BatchConfig, BatchProcessor, JobPriority
+
+
+def make_processor(**overrides):
+    """Create a processor with caching disabled and short waits"""
+    config = BatchConfig(cache_results=False, worker_count=2, **overrides)
+    return BatchProcessor(config)
+
+
+async def echo(batch):
+    """Processor returning its inputs unchanged"""
+    return list(batch)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_full_batch_dispatches_without_waiting():
+    """Test a full batch is processed long before max_wait_seconds"""
+    processor = make_processor(max_batch_size=4, max_wait_seconds=30.0)
+    batches = []
+
+    async def record(batch):
+        batches.append(len(batch))
+        return list(batch)
+
+    await processor.start_workers({'echo': record})
+    try:
+        job_ids = processor.submit_batch('echo', ['a', 'b', 'c', 'd'])
+        results = await asyncio.wait_for(
+            asyncio.gather(*(processor.result(job_id) for job_id in job_ids)), timeout=1.0
+        )
+    finally:
+        await processor.stop_workers()
+
+    assert results == ['a', 'b', 'c', 'd']
+    assert batches == [4]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_partial_batch_dispatches_at_deadline():
+    """Test a partial batch waits for the oldest job's deadline"""
+    processor = make_processor(max_batch_size=32, max_wait_seconds=0.2)
+    await processor.start_workers({'echo': echo})
+    try:
+        start = time.monotonic()
+        job_id = processor.submit('echo', 'texto')
+        assert await processor.result(job_id, timeout=2.0) == 'texto'
+        elapsed = time.monotonic() - start
+    finally:
+        await processor.stop_workers()
+
+    assert 0.15 <= elapsed < 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_urgent_job_skips_wait():
+    """Test URGENT jobs are dispatched immediately"""
+    processor = make_processor(max_batch_size=32, max_wait_seconds=30.0)
+    await processor.start_workers({'echo': echo})
+    try:
+        job_id = processor.submit('echo', 'urgente', priority=JobPriority.URGENT)
+        assert await processor.result(job_id, timeout=1.0) == 'urgente'
+    finally:
+        await processor.stop_workers()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_higher_priority_dequeued_first():
+    """Test a batch is filled highest priority first"""
+    processor = make_processor(max_batch_size=2, max_wait_seconds=30.0)
+    processor.submit('echo', 'low', priority=JobPriority.LOW)
+    processor.submit('echo', 'normal')
+    processor.submit('echo', 'urgent', priority=JobPriority.URGENT)
+
+    batch = processor._get_next_batch('echo')
+
+    assert [job.input_data for job in batch] == ['urgent', 'normal']
+    assert processor._queued_counts['echo'] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_job_raises_from_result():
+    """Test processor errors surface when awaiting the result"""
+    async def broken(batch):
+        raise ValueError("boom")
+
+    processor = make_processor(max_batch_size=1)
+    await processor.start_workers({'broken': broken})
+    try:
+        job_id = processor.submit('broken', 'x')
+        with pytest.raises(Exception, match="boom"):
+            await processor.result(job_id, timeout=1.0)
+    finally:
+        await processor.stop_workers()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_jobs_without_a_result_fail():
+    """Test a processor returning too few results fails the remaining jobs"""
+    async def truncated(batch):
+        return list(batch)[:1]
+
+    processor = make_processor(max_batch_size=3, max_wait_seconds=30.0)
+    await processor.start_workers({'truncated': truncated})
+    try:
+        job_ids = processor.submit_batch('truncated', ['a', 'b', 'c'])
+        results = await asyncio.wait_for(
+            asyncio.gather(*(processor.result(job_id) for job_id in job_ids), return_exceptions=True),
+            timeout=1.0
+        )
+    finally:
+        await processor.stop_workers()
+
+    assert results[0] == 'a'
+    assert all("1 results for 3 inputs" in str(error) for error in results[1:])
@@ -0,0 +1,101 @@
+"""
+Unit tests for bulk upserts of scraped articles
+"""
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.bulk import SKIP, UPDATE, upsert_scraped_content
+from app.database.models import Base, ContentAnalysis, ScrapedContent
+
+
+@pytest.fixture
+def session():
+    """Session on an in-memory SQLite database, counting statements"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def article(i, **overrides):
+    values = {
+        'source': 'El Tiempo',
+        'source_url': f"https://www.eltiempo.com/politica/nota-{i}",
+        'title': f"Noticia {i}",
+        'content': f"Contenido de la noticia {i}",
+        'content_hash': f"hash-{i}"
+    }
+    values.update(overrides)
+    return values
+
+
+@pytest.mark.unit
+class TestBulkUpsert:
+    """Test multi-row inserts, conflict handling and counts"""
+
+    def test_articles_and_analyses_in_two_statements(self, session):
+        """Test 50 articles and their analyses are stored with one INSERT each"""
+        articles = [ScrapedContent(**article(i)) for i in range(50)]
+        analyses = [{'summary': f"Resumen {i}", 'model_version': '1.0.0'} for i in range(50)]
+
+        del session.statements[:]
+        result = upsert_scraped_content(session, articles, analyses)
+        session.commit()
+
+        inserts = [s for s in session.statements if s.lstrip().upper().startswith('INSERT')]
+        assert len(inserts) == 2
+        assert result.to_dict() == {'inserted': 50, 'updated': 0, 'skipped': 0, 'failed': 0}
+        assert session.scalar(select(func.count()).select_from(ContentAnalysis)) == 50
+
+        stored = session.scalars(select(ScrapedContent).where(ScrapedContent.source_url == articles[7].source_url)).one()
+        assert stored.id == result.ids[articles[7].source_url]
+        assert stored.is_paywall is False
+        assert stored.tags is None
+        assert stored.scraped_at is not None
+        assert stored.analyses[0].summary == "Resumen 7"
+
+    def test_duplicates_are_skipped_not_fatal(self, session):
+        """Test stored URLs, stored hashes and repeats in the input are skipped"""
+        upsert_scraped_content(session, [article(1), article(2)])
+        session.commit()
+
+        result = upsert_scraped_content(session, [
+            article(1),
+            article(3, content_hash='hash-2'),
+            article(4),
+            article(4),
+        ], chunk_size=2)
+        session.commit()
+
+        assert result.to_dict() == {'inserted': 1, 'updated': 0, 'skipped': 3, 'failed': 0}
+        assert session.scalar(select(func.count()).select_from(ScrapedContent)) == 3
+
+    def test_update_changed_articles(self, session):
+        """Test UPDATE rewrites changed articles and skips unchanged ones"""
+        upsert_scraped_content(session, [article(1), article(2)])
+        session.commit()
+
+        result = upsert_scraped_content(session, [
+            article(1),
+            article(2, title="Noticia 2 (actualizada)", content_hash='hash-2b'),
+            article(3),
+        ], on_conflict=UPDATE)
+        session.commit()
+
+        assert result.to_dict() == {'inserted': 1, 'updated': 1, 'skipped': 1, 'failed': 0}
+        title = session.scalar(select(ScrapedContent.title).where(ScrapedContent.content_hash == 'hash-2b'))
+        assert title == "Noticia 2 (actualizada)"
+
+    def test_failing_rows_fall_back_to_savepoints(self, session):
+        """Test one invalid article does not lose the rest of its chunk"""
+        result = upsert_scraped_content(session, [article(1), article(2, title=None), article(3)], on_conflict=SKIP)
+        session.commit()
+
+        assert result.to_dict() == {'inserted': 2, 'updated': 0, 'skipped': 0, 'failed': 1}
+        assert session.scalar(select(func.count()).select_from(ScrapedContent)) == 2
@@ -0,0 +1,74 @@
+"""
+Unit tests for cached value encoding
+"""
+import json
+
+import pytest
+
+from app.core.cache_codec import HEADER_FLAG, CacheCodec, CacheCodecError
+
+VALUE = {
+    'titulo': "Reforma tributaria en el Congreso",
+    'entidades': [{'texto': "Bogotá", 'tipo': 'LOC', 'score': 0.93}] * 50,
+    'conteo': 3,
+    'vacio': None
+}
+
+
+@pytest.mark.unit
+class TestCacheCodec:
+    """Test round trips, the header byte and legacy values"""
+
+    @pytest.mark.parametrize("compression", ['none', 'zlib', 'zstd', 'lz4'])
+    def test_round_trip(self, compression):
+        """Test every compression decodes to the original value"""
+        codec = CacheCodec('orjson', compression, min_compress_bytes=100)
+
+        encoded = codec.encode(VALUE)
+
+        assert isinstance(encoded, bytes)
+        assert encoded[0] & 0xC0 == HEADER_FLAG
+        assert codec.decode(encoded) == VALUE
+
+    def test_msgpack_round_trip(self):
+        """Test msgpack values decode like JSON ones"""
+        pytest.importorskip("msgpack")
+        codec = CacheCodec('msgpack', 'none')
+
+        assert codec.decode(codec.encode(VALUE)) == VALUE
+
+    def test_small_values_are_not_compressed(self):
+        """Test values below the threshold are stored as serialized"""
+        codec = CacheCodec('orjson', 'zlib', min_compress_bytes=1024)
+
+        small = codec.encode({'id': 1})
+        large = codec.encode(VALUE)
+
+        assert json.loads(small[1:]) == {'id': 1}
+        assert len(large) < len(json.dumps(VALUE)) / 2
+
+    def test_legacy_json_strings_still_decode(self):
+        """Test entries written with json.dumps before the header existed"""
+        codec = CacheCodec('orjson', 'zlib')
+        legacy = json.dumps(VALUE, ensure_ascii=False)
+
+        assert codec.decode(legacy) == VALUE
+        assert codec.decode(legacy.encode('utf-8')) == VALUE
+
+    def test_decode_follows_header_not_configuration(self):
+        """Test changing the configured codec keeps old entries readable"""
+        written = CacheCodec('orjson', 'zlib', min_compress_bytes=0).encode(VALUE)
+
+        assert CacheCodec('orjson', 'none').decode(written) == VALUE
+
+    def test_unknown_header_is_an_error(self):
+        """Test a header from a newer format is reported, not misread"""
+        with pytest.raises(CacheCodecError):
+            CacheCodec().decode(bytes((HEADER_FLAG | 7 << 3 | 1,)) + b'{}')
+
+    def test_unknown_options_are_rejected(self):
+        """Test misconfigured settings fail at startup"""
+        with pytest.raises(ValueError):
+            CacheCodec('pickle')
+        with pytest.raises(ValueError):
+            CacheCodec('orjson', 'brotli')
@@ -0,0 +1,222 @@
+"""
+Unit tests for the in-process (L1) cache of CacheManager
+"""
+import asyncio
+import fnmatch
+import json
+
+import pytest
+
+from app.core.cache import INVALIDATION_CHANNEL, CacheManager, LocalCache
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, count_trip=False, **kwargs)
+                for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """Redis stand-in shared by several CacheManagers (one per replica)"""
+
+    def __init__(self):
+        self.store = {}
+        self.replicas = []
+        self.round_trips = 0
+
+    def _trip(self, count_trip):
+        if count_trip:
+            self.round_trips += 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key, count_trip=True):
+        self._trip(count_trip)
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value, count_trip=True):
+        self._trip(count_trip)
+        self.store[key] = value
+
+    async def delete(self, *keys, count_trip=True):
+        self._trip(count_trip)
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def zadd(self, key, mapping, count_trip=True):
+        self._trip(count_trip)
+        self.store.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, low, high, count_trip=True):
+        self._trip(count_trip)
+        members = self.store.get(key, {})
+        for member in [m for m, score in members.items() if score <= high]:
+            del members[member]
+
+    async def zrem(self, key, *members, count_trip=True):
+        self._trip(count_trip)
+        for member in members:
+            self.store.get(key, {}).pop(member, None)
+
+    async def expire(self, key, seconds, count_trip=True):
+        self._trip(count_trip)
+
+    async def scan(self, cursor, match=None, count=None):
+        self.round_trips += 1
+        return 0, [key for key in self.store if fnmatch.fnmatchcase(key, match)]
+
+    async def publish(self, channel, message, count_trip=True):
+        self._trip(count_trip)
+        assert channel == INVALIDATION_CHANNEL
+        for replica in self.replicas:
+            replica._apply_invalidation(message)
+
+
+def replicas(count=2):
+    redis = FakeRedis()
+    managers = []
+    for _ in range(count):
+        manager = CacheManager(redis_url="redis://fake", local=LocalCache(100, 1 << 20, 30))
+        manager._redis = redis
+        redis.replicas.append(manager)
+        managers.append(manager)
+    return redis, managers
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Test LRU, size and TTL bounds"""
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        """Test the least recently used entries go first"""
+        cache = LocalCache(max_entries=2, max_bytes=100, ttl=30)
+        cache.put("a", 1, 10)
+        cache.put("b", 2, 10)
+        cache.get("a")
+        cache.put("c", 3, 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        cache.put("d", 4, 95)
+        assert len(cache) == 1
+        assert cache.current_bytes == 95
+        cache.put("huge", 5, 101)
+        assert cache.get("huge") is None
+
+    def test_ttl_is_capped(self, monkeypatch):
+        """Test entries expire after the shorter of the layer and L1 TTL"""
+        now = [1000.0]
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+        cache = LocalCache(max_entries=10, max_bytes=100, ttl=30)
+        cache.put("short", 1, 1, ttl=5)
+        cache.put("long", 2, 1, ttl=3600)
+
+        now[0] += 10
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        now[0] += 25
+        assert cache.get("long") is None
+        assert cache.current_bytes == 0
+
+    def test_evict_pattern(self):
+        """Test Redis glob patterns evict matching keys only"""
+        cache = LocalCache(max_entries=10, max_bytes=100, ttl=30)
+        for key in ("article:v1:1", "article:v1:2", "source:v1:1"):
+            cache.put(key, key, 1)
+
+        assert cache.evict_pattern("article:v1:*") == 2
+        assert cache.get("source:v1:1") == "source:v1:1"
+        assert cache.stats["invalidations"] == 2
+
+
+@pytest.mark.unit
+class TestCacheManagerL1:
+    """Test L1 hits, write-through and cross-replica invalidation"""
+
+    def test_hits_are_served_without_redis(self):
+        """Test a second get of a local layer costs no round-trip"""
+        redis, (manager, _) = replicas()
+        redis.store[manager._generate_key("article", "1")] = json.dumps({"id": 1})
+
+        async def run():
+            first = await manager.get("article", "1")
+            trips = redis.round_trips
+            second = await manager.get("article", "1")
+            return first, second, redis.round_trips - trips
+
+        first, second, trips = asyncio.run(run())
+        assert first == second == {"id": 1}
+        assert trips == 0
+        assert manager.local_cache.stats == {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0}
+
+    def test_non_local_layers_always_use_redis(self):
+        """Test session data is never kept in process memory"""
+        redis, (manager, _) = replicas()
+
+        async def run():
+            await manager.set("session", "abc", {"user": 1})
+            await manager.get("session", "abc")
+            await manager.get("session", "abc")
+
+        asyncio.run(run())
+        assert len(manager.local_cache) == 0
+        assert redis.round_trips == 3
+
+    def test_set_and_delete_evict_other_replicas(self):
+        """Test writes and deletes reach every replica's L1"""
+        redis, (writer, reader) = replicas()
+
+        async def run():
+            await writer.set("article", "1", {"title": "v1"})
+            assert await reader.get("article", "1") == {"title": "v1"}
+
+            await writer.set("article", "1", {"title": "v2"})
+            assert await reader.get("article", "1") == {"title": "v2"}
+
+            await writer.delete("article", "1")
+            assert await reader.get("article", "1") is None
+
+        asyncio.run(run())
+
+    def test_pattern_invalidation_reaches_other_replicas(self):
+        """Test delete_pattern (invalidate_cache_async) clears L1 everywhere"""
+        redis, (writer, reader) = replicas()
+
+        async def run():
+            await writer.set("content", "articles-1", [1])
+            await writer.set("content", "articles-2", [2])
+            await reader.get("content", "articles-1")
+            await reader.get("content", "articles-2")
+            assert len(reader.local_cache) == 2
+
+            await writer.delete_pattern(f"content:{writer._version}:articles-*")
+            return await reader.get("content", "articles-1")
+
+        assert asyncio.run(run()) is None
+        assert len(reader.local_cache) == 0
+        assert len(writer.local_cache) == 0
+
+    def test_own_messages_are_ignored(self):
+        """Test a replica keeps the value it just wrote"""
+        redis, (manager, _) = replicas()
+
+        asyncio.run(manager.set("article", "1", {"id": 1}))
+
+        assert len(manager.local_cache) == 1
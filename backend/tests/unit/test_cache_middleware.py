@@ -12,7 +12,6 @@ Tests for:
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from datetime import datetime
 import hashlib
 
 from fastapi import FastAPI, Request, Response
@@ -21,6 +20,9 @@ from starlette.responses import JSONResponse
 
 from app.middleware.cache_middleware import (
     CacheMiddleware,
+    CachedResponse,
+    pack_response,
+    unpack_response,
     invalidate_http_cache,
     invalidate_endpoint_cache,
 )
@@ -48,8 +50,8 @@ class TestCacheMiddleware:
         # Mock cache manager
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=None)  # Cache miss
-            mock_cache.set = AsyncMock()
+            mock_cache.get_bytes = AsyncMock(return_value=None)  # Cache miss
+            mock_cache.set_bytes = AsyncMock()
 
             # Create mock request
             request = Mock(spec=Request)
@@ -79,11 +81,13 @@ class TestCacheMiddleware:
             response = await cache_middleware.dispatch(request, call_next)
 
             # Verify cache.set was called
-            assert mock_cache.set.called
-            call_args = mock_cache.set.call_args
+            assert mock_cache.set_bytes.called
+            call_args = mock_cache.set_bytes.call_args
             assert call_args[1]['layer'] == 'http_response'
-            assert 'etag' in call_args[1]['value']
-            assert call_args[1]['value']['status_code'] == 200
+            cached = unpack_response(call_args[1]['data'])
+            assert cached.etag == cache_middleware._generate_etag(body_content)
+            assert cached.status_code == 200
+            assert cached.body == body_content
 
     @pytest.mark.asyncio
     async def test_cache_hit_returns_cached_response(self, cache_middleware):
@@ -91,17 +95,17 @@ class TestCacheMiddleware:
         cached_body = '{"cached": "data"}'
         cached_etag = '"abc123"'
 
-        cached_data = {
-            'body': cached_body,
-            'status_code': 200,
-            'content_type': 'application/json',
-            'etag': cached_etag,
-            'cached_at': datetime.utcnow().isoformat()
-        }
+        cached_data = pack_response(CachedResponse(
+            status_code=200,
+            etag=cached_etag,
+            content_type='application/json',
+            content_encoding='',
+            body=cached_body.encode()
+        ))
 
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=cached_data)
+            mock_cache.get_bytes = AsyncMock(return_value=cached_data)
 
             request = Mock(spec=Request)
             request.method = "GET"
@@ -124,17 +128,17 @@ class TestCacheMiddleware:
         """Conditional request with matching ETag should return 304"""
         cached_etag = '"matching_etag"'
 
-        cached_data = {
-            'body': '{"data": "test"}',
-            'status_code': 200,
-            'content_type': 'application/json',
-            'etag': cached_etag,
-            'cached_at': datetime.utcnow().isoformat()
-        }
+        cached_data = pack_response(CachedResponse(
+            status_code=200,
+            etag=cached_etag,
+            content_type='application/json',
+            content_encoding='',
+            body=b'{"data": "test"}'
+        ))
 
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=cached_data)
+            mock_cache.get_bytes = AsyncMock(return_value=cached_data)
 
             request = Mock(spec=Request)
             request.method = "GET"
@@ -169,8 +173,8 @@ class TestCacheMiddleware:
             response = await cache_middleware.dispatch(request, call_next)
 
             # Cache should not be checked or set for POST
-            assert not mock_cache.get.called
-            assert not mock_cache.set.called
+            assert not mock_cache.get_bytes.called
+            assert not mock_cache.set_bytes.called
             assert response.status_code == 201
 
     @pytest.mark.asyncio
@@ -193,7 +197,7 @@ class TestCacheMiddleware:
             response = await cache_middleware.dispatch(request, call_next)
 
             # Cache should be bypassed for authenticated requests
-            assert not mock_cache.get.called
+            assert not mock_cache.get_bytes.called
             assert response.status_code == 200
 
     @pytest.mark.asyncio
@@ -215,7 +219,7 @@ class TestCacheMiddleware:
             response = await disabled_middleware.dispatch(request, call_next)
 
             # Cache manager should not be used when disabled
-            assert not mock_cache.get.called
+            assert not mock_cache.get_bytes.called
             assert response.status_code == 200
 
     @pytest.mark.asyncio
@@ -235,7 +239,7 @@ class TestCacheMiddleware:
 
             response = await cache_middleware.dispatch(request, call_next)
 
-            assert not mock_cache.get.called
+            assert not mock_cache.get_bytes.called
             assert response.status_code == 200
 
     @pytest.mark.asyncio
@@ -243,7 +247,7 @@ class TestCacheMiddleware:
         """Non-200 responses should not be cached"""
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.get_bytes = AsyncMock(return_value=None)
 
             request = Mock(spec=Request)
             request.method = "GET"
@@ -261,7 +265,7 @@ class TestCacheMiddleware:
             response = await cache_middleware.dispatch(request, call_next)
 
             # Cache should not be set for non-200 responses
-            assert not mock_cache.set.called
+            assert not mock_cache.set_bytes.called
             assert response.status_code == 404
 
     def test_generate_cache_key_includes_query_params(self, cache_middleware):
@@ -396,8 +400,8 @@ class TestCacheEdgeCases:
 
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=None)
-            mock_cache.set = AsyncMock()
+            mock_cache.get_bytes = AsyncMock(return_value=None)
+            mock_cache.set_bytes = AsyncMock()
 
             request = Mock(spec=Request)
             request.method = "GET"
@@ -419,9 +423,9 @@ class TestCacheEdgeCases:
 
             await middleware.dispatch(request, call_next)
 
-            assert mock_cache.set.called
-            cached_value = mock_cache.set.call_args[1]['value']
-            assert len(cached_value['body']) > 100000
+            assert mock_cache.set_bytes.called
+            cached = unpack_response(mock_cache.set_bytes.call_args[1]['data'])
+            assert cached.body == large_body
 
     @pytest.mark.asyncio
     async def test_cache_binary_response(self):
@@ -433,8 +437,8 @@ class TestCacheEdgeCases:
 
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=None)
-            mock_cache.set = AsyncMock()
+            mock_cache.get_bytes = AsyncMock(return_value=None)
+            mock_cache.set_bytes = AsyncMock()
 
             request = Mock(spec=Request)
             request.method = "GET"
@@ -466,8 +470,8 @@ class TestCacheEdgeCases:
 
         with patch('app.middleware.cache_middleware.cache_manager') as mock_cache:
             mock_cache.is_available = True
-            mock_cache.get = AsyncMock(return_value=None)
-            mock_cache.set = AsyncMock()
+            mock_cache.get_bytes = AsyncMock(return_value=None)
+            mock_cache.set_bytes = AsyncMock()
 
             async def make_request():
                 request = Mock(spec=Request)
@@ -496,4 +500,4 @@ class TestCacheEdgeCases:
 
             assert len(responses) == 5
             # Cache should be set multiple times (no lock in current implementation)
-            assert mock_cache.set.call_count >= 1
+            assert mock_cache.set_bytes.call_count >= 1
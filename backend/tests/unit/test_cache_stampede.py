@@ -0,0 +1,268 @@
+"""
+Unit tests for stampede protection in CacheManager.get_or_set
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache import ENTRY_MARKER, CacheManager, cached
+
+
+class FakePipeline:
+    """Runs queued commands on execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the commands get_or_set uses"""
+
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, low, high):
+        members = self.store.get(key, {})
+        for member in [m for m, score in members.items() if score <= high]:
+            del members[member]
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+class TrackedSession(Session):
+    """Session that records whether the request closed it"""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def manager():
+    cache = CacheManager(redis_url="redis://fake")
+    cache._local = None
+    cache._redis = FakeRedis()
+    return cache
+
+
+def counting_fetch(value, delay=0.01):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return {"value": value, "call": len(calls)}
+
+    return fetch, calls
+
+
+@pytest.mark.unit
+class TestGetOrSet:
+    """Test single flight, stale-while-revalidate and XFetch"""
+
+    def test_concurrent_misses_fetch_once(self):
+        """Test 50 concurrent callers of a cold key share one fetch"""
+        cache = manager()
+        fetch, calls = counting_fetch("fresh")
+
+        async def run():
+            return await asyncio.gather(*[
+                cache.get_or_set("analytics", "status", fetch) for _ in range(50)
+            ])
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(result == {"value": "fresh", "call": 1} for result in results)
+        assert not cache._inflight
+
+    def test_fetch_errors_reach_every_caller_once(self):
+        """Test a failing fetch is not retried by each coalesced caller"""
+        cache = manager()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("database down")
+
+        async def run():
+            return await asyncio.gather(*[
+                cache.get_or_set("analytics", "status", fetch) for _ in range(10)
+            ], return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_stale_value_is_served_while_refreshing(self):
+        """Test an expired entry is returned at once and refreshed in the background"""
+        cache = manager()
+        fetch, calls = counting_fetch("new")
+
+        async def run():
+            await cache.set("content", "articles", {
+                ENTRY_MARKER: 1, "value": "old", "fresh_until": time.time() - 1, "delta": 0.01
+            })
+            stale = await asyncio.gather(*[
+                cache.get_or_set("content", "articles", fetch) for _ in range(20)
+            ])
+            await asyncio.gather(*cache._refresh_tasks.values())
+            fresh = await cache.get_or_set("content", "articles", fetch)
+            return stale, fresh
+
+        stale, fresh = asyncio.run(run())
+
+        assert stale == ["old"] * 20
+        assert fresh == {"value": "new", "call": 1}
+        assert len(calls) == 1
+        assert cache._generate_key("content", "articles") in cache._redis.store
+        assert "lock:content:articles" not in cache._redis.store
+
+    def test_xfetch_refreshes_expensive_layers_early(self, monkeypatch):
+        """Test values near expiry are refreshed early only on "xfetch" layers"""
+        monkeypatch.setattr("app.core.cache.random.random", lambda: 0.99)
+        cache = manager()
+        fetch, calls = counting_fetch("new")
+        # Took 10s to compute, expires in 20s: -10 * ln(0.01) = 46s > 20s
+        entry = {ENTRY_MARKER: 1, "value": "old", "fresh_until": time.time() + 20, "delta": 10.0}
+
+        async def run():
+            await cache.set("analytics", "stats", entry)
+            await cache.set("content", "stats", entry)
+            results = [
+                await cache.get_or_set("analytics", "stats", fetch),
+                await cache.get_or_set("content", "stats", fetch)
+            ]
+            await asyncio.gather(*cache._refresh_tasks.values())
+            return results
+
+        assert asyncio.run(run()) == ["old", "old"]
+        assert len(calls) == 1
+        assert asyncio.run(cache.get("analytics", "stats")) == {"value": "new", "call": 1}
+        assert asyncio.run(cache.get("content", "stats")) == "old"
+
+    def test_waits_for_other_replica(self, monkeypatch):
+        """Test a replica that loses the lock waits for the winner's value"""
+        monkeypatch.setattr("app.core.cache.settings.CACHE_LOCK_WAIT_SECONDS", 1.0)
+        cache = manager()
+        fetch, calls = counting_fetch("mine")
+
+        async def other_replica():
+            await asyncio.sleep(0.1)
+            await cache.set("analytics", "status", "theirs")
+
+        async def run():
+            cache._redis.store["lock:analytics:status"] = "1"
+            writer = asyncio.ensure_future(other_replica())
+            result = await cache.get_or_set("analytics", "status", fetch)
+            await writer
+            return result
+
+        assert asyncio.run(run()) == "theirs"
+        assert calls == []
+
+    def test_refresh_never_uses_a_request_session(self, monkeypatch):
+        """Test stale entries of endpoints taking a DB session are refetched in the request"""
+        cache = manager()
+        monkeypatch.setattr("app.core.cache.cache_manager", cache)
+        now = [time.time()]
+        monkeypatch.setattr("app.core.cache.time.time", lambda: now[0])
+        used = []
+
+        @cached(layer="analytics", identifier="status", ttl=60)
+        async def get_status(db: Session):
+            used.append((db, db.closed))
+            return {"call": len(used)}
+
+        async def request():
+            # Like a FastAPI dependency: the session closes when the handler returns
+            db = TrackedSession()
+            try:
+                return await get_status(db=db)
+            finally:
+                db.close()
+
+        async def run():
+            first = await request()
+            now[0] += 61
+            second = await request()
+            await asyncio.gather(*cache._refresh_tasks.values())
+            return first, second
+
+        assert asyncio.run(run()) == ({"call": 1}, {"call": 2})
+        assert [closed for _, closed in used] == [False, False]
+        assert used[0][0] is not used[1][0]
+        assert not cache._refresh_tasks
+
+    def test_requests_never_share_a_session_bound_fetch(self, monkeypatch):
+        """Test a request does not await a fetch on another request's session"""
+        monkeypatch.setattr("app.core.cache.settings.CACHE_LOCK_WAIT_SECONDS", 0.3)
+        cache = manager()
+        monkeypatch.setattr("app.core.cache.cache_manager", cache)
+        used = []
+
+        @cached(layer="analytics", identifier="status", ttl=60)
+        async def get_status(db: Session):
+            used.append(db)
+            await asyncio.sleep(0.1)
+            assert not db.closed
+            return {"call": len(used)}
+
+        async def request():
+            db = TrackedSession()
+            try:
+                return await get_status(db=db)
+            finally:
+                db.close()
+
+        async def run():
+            first = asyncio.ensure_future(request())
+            await asyncio.sleep(0.01)
+            second = asyncio.ensure_future(request())
+            await asyncio.sleep(0.01)
+            first.cancel()  # Client went away: its session closes mid-fetch
+            return await second
+
+        assert asyncio.run(run()) == {"call": 2}
+        assert len(used) == 2 and used[0] is not used[1]
+        assert not cache._inflight
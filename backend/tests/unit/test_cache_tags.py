@@ -0,0 +1,184 @@
+"""
+Unit tests for tag-based cache invalidation
+"""
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import CacheManager, LocalCache, article_tag, cached, source_tag
+
+
+class FakePipeline:
+    """Runs queued commands on execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """Dict-backed Redis without SCAN, so pattern deletes fail the tests"""
+
+    def __init__(self):
+        self.store = {}
+        self.replicas = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, low, high):
+        members = self.store.get(key, {})
+        for member in [m for m, score in members.items() if score <= high]:
+            del members[member]
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.store.get(key, {}).pop(member, None)
+
+    async def zrange(self, key, start, end):
+        return list(self.store.get(key, {}))
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def publish(self, channel, message):
+        for replica in self.replicas:
+            replica._apply_invalidation(message)
+
+
+def replicas(count=1):
+    redis = FakeRedis()
+    managers = []
+    for _ in range(count):
+        manager = CacheManager(redis_url="redis://fake", local=LocalCache(100, 1 << 20, 30))
+        manager._redis = redis
+        redis.replicas.append(manager)
+        managers.append(manager)
+    return redis, managers
+
+
+@pytest.mark.unit
+class TestTagInvalidation:
+    """Test tags registered on write and O(affected keys) invalidation"""
+
+    def test_invalidate_tags_deletes_tagged_entries_only(self):
+        """Test an article tag reaches entries in any layer, and nothing else"""
+        redis, (cache,) = replicas()
+
+        async def run():
+            await cache.set("article", "7", {"id": 7}, tags=[article_tag(7), source_tag("El Tiempo")])
+            await cache.set("analytics", "article-7-stats", {"views": 3}, tags=[article_tag(7)])
+            await cache.set("article", "8", {"id": 8}, tags=[article_tag(8)])
+
+            deleted = await cache.invalidate_tags([article_tag(7)])
+            return deleted, [await cache.get("article", i) for i in ("7", "8")]
+
+        deleted, values = asyncio.run(run())
+
+        assert deleted == 2
+        assert values == [None, {"id": 8}]
+        assert cache._tag_key(article_tag(7)) not in redis.store
+
+    def test_invalidate_layer_uses_layer_tag(self):
+        """Test invalidate_layer deletes the layer's keys without scanning"""
+        redis, (cache,) = replicas()
+
+        async def run():
+            for i in range(3):
+                await cache.set("content", f"articles-{i}", [i])
+            await cache.set("source", "list", ["El Tiempo"])
+            await cache.warm_cache("content", [{"identifier": "articles-9", "value": [9]}])
+
+            deleted = await cache.invalidate_layer("content")
+            return deleted, await cache.get("source", "list")
+
+        deleted, source_list = asyncio.run(run())
+
+        assert deleted == 4
+        assert source_list == ["El Tiempo"]
+        assert not any(key.startswith("content:") for key in redis.store)
+
+    def test_other_replicas_drop_invalidated_entries(self):
+        """Test tag invalidation evicts every replica's local cache"""
+        redis, (writer, reader) = replicas(2)
+
+        async def run():
+            await writer.set("article", "7", {"id": 7}, tags=[article_tag(7)])
+            await reader.get("article", "7")
+            assert len(reader.local_cache) == 1
+
+            await writer.invalidate_tags([article_tag(7)])
+
+        asyncio.run(run())
+
+        assert len(reader.local_cache) == 0
+
+    def test_cached_decorator_formats_tags_from_arguments(self, monkeypatch):
+        """Test @cached tags are filled in from the call's arguments"""
+        redis, (cache,) = replicas()
+        monkeypatch.setattr(cache_module, "cache_manager", cache)
+        calls = []
+
+        @cached(layer="article", identifier_param="article_id", tags=["articles", "article:{article_id}", "{source}"])
+        async def get_article(article_id: int, source: str = "source:El Tiempo"):
+            calls.append(article_id)
+            return {"id": article_id, "calls": len(calls)}
+
+        async def run():
+            await get_article(article_id=7)
+            await get_article(article_id=8)
+            await cache_module.invalidate_tags_async(source_tag("El Tiempo"))
+            return await get_article(article_id=7)
+
+        assert asyncio.run(run()) == {"id": 7, "calls": 3}
+        assert set(redis.store[cache._tag_key(article_tag(8))]) == {cache._generate_key("article", "8")}
+
+    def test_tag_sets_only_hold_live_entries(self, monkeypatch):
+        """Test expired and deleted keys leave the tag sets, so they stay bounded"""
+        now = [1000.0]
+        monkeypatch.setattr("app.core.cache.time.time", lambda: now[0])
+        redis, (cache,) = replicas()
+        layer_tag = cache._tag_key("layer:content")
+
+        async def run():
+            for i in range(100):
+                await cache.set("content", f"page-{i}", [i], ttl=60, tags=["articles"])
+                now[0] += 60
+            await cache.delete("content", "page-99")
+
+        asyncio.run(run())
+
+        # Written within one TTL plus the pruning grace period
+        assert set(redis.store[layer_tag]) == {cache._generate_key("content", "page-98")}
+        assert len(redis.store[cache._tag_key("articles")]) == 2
@@ -0,0 +1,84 @@
+"""
+Unit tests for adaptive crawl intervals
+"""
+import pytest
+
+from app.config.scheduler_config import SCRAPER_TIERS
+from app.services.crawl_schedule import CrawlSchedule
+
+HOUR = 3600
+
+
+def run_hourly(schedule, source, articles_per_run, runs, tier='medium', start=0.0):
+    """Record runs one hour apart; returns the time of the last one"""
+    now = start
+    for _ in range(runs):
+        now += HOUR
+        schedule.record_run(source, articles_per_run, tier, now=now)
+    return now
+
+
+@pytest.mark.unit
+class TestCrawlSchedule:
+    """Test rate estimation, interval bounds and persistence"""
+
+    def test_new_source_starts_at_tier_interval(self):
+        """Test an unknown source gets its tier interval"""
+        schedule = CrawlSchedule(path=None)
+
+        assert schedule.interval_minutes('Fuente', 'high') == SCRAPER_TIERS['high']['interval_minutes']
+        assert schedule.interval_minutes('Otra', 'low', start_minutes=90) == 90
+
+    def test_first_run_only_sets_clock(self):
+        """Test the backlog found by a first run is not taken as the rate"""
+        schedule = CrawlSchedule(path=None, target_articles=3)
+
+        state = schedule.record_run('Fuente', 200, 'medium', now=HOUR)
+
+        assert state.interval_minutes == SCRAPER_TIERS['medium']['interval_minutes']
+        assert state.predicted_articles == 0
+        assert state.actual_articles == 0
+
+    def test_fast_source_is_scraped_more_often(self):
+        """Test 12 articles/hour converges to target / rate, within the tier minimum"""
+        schedule = CrawlSchedule(path=None, target_articles=3, half_life_hours=6)
+
+        run_hourly(schedule, 'Rápida', 12, runs=48)
+        state = schedule.get('Rápida', 'medium')
+
+        assert state.rate_per_hour == pytest.approx(12, rel=0.01)
+        assert state.interval_minutes == pytest.approx(15, rel=0.01)
+        assert state.interval_minutes >= SCRAPER_TIERS['medium']['min_interval_minutes']
+
+    def test_quiet_source_backs_off_to_tier_maximum(self):
+        """Test a source without new articles is scraped at the tier maximum"""
+        schedule = CrawlSchedule(path=None, target_articles=3, half_life_hours=6)
+
+        run_hourly(schedule, 'Lenta', 0, runs=48, tier='low')
+
+        assert schedule.interval_minutes('Lenta', 'low') == SCRAPER_TIERS['low']['max_interval_minutes']
+
+    def test_predicted_and_actual_yield(self):
+        """Test each run records the yield the previous estimate predicted"""
+        schedule = CrawlSchedule(path=None, target_articles=3, half_life_hours=6)
+
+        now = run_hourly(schedule, 'Fuente', 6, runs=24)
+        schedule.record_run('Fuente', 4, 'medium', now=now + 2 * HOUR)
+        stats = schedule.get_statistics('Fuente')['Fuente']
+
+        assert stats['runs'] == 25
+        assert stats['last_predicted'] == pytest.approx(12, rel=0.05)
+        assert stats['last_actual'] == 4
+        assert stats['actual_articles'] == 23 * 6 + 4
+        assert schedule.get_statistics('Desconocida') == {}
+
+    def test_state_survives_restart(self, tmp_path):
+        """Test estimates are written to and read back from SQLite"""
+        path = str(tmp_path / "schedule.db")
+        schedule = CrawlSchedule(path=path, target_articles=3)
+        run_hourly(schedule, 'Fuente', 12, runs=10)
+        expected = schedule.get('Fuente', 'medium')
+
+        restored = CrawlSchedule(path=path, target_articles=3).get('Fuente', 'medium')
+
+        assert restored == expected
@@ -0,0 +1,82 @@
+"""
+Unit tests for BatchProcessor execution backends
+"""
+import pytest
+from backend.nlp.analysis_context import AnalysisContext
+from backend.nlp.batch_processor import BatchConfig, BatchProcessor
+from backend.nlp.executors import AnalysisComponents, ProcessExecutor, ThreadExecutor, run_task
+
+
+class FakePipeline:
+    """Pipeline stand-in that records how texts are parsed"""
+
+    def __init__(self):
+        self.parsed = []
+
+    def create_contexts(self, texts, batch_size=64):
+        self.parsed.append(list(texts))
+        return [AnalysisContext(text) for text in texts]
+
+    def extract_entities(self, text, context=None):
+        return {'words': context.words}
+
+
+class FakeScorer:
+    """DifficultyScorer stand-in"""
+
+    def score_batch(self, contexts):
+        return [float(len(context.words)) for context in contexts]
+
+
+def make_components():
+    return AnalysisComponents(
+        pipeline=FakePipeline(),
+        sentiment_analyzer=None,
+        topic_modeler=None,
+        difficulty_scorer=FakeScorer()
+    )
+
+
+@pytest.mark.unit
+def test_run_task_parses_batch_once():
+    """Test a batch is parsed in one create_contexts call"""
+    components = make_components()
+    results = run_task(components, 'ner', ["hola mundo", "paz"])
+
+    assert results == [{'words': ['hola', 'mundo']}, {'words': ['paz']}]
+    assert components.pipeline.parsed == [["hola mundo", "paz"]]
+
+
+@pytest.mark.unit
+def test_run_task_rejects_unknown_type():
+    """Test unknown task types raise"""
+    with pytest.raises(ValueError):
+        run_task(make_components(), 'translate', ["hola"])
+
+
+@pytest.mark.unit
+def test_process_executor_chunks_per_worker():
+    """Test batches are split into at most one chunk per worker"""
+    executor = ProcessExecutor(max_workers=4, min_chunk_size=2)
+
+    chunks = executor._chunks([str(i) for i in range(10)])
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert sum(chunks, []) == [str(i) for i in range(10)]
+
+    small = executor._chunks(["a", "b", "c"])
+    assert [len(chunk) for chunk in small] == [2, 1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_batch_processor_uses_executor():
+    """Test BatchProcessor dispatches through an executor's processor map"""
+    processor = BatchProcessor(BatchConfig(max_batch_size=2, cache_results=False))
+    await processor.start_workers(executor=ThreadExecutor(make_components()))
+    try:
+        job_ids = processor.submit_batch('difficulty', ["uno dos", "tres"])
+        results = [await processor.result(job_id, timeout=1.0) for job_id in job_ids]
+    finally:
+        await processor.stop_workers()
+
+    assert results == [2.0, 1.0]
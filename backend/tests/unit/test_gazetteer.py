@@ -0,0 +1,63 @@
+"""
+Unit tests for the Colombian gazetteer matcher
+"""
+import pytest
+from backend.nlp.gazetteer import GazetteerMatcher, get_colombian_gazetteer
+
+
+@pytest.mark.unit
+def test_match_returns_original_offsets():
+    """Test matches carry offsets into the original text"""
+    text = "El presidente Gustavo Petro llegó a Medellín."
+    matches = get_colombian_gazetteer().find_all(text)
+
+    names = {m.name: m for m in matches}
+    assert 'Gustavo Petro' in names
+    match = names['Gustavo Petro']
+    assert text[match.start:match.end] == 'Gustavo Petro'
+    assert names['Medellín'].category == 'cities'
+
+
+@pytest.mark.unit
+def test_accent_and_case_insensitive():
+    """Test matching ignores accents and case"""
+    matches = get_colombian_gazetteer().find_all("Reunión en BOGOTA y medellin")
+    assert {m.name for m in matches} == {'Bogotá', 'Medellín'}
+    assert [m.text for m in matches] == ['BOGOTA', 'medellin']
+
+
+@pytest.mark.unit
+def test_word_boundaries():
+    """Test short entries do not match inside longer words"""
+    text = "La calidad del servicio es precisa en la metrópoli"
+    assert get_colombian_gazetteer().find_all(text) == []
+
+
+@pytest.mark.unit
+def test_overlapping_matches_are_reported():
+    """Test nested entries are all found in one pass"""
+    matches = get_colombian_gazetteer().find_all("Lluvias en el Valle del Cauca")
+    assert {m.name for m in matches} == {'Valle del Cauca', 'Cauca'}
+
+
+@pytest.mark.unit
+def test_aliases_resolve_to_canonical_entry():
+    """Test alias variants map to the canonical name"""
+    grouped = get_colombian_gazetteer().find_by_category("Combates con guerrillas")
+    assert [e.name for e in grouped['conflict_actors']] == ['guerrilla']
+
+
+@pytest.mark.unit
+def test_failure_links_recover_suffix_patterns():
+    """Test a partial long match falls back to a shorter pattern"""
+    matcher = GazetteerMatcher.from_gazetteers({
+        'test': {'banco de bogota': 'A', 'de bogota central': 'B', 'bogota': 'C'}
+    })
+    matches = matcher.find_all("banco de bogota central")
+    assert sorted(m.label for m in matches) == ['A', 'B', 'C']
+
+
+@pytest.mark.unit
+def test_empty_text():
+    """Test empty input returns no matches"""
+    assert get_colombian_gazetteer().find_all("") == []
@@ -0,0 +1,146 @@
+"""
+Unit tests for the staged ingestion pipeline
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from backend.core.ingestion_pipeline import (
+    DocumentIngestor, Stage, StagedPipeline, clean_text, parse_published_date
+)
+
+
+class FakeIngestor(DocumentIngestor):
+    """DocumentIngestor with the database replaced by sets and a list"""
+
+    def __init__(self, stored_hashes=(), **kwargs):
+        super().__init__(
+            session_factory=None,
+            enrich=lambda item: setattr(item, 'analysis', {'summary': item.text[:10]}),
+            validate=lambda doc: isinstance(doc, dict) and 'title' in doc and 'content' in doc,
+            **kwargs
+        )
+        self.stored_hashes = set(stored_hashes)
+        self.rows = []
+        self.lookups = 0
+
+    def _lookup_existing(self, hashes, urls):
+        self.lookups += 1
+        return hashes & self.stored_hashes, set()
+
+    def _store(self, items):
+        self.rows.extend(items)
+        return len(items), 0
+
+
+def document(i, **overrides):
+    doc = {
+        'title': f"Noticia {i}",
+        'content': f"<p>Contenido   de la noticia {i}.</p>",
+        'content_hash': f"hash-{i}",
+        'source_url': f"https://example.co/{i}"
+    }
+    doc.update(overrides)
+    return doc
+
+
+SOURCE = SimpleNamespace(name='El Tiempo', category='media.national')
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ingest_dedupes_and_stores_in_batches():
+    """Test stored, in-stream and invalid duplicates are filtered with one lookup per batch"""
+    documents = [document(i) for i in range(10)]
+    documents += [document(3), document(99, source_url="https://example.co/4"), {'title': 'sin contenido'}]
+
+    ingestor = FakeIngestor(stored_hashes={'hash-0'}, batch_size=4)
+    result = await ingestor.ingest(documents, SOURCE)
+
+    assert result['stored'] == 9
+    assert result['duplicates'] == 3
+    assert result['invalid'] == 1
+    assert result['failed'] == 0
+    assert ingestor.lookups == 4
+    assert result['stages']['store']['items_in'] == 9
+
+    item = ingestor.rows[0]
+    assert item.fields['source'] == 'El Tiempo'
+    assert item.fields['category'] == 'media.national'
+    assert item.text == "Contenido de la noticia 1."
+    assert item.analysis == {'summary': "Contenido "}
+    assert item.context is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ingest_accepts_async_stream():
+    """Test documents can arrive from an async iterator"""
+    async def stream():
+        for i in range(5):
+            await asyncio.sleep(0)
+            yield document(i)
+
+    ingestor = FakeIngestor(batch_size=2)
+    result = await ingestor.ingest(stream(), SOURCE)
+
+    assert result['stored'] == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bounded_queues_apply_backpressure():
+    """Test a slow stage limits how far ahead the fast stage runs"""
+    produced = []
+
+    def fast(batch):
+        produced.extend(batch)
+        return batch
+
+    async def slow(batch):
+        await asyncio.sleep(0.01)
+        return batch
+
+    pipeline = StagedPipeline(
+        [Stage('fast', fast), Stage('slow', slow)],
+        batch_size=1,
+        queue_size=2
+    )
+    task = asyncio.create_task(pipeline.run(range(50)))
+    await asyncio.sleep(0.02)
+
+    # fast can be at most queue_size batches (plus the one in hand) ahead
+    assert len(produced) - pipeline.stats['slow'].items_in <= 4
+
+    stats = await task
+    assert stats['slow'].items_out == 50
+    assert stats['slow'].max_queue_depth <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failing_batch_is_dropped_and_counted():
+    """Test an exception drops only its batch"""
+    def flaky(batch):
+        if 3 in batch:
+            raise ValueError("boom")
+        return batch
+
+    pipeline = StagedPipeline(
+        [Stage('flaky', flaky, concurrency=2, in_executor=True)],
+        batch_size=2
+    )
+    stats = await pipeline.run(range(10))
+
+    assert stats['flaky'].failed_batches == 1
+    assert stats['flaky'].failed_items == 2
+    assert stats['flaky'].items_out == 8
+
+
+@pytest.mark.unit
+def test_clean_helpers():
+    """Test text cleanup and date parsing"""
+    assert clean_text("<b>Hola</b>\n\n mundo ") == "Hola mundo"
+    assert parse_published_date("2024-01-02T03:04:05Z").tzinfo is not None
+    assert parse_published_date("ayer") is None
+    assert parse_published_date(None) is None
@@ -0,0 +1,97 @@
+"""
+Unit tests for the bounded batch job registry
+"""
+import pytest
+from backend.nlp.batch_processor import BatchConfig, BatchJob, BatchProcessor, JobStatus
+from backend.nlp.job_store import MemoryJobStore, RedisJobStore, job_from_record, job_to_record
+
+
+def finished_job(job_id):
+    job = BatchJob(job_id=job_id, task_type='sentiment', input_data=None)
+    job.status = JobStatus.COMPLETED
+    return job
+
+
+class FakeRemote:
+    """CacheManager stand-in backed by a dict"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, layer, identifier):
+        return self.store.get((layer, identifier))
+
+    async def warm_cache(self, layer, items, ttl=None):
+        for item in items:
+            self.store[(layer, item['identifier'])] = item['value']
+        return len(items)
+
+
+@pytest.mark.unit
+def test_count_limit_evicts_oldest_finished():
+    """Test finished jobs are evicted oldest-first past max_jobs"""
+    store = MemoryJobStore(max_jobs=2)
+    pending = BatchJob(job_id='pending', task_type='sentiment', input_data="texto")
+    store.add(pending)
+
+    for job_id in ('a', 'b'):
+        job = finished_job(job_id)
+        store.add(job)
+        store.finish(job)
+
+    assert 'pending' in store
+    assert 'a' not in store
+    assert 'b' in store
+    assert store.evicted == 1
+
+
+@pytest.mark.unit
+def test_age_limit_expires_finished_jobs():
+    """Test finished jobs expire after max_age_seconds"""
+    store = MemoryJobStore(max_age_seconds=0)
+    job = finished_job('old')
+    store.add(job)
+    store.finish(job)
+
+    store.prune()
+    assert store.get('old') is None
+
+
+@pytest.mark.unit
+def test_record_round_trip():
+    """Test job snapshots survive serialization"""
+    job = finished_job('x')
+    job.result = {'polarity': 0.5}
+
+    restored = job_from_record(job_to_record(job))
+    assert restored.status == JobStatus.COMPLETED
+    assert restored.result == {'polarity': 0.5}
+    assert restored.created_at == job.created_at
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_inputs_released_and_status_shared():
+    """Test completed jobs drop their input and are visible via Redis"""
+    async def echo(batch):
+        return [len(text) for text in batch]
+
+    remote = FakeRemote()
+    processor = BatchProcessor(
+        BatchConfig(max_batch_size=1, cache_results=False),
+        job_store=RedisJobStore(remote)
+    )
+    await processor.start_workers({'difficulty': echo})
+    try:
+        job_id = processor.submit('difficulty', "hola")
+        assert await processor.result(job_id, timeout=1.0) == 4
+        await processor.jobs.flush()
+    finally:
+        await processor.stop_workers()
+
+    assert processor.get_status(job_id).input_data is None
+
+    other_worker = RedisJobStore(remote)
+    job = await other_worker.fetch(job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.result == 4
@@ -0,0 +1,96 @@
+"""
+Unit tests for the two-tier NLP result cache
+"""
+import asyncio
+
+import pytest
+from backend.nlp.batch_processor import BatchConfig, BatchProcessor
+from backend.nlp.result_cache import MISSING, ResultCache, content_hash
+
+
+class FakeRemote:
+    """CacheManager stand-in backed by a dict"""
+
+    def __init__(self):
+        self.store = {}
+        self.lookups = 0
+
+    async def get_many(self, layer, identifiers):
+        self.lookups += 1
+        return {i: self.store[(layer, i)] for i in identifiers if (layer, i) in self.store}
+
+    async def warm_cache(self, layer, items, ttl=None):
+        for item in items:
+            self.store[(layer, item['identifier'])] = item['value']
+        return len(items)
+
+
+@pytest.mark.unit
+def test_content_hash_is_stable_and_whitespace_insensitive():
+    """Test keys do not depend on process hash seeds or line wrapping"""
+    assert content_hash("Paz en\n  Colombia") == content_hash("Paz en Colombia")
+    assert content_hash("Paz en Colombia") != content_hash("Paz en Cali")
+    assert len(content_hash({'b': 1, 'a': 2})) == 64
+
+
+@pytest.mark.unit
+def test_model_version_changes_key():
+    """Test bumping the model version invalidates keys"""
+    assert ResultCache(model_version="1").make_key('sentiment', "x") != \
+        ResultCache(model_version="2").make_key('sentiment', "x")
+
+
+@pytest.mark.unit
+def test_lru_eviction_respects_byte_budget():
+    """Test least recently used entries are evicted past the byte budget"""
+    cache = ResultCache(max_bytes=50, max_entries=100)
+    cache.put('a', 'x' * 10)
+    cache.put('b', 'x' * 10)
+    cache.get('a')  # a is now most recently used
+    cache.put('c', 'x' * 30)
+
+    assert cache.get('b') is MISSING
+    assert cache.get('a') == 'x' * 10
+    assert cache.current_bytes <= 50
+    assert cache.stats['evictions'] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_remote_hits_are_promoted():
+    """Test Redis hits are copied into the in-process tier"""
+    remote = FakeRemote()
+    writer = ResultCache(remote=remote)
+    key = writer.make_key('sentiment', "texto")
+    await writer.put_many('sentiment', {key: {'polarity': 0.5}})
+
+    reader = ResultCache(remote=remote)
+    found = await reader.get_remote_many('sentiment', [key, 'missing'])
+
+    assert found == {key: {'polarity': 0.5}}
+    assert reader.get(key) == {'polarity': 0.5}
+    assert reader.stats['misses'] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_duplicate_submissions_are_analysed_once():
+    """Test identical in-flight texts share a single processing slot"""
+    processed = []
+
+    async def record(batch):
+        processed.extend(batch)
+        return [len(text) for text in batch]
+
+    processor = BatchProcessor(BatchConfig(max_batch_size=8, max_wait_seconds=0.05))
+    await processor.start_workers({'difficulty': record})
+    try:
+        job_ids = processor.submit_batch('difficulty', ["misma noticia", "misma  noticia", "otra"])
+        results = await asyncio.gather(*(processor.result(job_id, timeout=1.0) for job_id in job_ids))
+        cached_id = processor.submit('difficulty', "otra")
+    finally:
+        await processor.stop_workers()
+
+    assert processed == ["misma noticia", "otra"]
+    assert results == [13, 13, 4]
+    assert processor.get_result(cached_id) == 4
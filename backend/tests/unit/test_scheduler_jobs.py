@@ -28,6 +28,16 @@ from app.services.scheduler_jobs import (
     _job_failures,
 )
 from app.config.scheduler_config import SCRAPER_TIERS, RETRY_CONFIG
+from app.services import crawl_schedule
+from app.database.bulk import UpsertResult
+
+
+@pytest.fixture(autouse=True)
+def isolated_crawl_schedule(monkeypatch):
+    """Give each test an empty, in-memory crawl schedule"""
+    schedule = crawl_schedule.CrawlSchedule(path=None)
+    monkeypatch.setattr(crawl_schedule, "_crawl_schedule", schedule)
+    yield schedule
 
 
 class TestBackoffCalculation:
@@ -108,16 +118,21 @@ class TestScraperExecution:
 
         with patch('app.services.scheduler_jobs.SCRAPER_REGISTRY', {'Test Source': mock_scraper_class}):
             with patch('app.services.scheduler_jobs.get_db', return_value=mock_db):
-                result = await execute_scraper_with_retry(
-                    'Test Source',
-                    source_config,
-                    tier='high'
-                )
+                with patch('app.services.scheduler_jobs.upsert_scraped_content',
+                           return_value=UpsertResult(inserted=1, skipped=1)) as mock_upsert:
+                    result = await execute_scraper_with_retry(
+                        'Test Source',
+                        source_config,
+                        tier='high'
+                    )
 
         assert result['success'] is True
         assert result['articles_scraped'] == 2
+        assert result['articles_stored'] == 1
+        assert mock_upsert.call_count == 1
         assert result['retries'] == 0
         assert result['error'] is None
+        assert result['interval_minutes'] == SCRAPER_TIERS['high']['interval_minutes']
 
     @pytest.mark.asyncio
     async def test_execute_scraper_not_implemented(self):
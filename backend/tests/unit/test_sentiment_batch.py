@@ -0,0 +1,77 @@
+"""
+Unit tests for vectorized batch sentiment analysis
+"""
+import numpy as np
+import pytest
+from backend.nlp.sentiment_analyzer import SentimentAnalyzer
+
+
+TEXTS = [
+    "La paz y el desarrollo traen mucho progreso a Colombia.",
+    "No hubo violencia ni corrupción, pero sí una crisis muy grave.",
+    "Apenas un poco de avance en el diálogo con el ELN.",
+    "",
+    "   ",
+    "Masacre",
+    "No",
+    "Sin acuerdo, sin paz y sin reconciliación: el conflicto sigue. " * 10,
+    "El gobierno anunció una reforma. Nada de amenaza, nunca secuestro.",
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_vader", [False, True])
+def test_batch_matches_single_analysis(use_vader):
+    """Test analyze_batch is numerically identical to analyze"""
+    analyzer = SentimentAnalyzer(use_vader=use_vader)
+
+    assert analyzer.analyze_batch(TEXTS) == [analyzer.analyze(text) for text in TEXTS]
+
+
+@pytest.mark.unit
+def test_batch_chunking_preserves_order():
+    """Test results are identical regardless of chunk size"""
+    analyzer = SentimentAnalyzer(use_vader=False)
+
+    assert analyzer.analyze_batch(TEXTS, chunk_size=2) == analyzer.analyze_batch(TEXTS)
+
+
+@pytest.mark.unit
+def test_slang_expansions_do_not_change_word_counts():
+    """Test scores use the words of the normalized text, as before batching"""
+    analyzer = SentimentAnalyzer(use_vader=False)
+    text = "Este proyecto es muy bacano, q chévere la paz. No es una berraquera."
+
+    expected = {'polarity': 0.0, 'subjectivity': 0.0, 'confidence': 0.6}
+    assert analyzer.analyze(text) == expected
+    assert analyzer.analyze_batch([text]) == [expected]
+
+
+@pytest.mark.unit
+def test_negation_window_stays_within_document():
+    """Test a trailing negation does not flip the next document's words"""
+    analyzer = SentimentAnalyzer(use_vader=False)
+    multiplier, adjustment, lexicon_counts, _ = analyzer._lexicon_features([
+        ["hubo", "no"],
+        ["paz"],
+    ])
+
+    assert adjustment.tolist() == [0.0, 0.8 * 0.3]
+    assert lexicon_counts.tolist() == [0, 1]
+    assert multiplier.tolist() == [1.0, 1.0]
+
+
+@pytest.mark.unit
+def test_accumulate_folds_left_to_right_with_long_documents():
+    """Test one document with thousands of terms folds like the scalar loop"""
+    rng = np.random.default_rng(7)
+    docs = np.concatenate([np.full(3000, 2), rng.integers(0, 500, 2000)])
+    order = rng.permutation(len(docs))
+    values = rng.uniform(-1.0, 1.0, len(docs))
+
+    folded = SentimentAnalyzer._accumulate(docs, order, values, 500, np.add, 0.0)
+
+    expected = [0.0] * 500
+    for index in np.lexsort((order, docs)).tolist():
+        expected[docs[index]] += values[index]
+    assert folded.tolist() == expected
@@ -0,0 +1,65 @@
+"""
+Unit tests for batch topic prediction
+"""
+import pytest
+from backend.nlp.analysis_context import AnalysisContext
+from backend.nlp.topic_modeler import TopicModeler
+
+
+CORPUS = [
+    "El gobierno presentó la reforma tributaria ante el congreso nacional",
+    "La inflación y el dólar afectan la economía y el empleo en Colombia",
+    "El ejército reportó combates con disidencias en la región del Cauca",
+    "El festival de música vallenata reunió artistas en Valledupar",
+    "La universidad nacional abrió matrículas con nuevas becas",
+    "El ministro de hacienda defendió la reforma tributaria en el congreso",
+    "La policía capturó una banda dedicada a la extorsión en Cali",
+    "El banco de la república subió las tasas por la inflación",
+]
+
+TEXTS = CORPUS + [
+    "",
+    "   ",
+    "Bancolombia y Ecopetrol lideran la bolsa",
+    "La selección Colombia ganó la copa con gol de James",
+    "Minsalud y la EPS atienden la emergencia de salud",
+]
+
+
+@pytest.mark.unit
+def test_batch_matches_single_keyword_only():
+    """Test keyword scoring via sparse products matches per-text scoring"""
+    modeler = TopicModeler(use_lda=False, use_nmf=False)
+
+    batch = modeler.predict_topics_batch(TEXTS)
+
+    assert batch == [modeler.predict_topics(text) for text in TEXTS]
+    assert batch[8] == [] and batch[9] == []
+
+
+@pytest.mark.unit
+def test_batch_matches_single_with_lda():
+    """Test a single LDA transform gives the same topics as one-row transforms"""
+    modeler = TopicModeler(n_topics=3, use_nmf=False)
+    modeler.fit(CORPUS)
+
+    assert modeler.predict_topics_batch(TEXTS) == [modeler.predict_topics(text) for text in TEXTS]
+
+
+@pytest.mark.unit
+def test_prefix_keywords_are_counted():
+    """Test a keyword inside a longer keyword still counts (banco in bancolombia)"""
+    modeler = TopicModeler(use_lda=False, use_nmf=False)
+    filler = ['uno', 'dos', 'tres', 'cuatro', 'cinco', 'seis', 'siete', 'ocho',
+              'nueve', 'diez', 'once', 'doce', 'trece', 'catorce', 'quince', 'dieciséis',
+              'diecisiete', 'dieciocho', 'diecinueve', 'veinte', 'veintiuno', 'veintidós',
+              'veintitrés', 'veinticuatro']
+    keywords = [kw for config in TopicModeler.COLOMBIAN_TOPICS.values() for kw in config['keywords']]
+    assert not [word for word in filler if any(kw in word for kw in keywords)]
+    context = AnalysisContext(' '.join(['Bancolombia'] + filler))
+
+    scores = modeler._calculate_keyword_scores([context])[0]
+
+    # 'banco' and 'bancolombia' both match among 25 distinct words, and
+    # substring matching also finds the sports keyword 'colombia'
+    assert scores == {'economics': 2 / 25 * 1.1 * 10, 'sports': 1 / 25 * 0.9 * 10}
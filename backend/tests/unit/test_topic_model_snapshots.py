@@ -0,0 +1,133 @@
+"""
+Unit tests for incremental and persisted topic model fitting
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import ScrapedContent
+from app.services import topic_model_jobs
+from backend.nlp.topic_modeler import TopicModeler, list_snapshots, topic_drift
+
+
+CORPUS = [
+    "El gobierno presentó la reforma tributaria ante el congreso nacional",
+    "La inflación y el dólar afectan la economía y el empleo en Colombia",
+    "El ejército reportó combates con disidencias en la región del Cauca",
+    "El festival de música vallenata reunió artistas en Valledupar",
+    "La universidad nacional abrió matrículas con nuevas becas",
+    "El ministro de hacienda defendió la reforma tributaria en el congreso",
+    "La policía capturó una banda dedicada a la extorsión en Cali",
+    "El banco de la república subió las tasas por la inflación",
+]
+
+NEW_ARTICLES = [
+    "El congreso aprobó la reforma tributaria tras un largo debate",
+    "La economía creció y el desempleo bajó según el banco",
+]
+
+
+def fitted_modeler(snapshot_dir=None):
+    modeler = TopicModeler(n_topics=3, use_nmf=False, snapshot_dir=snapshot_dir)
+    assert modeler.fit(CORPUS)
+    return modeler
+
+
+@pytest.mark.unit
+def test_partial_fit_updates_version_and_tracks_drift():
+    """Test partial_fit updates LDA in place of a refit and records drift"""
+    modeler = fitted_modeler()
+    vocabulary = dict(modeler.count_vectorizer.vocabulary_)
+
+    drift = modeler.partial_fit(NEW_ARTICLES)
+
+    assert 0.0 <= drift <= 1.0
+    assert modeler.version == 2
+    assert modeler.documents_seen == len(CORPUS) + len(NEW_ARTICLES)
+    assert modeler.drift_history[-1]['version'] == 2
+    assert modeler.count_vectorizer.vocabulary_ == vocabulary
+
+
+@pytest.mark.unit
+def test_partial_fit_before_fit_falls_back_to_fit():
+    """Test the first partial_fit performs a full fit"""
+    modeler = TopicModeler(n_topics=3, use_nmf=False)
+
+    assert modeler.partial_fit(CORPUS) is None
+    assert modeler.get_model_info()['fitted']
+    assert modeler.version == 1
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip_and_retention(tmp_path):
+    """Test snapshots restore identical predictions and old versions are pruned"""
+    modeler = fitted_modeler()
+    for _ in range(3):
+        modeler.partial_fit(NEW_ARTICLES)
+        modeler.save_snapshot(str(tmp_path), keep=2)
+
+    assert list_snapshots(str(tmp_path)) == [3, 4]
+
+    restored = TopicModeler(n_topics=3, use_nmf=False, snapshot_dir=str(tmp_path))
+    assert restored.version == 4
+    assert restored.predict_topics(CORPUS[0]) == modeler.predict_topics(CORPUS[0])
+
+    assert restored.load_snapshot(version=3)
+    assert restored.version == 3
+
+
+@pytest.mark.unit
+def test_refresh_picks_up_published_snapshot(tmp_path):
+    """Test a reader loads a newer snapshot written by the trainer"""
+    trainer = fitted_modeler(snapshot_dir=str(tmp_path))
+    trainer.save_snapshot()
+
+    reader = TopicModeler(n_topics=3, use_nmf=False, snapshot_dir=str(tmp_path))
+    assert reader.version == 1
+
+    trainer.partial_fit(NEW_ARTICLES)
+    trainer.save_snapshot()
+
+    assert reader.refresh(force=True)
+    assert reader.version == 2
+    assert not reader.refresh(force=True)
+
+
+@pytest.mark.unit
+def test_topic_drift_bounds():
+    """Test drift is 0 for identical topics and 1 for disjoint ones"""
+    topics = np.array([[1.0, 0.0], [0.0, 2.0]])
+
+    assert topic_drift(topics, topics) == 0.0
+    assert topic_drift(topics, topics[::-1]) == 1.0
+
+
+@pytest.mark.unit
+def test_new_articles_follow_row_ids_not_scraped_at(monkeypatch):
+    """Test an article committed late with an older scraped_at is still trained on"""
+    engine = create_engine("sqlite://")
+    ScrapedContent.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(topic_model_jobs, "SessionLocal", session_factory)
+    now = datetime(2026, 3, 14, 8, 30)
+
+    def store(*ages):
+        db = session_factory()
+        for age in ages:
+            url = f"https://test.com/{len(db.query(ScrapedContent).all())}-{age}"
+            db.add(ScrapedContent(source="Test", source_url=url, title=url, content="c",
+                                  content_hash=url, scraped_at=now - timedelta(minutes=age)))
+            db.commit()
+        db.close()
+
+    store(10, 5, 5)
+    first = topic_model_jobs.load_new_articles(None, limit=2)
+    # Parsed before the watermark's article, committed after it
+    store(30)
+    second = topic_model_jobs.load_new_articles(first[-1][0], limit=10)
+
+    assert [row_id for row_id, _ in first] == [1, 2]
+    assert [row_id for row_id, _ in second] == [3, 4]
@@ -166,7 +166,7 @@ class TestProcessDataMethod:
     ):
         """Test that API data is properly stored to database"""
         # Inject test database session
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_data(sample_api_data, mock_api_source)
 
         # Verify data was stored
@@ -182,7 +182,7 @@ class TestProcessDataMethod:
         test_db_session
     ):
         """Test handling of empty data list"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_data([], mock_api_source)
 
         # Should complete without errors
@@ -202,7 +202,7 @@ class TestProcessDataMethod:
             'invalid'  # Wrong type
         ]
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Should handle invalid data gracefully
             await source_manager._process_data(invalid_data, mock_api_source)
 
@@ -224,7 +224,7 @@ class TestProcessDataMethod:
             'extracted_at': datetime.utcnow().isoformat()
         }]
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_data(high_inflation_data, mock_api_source)
 
         # Check if alerts were created
@@ -252,7 +252,7 @@ class TestProcessDataMethod:
         import time
         start = time.time()
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_data(large_dataset, mock_api_source)
 
         elapsed = time.time() - start
@@ -271,7 +271,7 @@ class TestProcessDataMethod:
         mock_session = MagicMock()
         mock_session.add.side_effect = Exception("Database error")
 
-        with patch('backend.core.source_manager.Session', return_value=mock_session):
+        with patch.object(source_manager, 'session_factory', return_value=mock_session):
             # Should not raise exception, just log error
             await source_manager._process_data([{'data': 'test'}], mock_api_source)
 
@@ -288,7 +288,7 @@ class TestProcessDocumentsMethod:
         test_db_session
     ):
         """Test that scraped documents are stored as ScrapedContent"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(
                 sample_scraped_documents,
                 mock_scraper_source
@@ -314,7 +314,7 @@ class TestProcessDocumentsMethod:
         test_db_session
     ):
         """Test duplicate detection using content_hash"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Process documents twice
             await source_manager._process_documents(
                 sample_scraped_documents,
@@ -339,7 +339,7 @@ class TestProcessDocumentsMethod:
         test_db_session
     ):
         """Test difficulty score calculation for language learning"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(
                 sample_scraped_documents,
                 mock_scraper_source
@@ -360,7 +360,7 @@ class TestProcessDocumentsMethod:
         test_db_session
     ):
         """Test extraction of Colombian-specific entities"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(
                 sample_scraped_documents,
                 mock_scraper_source
@@ -388,7 +388,7 @@ class TestProcessDocumentsMethod:
             'scraped_at': datetime.utcnow().isoformat()
         }]
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Should handle missing author, subtitle, etc.
             await source_manager._process_documents(minimal_doc, mock_scraper_source)
 
@@ -420,7 +420,7 @@ class TestProcessDocumentsMethod:
         import time
         start = time.time()
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(batch_docs, mock_scraper_source)
 
         elapsed = time.time() - start
@@ -440,7 +440,7 @@ class TestProcessDocumentsMethod:
         test_db_session
     ):
         """Test that ContentAnalysis records are created"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(
                 sample_scraped_documents,
                 mock_scraper_source
@@ -464,7 +464,7 @@ class TestIntegrationPipeline:
     ):
         """Test complete API data collection and processing pipeline"""
         # Simulate full collection process
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # This would normally be called by _collect_from_api
             await source_manager._process_data(sample_api_data, mock_api_source)
 
@@ -480,7 +480,7 @@ class TestIntegrationPipeline:
         test_db_session
     ):
         """Test complete scraper collection and processing pipeline"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             await source_manager._process_documents(
                 sample_scraped_documents,
                 mock_scraper_source
@@ -501,7 +501,7 @@ class TestIntegrationPipeline:
         test_db_session
     ):
         """Test concurrent processing of API and scraper data"""
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Run both pipelines concurrently
             await asyncio.gather(
                 source_manager._process_data(sample_api_data, mock_api_source),
@@ -532,7 +532,7 @@ class TestDataValidation:
             {'data': 'test'}  # Missing source field
         ]
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Should skip invalid entries
             await source_manager._process_data(invalid_data, mock_api_source)
 
@@ -550,7 +550,7 @@ class TestDataValidation:
             {'source': 'Test', 'title': 'Test'}  # Missing content
         ]
 
-        with patch('backend.core.source_manager.Session', return_value=test_db_session):
+        with patch.object(source_manager, 'session_factory', return_value=test_db_session):
             # Should skip invalid documents
             await source_manager._process_documents(invalid_docs, mock_scraper_source)
 